@@ -0,0 +1,24 @@
+"""Caches and pools of previously generated records."""
+
+from test_data_agent.cache.reservoir import BYPASS_HINT, RecordReservoir
+from test_data_agent.cache.response_cache import (
+    RedisResponseCache,
+    ResponseCache,
+    ResponseCacheBackend,
+    SQLiteResponseCache,
+    build_response_cache,
+    response_key,
+    set_response_cache_bypass,
+)
+
+__all__ = [
+    "BYPASS_HINT",
+    "RecordReservoir",
+    "RedisResponseCache",
+    "ResponseCache",
+    "ResponseCacheBackend",
+    "SQLiteResponseCache",
+    "build_response_cache",
+    "response_key",
+    "set_response_cache_bypass",
+]
@@ -0,0 +1,216 @@
+"""Reservoir of validated LLM records kept in Redis pools.
+
+LLM calls are slow and mostly pay for a fixed prompt, so generating a few
+extra records per call is cheap. The surplus is stored in a Redis pool keyed by
+the schema and request context fingerprints, and later requests with the same
+shape are served from the pool before the LLM is called for the shortfall.
+"""
+
+import math
+import time
+
+from google.protobuf.json_format import MessageToDict
+
+from test_data_agent.clients.redis_client import RedisClient
+from test_data_agent.config import Settings
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.utils.fingerprint import fingerprint, schema_fingerprint
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+from test_data_agent.validators.coherence import CoherenceScorer
+from test_data_agent.validators.constraint import ConstraintValidator
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+# Request hint that skips the reservoir for both reads and writes
+BYPASS_HINT = "no_cache"
+
+
+class RecordReservoir:
+    """Per-(schema, context) pools of validated, coherence-scored LLM records."""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        settings: Settings,
+        constraint_validator: ConstraintValidator | None = None,
+        coherence_scorer: CoherenceScorer | None = None,
+    ):
+        """Initialize the reservoir.
+
+        Args:
+            redis_client: Redis client holding the pools
+            settings: Application settings
+            constraint_validator: Validator used to gate records before storing
+            coherence_scorer: Scorer used to gate records before storing
+        """
+        self.redis_client = redis_client
+        self.settings = settings
+        self.constraint_validator = constraint_validator or ConstraintValidator()
+        self.coherence_scorer = coherence_scorer or CoherenceScorer()
+
+    def enabled_for(self, request: test_data_pb2.GenerateRequest) -> bool:
+        """Check if the reservoir should be used for a request.
+
+        Args:
+            request: Generate data request
+
+        Returns:
+            True if reservoir reads and writes are allowed
+        """
+        if not self.settings.reservoir_enabled or self.redis_client.client is None:
+            return False
+        return BYPASS_HINT not in [h.lower() for h in request.hints]
+
+    def pool_name(self, request: test_data_pb2.GenerateRequest, schema_dict: dict) -> str:
+        """Build the pool name for a request.
+
+        Requests share a pool only when everything that shapes the prompt
+        matches: schema, context, hints, constraints, scenarios and flags.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            Pool name (without the RedisClient "pool:" prefix)
+        """
+        context = {
+            "domain": request.domain,
+            "entity": request.entity,
+            "context": request.context,
+            "hints": sorted(h.lower() for h in request.hints if h.lower() != BYPASS_HINT),
+            "constraints": MessageToDict(request.constraints),
+            "scenarios": [MessageToDict(s) for s in request.scenarios],
+            "defect_triggering": request.defect_triggering,
+            "production_like": request.production_like,
+        }
+        entity = request.entity or "unknown"
+        return f"reservoir:{entity}:{schema_fingerprint(schema_dict)}:{fingerprint(context)}"
+
+    def surplus(self, count: int) -> int:
+        """Number of extra records to generate alongside a request.
+
+        Only small requests over-generate; for those the extra output tokens
+        are cheap compared to the fixed cost of a call.
+
+        Args:
+            count: Records the caller still needs
+
+        Returns:
+            Number of surplus records to request from the LLM
+        """
+        if count <= 0 or count > self.settings.reservoir_overgenerate_max_count:
+            return 0
+        return math.ceil(count * self.settings.reservoir_overgenerate_ratio)
+
+    async def take(self, pool_name: str, count: int, entity: str) -> list[dict]:
+        """Take up to ``count`` fresh records from a pool.
+
+        Records older than ``reservoir_max_age_seconds`` are dropped.
+
+        Args:
+            pool_name: Pool name from :meth:`pool_name`
+            count: Maximum number of records to return
+            entity: Entity type (metrics label)
+
+        Returns:
+            Records removed from the pool (may be fewer than requested)
+        """
+        entries = await self.redis_client.get_from_pool(pool_name, count)
+        now = time.time()
+        records = []
+        expired = 0
+
+        for entry in entries:
+            age = now - entry.get("stored_at", 0)
+            if age > self.settings.reservoir_max_age_seconds:
+                expired += 1
+                continue
+            metrics.record_reservoir_age(entity, age)
+            records.append(entry["record"])
+
+        if not records:
+            outcome = "miss"
+        elif len(records) < count:
+            outcome = "partial"
+        else:
+            outcome = "hit"
+        metrics.record_reservoir_lookup(entity, outcome, served=len(records), expired=expired)
+        await self._record_depth(pool_name, entity)
+
+        logger.debug(
+            "reservoir_take",
+            pool=pool_name,
+            requested=count,
+            served=len(records),
+            expired=expired,
+        )
+        return records
+
+    async def put(self, pool_name: str, records: list[dict], entity: str, schema_dict: dict) -> int:
+        """Store surplus records after validation and coherence scoring.
+
+        Args:
+            pool_name: Pool name from :meth:`pool_name`
+            records: Surplus records produced by the LLM
+            entity: Entity type
+            schema_dict: Schema dictionary used for validation
+
+        Returns:
+            Number of records stored
+        """
+        entries = []
+        for record in records:
+            if schema_dict and not self.constraint_validator.validate(record, schema_dict):
+                continue
+            score = self.coherence_scorer.score(record, entity)
+            if score < self.settings.reservoir_min_coherence:
+                continue
+            stored = {k: v for k, v in record.items() if k != "_index"}
+            entries.append({"record": stored, "stored_at": time.time(), "coherence": score})
+
+        if entries:
+            await self.redis_client.add_to_pool(pool_name, entries)
+            metrics.record_reservoir_stored(entity, len(entries))
+            await self._record_depth(pool_name, entity)
+
+        logger.debug(
+            "reservoir_put",
+            pool=pool_name,
+            offered=len(records),
+            stored=len(entries),
+        )
+        return len(entries)
+
+    async def restore(self, pool_name: str, records: list[dict], entity: str) -> None:
+        """Return records taken for a request that then failed.
+
+        The records already passed validation when they were stored, so they
+        go back as they are; their age restarts from now.
+
+        Args:
+            pool_name: Pool name from :meth:`pool_name`
+            records: Records returned by :meth:`take`
+            entity: Entity type
+        """
+        if not records:
+            return
+        now = time.time()
+        entries = [
+            {
+                "record": record,
+                "stored_at": now,
+                "coherence": self.coherence_scorer.score(record, entity),
+            }
+            for record in records
+        ]
+        await self.redis_client.add_to_pool(pool_name, entries)
+        await self._record_depth(pool_name, entity)
+        logger.debug("reservoir_restore", pool=pool_name, restored=len(entries))
+
+    async def _record_depth(self, pool_name: str, entity: str) -> None:
+        """Export the current depth of a pool."""
+        depth = await self.redis_client.get_pool_size(pool_name)
+        metrics.record_reservoir_depth(entity, depth)
@@ -0,0 +1,285 @@
+"""Content-addressed cache of LLM responses.
+
+Dev and CI runs replay the same prompts over and over, and every replay is a
+paid call of many seconds. Responses are cached under a hash of everything
+that determines them (model, prompts, temperature, max_tokens and output
+schema), in SQLite for a single node or Redis for a cluster. Both backends
+keep at most ``max_entries`` responses and evict the least recently used.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+
+if TYPE_CHECKING:
+    from test_data_agent.clients.redis_client import RedisClient
+    from test_data_agent.config import Settings
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+REDIS_PREFIX = "llmcache"
+
+# Stores the response and marks it most recently used, then evicts the least
+# recently used entries beyond ARGV[3]
+REDIS_SET_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1])
+redis.call('ZADD', KEYS[2], ARGV[2], KEYS[1])
+local excess = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[3])
+if excess > 0 then
+  local evicted = redis.call('ZRANGE', KEYS[2], 0, excess - 1)
+  redis.call('DEL', unpack(evicted))
+  redis.call('ZREM', KEYS[2], unpack(evicted))
+end
+return excess
+"""
+
+# Returns the response and marks it most recently used
+REDIS_GET_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if value then
+  redis.call('ZADD', KEYS[2], ARGV[1], KEYS[1])
+end
+return value
+"""
+
+_bypass: ContextVar[bool] = ContextVar("response_cache_bypass", default=False)
+
+
+def set_response_cache_bypass(bypass: bool) -> None:
+    """Skip the response cache for the current request.
+
+    Args:
+        bypass: True to neither read nor write cached responses
+    """
+    _bypass.set(bypass)
+
+
+def response_key(
+    model: str,
+    system: str,
+    user: str,
+    temperature: float,
+    max_tokens: int,
+    json_schema: dict | None = None,
+) -> str:
+    """Hash the inputs that determine an LLM response.
+
+    Args:
+        model: Model name
+        system: System prompt
+        user: Full user prompt (including any cached prefix)
+        temperature: Sampling temperature
+        max_tokens: Output token limit
+        json_schema: Output schema for structured output
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        [model, system, user, temperature, max_tokens, json_schema],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCacheBackend(ABC):
+    """Storage for cached responses, bounded by LRU eviction."""
+
+    @abstractmethod
+    async def get(self, key: str) -> dict | None:
+        """Fetch a response and mark it recently used.
+
+        Args:
+            key: Response key
+
+        Returns:
+            Response fields, or None on a miss
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: dict) -> None:
+        """Store a response, evicting the least recently used beyond the limit.
+
+        Args:
+            key: Response key
+            value: Response fields
+        """
+
+
+class SQLiteResponseCache(ResponseCacheBackend):
+    """Response cache in a local SQLite file."""
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        """Initialize SQLite backend.
+
+        Args:
+            path: Database file (``:memory:`` for a process-local cache)
+            max_entries: Responses kept before evicting
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+        self._db.commit()
+
+    async def get(self, key: str) -> dict | None:
+        """Fetch a response and mark it recently used."""
+        value = await asyncio.to_thread(self._get, key)
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: dict) -> None:
+        """Store a response, evicting the least recently used beyond the limit."""
+        await asyncio.to_thread(self._set, key, json.dumps(value))
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            return row[0]
+
+    def _set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, used_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+
+class RedisResponseCache(ResponseCacheBackend):
+    """Response cache shared through Redis, with a sorted set as the LRU index."""
+
+    def __init__(self, redis_client: "RedisClient", max_entries: int = 10000):
+        """Initialize Redis backend.
+
+        Args:
+            redis_client: Connected Redis client
+            max_entries: Responses kept before evicting
+        """
+        self.redis_client = redis_client
+        self.max_entries = max_entries
+        self._index = f"{REDIS_PREFIX}:lru"
+
+    async def get(self, key: str) -> dict | None:
+        """Fetch a response and mark it recently used."""
+        value = await self.redis_client.run_script(
+            REDIS_GET_SCRIPT, [f"{REDIS_PREFIX}:{key}", self._index], [time.time()]
+        )
+        return json.loads(value) if value else None
+
+    async def set(self, key: str, value: dict) -> None:
+        """Store a response, evicting the least recently used beyond the limit."""
+        await self.redis_client.run_script(
+            REDIS_SET_SCRIPT,
+            [f"{REDIS_PREFIX}:{key}", self._index],
+            [json.dumps(value), time.time(), self.max_entries],
+        )
+
+
+class ResponseCache:
+    """Exact-match cache in front of an LLM client's ``generate``."""
+
+    def __init__(self, backend: ResponseCacheBackend):
+        """Initialize response cache.
+
+        Args:
+            backend: Storage backend
+        """
+        self.backend = backend
+
+    async def get(self, provider: str, key: str) -> dict | None:
+        """Look up a response unless the current request bypasses the cache.
+
+        Backend errors count as misses so the call goes to the LLM.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            key: Response key from :func:`response_key`
+
+        Returns:
+            Cached response fields, or None
+        """
+        if _bypass.get():
+            return None
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            logger.warning("response_cache_get_failed", provider=provider, error=str(e))
+            value = None
+        metrics.record_response_cache_lookup(
+            provider, hit=value is not None, saved_tokens=(value or {}).get("tokens_used", 0)
+        )
+        return value
+
+    async def set(self, provider: str, key: str, value: dict[str, Any]) -> None:
+        """Store a response unless the current request bypasses the cache.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            key: Response key from :func:`response_key`
+            value: Response fields
+        """
+        if _bypass.get():
+            return
+        try:
+            await self.backend.set(key, value)
+        except Exception as e:
+            logger.warning("response_cache_set_failed", provider=provider, error=str(e))
+
+
+def build_response_cache(
+    settings: "Settings", redis_client: "RedisClient | None" = None
+) -> ResponseCache | None:
+    """Build the response cache selected by settings.
+
+    Args:
+        settings: Application settings
+        redis_client: Redis client for the ``redis`` backend
+
+    Returns:
+        ResponseCache, or None when the cache is disabled
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend_name = settings.llm_response_cache_backend.lower()
+    if backend_name == "none":
+        return None
+    if backend_name == "sqlite":
+        backend: ResponseCacheBackend = SQLiteResponseCache(
+            settings.llm_response_cache_path, settings.llm_response_cache_max_entries
+        )
+    elif backend_name == "redis":
+        if redis_client is None:
+            raise ValueError("The redis LLM response cache backend needs a Redis client")
+        backend = RedisResponseCache(redis_client, settings.llm_response_cache_max_entries)
+    else:
+        raise ValueError(f"Unknown LLM response cache backend: {backend_name}")
+    logger.info("response_cache_enabled", backend=backend_name)
+    return ResponseCache(backend)
@@ -1,15 +1,34 @@
 """Client libraries for external services (LLM, RAG, Cache)."""
 
 from test_data_agent.clients.claude import ClaudeClient, ClaudeResponse
+from test_data_agent.clients.message_batches import (
+    AnthropicMessageBatches,
+    BatchCall,
+    BatchCallResult,
+    BatchStatus,
+    LocalMessageBatches,
+    MessageBatchBackend,
+)
+from test_data_agent.clients.rate_limiter import ClusterRateLimiter, RateLimitTimeoutError
 from test_data_agent.clients.redis_client import RedisClient
+from test_data_agent.clients.streaming import StreamChunk
 from test_data_agent.clients.vllm import VLLMClient, VLLMResponse
 from test_data_agent.clients.weaviate_client import WeaviateClient
 from test_data_agent.clients.weaviate_schema import ensure_collections
 
 __all__ = [
+    "AnthropicMessageBatches",
+    "BatchCall",
+    "BatchCallResult",
+    "BatchStatus",
     "ClaudeClient",
     "ClaudeResponse",
+    "ClusterRateLimiter",
+    "LocalMessageBatches",
+    "MessageBatchBackend",
+    "RateLimitTimeoutError",
     "RedisClient",
+    "StreamChunk",
     "VLLMClient",
     "VLLMResponse",
     "WeaviateClient",
@@ -1,15 +1,91 @@
 """Claude API client with retry logic."""
 
 import asyncio
-from dataclasses import dataclass
-
-from anthropic import Anthropic, APIError, RateLimitError, APITimeoutError
+import importlib.util
+import itertools
+import json
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator
+
+import httpx
+from anthropic import AsyncAnthropic, APIError, RateLimitError
+from anthropic import APIConnectionError, InternalServerError
+from anthropic import DefaultAsyncHttpxClient
 from anthropic.types import Message
 
+from test_data_agent.cache.response_cache import ResponseCache, response_key
+from test_data_agent.clients.rate_limiter import ClusterRateLimiter
+from test_data_agent.clients.streaming import StreamChunk
 from test_data_agent.config import Settings
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+from test_data_agent.resilience.circuit_breaker import CircuitBreaker, get_circuit_breakers
+from test_data_agent.resilience.retry import RetryPolicy, retry_after_seconds
 from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
 
 logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+# Tool Claude is forced to call when output must follow a JSON Schema
+RECORDS_TOOL = "emit_records"
+
+
+def build_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Build the long-lived HTTP connection pool shared by all Claude calls.
+
+    HTTP/2 needs the optional ``h2`` package; without it the pool falls back
+    to HTTP/1.1 keep-alive connections.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Async HTTP client configured with the pool limits from settings
+    """
+    http2 = settings.claude_http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("claude_http2_unavailable", reason="h2 package not installed")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.claude_max_connections,
+        max_keepalive_connections=settings.claude_max_keepalive_connections,
+        keepalive_expiry=settings.claude_keepalive_expiry,
+    )
+    return DefaultAsyncHttpxClient(limits=limits, http2=http2)
+
+
+def pool_stats(http_client: httpx.AsyncClient) -> dict[str, int]:
+    """Count active and idle connections in an httpx connection pool.
+
+    httpx does not expose pool state publicly, so this reads the underlying
+    httpcore pool defensively and reports zeros if the layout is unknown.
+
+    Args:
+        http_client: Async HTTP client
+
+    Returns:
+        Dict with ``active`` and ``idle`` connection counts
+    """
+    pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None) or []
+    idle = sum(1 for conn in connections if getattr(conn, "is_idle", lambda: False)())
+    return {"active": len(connections) - idle, "idle": idle}
+
+
+def is_outage(error: Exception) -> bool:
+    """Check whether an API error means Claude itself is unavailable.
+
+    Connection failures, timeouts, rate limiting and 5xx responses count
+    against the circuit breaker; request errors (4xx) do not.
+
+    Args:
+        error: Exception raised by the API call
+
+    Returns:
+        True if the error should count as a dependency failure
+    """
+    return isinstance(error, (APIConnectionError, RateLimitError, InternalServerError))
 
 
 @dataclass
@@ -17,128 +93,265 @@ class ClaudeResponse:
     """Response from Claude API."""
 
     content: str
-    tokens_used: int  # input + output tokens
+    tokens_used: int  # input (cache writes included) + output tokens
     model: str
     stop_reason: str
+    cache_read_tokens: int = 0  # input tokens served from the prompt cache
+    cache_write_tokens: int = 0  # input tokens written to the prompt cache
+    output_tokens: int = 0  # generated tokens only
 
 
 class ClaudeClient:
-    """Client for Claude API with retry logic."""
+    """Async client for Claude API with retry logic.
+
+    Uses ``AsyncAnthropic`` over a single pooled HTTP client so concurrent
+    calls cost coroutines rather than executor threads.
+    """
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        breaker: CircuitBreaker | None = None,
+        rate_limiter: ClusterRateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
         """
         Initialize Claude client.
 
         Args:
             settings: Application settings
+            breaker: Circuit breaker (defaults to the shared "claude" breaker)
+            rate_limiter: Cluster-wide rate limiter consulted before each call
+            response_cache: Exact-match cache consulted before each ``generate`` call
+            retry_policy: Retry policy (defaults to one built from settings)
         """
         self.settings = settings
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
-        self.max_retries = 3
-        self.base_delay = 1.0  # seconds
+        self.breaker = breaker or get_circuit_breakers().get(
+            "claude",
+            settings.circuit_breaker_failure_threshold,
+            settings.circuit_breaker_recovery_seconds,
+        )
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.http_client = build_http_client(settings)
+        # Retries are left to retry_policy so they count against the request's budget
+        self.client = AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=self.http_client,
+            max_retries=0,
+        )
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=settings.llm_retry_max_attempts,
+            base_delay=settings.llm_retry_base_delay_seconds,
+            max_delay=settings.llm_retry_max_delay_seconds,
+        )
         logger.info(
             "claude_client_initialized",
             model=settings.claude_model,
             max_tokens=settings.claude_max_tokens,
+            max_connections=settings.claude_max_connections,
         )
 
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
+        logger.info("claude_client_closed")
+
     async def generate(
         self,
         system: str,
         user: str,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        cached_prefix: str | None = None,
+        json_schema: dict | None = None,
     ) -> ClaudeResponse:
         """
         Generate text with Claude.
 
         Args:
             system: System prompt
-            user: User prompt
+            user: User prompt (the variable part when cached_prefix is given)
             max_tokens: Max tokens to generate (defaults to settings)
             temperature: Temperature (defaults to settings)
+            cached_prefix: Stable start of the user prompt to mark for prompt caching
+            json_schema: JSON Schema of an array the output must follow; Claude is
+                forced to answer through a tool with this input schema and the
+                array is returned as the response content
 
         Returns:
             ClaudeResponse with content and metadata
 
         Raises:
             APIError: On authentication or other API errors
+            CircuitOpenError: If the Claude circuit is open
         """
         max_tokens = max_tokens or self.settings.claude_max_tokens
         temperature = temperature if temperature is not None else self.settings.claude_temperature
 
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(
-                    "claude_api_call",
-                    attempt=attempt + 1,
-                    model=self.settings.claude_model,
-                )
-
-                # Make API call (synchronous, run in thread pool)
-                message = await asyncio.to_thread(
-                    self._call_api,
-                    system=system,
-                    user=user,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
-
-                # Extract content
-                content = ""
-                for block in message.content:
-                    if hasattr(block, "text"):
-                        content += block.text
-
-                # Calculate tokens used
-                tokens_used = message.usage.input_tokens + message.usage.output_tokens
-
-                logger.info(
-                    "claude_api_success",
-                    tokens_used=tokens_used,
-                    stop_reason=message.stop_reason,
-                )
-
-                return ClaudeResponse(
-                    content=content,
-                    tokens_used=tokens_used,
-                    model=message.model,
-                    stop_reason=message.stop_reason,
-                )
-
-            except RateLimitError:
-                if attempt < self.max_retries - 1:
-                    delay = self.base_delay * (2**attempt)
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = response_key(
+                self.settings.claude_model,
+                system,
+                (cached_prefix or "") + user,
+                temperature,
+                max_tokens,
+                json_schema,
+            )
+            cached = await self.response_cache.get("claude", cache_key)
+            if cached is not None:
+                logger.info("claude_response_cache_hit", tokens_saved=cached["tokens_used"])
+                return ClaudeResponse(**cached)
+
+        delay = None
+        async with self.breaker.guard(is_failure=is_outage):
+            for attempt in itertools.count():
+                try:
+                    logger.debug(
+                        "claude_api_call",
+                        attempt=attempt + 1,
+                        model=self.settings.claude_model,
+                    )
+
+                    reserved = await self._reserve(system, user, cached_prefix, max_tokens)
+                    used = 0
+                    metrics.llm_request_started("claude")
+                    try:
+                        message = await self._call_api(
+                            system=system,
+                            user=user,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            cached_prefix=cached_prefix,
+                            json_schema=json_schema,
+                        )
+                        response = self.to_response(message)
+                        used = response.tokens_used
+                    finally:
+                        metrics.llm_request_finished("claude")
+                        metrics.record_http_pool("claude", **pool_stats(self.http_client))
+                        await self._release(reserved, used)
+
+                    logger.info(
+                        "claude_api_success",
+                        tokens_used=response.tokens_used,
+                        cache_read_tokens=response.cache_read_tokens,
+                        stop_reason=response.stop_reason,
+                    )
+
+                    if cache_key is not None:
+                        await self.response_cache.set("claude", cache_key, asdict(response))
+                    return response
+
+                except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                    # Timeouts are connection errors; 4xx request errors are not retried
+                    delay = await self._retry_delay(e, attempt, delay)
+                    if delay is None:
+                        logger.error("claude_retries_exhausted", error=type(e).__name__)
+                        raise
                     logger.warning(
-                        "claude_rate_limit",
+                        "claude_retry",
                         attempt=attempt + 1,
                         retry_delay=delay,
+                        error=type(e).__name__,
                     )
                     await asyncio.sleep(delay)
-                else:
-                    logger.error("claude_rate_limit_exhausted")
+
+                except APIError as e:
+                    # Don't retry on authentication or other API errors
+                    logger.error("claude_api_error", error=str(e))
                     raise
 
-            except APITimeoutError:
-                if attempt < self.max_retries - 1:
-                    delay = self.base_delay * (2**attempt)
+    async def stream(
+        self,
+        system: str,
+        user: str,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        cached_prefix: str | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Stream text from Claude as it is generated.
+
+        Failures before the first token are retried like ``generate``; once
+        text has been yielded, errors propagate to the caller.
+
+        Args:
+            system: System prompt
+            user: User prompt (the variable part when cached_prefix is given)
+            max_tokens: Max tokens to generate (defaults to settings)
+            temperature: Temperature (defaults to settings)
+            cached_prefix: Stable start of the user prompt to mark for prompt caching
+
+        Yields:
+            StreamChunk per text delta, then a final chunk with the ClaudeResponse
+
+        Raises:
+            CircuitOpenError: If the Claude circuit is open
+        """
+        max_tokens = max_tokens or self.settings.claude_max_tokens
+        temperature = temperature if temperature is not None else self.settings.claude_temperature
+        system_param, messages = self._build_messages(system, user, cached_prefix)
+
+        delay = None
+        async with self.breaker.guard(is_failure=is_outage):
+            for attempt in itertools.count():
+                yielded = False
+                try:
+                    logger.debug(
+                        "claude_stream_call",
+                        attempt=attempt + 1,
+                        model=self.settings.claude_model,
+                    )
+                    reserved = await self._reserve(system, user, cached_prefix, max_tokens)
+                    used = 0
+                    metrics.llm_request_started("claude")
+                    try:
+                        async with self.client.messages.stream(
+                            model=self.settings.claude_model,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            system=system_param,
+                            messages=messages,
+                        ) as stream:
+                            async for text in stream.text_stream:
+                                yielded = True
+                                yield StreamChunk(text=text)
+                            message = await stream.get_final_message()
+                        response = self.to_response(message)
+                        used = response.tokens_used
+                    finally:
+                        metrics.llm_request_finished("claude")
+                        metrics.record_http_pool("claude", **pool_stats(self.http_client))
+                        await self._release(reserved, used)
+
+                    logger.info(
+                        "claude_stream_success",
+                        tokens_used=response.tokens_used,
+                        cache_read_tokens=response.cache_read_tokens,
+                        stop_reason=response.stop_reason,
+                    )
+                    yield StreamChunk(text="", response=response)
+                    return
+
+                except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                    delay = None if yielded else await self._retry_delay(e, attempt, delay)
+                    if delay is None:
+                        logger.error("claude_stream_failed", error=str(e))
+                        raise
                     logger.warning(
-                        "claude_timeout",
+                        "claude_stream_retry",
                         attempt=attempt + 1,
                         retry_delay=delay,
+                        error=type(e).__name__,
                     )
                     await asyncio.sleep(delay)
-                else:
-                    logger.error("claude_timeout_exhausted")
-                    raise
-
-            except APIError as e:
-                # Don't retry on authentication or other API errors
-                logger.error("claude_api_error", error=str(e))
-                raise
 
-        # Should not reach here
-        raise APIError("Max retries exceeded")
+                except APIError as e:
+                    logger.error("claude_stream_api_error", error=str(e))
+                    raise
 
     async def generate_json(
         self,
@@ -146,6 +359,7 @@ class ClaudeClient:
         user: str,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        cached_prefix: str | None = None,
     ) -> dict:
         """
         Generate JSON response with Claude.
@@ -155,6 +369,7 @@ class ClaudeClient:
             user: User prompt
             max_tokens: Max tokens to generate
             temperature: Temperature
+            cached_prefix: Stable start of the user prompt to mark for prompt caching
 
         Returns:
             Parsed JSON dict
@@ -163,10 +378,9 @@ class ClaudeClient:
             ValueError: If response is not valid JSON
             APIError: On API errors
         """
-        response = await self.generate(system, user, max_tokens, temperature)
+        response = await self.generate(system, user, max_tokens, temperature, cached_prefix)
 
         # Parse JSON from response
-        import json
         import re
 
         content = response.content.strip()
@@ -186,29 +400,228 @@ class ClaudeClient:
             logger.error("claude_json_parse_error", error=str(e), content=content[:200])
             raise ValueError(f"Failed to parse JSON from Claude response: {e}")
 
-    def _call_api(
+    async def _reserve(
+        self, system: str, user: str, cached_prefix: str | None, max_tokens: int
+    ) -> int:
+        """
+        Wait for cluster-wide rate-limit capacity for one call.
+
+        Args:
+            system: System prompt
+            user: User prompt
+            cached_prefix: Stable start of the user prompt
+            max_tokens: Max tokens to generate
+
+        Returns:
+            Tokens reserved for the call (0 without a rate limiter)
+
+        Raises:
+            RateLimitTimeoutError: If capacity would arrive after the request deadline
+        """
+        if self.rate_limiter is None:
+            return 0
+        tokens = (
+            TokenBudgetPlanner.estimate_prompt_tokens(system, user, cached_prefix or "")
+            + max_tokens
+        )
+        await self.rate_limiter.acquire(tokens)
+        return tokens
+
+    async def _release(self, reserved: int, used: int) -> None:
+        """
+        Return reserved tokens the call did not use.
+
+        Runs after every call, so failed, retried and cancelled calls
+        (``used`` of 0) give their whole reservation back.
+
+        Args:
+            reserved: Tokens reserved by ``_reserve``
+            used: Tokens the call used (0 if it failed)
+        """
+        if self.rate_limiter is not None and reserved:
+            await self.rate_limiter.refund(reserved - used)
+
+    async def _retry_delay(
+        self, error: Exception, attempt: int, previous: float | None
+    ) -> float | None:
+        """
+        Delay before retrying a failed call, if it may be retried.
+
+        A ``retry-after`` on a rate-limit error is honored and shared with
+        the other replicas through the rate limiter; otherwise the retry
+        policy backs off with jitter.
+
+        Args:
+            error: Retryable API error
+            attempt: Zero-based attempt number
+            previous: Delay before the failed attempt
+
+        Returns:
+            Seconds to wait, or None if attempts or the request's retry budget ran out
+        """
+        retry_after = retry_after_seconds(error) if isinstance(error, RateLimitError) else None
+        if retry_after is not None and self.rate_limiter is not None:
+            await self.rate_limiter.pause(retry_after)
+        return self.retry_policy.next_delay("claude", attempt, previous, retry_after)
+
+    async def _call_api(
         self,
         system: str,
         user: str,
         max_tokens: int,
         temperature: float,
+        cached_prefix: str | None = None,
+        json_schema: dict | None = None,
     ) -> Message:
         """
-        Make synchronous API call to Claude.
+        Make async API call to Claude.
 
         Args:
             system: System prompt
             user: User prompt
             max_tokens: Max tokens
             temperature: Temperature
+            cached_prefix: Stable start of the user prompt to mark for prompt caching
+            json_schema: Optional JSON Schema the output must follow
 
         Returns:
             Message from Claude API
         """
-        return self.client.messages.create(
-            model=self.settings.claude_model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            system=system,
-            messages=[{"role": "user", "content": user}],
+        return await self.client.messages.create(
+            **self.message_params(system, user, max_tokens, temperature, cached_prefix, json_schema)
+        )
+
+    def message_params(
+        self,
+        system: str,
+        user: str,
+        max_tokens: int,
+        temperature: float | None = None,
+        cached_prefix: str | None = None,
+        json_schema: dict | None = None,
+    ) -> dict:
+        """
+        Build the Messages API parameters for one call.
+
+        Shared by interactive calls and message batch requests, so both send
+        the same prompt cache breakpoints and structured output tool.
+
+        Args:
+            system: System prompt
+            user: User prompt
+            max_tokens: Max tokens
+            temperature: Temperature (defaults to settings)
+            cached_prefix: Stable start of the user prompt to mark for prompt caching
+            json_schema: Optional JSON Schema the output must follow
+
+        Returns:
+            Keyword arguments for ``messages.create``
+        """
+        system_param, messages = self._build_messages(system, user, cached_prefix)
+        params = {
+            "model": self.settings.claude_model,
+            "max_tokens": max_tokens,
+            "temperature": (
+                temperature if temperature is not None else self.settings.claude_temperature
+            ),
+            "system": system_param,
+            "messages": messages,
+        }
+        if json_schema is not None:
+            params["tools"] = [self._records_tool(json_schema)]
+            params["tool_choice"] = {"type": "tool", "name": RECORDS_TOOL}
+        return params
+
+    @staticmethod
+    def _records_tool(json_schema: dict) -> dict:
+        """
+        Build the tool definition carrying a JSON Schema.
+
+        Tool inputs must be objects, so the records array is wrapped in a
+        ``records`` property.
+
+        Args:
+            json_schema: JSON Schema of the records array
+
+        Returns:
+            Tool definition for the Messages API
+        """
+        return {
+            "name": RECORDS_TOOL,
+            "description": "Return the generated test data records.",
+            "input_schema": {
+                "type": "object",
+                "properties": {"records": json_schema},
+                "required": ["records"],
+            },
+        }
+
+    def _build_messages(
+        self,
+        system: str,
+        user: str,
+        cached_prefix: str | None,
+    ) -> tuple[str | list[dict], list[dict]]:
+        """
+        Build system and messages parameters, adding prompt cache breakpoints.
+
+        With prompt caching enabled, the system prompt and the stable user
+        prefix each end a cache breakpoint, so repeat requests for the same
+        entity only pay full price for the variable suffix.
+
+        Args:
+            system: System prompt
+            user: Variable user prompt
+            cached_prefix: Stable start of the user prompt (may be None)
+
+        Returns:
+            Tuple of (system parameter, messages list)
+        """
+        if not self.settings.claude_prompt_caching:
+            full_user = (cached_prefix or "") + user
+            return system, [{"role": "user", "content": full_user}]
+
+        cache_control = {"type": "ephemeral"}
+        system_param = [{"type": "text", "text": system, "cache_control": cache_control}]
+
+        content: list[dict] = []
+        if cached_prefix:
+            content.append({"type": "text", "text": cached_prefix, "cache_control": cache_control})
+        content.append({"type": "text", "text": user})
+
+        return system_param, [{"role": "user", "content": content}]
+
+    def to_response(self, message: Message) -> ClaudeResponse:
+        """
+        Convert an API message to a ClaudeResponse and record cache usage.
+
+        Args:
+            message: Message from Claude API
+
+        Returns:
+            ClaudeResponse with content, token usage and cache statistics
+        """
+        content = ""
+        for block in message.content:
+            if getattr(block, "type", None) == "tool_use" and block.name == RECORDS_TOOL:
+                # Structured output; hand it on as the JSON array text callers parse
+                records = block.input.get("records", []) if isinstance(block.input, dict) else []
+                content += json.dumps(records)
+            elif hasattr(block, "text"):
+                content += block.text
+
+        usage = message.usage
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        metrics.record_prompt_cache_tokens("claude", read=cache_read, write=cache_write)
+
+        return ClaudeResponse(
+            content=content,
+            # Cache writes are billed at a premium and count against the input limit
+            tokens_used=usage.input_tokens + cache_write + usage.output_tokens,
+            model=message.model,
+            stop_reason=message.stop_reason,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+            output_tokens=usage.output_tokens,
         )
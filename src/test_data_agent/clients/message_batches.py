@@ -0,0 +1,262 @@
+"""Message batch backends for offline LLM jobs.
+
+Bulk jobs don't need interactive latency. Their prompts are submitted as
+one asynchronous batch that the provider works through at a discount and
+outside the interactive rate limits, and the responses are collected once
+the batch has ended.
+
+:class:`MessageBatchBackend` is the interface batch jobs run against.
+:class:`AnthropicMessageBatches` implements it with the Anthropic Message
+Batches API; :class:`LocalMessageBatches` answers in process, for tests and
+local runs.
+"""
+
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from test_data_agent.clients.claude import ClaudeClient, ClaudeResponse
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+from test_data_agent.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BatchCall:
+    """One prompt of a message batch."""
+
+    custom_id: str  # Matches the call to its result; letters, digits, _ and - only
+    system: str
+    user: str
+    max_tokens: int
+    cached_prefix: str | None = None
+    json_schema: dict | None = None
+
+
+@dataclass
+class BatchStatus:
+    """Progress of a submitted batch."""
+
+    batch_id: str
+    ended: bool  # All calls have a result (succeeded, errored, canceled or expired)
+    processing: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+
+@dataclass
+class BatchCallResult:
+    """Outcome of one call of an ended batch."""
+
+    custom_id: str
+    response: ClaudeResponse | None = None  # None if the call did not succeed
+    error: str = ""
+
+
+class MessageBatchBackend(ABC):
+    """Runs prompts as an asynchronous batch."""
+
+    @abstractmethod
+    async def submit(self, calls: list[BatchCall]) -> str:
+        """Submit prompts as one batch.
+
+        Args:
+            calls: Prompts of the batch
+
+        Returns:
+            Batch ID for later status checks
+        """
+        pass
+
+    @abstractmethod
+    async def status(self, batch_id: str) -> BatchStatus:
+        """Check a batch's progress.
+
+        Args:
+            batch_id: ID returned by ``submit``
+
+        Returns:
+            BatchStatus of the batch
+        """
+        pass
+
+    @abstractmethod
+    async def results(self, batch_id: str) -> list[BatchCallResult]:
+        """Collect the results of an ended batch.
+
+        Args:
+            batch_id: ID returned by ``submit``
+
+        Returns:
+            One result per call, in no particular order
+        """
+        pass
+
+
+class AnthropicMessageBatches(MessageBatchBackend):
+    """Backend on the Anthropic Message Batches API.
+
+    Calls are built exactly like interactive Claude calls (prompt caching,
+    structured output), but bypass the cluster rate limiter, the response
+    cache and the circuit breaker, which only guard interactive traffic.
+    """
+
+    def __init__(self, claude_client: ClaudeClient):
+        """Initialize backend.
+
+        Args:
+            claude_client: Claude client whose API client and settings are used
+        """
+        self.claude_client = claude_client
+
+    async def submit(self, calls: list[BatchCall]) -> str:
+        """Submit prompts as one Message Batch.
+
+        Args:
+            calls: Prompts of the batch
+
+        Returns:
+            Message Batch ID
+        """
+        batch = await self.claude_client.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": call.custom_id,
+                    "params": self.claude_client.message_params(
+                        call.system,
+                        call.user,
+                        call.max_tokens,
+                        cached_prefix=call.cached_prefix,
+                        json_schema=call.json_schema,
+                    ),
+                }
+                for call in calls
+            ]
+        )
+        logger.info("message_batch_submitted", batch_id=batch.id, calls=len(calls))
+        return batch.id
+
+    async def status(self, batch_id: str) -> BatchStatus:
+        """Check a Message Batch's progress.
+
+        Args:
+            batch_id: Message Batch ID
+
+        Returns:
+            BatchStatus with the batch's request counts
+        """
+        batch = await self.claude_client.client.messages.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        return BatchStatus(
+            batch_id=batch_id,
+            ended=batch.processing_status == "ended",
+            processing=counts.processing,
+            succeeded=counts.succeeded,
+            failed=counts.errored + counts.canceled + counts.expired,
+        )
+
+    async def results(self, batch_id: str) -> list[BatchCallResult]:
+        """Stream the results of an ended Message Batch.
+
+        Args:
+            batch_id: Message Batch ID
+
+        Returns:
+            One result per call
+        """
+        results = []
+        async for entry in await self.claude_client.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                response = self.claude_client.to_response(result.message)
+                results.append(BatchCallResult(custom_id=entry.custom_id, response=response))
+            elif result.type == "errored":
+                error = f"errored: {result.error.error.message}"
+                results.append(BatchCallResult(custom_id=entry.custom_id, error=error))
+            else:
+                results.append(BatchCallResult(custom_id=entry.custom_id, error=result.type))
+        return results
+
+
+class LocalMessageBatches(MessageBatchBackend):
+    """In-process backend, for tests and local runs without the batch API.
+
+    A batch ends after a fixed number of status checks; each call is then
+    answered by a function of the call.
+    """
+
+    def __init__(self, respond: Callable[[BatchCall], str], polls_to_end: int = 1):
+        """Initialize backend.
+
+        Args:
+            respond: Returns a call's response text (raising fails the call)
+            polls_to_end: Status checks a batch stays in progress for
+        """
+        self.respond = respond
+        self.polls_to_end = polls_to_end
+        self.batches: dict[str, list[BatchCall]] = {}
+        self._polls: dict[str, int] = {}
+
+    async def submit(self, calls: list[BatchCall]) -> str:
+        """Store prompts as a new batch.
+
+        Args:
+            calls: Prompts of the batch
+
+        Returns:
+            Local batch ID
+        """
+        batch_id = f"local_{uuid.uuid4().hex}"
+        self.batches[batch_id] = list(calls)
+        self._polls[batch_id] = 0
+        return batch_id
+
+    async def status(self, batch_id: str) -> BatchStatus:
+        """Count a status check; the batch ends after ``polls_to_end`` of them.
+
+        Args:
+            batch_id: Local batch ID
+
+        Returns:
+            BatchStatus of the batch
+
+        Raises:
+            KeyError: If the batch was never submitted
+        """
+        calls = self.batches[batch_id]
+        self._polls[batch_id] += 1
+        if self._polls[batch_id] < self.polls_to_end:
+            return BatchStatus(batch_id=batch_id, ended=False, processing=len(calls))
+        return BatchStatus(batch_id=batch_id, ended=True, succeeded=len(calls))
+
+    async def results(self, batch_id: str) -> list[BatchCallResult]:
+        """Answer every call of a batch.
+
+        Args:
+            batch_id: Local batch ID
+
+        Returns:
+            One result per call
+        """
+        results = []
+        for call in self.batches[batch_id]:
+            try:
+                content = self.respond(call)
+            except Exception as e:
+                results.append(BatchCallResult(custom_id=call.custom_id, error=str(e)))
+                continue
+            output_tokens = TokenBudgetPlanner.estimate_prompt_tokens(content)
+            input_tokens = TokenBudgetPlanner.estimate_prompt_tokens(
+                call.system, call.cached_prefix or "", call.user
+            )
+            response = ClaudeResponse(
+                content=content,
+                tokens_used=input_tokens + output_tokens,
+                model="local",
+                stop_reason="end_turn",
+                output_tokens=output_tokens,
+            )
+            results.append(BatchCallResult(custom_id=call.custom_id, response=response))
+        return results
@@ -0,0 +1,259 @@
+"""Cluster-wide token-bucket rate limiting for LLM provider calls.
+
+Every replica draws from the same Redis buckets (requests per minute and
+tokens per minute), so the fleet as a whole stays under the provider's
+organisation limit instead of each pod discovering it through 429s. A
+``retry-after`` from the provider pauses the bucket for all replicas.
+
+A call that finds capacity goes straight through. Otherwise, within a
+replica, callers queue in arrival order; a caller whose deadline would pass
+before its turn fails fast with :class:`RateLimitTimeoutError`.
+Without Redis the limiter lets every call through.
+"""
+
+import asyncio
+import math
+import time
+from contextvars import ContextVar
+
+from test_data_agent.clients.redis_client import RedisClient
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+# Refills both buckets from Redis server time and takes one request and
+# ARGV[3] tokens if both have enough. Returns 0 on success, otherwise the
+# milliseconds until the call could proceed.
+ACQUIRE_SCRIPT = """
+local paused = redis.call('PTTL', KEYS[2])
+if paused > 0 then
+  return paused
+end
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local rpm = tonumber(ARGV[1])
+local tpm = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local request_cost = tonumber(ARGV[4])
+
+local state = redis.call('HMGET', KEYS[1], 'requests', 'tokens', 'ts')
+local requests = tonumber(state[1]) or rpm
+local tokens = tonumber(state[2]) or tpm
+local elapsed = math.max(0, now - (tonumber(state[3]) or now))
+requests = math.min(rpm, requests + elapsed * rpm / 60000)
+tokens = math.min(tpm, tokens + elapsed * tpm / 60000)
+
+local wait = 0
+if rpm > 0 and requests < request_cost then
+  wait = math.ceil((request_cost - requests) * 60000 / rpm)
+end
+if tpm > 0 and tokens < cost then
+  wait = math.max(wait, math.ceil((cost - tokens) * 60000 / tpm))
+end
+if wait == 0 then
+  requests = requests - request_cost
+  tokens = math.min(tpm, tokens - cost)
+end
+
+redis.call('HSET', KEYS[1], 'requests', tostring(requests), 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], 120000)
+return wait
+"""
+
+# Refills the token bucket and puts ARGV[2] unused tokens back. Refunds are
+# applied while the bucket is paused, so a pause does not lose them.
+REFUND_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local tpm = tonumber(ARGV[1])
+local refund = tonumber(ARGV[2])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or tpm
+local elapsed = math.max(0, now - (tonumber(state[2]) or now))
+tokens = math.min(tpm, tokens + elapsed * tpm / 60000 + refund)
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], 120000)
+return 0
+"""
+
+# Pauses the bucket for ARGV[1] milliseconds unless a longer pause is set
+PAUSE_SCRIPT = """
+if redis.call('PTTL', KEYS[1]) < tonumber(ARGV[1]) then
+  redis.call('SET', KEYS[1], '1', 'PX', ARGV[1])
+end
+return 0
+"""
+
+_request_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def set_request_deadline(time_remaining: float | None) -> None:
+    """Record the current request's deadline for rate-limited calls.
+
+    Args:
+        time_remaining: Seconds left before the caller gives up (None = no deadline)
+    """
+    deadline = None if time_remaining is None else time.monotonic() + time_remaining
+    _request_deadline.set(deadline)
+
+
+class RateLimitTimeoutError(RuntimeError):
+    """Raised when a call cannot get rate-limit capacity before its deadline."""
+
+    def __init__(self, name: str, retry_after: float):
+        """Initialize error.
+
+        Args:
+            name: Rate-limited provider
+            retry_after: Seconds until capacity is expected
+        """
+        super().__init__(f"{name} rate limit: no capacity for {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class ClusterRateLimiter:
+    """Redis token buckets for requests/min and tokens/min, shared by all replicas."""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        name: str,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_wait: float = 30.0,
+    ):
+        """Initialize limiter.
+
+        Args:
+            redis_client: Redis client holding the buckets
+            name: Provider name (key prefix and metrics label)
+            requests_per_minute: Request bucket size and refill per minute (0 = unlimited)
+            tokens_per_minute: Token bucket size and refill per minute (0 = unlimited)
+            max_wait: Longest wait for callers without a request deadline
+        """
+        self.redis_client = redis_client
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_wait = max_wait
+        self.bucket_key = f"ratelimit:{name}:bucket"
+        self.pause_key = f"ratelimit:{name}:paused"
+        self._queue = asyncio.Lock()  # Callers without capacity wait in arrival order
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait for capacity for one request using ``tokens`` tokens.
+
+        Args:
+            tokens: Estimated input + output tokens for the call
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitTimeoutError: If capacity is not expected before the deadline
+        """
+        start = time.monotonic()
+        deadline = _request_deadline.get() or start + self.max_wait
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        # Queue only when the bucket is short; don't jump ahead of queued callers
+        if self._queue.locked():
+            await self._wait_in_queue(tokens, deadline)
+        else:
+            wait = await self._try_take(tokens, request_cost=1)
+            if wait > 0:
+                if time.monotonic() + wait > deadline:
+                    self._reject("deadline", wait)
+                await self._wait_in_queue(tokens, deadline, time.monotonic() + wait)
+
+        waited = time.monotonic() - start
+        metrics.record_rate_limit_wait(self.name, waited)
+        if waited > 0.1:
+            logger.info("rate_limit_waited", provider=self.name, seconds=round(waited, 2))
+        return waited
+
+    async def _wait_in_queue(self, tokens: int, deadline: float, not_before: float = 0.0) -> None:
+        """Wait in arrival order until the bucket has capacity, then take it.
+
+        Args:
+            tokens: Tokens to take
+            deadline: Monotonic time by which capacity must be taken
+            not_before: Monotonic time before which the bucket is known to be short
+
+        Raises:
+            RateLimitTimeoutError: If capacity is not expected before the deadline
+        """
+        try:
+            await asyncio.wait_for(
+                self._queue.acquire(), timeout=max(0.0, deadline - time.monotonic())
+            )
+        except TimeoutError:
+            self._reject("queue_timeout", deadline - time.monotonic())
+
+        try:
+            wait = not_before - time.monotonic()
+            while True:
+                if wait > 0:
+                    if time.monotonic() + wait > deadline:
+                        self._reject("deadline", wait)
+                    await asyncio.sleep(wait)
+                wait = await self._try_take(tokens, request_cost=1)
+                if wait <= 0:
+                    break
+        finally:
+            self._queue.release()
+
+    async def refund(self, tokens: int) -> None:
+        """Return unused tokens reserved by :meth:`acquire`.
+
+        Args:
+            tokens: Reserved tokens the call did not use
+        """
+        if self.tokens_per_minute and tokens > 0:
+            await self.redis_client.run_script(
+                REFUND_SCRIPT, keys=[self.bucket_key], args=[self.tokens_per_minute, tokens]
+            )
+
+    async def pause(self, seconds: float) -> None:
+        """Stop all replicas from calling the provider for ``seconds``.
+
+        Args:
+            seconds: Pause length (e.g. a provider ``retry-after``)
+        """
+        if seconds <= 0:
+            return
+        await self.redis_client.run_script(
+            PAUSE_SCRIPT, keys=[self.pause_key], args=[math.ceil(seconds * 1000)]
+        )
+        logger.warning("rate_limit_paused", provider=self.name, seconds=seconds)
+
+    async def _try_take(self, tokens: int, request_cost: int) -> float:
+        """Run the bucket script.
+
+        Returns:
+            Seconds to wait before retrying (0 if capacity was taken or Redis is unavailable)
+        """
+        wait_ms = await self.redis_client.run_script(
+            ACQUIRE_SCRIPT,
+            keys=[self.bucket_key, self.pause_key],
+            args=[self.requests_per_minute, self.tokens_per_minute, tokens, request_cost],
+        )
+        return (wait_ms or 0) / 1000
+
+    def _reject(self, reason: str, retry_after: float) -> None:
+        """Record and raise a fail-fast rejection."""
+        metrics.record_rate_limit_rejection(self.name, reason)
+        logger.warning(
+            "rate_limit_rejected",
+            provider=self.name,
+            reason=reason,
+            retry_after=round(retry_after, 2),
+        )
+        raise RateLimitTimeoutError(self.name, retry_after)
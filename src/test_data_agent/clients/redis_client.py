@@ -6,22 +6,34 @@ from typing import Any
 import redis.asyncio as redis
 
 from test_data_agent.config import Settings
+from test_data_agent.resilience.circuit_breaker import CircuitBreaker, get_circuit_breakers
 from test_data_agent.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 class RedisClient:
-    """Async Redis client for caching and data pooling."""
+    """Async Redis client for caching and data pooling.
 
-    def __init__(self, settings: Settings):
+    Operations are skipped (as if Redis were not configured) while the
+    "redis" circuit breaker is open.
+    """
+
+    def __init__(self, settings: Settings, breaker: CircuitBreaker | None = None):
         """Initialize Redis client.
 
         Args:
             settings: Application settings
+            breaker: Circuit breaker (defaults to the shared "redis" breaker)
         """
         self.settings = settings
         self.client: redis.Redis | None = None
+        self._scripts: dict[str, Any] = {}
+        self.breaker = breaker or get_circuit_breakers().get(
+            "redis",
+            settings.circuit_breaker_failure_threshold,
+            settings.circuit_breaker_recovery_seconds,
+        )
 
     async def connect(self) -> None:
         """Connect to Redis server."""
@@ -54,17 +66,19 @@ class RedisClient:
         Returns:
             Cached value or None if not found
         """
-        if not self.client:
+        if not self._available():
             return None
 
         try:
             value = await self.client.get(key)
+            self.breaker.record_success()
             if value:
                 logger.debug("cache_hit", key=key)
             else:
                 logger.debug("cache_miss", key=key)
             return value
         except Exception as e:
+            self.breaker.record_failure()
             logger.error("cache_get_failed", key=key, error=str(e))
             return None
 
@@ -76,14 +90,16 @@ class RedisClient:
             value: Value to cache
             ttl: Time to live in seconds (None for default)
         """
-        if not self.client:
+        if not self._available():
             return
 
         try:
             ttl = ttl or self.settings.cache_ttl_seconds
             await self.client.set(key, value, ex=ttl)
+            self.breaker.record_success()
             logger.debug("cache_set", key=key, ttl=ttl)
         except Exception as e:
+            self.breaker.record_failure()
             logger.error("cache_set_failed", key=key, error=str(e))
 
     async def delete(self, key: str) -> None:
@@ -92,13 +108,15 @@ class RedisClient:
         Args:
             key: Cache key
         """
-        if not self.client:
+        if not self._available():
             return
 
         try:
             await self.client.delete(key)
+            self.breaker.record_success()
             logger.debug("cache_deleted", key=key)
         except Exception as e:
+            self.breaker.record_failure()
             logger.error("cache_delete_failed", key=key, error=str(e))
 
     async def get_from_pool(self, pool_name: str, count: int) -> list[dict]:
@@ -111,7 +129,7 @@ class RedisClient:
         Returns:
             List of data items (may be fewer than requested if pool is small)
         """
-        if not self.client:
+        if not self._available():
             return []
 
         try:
@@ -121,12 +139,14 @@ class RedisClient:
             # Remove retrieved items from pool
             if items:
                 await self.client.ltrim(pool_key, len(items), -1)
+            self.breaker.record_success()
 
             parsed_items = [json.loads(item) for item in items]
             logger.debug("pool_get", pool=pool_name, requested=count, retrieved=len(parsed_items))
             return parsed_items
 
         except Exception as e:
+            self.breaker.record_failure()
             logger.error("pool_get_failed", pool=pool_name, error=str(e))
             return []
 
@@ -137,7 +157,7 @@ class RedisClient:
             pool_name: Name of the pool
             data: List of data items to add
         """
-        if not self.client:
+        if not self._available():
             return
 
         try:
@@ -152,10 +172,12 @@ class RedisClient:
                 ttl = await self.client.ttl(pool_key)
                 if ttl == -1:  # No TTL set
                     await self.client.expire(pool_key, self.settings.cache_ttl_seconds)
+            self.breaker.record_success()
 
             logger.debug("pool_add", pool=pool_name, count=len(data))
 
         except Exception as e:
+            self.breaker.record_failure()
             logger.error("pool_add_failed", pool=pool_name, error=str(e))
 
     async def get_pool_size(self, pool_name: str) -> int:
@@ -167,17 +189,52 @@ class RedisClient:
         Returns:
             Number of items in pool
         """
-        if not self.client:
+        if not self._available():
             return 0
 
         try:
             pool_key = f"pool:{pool_name}"
             size = await self.client.llen(pool_key)
+            self.breaker.record_success()
             return size
         except Exception as e:
+            self.breaker.record_failure()
             logger.error("pool_size_failed", pool=pool_name, error=str(e))
             return 0
 
+    async def run_script(self, script: str, keys: list[str], args: list[Any]) -> Any:
+        """Run a Lua script (via EVALSHA, loading it on first use).
+
+        Args:
+            script: Lua source
+            keys: Redis keys the script touches
+            args: Script arguments
+
+        Returns:
+            Script result, or None if Redis is unavailable
+        """
+        if not self._available():
+            return None
+
+        try:
+            if script not in self._scripts:
+                self._scripts[script] = self.client.register_script(script)
+            result = await self._scripts[script](keys=keys, args=args)
+            self.breaker.record_success()
+            return result
+        except Exception as e:
+            self.breaker.record_failure()
+            logger.error("script_failed", keys=keys, error=str(e))
+            return None
+
+    def _available(self) -> bool:
+        """Check if Redis is connected and its circuit lets the call through.
+
+        Returns:
+            True if an operation may be attempted
+        """
+        return self.client is not None and self.breaker.allow()
+
     def build_cache_key(self, domain: str, entity: str, **kwargs: Any) -> str:
         """Build cache key from request parameters.
 
@@ -0,0 +1,17 @@
+"""Shared types for streaming LLM responses."""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class StreamChunk:
+    """A piece of a streamed LLM response.
+
+    Text chunks carry model output as it arrives. The final chunk has empty
+    text and carries the provider response (full content, token usage and
+    stop reason).
+    """
+
+    text: str
+    response: Any | None = None  # ClaudeResponse or VLLMResponse on the final chunk
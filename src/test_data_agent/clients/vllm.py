@@ -1,15 +1,45 @@
-"""vLLM client using OpenAI-compatible API."""
+"""vLLM client using OpenAI-compatible API.
+
+vLLM's throughput comes from continuous batching: sequences that are in
+flight together are decoded together. The client keeps up to
+``vllm_max_concurrency`` requests in flight over a connection pool of the
+same size, so the LLM generator's parallel chunk calls fill the server's
+batch.
+"""
 
 import asyncio
+import itertools
 import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator
 
-from openai import AsyncOpenAI, APIError, RateLimitError, APITimeoutError
+import httpx
+from openai import AsyncOpenAI, APIError, RateLimitError
+from openai import DefaultAsyncHttpxClient
+from openai import APIConnectionError, InternalServerError
 
+from test_data_agent.cache.response_cache import ResponseCache, response_key
+from test_data_agent.clients.streaming import StreamChunk
 from test_data_agent.config import Settings
+from test_data_agent.resilience.circuit_breaker import CircuitBreaker, get_circuit_breakers
+from test_data_agent.resilience.retry import RetryPolicy, retry_after_seconds
 from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
 
 logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+
+def is_outage(error: Exception) -> bool:
+    """Check whether an API error means the vLLM server is unavailable.
+
+    Args:
+        error: Exception raised by the API call
+
+    Returns:
+        True for connection failures, timeouts, rate limiting and 5xx responses
+    """
+    return isinstance(error, (APIConnectionError, RateLimitError, InternalServerError))
 
 
 @dataclass
@@ -20,36 +50,73 @@ class VLLMResponse:
     tokens_used: int  # Approximate, vLLM may not return exact counts
     model: str
     stop_reason: str
+    output_tokens: int = 0  # generated tokens only
 
 
 class VLLMClient:
     """Client for vLLM using OpenAI-compatible API."""
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
         """Initialize vLLM client.
 
         Args:
             settings: Application settings with vLLM config
+            breaker: Circuit breaker (defaults to the shared "vllm" breaker)
+            response_cache: Exact-match cache consulted before each ``generate`` call
+            retry_policy: Retry policy (defaults to one built from settings)
         """
         self.settings = settings
+        self.response_cache = response_cache
+        self.breaker = breaker or get_circuit_breakers().get(
+            "vllm",
+            settings.circuit_breaker_failure_threshold,
+            settings.circuit_breaker_recovery_seconds,
+        )
+        # One connection per in-flight sequence; more requests queue on the slots
+        self.http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=settings.vllm_max_concurrency,
+                max_keepalive_connections=settings.vllm_max_concurrency,
+            )
+        )
         self.client = AsyncOpenAI(
             base_url=settings.vllm_base_url,
             api_key="dummy",  # vLLM doesn't require real API key
+            http_client=self.http_client,
+            max_retries=0,  # retry_policy retries, within the request's budget
+        )
+        self._slots = asyncio.Semaphore(settings.vllm_max_concurrency)
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=settings.llm_retry_max_attempts,
+            base_delay=settings.llm_retry_base_delay_seconds,
+            max_delay=settings.llm_retry_max_delay_seconds,
         )
-        self.max_retries = 3
-        self.base_delay = 1.0  # seconds
         logger.info(
             "vllm_client_initialized",
             base_url=settings.vllm_base_url,
             model=settings.vllm_model,
+            max_concurrency=settings.vllm_max_concurrency,
         )
 
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
+        logger.info("vllm_client_closed")
+
     async def generate(
         self,
         system: str,
         user: str,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        cached_prefix: str | None = None,
+        json_schema: dict | None = None,
     ) -> VLLMResponse:
         """Generate text with vLLM.
 
@@ -58,91 +125,236 @@ class VLLMClient:
             user: User prompt
             max_tokens: Max tokens to generate
             temperature: Temperature (defaults to settings)
+            cached_prefix: Stable start of the user prompt, placed first so
+                vLLM's automatic prefix caching can reuse it
+            json_schema: JSON Schema the output must follow, enforced by
+                vLLM's guided decoding (``guided_json``)
 
         Returns:
             VLLMResponse with content and metadata
 
         Raises:
             APIError: On API errors
+            CircuitOpenError: If the vLLM circuit is open
         """
         max_tokens = max_tokens or self.settings.claude_max_tokens
         temperature = temperature if temperature is not None else self.settings.claude_temperature
+        user = (cached_prefix or "") + user
+
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = response_key(
+                self.settings.vllm_model, system, user, temperature, max_tokens, json_schema
+            )
+            cached = await self.response_cache.get("vllm", cache_key)
+            if cached is not None:
+                logger.info("vllm_response_cache_hit", tokens_saved=cached["tokens_used"])
+                return VLLMResponse(**cached)
+
+        delay = None
+        async with self.breaker.guard(is_failure=is_outage):
+            for attempt in itertools.count():
+                try:
+                    logger.debug(
+                        "vllm_api_call",
+                        attempt=attempt + 1,
+                        model=self.settings.vllm_model,
+                    )
 
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(
-                    "vllm_api_call",
-                    attempt=attempt + 1,
-                    model=self.settings.vllm_model,
-                )
-
-                # vLLM uses OpenAI-compatible chat completions API
-                response = await self.client.chat.completions.create(
-                    model=self.settings.vllm_model,
-                    messages=[
-                        {"role": "system", "content": system},
-                        {"role": "user", "content": user},
-                    ],
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
-
-                choice = response.choices[0]
-                content = choice.message.content or ""
-
-                # vLLM may not always return usage info
-                tokens_used = 0
-                if response.usage:
-                    tokens_used = response.usage.prompt_tokens + response.usage.completion_tokens
-
-                logger.info(
-                    "vllm_api_success",
-                    tokens_used=tokens_used,
-                    finish_reason=choice.finish_reason,
-                )
-
-                return VLLMResponse(
-                    content=content,
-                    tokens_used=tokens_used,
-                    model=self.settings.vllm_model,
-                    stop_reason=choice.finish_reason or "stop",
-                )
-
-            except RateLimitError:
-                if attempt < self.max_retries - 1:
-                    delay = self.base_delay * (2**attempt)
+                    # vLLM uses OpenAI-compatible chat completions API
+                    async with self._slots:
+                        metrics.llm_request_started("vllm")
+                        try:
+                            response = await self.client.chat.completions.create(
+                                model=self.settings.vllm_model,
+                                messages=[
+                                    {"role": "system", "content": system},
+                                    {"role": "user", "content": user},
+                                ],
+                                max_tokens=max_tokens,
+                                temperature=temperature,
+                                **self._guided(json_schema),
+                            )
+                        finally:
+                            metrics.llm_request_finished("vllm")
+
+                    choice = response.choices[0]
+                    content = choice.message.content or ""
+
+                    # vLLM may not always return usage info
+                    tokens_used = 0
+                    output_tokens = 0
+                    if response.usage:
+                        tokens_used = (
+                            response.usage.prompt_tokens + response.usage.completion_tokens
+                        )
+                        output_tokens = response.usage.completion_tokens
+
+                    logger.info(
+                        "vllm_api_success",
+                        tokens_used=tokens_used,
+                        finish_reason=choice.finish_reason,
+                    )
+
+                    result = VLLMResponse(
+                        content=content,
+                        tokens_used=tokens_used,
+                        model=self.settings.vllm_model,
+                        stop_reason=choice.finish_reason or "stop",
+                        output_tokens=output_tokens,
+                    )
+                    if cache_key is not None:
+                        await self.response_cache.set("vllm", cache_key, asdict(result))
+                    return result
+
+                except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                    delay = self.retry_policy.next_delay(
+                        "vllm", attempt, delay, retry_after_seconds(e)
+                    )
+                    if delay is None:
+                        logger.error("vllm_retries_exhausted", error=type(e).__name__)
+                        raise
                     logger.warning(
-                        "vllm_rate_limit",
+                        "vllm_retry",
                         attempt=attempt + 1,
                         retry_delay=delay,
+                        error=type(e).__name__,
                     )
                     await asyncio.sleep(delay)
-                else:
-                    logger.error("vllm_rate_limit_exhausted")
+
+                except APIError as e:
+                    logger.error("vllm_api_error", error=str(e))
                     raise
 
-            except APITimeoutError:
-                if attempt < self.max_retries - 1:
-                    delay = self.base_delay * (2**attempt)
+                except Exception as e:
+                    logger.error("vllm_unexpected_error", error=str(e), type=type(e).__name__)
+                    raise
+
+    async def stream(
+        self,
+        system: str,
+        user: str,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        cached_prefix: str | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream text from vLLM as it is generated.
+
+        Failures before the first token are retried like ``generate``; once
+        text has been yielded, errors propagate to the caller.
+
+        Args:
+            system: System prompt
+            user: User prompt
+            max_tokens: Max tokens to generate
+            temperature: Temperature (defaults to settings)
+            cached_prefix: Stable start of the user prompt
+
+        Yields:
+            StreamChunk per text delta, then a final chunk with the VLLMResponse
+
+        Raises:
+            CircuitOpenError: If the vLLM circuit is open
+        """
+        max_tokens = max_tokens or self.settings.claude_max_tokens
+        temperature = temperature if temperature is not None else self.settings.claude_temperature
+        user = (cached_prefix or "") + user
+
+        delay = None
+        async with self.breaker.guard(is_failure=is_outage):
+            for attempt in itertools.count():
+                yielded = False
+                try:
+                    logger.debug(
+                        "vllm_stream_call",
+                        attempt=attempt + 1,
+                        model=self.settings.vllm_model,
+                    )
+
+                    parts: list[str] = []
+                    finish_reason = None
+                    tokens_used = 0
+                    output_tokens = 0
+                    async with self._slots:
+                        response_stream = await self.client.chat.completions.create(
+                            model=self.settings.vllm_model,
+                            messages=[
+                                {"role": "system", "content": system},
+                                {"role": "user", "content": user},
+                            ],
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            stream=True,
+                            stream_options={"include_usage": True},
+                        )
+
+                        async for event in response_stream:
+                            if event.usage:
+                                tokens_used = (
+                                    event.usage.prompt_tokens + event.usage.completion_tokens
+                                )
+                                output_tokens = event.usage.completion_tokens
+                            if not event.choices:
+                                continue
+                            choice = event.choices[0]
+                            if choice.finish_reason:
+                                finish_reason = choice.finish_reason
+                            text = choice.delta.content if choice.delta else None
+                            if text:
+                                parts.append(text)
+                                yielded = True
+                                yield StreamChunk(text=text)
+
+                    logger.info(
+                        "vllm_stream_success",
+                        tokens_used=tokens_used,
+                        finish_reason=finish_reason,
+                    )
+                    yield StreamChunk(
+                        text="",
+                        response=VLLMResponse(
+                            content="".join(parts),
+                            tokens_used=tokens_used,
+                            model=self.settings.vllm_model,
+                            stop_reason=finish_reason or "stop",
+                            output_tokens=output_tokens,
+                        ),
+                    )
+                    return
+
+                except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                    if not yielded:
+                        delay = self.retry_policy.next_delay(
+                            "vllm", attempt, delay, retry_after_seconds(e)
+                        )
+                    if yielded or delay is None:
+                        logger.error("vllm_stream_failed", error=str(e))
+                        raise
                     logger.warning(
-                        "vllm_timeout",
+                        "vllm_stream_retry",
                         attempt=attempt + 1,
                         retry_delay=delay,
+                        error=type(e).__name__,
                     )
                     await asyncio.sleep(delay)
-                else:
-                    logger.error("vllm_timeout_exhausted")
+
+                except APIError as e:
+                    logger.error("vllm_stream_api_error", error=str(e))
                     raise
 
-            except APIError as e:
-                logger.error("vllm_api_error", error=str(e))
-                raise
+    @staticmethod
+    def _guided(json_schema: dict | None) -> dict:
+        """Request arguments enabling guided decoding for a JSON Schema.
 
-            except Exception as e:
-                logger.error("vllm_unexpected_error", error=str(e), type=type(e).__name__)
-                raise
+        Args:
+            json_schema: JSON Schema, or None for unconstrained output
 
-        raise APIError("Max retries exceeded")
+        Returns:
+            Extra keyword arguments for ``chat.completions.create``
+        """
+        if json_schema is None:
+            return {}
+        return {"extra_body": {"guided_json": json_schema}}
 
     async def generate_json(
         self,
@@ -150,6 +362,7 @@ class VLLMClient:
         user: str,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        cached_prefix: str | None = None,
     ) -> dict:
         """Generate JSON response with vLLM.
 
@@ -158,6 +371,7 @@ class VLLMClient:
             user: User prompt
             max_tokens: Max tokens to generate
             temperature: Temperature
+            cached_prefix: Stable start of the user prompt
 
         Returns:
             Parsed JSON dict
@@ -166,7 +380,7 @@ class VLLMClient:
             ValueError: If response is not valid JSON
             APIError: On API errors
         """
-        response = await self.generate(system, user, max_tokens, temperature)
+        response = await self.generate(system, user, max_tokens, temperature, cached_prefix)
 
         # Parse JSON from response
         import re
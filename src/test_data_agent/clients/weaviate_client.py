@@ -6,6 +6,11 @@ import weaviate
 from weaviate.classes.query import MetadataQuery
 
 from test_data_agent.config import Settings
+from test_data_agent.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breakers,
+)
 from test_data_agent.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -19,27 +24,41 @@ class WeaviateClient:
     COLLECTION_DEFECTS = "DefectPattern"
     COLLECTION_PROD_SAMPLES = "ProductionSample"
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, breaker: CircuitBreaker | None = None):
         """Initialize Weaviate client.
 
         Args:
             settings: Application settings with Weaviate config
+            breaker: Circuit breaker (defaults to the shared "weaviate" breaker)
         """
         self.settings = settings
         self.client: weaviate.WeaviateClient | None = None
+        self.breaker = breaker or get_circuit_breakers().get(
+            "weaviate",
+            settings.circuit_breaker_failure_threshold,
+            settings.circuit_breaker_recovery_seconds,
+        )
         logger.info(
             "weaviate_client_initialized",
             url=settings.weaviate_url,
         )
 
     async def connect(self) -> None:
-        """Connect to Weaviate instance."""
+        """Connect to Weaviate instance.
+
+        Raises:
+            CircuitOpenError: If the Weaviate circuit is open
+        """
         try:
-            self.client = weaviate.connect_to_local(
-                host=self.settings.weaviate_url.replace("http://", "").replace(":8080", ""),
-                port=8080,
-            )
+            async with self.breaker.guard():
+                self.client = weaviate.connect_to_local(
+                    host=self.settings.weaviate_url.replace("http://", "").replace(":8080", ""),
+                    port=8080,
+                )
             logger.info("weaviate_connected", url=self.settings.weaviate_url)
+        except CircuitOpenError:
+            logger.warning("weaviate_circuit_open", url=self.settings.weaviate_url)
+            raise
         except Exception as e:
             logger.error("weaviate_connection_error", error=str(e))
             raise
@@ -68,6 +87,8 @@ class WeaviateClient:
         """
         if not self.client:
             raise RuntimeError("Client not connected. Call connect() first.")
+        if not self.breaker.allow():
+            return []
 
         try:
             collection_obj = self.client.collections.get(collection)
@@ -87,6 +108,7 @@ class WeaviateClient:
                     "score": obj.metadata.score if obj.metadata else None,
                 }
                 results.append(result)
+            self.breaker.record_success()
 
             logger.info(
                 "weaviate_search_complete",
@@ -98,6 +120,7 @@ class WeaviateClient:
             return results
 
         except Exception as e:
+            self.breaker.record_failure()
             logger.error(
                 "weaviate_search_error",
                 collection=collection,
@@ -26,11 +26,45 @@ class Settings(BaseSettings):
     claude_model: str = "claude-sonnet-4-20250514"
     claude_max_tokens: int = 4096
     claude_temperature: float = 0.7
+    claude_max_connections: int = 100
+    claude_max_keepalive_connections: int = 20
+    claude_keepalive_expiry: float = 30.0  # seconds
+    claude_http2: bool = True
+    claude_prompt_caching: bool = True
+
+    # LLM - Token planning
+    llm_token_budget: int = 0  # Default per-request token budget, 0 = unlimited
+    llm_token_safety_margin: float = 1.25  # Headroom over the per-record estimate
+    llm_max_parallel_calls: int = 4  # Concurrent calls for requests split into chunks
+    llm_structured_output: bool = True  # Hold output to the schema (tool use / guided_json)
+    llm_compact_output: bool = False  # Request records as rows under a column header
+    llm_field_level: bool = False  # LLM writes only free-text fields; the rest are local
+
+    # LLM - Provider selection
+    llm_quality_preference: float = 1.5  # vLLM must be this many times faster to win
+    llm_max_error_rate: float = 0.5  # Providers failing more often are tried last
+
+    # LLM - Request hedging (opt-in)
+    llm_hedging_enabled: bool = False
+    llm_hedge_percentile: float = 0.95  # Hedge calls slower than this latency percentile
+    llm_hedge_min_delay_seconds: float = 1.0
+    llm_hedge_budget_per_minute: int = 10  # Caps extra token spend from hedges
+
+    # LLM - Offline batch jobs (Anthropic Message Batches; results within 24 hours)
+    llm_batch_enabled: bool = False
+    llm_batch_poll_interval_seconds: float = 60.0
+    llm_batch_job_ttl_seconds: int = 604800  # 7 days; job status and records kept in Redis
+
+    # LLM - Prices for cost estimates (USD per million tokens)
+    claude_input_cost_per_mtok: float = 3.0
+    claude_output_cost_per_mtok: float = 15.0
+    vllm_cost_per_mtok: float = 0.0  # Self-hosted; set to the GPU cost per token if known
 
     # LLM - Local vLLM
     vllm_base_url: str = "http://vllm:8000/v1"
     vllm_model: str = "meta-llama/Meta-Llama-3-8B-Instruct"
     use_local_llm: bool = False
+    vllm_max_concurrency: int = 32  # Requests kept in flight to vLLM (continuous batching width)
 
     # RAG - Weaviate
     weaviate_url: str = "http://weaviate:8080"
@@ -38,15 +72,52 @@ class Settings(BaseSettings):
     rag_collection_patterns: str = "testdata_patterns"
     rag_collection_defects: str = "testdata_defects"
     rag_top_k: int = 5
+    rag_prompt_max_examples: int = 5  # Most diverse RAG examples shown in a prompt
+    rag_prompt_token_budget: int = 1500  # Input tokens for RAG examples (0 = unlimited)
 
     # Cache - Redis
     redis_url: str = "redis://redis:6379/0"
     cache_ttl_seconds: int = 86400  # 24 hours
 
+    # LLM response cache (exact prompt matches; none, sqlite or redis)
+    llm_response_cache_backend: str = "none"
+    llm_response_cache_path: str = ".cache/llm_responses.sqlite3"
+    llm_response_cache_max_entries: int = 10000
+
+    # LLM record reservoir (surplus records kept in Redis pools)
+    reservoir_enabled: bool = False  # Over-generation adds output tokens; opt in per deployment
+    reservoir_overgenerate_ratio: float = 0.5
+    reservoir_overgenerate_max_count: int = 50  # Only over-generate for small requests
+    reservoir_max_age_seconds: int = 21600  # 6 hours
+    reservoir_min_coherence: float = 0.7
+
+    # Cluster-wide Anthropic rate limit shared through Redis (0 = unlimited)
+    anthropic_requests_per_minute: int = 0
+    anthropic_tokens_per_minute: int = 0
+    rate_limit_max_wait_seconds: float = 30.0  # Longest wait for calls without a deadline
+
+    # LLM retries (decorrelated jitter; the budget is shared by all calls of a request)
+    llm_retry_max_attempts: int = 3  # Calls per LLM request, first included
+    llm_retry_base_delay_seconds: float = 1.0
+    llm_retry_max_delay_seconds: float = 20.0  # Cap on computed backoff (retry-after may exceed)
+    llm_retry_budget: int = 4  # Retries per gRPC request, parse retries included
+    llm_retry_budget_wait_seconds: float = 30.0  # Backoff per gRPC request
+
+    # Circuit breakers (Claude, vLLM, Weaviate, Redis)
+    circuit_breaker_failure_threshold: int = 5  # Consecutive failures that open a circuit
+    circuit_breaker_recovery_seconds: float = 30.0  # Open time before a probe call
+
     # Generation
     max_sync_records: int = 1000
     default_batch_size: int = 50
+    progressive_deadline_margin_seconds: float = 0.5  # Left to finish a progressive stream
     coherence_threshold: float = 0.85
+    coherence_refine_enabled: bool = True  # Fix or regenerate records below the threshold
+    coherence_refine_max_attempts: int = 2  # Batched LLM regeneration calls per request
+    coherence_refine_timeout_seconds: float = 15.0  # Time budget for those calls
+    amplification_seed_count: int = 20  # LLM seed records per amplified request
+    amplification_min_count: int = 0  # Auto-route cart/order requests this large (0 = off)
+    spec_cache_ttl_seconds: int = 604800  # 7 days; generation specs kept in Redis
 
     # Observability
     prometheus_enabled: bool = True
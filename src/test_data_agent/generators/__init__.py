@@ -5,6 +5,12 @@ from test_data_agent.generators.traditional import TraditionalGenerator
 from test_data_agent.generators.llm import LLMGenerator
 from test_data_agent.generators.rag import RAGGenerator
 from test_data_agent.generators.hybrid import HybridGenerator
+from test_data_agent.generators.amplified import AmplifiedGenerator
+from test_data_agent.generators.spec import SpecGenerator
+from test_data_agent.generators.field_level import FieldLevelGenerator
+from test_data_agent.generators.refiner import CoherenceRefiner, RefinementResult
+from test_data_agent.generators.progressive import ProgressiveGenerator
+from test_data_agent.generators.batch_job import BatchJob, BatchJobRunner, BatchJobState
 
 __all__ = [
     "BaseGenerator",
@@ -13,4 +19,13 @@ __all__ = [
     "LLMGenerator",
     "RAGGenerator",
     "HybridGenerator",
+    "AmplifiedGenerator",
+    "SpecGenerator",
+    "FieldLevelGenerator",
+    "CoherenceRefiner",
+    "RefinementResult",
+    "ProgressiveGenerator",
+    "BatchJob",
+    "BatchJobRunner",
+    "BatchJobState",
 ]
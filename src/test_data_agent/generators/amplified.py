@@ -0,0 +1,378 @@
+"""Exemplar amplification: a few LLM records expanded into many variations."""
+
+import copy
+import random
+import re
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from test_data_agent.generators.base import BaseGenerator, GenerationResult
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.validators.coherence import CoherenceScorer
+from test_data_agent.validators.constraint import constraints_to_dict
+from test_data_agent.validators.derived import recompute_totals
+from test_data_agent.validators.repair import RepairEngine
+
+logger = get_logger(__name__)
+
+TRAILING_DIGITS = re.compile(r"\d+(?=\D*$)")
+UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I)
+MAX_TIMESTAMP_SHIFT = timedelta(days=30)
+
+
+class AmplifiedGenerator(BaseGenerator):
+    """Asks the LLM for a small seed set and expands it locally.
+
+    Each additional record is a schema-aware mutation of a seed: IDs are
+    re-drawn, timestamps shifted together, item quantities and prices
+    perturbed, items swapped for another seed product of the same category
+    group (with that product's price), and totals recomputed. A mutation is
+    repaired against the request's constraints and kept only if it is then
+    valid and its coherence score stays at or above ``coherence_threshold``
+    (or the seed's own score, if lower).
+    """
+
+    def __init__(
+        self,
+        llm_generator: LLMGenerator,
+        coherence_scorer: CoherenceScorer,
+        repair_engine: RepairEngine | None = None,
+        seed_count: int = 20,
+        coherence_threshold: float = 0.85,
+        max_mutation_attempts: int = 3,
+        swap_probability: float = 0.3,
+        rng: random.Random | None = None,
+    ):
+        """Initialize amplified generator.
+
+        Args:
+            llm_generator: Generator producing the seed records
+            coherence_scorer: Scorer used to reject incoherent mutations
+            repair_engine: Engine holding mutations to the schema and request constraints
+            seed_count: Number of seed records requested from the LLM
+            coherence_threshold: Minimum coherence score for mutations
+            max_mutation_attempts: Full mutations tried before falling back to
+                an ID/timestamp-only variation
+            swap_probability: Chance of swapping each item within its category group
+            rng: Random number generator (for reproducible output)
+        """
+        self.llm_generator = llm_generator
+        self.coherence_scorer = coherence_scorer
+        self.repair_engine = repair_engine or RepairEngine()
+        self.seed_count = seed_count
+        self.coherence_threshold = coherence_threshold
+        self.max_mutation_attempts = max_mutation_attempts
+        self.swap_probability = swap_probability
+        self.rng = rng or random.Random()
+
+    async def generate(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        context: dict | None = None,
+    ) -> GenerationResult:
+        """Generate seed records with the LLM and amplify them to the requested count.
+
+        Args:
+            request: Generate data request
+            context: Optional context (e.g., schema_dict)
+
+        Returns:
+            GenerationResult with seed and amplified records
+        """
+        start_time = time.time()
+        schema_dict = context.get("schema_dict", {}) if context else {}
+
+        seed_request = test_data_pb2.GenerateRequest()
+        seed_request.CopyFrom(request)
+        seed_request.count = min(self.seed_count, request.count)
+
+        logger.info(
+            "amplified_generate_start",
+            request_id=request.request_id,
+            count=request.count,
+            seeds=seed_request.count,
+        )
+
+        seed_result = await self.llm_generator.generate(seed_request, context)
+        seeds = [{k: v for k, v in record.items() if k != "_index"} for record in seed_result.data]
+        if not seeds:
+            raise ValueError("LLM returned no seed records to amplify")
+
+        seed_scores = [self.coherence_scorer.score(seed, request.entity) for seed in seeds]
+        catalog = self._build_catalog(seeds)
+        # Defect-triggering seeds violate constraints on purpose (as in LLMGenerator)
+        schema = schema_dict if schema_dict and not request.defect_triggering else None
+        constraints = constraints_to_dict(request.constraints)
+
+        data = [copy.deepcopy(seed) for seed in seeds[: request.count]]
+        fallbacks = 0
+        for i in range(len(data), request.count):
+            seed_index = i % len(seeds)
+            floor = min(self.coherence_threshold, seed_scores[seed_index])
+            record, full = self._amplify(
+                seeds[seed_index], schema_dict, schema, constraints, catalog, request.entity, floor
+            )
+            fallbacks += not full
+            data.append(record)
+
+        data = self._add_metadata_fields(data)
+        duration = time.time() - start_time
+
+        logger.info(
+            "amplified_generate_success",
+            request_id=request.request_id,
+            seeds=len(seeds),
+            records=len(data),
+            fallbacks=fallbacks,
+            duration=duration,
+        )
+
+        return GenerationResult(
+            data=data,
+            metadata={
+                "generation_path": "amplified",
+                "llm_provider": seed_result.metadata.get("llm_provider", "unknown"),
+                "llm_tokens_used": seed_result.metadata.get("llm_tokens_used", 0),
+                "llm_tokens_planned": seed_result.metadata.get("llm_tokens_planned", 0),
+                "seed_records": len(seeds),
+                "amplified_records": len(data) - len(seeds),
+                "mutation_fallbacks": fallbacks,
+                "generation_time_ms": duration * 1000,
+                "coherence_score": 0.0,  # Will be calculated by coherence scorer
+            },
+        )
+
+    async def generate_stream(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        batch_size: int = 50,
+        context: dict | None = None,
+    ):
+        """Stream amplified records in batches.
+
+        Args:
+            request: Generate data request
+            batch_size: Number of records per batch
+            context: Optional context
+
+        Yields:
+            GenerationResult for each batch
+        """
+        result = await self.generate(request, context)
+
+        for i in range(0, len(result.data), batch_size):
+            batch = result.data[i : i + batch_size]
+            yield GenerationResult(
+                data=batch,
+                metadata={
+                    **result.metadata,
+                    "batch_index": i // batch_size,
+                    "batch_size": len(batch),
+                },
+            )
+
+    def supports(self, request: test_data_pb2.GenerateRequest) -> bool:
+        """Check if amplification suits this request.
+
+        Args:
+            request: Generate data request
+
+        Returns:
+            True if the request needs more records than the seed set
+        """
+        return request.count > self.seed_count
+
+    def _amplify(
+        self,
+        seed: dict,
+        schema_dict: dict,
+        schema: dict | None,
+        constraints: dict,
+        catalog: dict[str, list[dict]],
+        entity: str,
+        floor: float,
+    ) -> tuple[dict, bool]:
+        """Create one valid, coherent variation of a seed.
+
+        Args:
+            seed: Seed record
+            schema_dict: Schema dictionary (field definitions guide the mutations)
+            schema: Schema mutations are repaired against, or None to skip repair
+            constraints: Request constraints by field (from ``constraints_to_dict``)
+            catalog: Seed items by category group (see ``_build_catalog``)
+            entity: Entity type
+            floor: Minimum acceptable coherence score
+
+        Returns:
+            Tuple of (record, True if a full mutation passed validation and the
+            coherence floor)
+        """
+        fields = schema_dict.get("fields", {}) if schema_dict else {}
+        for _ in range(self.max_mutation_attempts):
+            candidate = self._checked(
+                self._mutate(seed, fields, catalog, full=True), schema, constraints
+            )
+            if candidate and self.coherence_scorer.score(candidate, entity) >= floor:
+                return candidate, True
+
+        # ID and timestamp changes never affect the coherence score
+        fallback = self._checked(
+            self._mutate(seed, fields, catalog, full=False), schema, constraints
+        )
+        return fallback or copy.deepcopy(seed), False
+
+    def _checked(self, record: dict, schema: dict | None, constraints: dict) -> dict | None:
+        """Repair a mutation against the schema and request constraints.
+
+        Args:
+            record: Mutated record
+            schema: Schema to validate against, or None to accept the record as is
+            constraints: Request constraints by field
+
+        Returns:
+            The (repaired) record, or None if it still violates a constraint
+        """
+        if schema is None:
+            return record
+        result = self.repair_engine.repair(record, schema, constraints)
+        return result.record if result.valid else None
+
+    def _mutate(self, seed: dict, fields: dict, catalog: dict[str, list[dict]], full: bool) -> dict:
+        """Apply schema-aware mutations to a copy of a seed.
+
+        Args:
+            seed: Seed record
+            fields: Schema field definitions
+            catalog: Seed items by category group, candidates for item swaps
+            full: Also perturb items and recompute totals
+
+        Returns:
+            Mutated copy
+        """
+        record = copy.deepcopy(seed)
+        self._redraw_ids(record, fields)
+        self._shift_timestamps(record, fields)
+
+        if full and isinstance(record.get("items"), list):
+            for item in record["items"]:
+                if isinstance(item, dict):
+                    self._perturb_item(item, catalog)
+            recompute_totals(record)
+
+        return record
+
+    def _redraw_ids(self, record: dict, fields: dict) -> None:
+        """Re-draw identifier fields, keeping their format."""
+        for name, value in record.items():
+            field_type = fields.get(name, {}).get("type")
+            if not isinstance(value, str) or not (name.endswith("_id") or field_type == "uuid"):
+                continue
+            record[name] = self._redraw_id(value)
+
+    def _redraw_id(self, value: str) -> str:
+        """Re-draw one identifier (UUIDs are replaced, otherwise the last digit run)."""
+        if UUID_PATTERN.match(value):
+            return str(uuid.uuid4())
+        return TRAILING_DIGITS.sub(
+            lambda m: "".join(self.rng.choice("0123456789") for _ in m.group()), value
+        )
+
+    def _shift_timestamps(self, record: dict, fields: dict) -> None:
+        """Shift all date/datetime fields back by the same random offset.
+
+        A common offset keeps the record's chronological order intact.
+        """
+        shift = timedelta(seconds=self.rng.uniform(0, MAX_TIMESTAMP_SHIFT.total_seconds()))
+
+        for name, value in record.items():
+            field_type = fields.get(name, {}).get("type")
+            if not isinstance(value, str):
+                continue
+            if field_type not in ("date", "datetime") and not name.endswith("_at"):
+                continue
+            try:
+                if field_type == "date":
+                    shifted_date = date.fromisoformat(value) - timedelta(days=shift.days)
+                    record[name] = shifted_date.isoformat()
+                    continue
+                shifted = datetime.fromisoformat(value.replace("Z", "+00:00")) - shift
+            except ValueError:
+                continue
+            iso = shifted.isoformat()
+            record[name] = iso.replace("+00:00", "Z") if value.endswith("Z") else iso
+
+    def _perturb_item(self, item: dict, catalog: dict[str, list[dict]]) -> None:
+        """Maybe swap the item within its category group, then perturb quantity and price."""
+        name = item.get("name")
+        if isinstance(name, str) and self.rng.random() < self.swap_probability:
+            self._swap_item(item, name, catalog)
+
+        quantity = item.get("quantity")
+        if isinstance(quantity, int) and not isinstance(quantity, bool):
+            perturbed = max(1, quantity + self.rng.choice((-1, 0, 0, 1)))
+            item["quantity"] = min(perturbed, 10) if quantity <= 10 else perturbed
+
+        price_field = "price" if "price" in item else "unit_price"
+        price = item.get(price_field)
+        if isinstance(price, (int, float)) and not isinstance(price, bool):
+            item[price_field] = max(0.01, round(price * self.rng.uniform(0.9, 1.1), 2))
+
+    def _swap_item(self, item: dict, name: str, catalog: dict[str, list[dict]]) -> None:
+        """Replace the item with another seed product of its category group.
+
+        The product's price, SKU and category come with its name, so a swapped
+        item never keeps the price of the product it replaced.
+        """
+        choices = [
+            product
+            for product in catalog.get(self._category_group(name), [])
+            if product["name"].lower() != name.lower()
+        ]
+        if not choices:
+            return
+        product = self.rng.choice(choices)
+        price_field = "price" if "price" in item else "unit_price"
+        for key, value in product.items():
+            if key in ("price", "unit_price"):
+                key = price_field
+            if key in item or key == "name":
+                item[key] = copy.deepcopy(value)
+
+    def _build_catalog(self, seeds: list[dict]) -> dict[str, list[dict]]:
+        """Collect the seed items by category group, one entry per product name.
+
+        Args:
+            seeds: Seed records
+
+        Returns:
+            Product fields (name, price, SKU, category) by category group
+        """
+        catalog: dict[str, list[dict]] = {}
+        seen: set[str] = set()
+        for seed in seeds:
+            items = seed.get("items")
+            for item in items if isinstance(items, list) else []:
+                name = item.get("name") if isinstance(item, dict) else None
+                group = self._category_group(name) if isinstance(name, str) else None
+                if group is None or name.lower() in seen:
+                    continue
+                seen.add(name.lower())
+                catalog.setdefault(group, []).append(
+                    {
+                        k: item[k]
+                        for k in ("name", "price", "unit_price", "sku", "category")
+                        if k in item
+                    }
+                )
+        return catalog
+
+    def _category_group(self, name: str) -> str | None:
+        """Name of the category group ``name`` belongs to, if any."""
+        lowered = name.lower()
+        for group_name, group_items in self.coherence_scorer.CATEGORY_GROUPS.items():
+            if any(product in lowered for product in group_items):
+                return group_name
+        return None
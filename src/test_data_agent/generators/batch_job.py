@@ -0,0 +1,289 @@
+"""Offline LLM generation jobs run through a message batch backend.
+
+Nightly jobs generating tens of thousands of LLM records don't need
+interactive latency. A job plans the request into chunked prompts like the
+LLM generator does, submits them as one message batch (cheaper and outside
+the interactive rate limits), and polls until the batch has ended. The
+responses then go through the usual salvage, repair, validation and local
+coherence fixes, and the records are stored as the job's result.
+
+Job status and records live in Redis for ``ttl_seconds``, so any replica
+can report on a job and an unfinished job can be resumed after a restart.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+from test_data_agent.clients.message_batches import BatchCall, MessageBatchBackend
+from test_data_agent.clients.redis_client import RedisClient
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.generators.refiner import CoherenceRefiner
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.lru import LRUCache
+from test_data_agent.utils.metrics import MetricsCollector
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+
+class BatchJobState(Enum):
+    """Batch job states."""
+
+    IN_PROGRESS = "in_progress"  # Batch submitted, results not collected yet
+    COMPLETED = "completed"  # Records stored
+    FAILED = "failed"  # No usable records (see the job's error)
+
+
+@dataclass
+class BatchJob:
+    """Durable state of an offline LLM generation job."""
+
+    job_id: str
+    batch_id: str
+    request: dict  # GenerateRequest fields, to rebuild the request when collecting
+    schema: dict
+    llm_calls: int
+    state: str = BatchJobState.IN_PROGRESS.value
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: float = 0.0
+    failed_calls: int = 0  # Calls that errored, expired or were canceled
+    record_count: int = 0
+    llm_tokens_used: int = 0
+    coherence_score: float = 0.0
+    records_refined: int = 0
+    error: str = ""
+
+
+class BatchJobRunner:
+    """Submits, polls and collects offline LLM generation jobs."""
+
+    def __init__(
+        self,
+        llm_generator: LLMGenerator,
+        backend: MessageBatchBackend,
+        redis_client: RedisClient | None = None,
+        coherence_refiner: CoherenceRefiner | None = None,
+        poll_interval_seconds: float = 60.0,
+        ttl_seconds: int = 604800,
+        local_jobs: int = 32,
+    ):
+        """Initialize batch job runner.
+
+        Args:
+            llm_generator: Generator planning the prompts and parsing the responses
+            backend: Message batch backend running the prompts
+            redis_client: Redis client storing job status and records
+            coherence_refiner: Refiner applying local coherence fixes to the records
+            poll_interval_seconds: Wait between batch status checks
+            ttl_seconds: How long job status and records are kept
+            local_jobs: Jobs also kept in process, for when Redis is unavailable
+        """
+        self.llm_generator = llm_generator
+        self.backend = backend
+        self.redis_client = redis_client
+        self.coherence_refiner = coherence_refiner
+        self.poll_interval_seconds = poll_interval_seconds
+        self.ttl_seconds = ttl_seconds
+        self._jobs: LRUCache[BatchJob] = LRUCache(maxsize=local_jobs)
+        self._records: LRUCache[list[dict]] = LRUCache(maxsize=local_jobs)
+
+    @staticmethod
+    def job_key(job_id: str) -> str:
+        """Redis key of a job's status."""
+        return f"batchjob:{job_id}"
+
+    @staticmethod
+    def records_key(job_id: str) -> str:
+        """Redis key of a job's records."""
+        return f"batchjob:{job_id}:records"
+
+    async def submit(self, request: test_data_pb2.GenerateRequest, schema_dict: dict) -> BatchJob:
+        """Plan a request into prompts and submit them as one batch.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            The new job, in progress
+
+        Raises:
+            TokenBudgetExceededError: If the request does not fit its token budget
+        """
+        calls = [
+            BatchCall(custom_id=f"chunk-{i}", **call)
+            for i, call in enumerate(self.llm_generator.batch_calls(request, schema_dict))
+        ]
+        batch_id = await self.backend.submit(calls)
+        job = BatchJob(
+            job_id=uuid.uuid4().hex,
+            batch_id=batch_id,
+            request=MessageToDict(request, preserving_proto_field_name=True),
+            schema=schema_dict,
+            llm_calls=len(calls),
+        )
+        await self._save(job)
+        metrics.record_batch_job(job.state)
+        logger.info(
+            "batch_job_submitted",
+            job_id=job.job_id,
+            batch_id=batch_id,
+            request_id=request.request_id,
+            count=request.count,
+            calls=len(calls),
+        )
+        return job
+
+    async def get(self, job_id: str) -> BatchJob | None:
+        """Look up a job, preferring the shared copy in Redis.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            The job, or None if it is unknown or has expired
+        """
+        if self.redis_client:
+            stored = await self.redis_client.get(self.job_key(job_id))
+            if stored:
+                return BatchJob(**json.loads(stored))
+        return self._jobs.get(job_id)
+
+    async def records(self, job_id: str) -> list[dict]:
+        """Records of a completed job.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            The job's records ([] if it has none or they have expired)
+        """
+        if self.redis_client:
+            stored = await self.redis_client.get(self.records_key(job_id))
+            if stored:
+                return json.loads(stored)
+        return self._records.get(job_id) or []
+
+    async def poll(self, job: BatchJob) -> BatchJob:
+        """Check a job's batch once, collecting the results if it has ended.
+
+        Args:
+            job: Job to check
+
+        Returns:
+            The job, updated if its batch has ended
+        """
+        if job.state != BatchJobState.IN_PROGRESS.value:
+            return job
+        status = await self.backend.status(job.batch_id)
+        if not status.ended:
+            logger.debug(
+                "batch_job_pending",
+                job_id=job.job_id,
+                processing=status.processing,
+                succeeded=status.succeeded,
+            )
+            return job
+        return await self._collect(job)
+
+    async def run(self, job: BatchJob) -> BatchJob:
+        """Poll a job until it has finished.
+
+        Failed status checks are logged and retried at the next interval.
+
+        Args:
+            job: Job to run
+
+        Returns:
+            The finished job
+        """
+        while job.state == BatchJobState.IN_PROGRESS.value:
+            await asyncio.sleep(self.poll_interval_seconds)
+            try:
+                job = await self.poll(job)
+            except Exception as e:
+                logger.warning("batch_job_poll_error", job_id=job.job_id, error=str(e))
+        return job
+
+    async def _collect(self, job: BatchJob) -> BatchJob:
+        """Turn an ended batch's responses into the job's records.
+
+        Args:
+            job: Job whose batch has ended
+
+        Returns:
+            The job, completed or failed
+        """
+        request = ParseDict(job.request, test_data_pb2.GenerateRequest())
+        results = sorted(
+            await self.backend.results(job.batch_id),
+            key=lambda result: int(result.custom_id.rsplit("-", 1)[-1]),
+        )
+        responses = [result.response for result in results if result.response is not None]
+        job.failed_calls = len(results) - len(responses)
+        job.llm_tokens_used = sum(response.tokens_used for response in responses)
+        job.finished_at = time.time()
+
+        records: list[dict] = []
+        try:
+            result = self.llm_generator.records_from_responses(request, job.schema, responses)
+        except ValueError as e:
+            errors = sorted({r.error for r in results if r.error})
+            job.state = BatchJobState.FAILED.value
+            job.error = "; ".join([str(e), *errors])
+        else:
+            records = result.data
+            if self.coherence_refiner is not None:
+                # Local fixes only; regeneration would mean interactive LLM calls
+                refinement = await self.coherence_refiner.refine(
+                    request, records, job.schema, regenerate=False
+                )
+                records = refinement.records
+                job.records_refined = refinement.fixed_locally
+                if refinement.scores:
+                    job.coherence_score = sum(refinement.scores) / len(refinement.scores)
+            job.state = BatchJobState.COMPLETED.value
+            job.record_count = len(records)
+
+        await self._save(job, records)
+        metrics.record_batch_job(job.state, job.finished_at - job.submitted_at)
+        logger.info(
+            "batch_job_finished",
+            job_id=job.job_id,
+            state=job.state,
+            records=job.record_count,
+            failed_calls=job.failed_calls,
+            tokens_used=job.llm_tokens_used,
+            error=job.error or None,
+        )
+        return job
+
+    async def _save(self, job: BatchJob, records: list[dict] | None = None) -> None:
+        """Store a job (and its records) in Redis and in process.
+
+        Records are written before the status, so a completed job always
+        has its records.
+
+        Args:
+            job: Job to store
+            records: The job's records, once collected
+        """
+        self._jobs.put(job.job_id, job)
+        if records is not None:
+            self._records.put(job.job_id, records)
+        if not self.redis_client:
+            return
+        if records is not None:
+            await self.redis_client.set(
+                self.records_key(job.job_id), json.dumps(records), ttl=self.ttl_seconds
+            )
+        await self.redis_client.set(
+            self.job_key(job.job_id), json.dumps(asdict(job)), ttl=self.ttl_seconds
+        )
@@ -0,0 +1,353 @@
+"""Field-level hybrid generation: the LLM writes only the fields that need it.
+
+For text-heavy entities most fields (IDs, ratings, flags, timestamps) are
+produced by the traditional engine in microseconds, while the LLM spends its
+output tokens on every one of them. Here the traditional engine builds whole
+records first and the LLM is asked only for the LLM-worthy fields, keyed by
+record number, with each record's fixed values in the prompt so the text
+stays consistent with them (a 1-star review reads like one).
+"""
+
+import asyncio
+import json
+import math
+import time
+from collections import Counter
+from typing import AsyncIterator
+
+from test_data_agent.cache.reservoir import BYPASS_HINT
+from test_data_agent.generators.base import BaseGenerator, GenerationResult
+from test_data_agent.generators.llm import LLMGenerator, chunk_request
+from test_data_agent.generators.traditional import TraditionalGenerator
+from test_data_agent.prompts.templates import FIELD_LEVEL_NOTE
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.utils.fingerprint import schema_fingerprint
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.lru import LRUCache
+
+logger = get_logger(__name__)
+
+# Key the LLM copies into each entry so it can be merged into the right record
+RECORD_KEY = "_record"
+# Unflagged string fields longer than this are treated as free text
+LONG_TEXT_MIN_LENGTH = 200
+# Field types whose fixed values are shown to the LLM
+CONTEXT_TYPES = {"string", "enum", "integer", "float", "boolean"}
+
+
+def llm_fields(schema_dict: dict | None) -> list[str]:
+    """Top-level fields of a schema that need the LLM.
+
+    Fields flagged ``"llm": True`` are used when a schema has any flags;
+    otherwise unformatted strings longer than ``LONG_TEXT_MIN_LENGTH``
+    qualify.
+
+    Args:
+        schema_dict: Schema dictionary
+
+    Returns:
+        Field names, or an empty list when no field or every field qualifies
+    """
+    fields = schema_dict.get("fields", {}) if schema_dict else {}
+    flagged = [name for name, field_def in fields.items() if field_def.get("llm")]
+    if not flagged and not any("llm" in field_def for field_def in fields.values()):
+        flagged = [
+            name
+            for name, field_def in fields.items()
+            if field_def.get("type") == "string"
+            and not field_def.get("format")
+            and (field_def.get("max_length") or 0) > LONG_TEXT_MIN_LENGTH
+        ]
+    return flagged if len(flagged) < len(fields) else []
+
+
+class FieldLevelGenerator(BaseGenerator):
+    """Fills LLM-worthy fields of traditionally generated records with the LLM."""
+
+    def __init__(
+        self,
+        llm_generator: LLMGenerator,
+        traditional_generator: TraditionalGenerator,
+        cache_size: int = 128,
+    ):
+        """Initialize field-level generator.
+
+        Args:
+            llm_generator: Generator writing the LLM-worthy fields
+            traditional_generator: Engine producing the complete base records
+            cache_size: Reduced schemas kept in memory
+        """
+        self.llm_generator = llm_generator
+        self.traditional_generator = traditional_generator
+        self._schemas: LRUCache[dict] = LRUCache(cache_size)
+
+    def applies_to(self, request: test_data_pb2.GenerateRequest, schema_dict: dict) -> bool:
+        """Check if a request can be generated field by field.
+
+        Defect-triggering requests need whole-record edge cases, so they keep
+        the full LLM path.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            True if the schema has LLM-worthy fields
+        """
+        return not request.defect_triggering and bool(llm_fields(schema_dict))
+
+    def supports(self, request: test_data_pb2.GenerateRequest) -> bool:
+        """Check if field-level generation suits this request.
+
+        Args:
+            request: Generate data request
+
+        Returns:
+            True if the request's registry schema has LLM-worthy fields
+        """
+        return self.applies_to(request, self.traditional_generator._get_schema(request))
+
+    async def generate(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        context: dict | None = None,
+    ) -> GenerationResult:
+        """Generate base records locally and their LLM-worthy fields with the LLM.
+
+        Args:
+            request: Generate data request
+            context: Optional context (e.g., schema_dict)
+
+        Returns:
+            GenerationResult with merged records
+        """
+        start_time = time.time()
+        schema_dict = (context or {}).get("schema_dict") or self.traditional_generator._get_schema(
+            request
+        )
+        fields = llm_fields(schema_dict)
+        records = await self._base_records(request)
+        chunks = self._chunks(request, schema_dict, len(records))
+
+        logger.info(
+            "field_level_generate_start",
+            request_id=request.request_id,
+            count=len(records),
+            llm_fields=fields,
+            calls=len(chunks),
+        )
+
+        semaphore = asyncio.Semaphore(self.llm_generator.max_parallel_calls)
+
+        async def run_chunk(start: int, end: int) -> GenerationResult:
+            sub_request, sub_context = self._sub_request(request, schema_dict, records, start, end)
+            async with semaphore:
+                return await self.llm_generator.generate(sub_request, sub_context)
+
+        results = await asyncio.gather(*(run_chunk(start, end) for start, end in chunks))
+        filled: set[int] = set()
+        for (start, end), result in zip(chunks, results):
+            self._merge(records, result.data, fields, start, end, filled)
+
+        duration = time.time() - start_time
+        unfilled = len(records) - len(filled)
+        logger.info(
+            "field_level_generate_success",
+            request_id=request.request_id,
+            records=len(records),
+            unfilled=unfilled,
+            duration=duration,
+        )
+
+        return GenerationResult(
+            data=records,
+            metadata={
+                "generation_path": "llm",
+                "llm_provider": results[0].metadata.get("llm_provider", "unknown"),
+                "llm_tokens_used": sum(r.metadata.get("llm_tokens_used", 0) for r in results),
+                "llm_tokens_planned": sum(r.metadata.get("llm_tokens_planned", 0) for r in results),
+                "llm_fields": fields,
+                "llm_unfilled_records": unfilled,
+                "generation_time_ms": duration * 1000,
+                "coherence_score": 0.0,  # Will be calculated by coherence scorer
+            },
+        )
+
+    async def generate_stream(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        batch_size: int = 50,
+        context: dict | None = None,
+    ) -> AsyncIterator[GenerationResult]:
+        """Stream merged records as the LLM writes their fields.
+
+        Chunks are streamed one after another; records the LLM skipped are
+        sent last with their traditional values.
+
+        Args:
+            request: Generate data request
+            batch_size: Number of records per batch
+            context: Optional context (e.g., schema_dict)
+
+        Yields:
+            GenerationResult for each batch
+        """
+        start_time = time.time()
+        schema_dict = (context or {}).get("schema_dict") or self.traditional_generator._get_schema(
+            request
+        )
+        fields = llm_fields(schema_dict)
+        records = await self._base_records(request)
+        filled: set[int] = set()
+        batch_index = 0
+
+        def make_batch(batch: list[dict], provider: str) -> GenerationResult:
+            return GenerationResult(
+                data=batch,
+                metadata={
+                    "generation_path": "llm",
+                    "llm_provider": provider,
+                    "llm_fields": fields,
+                    "streamed": True,
+                    "generation_time_ms": (time.time() - start_time) * 1000,
+                    "coherence_score": 0.0,
+                    "batch_index": batch_index,
+                    "batch_size": len(batch),
+                },
+            )
+
+        for start, end in self._chunks(request, schema_dict, len(records)):
+            sub_request, sub_context = self._sub_request(request, schema_dict, records, start, end)
+            async for result in self.llm_generator.generate_stream(
+                sub_request, batch_size=batch_size, context=sub_context
+            ):
+                merged = self._merge(records, result.data, fields, start, end, filled)
+                if merged:
+                    yield make_batch(merged, result.metadata.get("llm_provider", "unknown"))
+                    batch_index += 1
+
+        unfilled = [record for i, record in enumerate(records) if i not in filled]
+        for i in range(0, len(unfilled), batch_size):
+            yield make_batch(unfilled[i : i + batch_size], "traditional")
+            batch_index += 1
+
+    async def _base_records(self, request: test_data_pb2.GenerateRequest) -> list[dict]:
+        """Generate complete records with the traditional engine."""
+        result = await self.traditional_generator.generate(request)
+        return result.data
+
+    def _chunks(
+        self, request: test_data_pb2.GenerateRequest, schema_dict: dict, count: int
+    ) -> list[tuple[int, int]]:
+        """Split the records into ranges that each fit one LLM call."""
+        plan = self.llm_generator.token_planner.plan(self.text_schema(schema_dict), count)
+        step = plan.records_per_call
+        return [(start, min(start + step, count)) for start in range(0, count, step)]
+
+    def text_schema(self, schema_dict: dict) -> dict:
+        """Schema the LLM fills: the LLM-worthy fields plus the record key (memoized).
+
+        Args:
+            schema_dict: Full schema dictionary
+
+        Returns:
+            Reduced schema dictionary
+        """
+
+        def build() -> dict:
+            fields = schema_dict.get("fields", {})
+            return {
+                "name": schema_dict.get("name", "unknown"),
+                "domain": schema_dict.get("domain", "unknown"),
+                "description": schema_dict.get("description", ""),
+                "fields": {
+                    RECORD_KEY: {
+                        "type": "integer",
+                        "required": True,
+                        "description": "Number of the record these fields belong to",
+                    },
+                    **{name: fields[name] for name in llm_fields(schema_dict)},
+                },
+                "coherence_rules": schema_dict.get("coherence_rules", []),
+            }
+
+        return self._schemas.get_or_compute(schema_fingerprint(schema_dict), build)
+
+    def _sub_request(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        schema_dict: dict,
+        records: list[dict],
+        start: int,
+        end: int,
+    ) -> tuple[test_data_pb2.GenerateRequest, dict]:
+        """Build the LLM request for records ``start`` to ``end``.
+
+        The fixed values of each record go into the request context; the
+        reservoir is bypassed since the entries only fit these records.
+
+        Returns:
+            Tuple of (request, generator context)
+        """
+        fields = schema_dict.get("fields", {})
+        lines = []
+        for i in range(start, end):
+            fixed = {
+                name: value
+                for name, value in records[i].items()
+                if name == "_scenario"
+                or (
+                    name in fields
+                    and not fields[name].get("llm")
+                    and fields[name].get("type") in CONTEXT_TYPES
+                    and not fields[name].get("format")
+                    and not name.endswith("_id")
+                )
+            }
+            lines.append(json.dumps({RECORD_KEY: i, **fixed}, ensure_ascii=False))
+
+        # Scenario counts follow the scenarios the base records in range were given
+        scenario_counts = None
+        if request.scenarios:
+            in_range = Counter(records[i].get("_scenario") for i in range(start, end))
+            scenario_counts = {
+                scenario.name: in_range[scenario.name] for scenario in request.scenarios
+            }
+        sub_request = chunk_request(request, end - start, scenario_counts)
+        sub_request.hints.append(BYPASS_HINT)
+        note = FIELD_LEVEL_NOTE.format(records="\n".join(lines))
+        sub_request.context = f"{request.context}\n\n{note}" if request.context else note
+        if request.token_budget:
+            sub_request.token_budget = math.ceil(
+                request.token_budget * (end - start) / max(request.count, 1)
+            )
+        return sub_request, {"schema_dict": self.text_schema(schema_dict)}
+
+    @staticmethod
+    def _merge(
+        records: list[dict],
+        entries: list[dict],
+        fields: list[str],
+        start: int,
+        end: int,
+        filled: set[int],
+    ) -> list[dict]:
+        """Copy LLM-written fields into their records.
+
+        Entries with a missing, out-of-range or already used record number
+        are ignored; those records keep their traditional values.
+
+        Returns:
+            Records filled by these entries
+        """
+        merged = []
+        for entry in entries:
+            ref = entry.get(RECORD_KEY)
+            if not isinstance(ref, int) or not start <= ref < end or ref in filled:
+                continue
+            for name in fields:
+                if name in entry:
+                    records[ref][name] = entry[name]
+            filled.add(ref)
+            merged.append(records[ref])
+        return merged
@@ -51,28 +51,8 @@ class HybridGenerator(BaseGenerator):
             entity=request.entity,
         )
 
-        # Step 1: Retrieve relevant patterns from RAG
-        rag_result = await self.rag_generator.generate(request, context)
-
-        rag_examples = []
-        if rag_result.data:
-            # Use RAG results as examples
-            rag_examples = rag_result.data
-            logger.info(
-                "hybrid_rag_retrieval",
-                request_id=request.request_id,
-                examples_retrieved=len(rag_examples),
-            )
-        else:
-            logger.warning(
-                "hybrid_no_rag_examples",
-                request_id=request.request_id,
-                falling_back="llm_only",
-            )
-
-        # Step 2: Pass RAG examples to LLM for informed generation
-        enhanced_context = context.copy() if context else {}
-        enhanced_context["rag_examples"] = rag_examples
+        rag_result, enhanced_context = await self._retrieve_examples(request, context)
+        rag_examples = enhanced_context["rag_examples"]
 
         # Use LLM to generate new data informed by RAG examples
         llm_result = await self.llm_generator.generate(request, context=enhanced_context)
@@ -95,7 +75,8 @@ class HybridGenerator(BaseGenerator):
                 "rag_examples_used": len(rag_examples),
                 "rag_collection": rag_result.metadata.get("rag_collection", "unknown"),
                 "llm_provider": llm_result.metadata.get("llm_provider", "unknown"),
-                "llm_tokens_used": llm_result.metadata.get("tokens_used", 0),
+                "llm_tokens_used": llm_result.metadata.get("llm_tokens_used", 0),
+                "llm_tokens_planned": llm_result.metadata.get("llm_tokens_planned", 0),
                 "generation_time_ms": duration * 1000,
                 "coherence_score": llm_result.metadata.get("coherence_score", 0.0),
             },
@@ -107,7 +88,10 @@ class HybridGenerator(BaseGenerator):
         batch_size: int = 50,
         context: dict | None = None,
     ):
-        """Stream hybrid-generated records in batches.
+        """Stream hybrid-generated records as the LLM produces them.
+
+        RAG retrieval runs first, then the LLM stream is forwarded batch by
+        batch so the first records arrive before the full response completes.
 
         Args:
             request: Generate data request
@@ -117,21 +101,62 @@ class HybridGenerator(BaseGenerator):
         Yields:
             GenerationResult for each batch
         """
-        # Use default implementation from BaseGenerator
-        result = await self.generate(request, context)
+        start_time = time.time()
+        rag_result, enhanced_context = await self._retrieve_examples(request, context)
 
-        # Yield in batches
-        for i in range(0, len(result.data), batch_size):
-            batch = result.data[i : i + batch_size]
+        async for result in self.llm_generator.generate_stream(
+            request, batch_size=batch_size, context=enhanced_context
+        ):
             yield GenerationResult(
-                data=batch,
+                data=result.data,
                 metadata={
                     **result.metadata,
-                    "batch_index": i // batch_size,
-                    "batch_size": len(batch),
+                    "generation_path": "hybrid",
+                    "rag_examples_used": len(enhanced_context["rag_examples"]),
+                    "rag_collection": rag_result.metadata.get("rag_collection", "unknown"),
+                    "generation_time_ms": (time.time() - start_time) * 1000,
                 },
             )
 
+    async def _retrieve_examples(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        context: dict | None,
+    ) -> tuple[GenerationResult, dict]:
+        """Retrieve RAG examples and build the LLM context from them.
+
+        Args:
+            request: Generate data request
+            context: Optional caller context
+
+        Returns:
+            Tuple of (RAG result, context enhanced with ``rag_examples``)
+        """
+        # Step 1: Retrieve relevant patterns from RAG
+        rag_result = await self.rag_generator.generate(request, context)
+
+        rag_examples = []
+        if rag_result.data:
+            # Use the stored patterns as examples; they are stable per pattern id
+            rag_examples = rag_result.metadata.get("rag_examples") or rag_result.data
+            logger.info(
+                "hybrid_rag_retrieval",
+                request_id=request.request_id,
+                examples_retrieved=len(rag_examples),
+            )
+        else:
+            logger.warning(
+                "hybrid_no_rag_examples",
+                request_id=request.request_id,
+                falling_back="llm_only",
+            )
+
+        # Step 2: Pass RAG examples to LLM for informed generation
+        enhanced_context = context.copy() if context else {}
+        enhanced_context["rag_examples"] = rag_examples
+
+        return rag_result, enhanced_context
+
     def supports(self, request: test_data_pb2.GenerateRequest) -> bool:
         """Check if hybrid generator can handle this request.
 
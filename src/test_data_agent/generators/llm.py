@@ -1,17 +1,100 @@
 """LLM-based data generator using Claude or vLLM."""
 
-import json
+import asyncio
+import math
 import time
+from collections import Counter
+from contextlib import aclosing
 
 from test_data_agent.generators.base import BaseGenerator, GenerationResult
-from test_data_agent.clients.claude import ClaudeClient
-from test_data_agent.clients.vllm import VLLMClient
+from test_data_agent.cache.reservoir import RecordReservoir
+from test_data_agent.clients.claude import ClaudeClient, ClaudeResponse
+from test_data_agent.clients.vllm import VLLMClient, VLLMResponse
+from test_data_agent.parsers.compact import RowFormat
+from test_data_agent.parsers.json_stream import JSONArrayStreamParser
+from test_data_agent.parsers.tolerant import recover_records
+from test_data_agent.planning.token_budget import TokenBudgetPlanner, TokenPlan
 from test_data_agent.prompts.builder import PromptBuilder
-from test_data_agent.validators.constraint import ConstraintValidator
+from test_data_agent.prompts.templates import CONTINUATION_NOTE
+from test_data_agent.resilience.hedging import RequestHedger
+from test_data_agent.resilience.retry import try_spend_retry
+from test_data_agent.router.provider_selector import ProviderSelector
+from test_data_agent.schemas.json_schema import JSONSchemaConverter
+from test_data_agent.validators.constraint import ConstraintValidator, constraints_to_dict
+from test_data_agent.validators.repair import RepairEngine, field_key
 from test_data_agent.proto import test_data_pb2
 from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
 
 logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+# Stop reasons of a response cut off at max_tokens (Claude, vLLM)
+TRUNCATED_STOP_REASONS = ("max_tokens", "length")
+
+
+def split_scenario_counts(
+    request: test_data_pb2.GenerateRequest, chunk_counts: list[int]
+) -> list[dict[str, int]] | None:
+    """Share a request's scenario record counts out over its chunks, in order.
+
+    Chunks are filled scenario by scenario, so the merged records have the
+    requested number of records per scenario. Records beyond the scenario
+    totals are left to the default scenario.
+
+    Args:
+        request: Generate data request
+        chunk_counts: Records per chunk
+
+    Returns:
+        Records per scenario for each chunk, or None if no scenario has a count
+    """
+    remaining = [[s.name, s.count] for s in request.scenarios if s.count > 0]
+    if not remaining:
+        return None
+
+    shares = []
+    for size in chunk_counts:
+        share: dict[str, int] = {}
+        while size and remaining:
+            name, left = remaining[0]
+            taken = min(size, left)
+            share[name] = share.get(name, 0) + taken
+            size -= taken
+            if taken == left:
+                remaining.pop(0)
+            else:
+                remaining[0][1] = left - taken
+        shares.append(share)
+    return shares
+
+
+def chunk_request(
+    request: test_data_pb2.GenerateRequest,
+    count: int,
+    scenario_counts: dict[str, int] | None = None,
+) -> test_data_pb2.GenerateRequest:
+    """Copy a request for a chunk of its records.
+
+    Args:
+        request: Generate data request
+        count: Records in the chunk
+        scenario_counts: Records per scenario in the chunk (None keeps the
+            request's scenarios as they are)
+
+    Returns:
+        Request for the chunk
+    """
+    chunk = test_data_pb2.GenerateRequest()
+    chunk.CopyFrom(request)
+    chunk.count = count
+    if scenario_counts is not None:
+        del chunk.scenarios[:]
+        for scenario in request.scenarios:
+            if scenario_counts.get(scenario.name):
+                chunk.scenarios.add().CopyFrom(scenario)
+                chunk.scenarios[-1].count = scenario_counts[scenario.name]
+    return chunk
 
 
 class LLMGenerator(BaseGenerator):
@@ -23,6 +106,16 @@ class LLMGenerator(BaseGenerator):
         vllm_client: VLLMClient | None,
         prompt_builder: PromptBuilder,
         constraint_validator: ConstraintValidator,
+        reservoir: RecordReservoir | None = None,
+        token_planner: TokenBudgetPlanner | None = None,
+        max_parallel_calls: int = 4,
+        provider_selector: ProviderSelector | None = None,
+        hedger: RequestHedger | None = None,
+        repair_engine: RepairEngine | None = None,
+        structured_output: bool = True,
+        json_schema_converter: JSONSchemaConverter | None = None,
+        compact_output: bool = False,
+        provider_parallel_calls: dict[str, int] | None = None,
     ):
         """Initialize LLM generator.
 
@@ -31,12 +124,40 @@ class LLMGenerator(BaseGenerator):
             vllm_client: Optional fallback vLLM client
             prompt_builder: Prompt builder for formatting prompts
             constraint_validator: Validator for checking generated data
+            reservoir: Optional reservoir of surplus records from earlier calls
+            token_planner: Planner sizing max_tokens and records per call
+            max_parallel_calls: Concurrent calls when a request is split into chunks
+            provider_selector: Selector routing calls to the provider expected to
+                finish first (defaults to Claude first, vLLM second)
+            hedger: Optional hedger sending a backup call when a call runs
+                past a percentile of recent latency
+            repair_engine: Engine repairing constraint violations in parsed records
+            structured_output: Constrain provider output to the schema's JSON Schema
+                (Claude tool use, vLLM guided decoding)
+            json_schema_converter: Converter from registry schemas to JSON Schema
+            compact_output: Request records as compact rows under a column
+                header instead of JSON objects, to cut output tokens
+            provider_parallel_calls: Per-provider overrides of max_parallel_calls
+                (e.g. a wide fan-out for vLLM's continuous batching)
         """
         self.claude_client = claude_client
         self.vllm_client = vllm_client
         self.prompt_builder = prompt_builder
         self.constraint_validator = constraint_validator
+        self.reservoir = reservoir
+        self.token_planner = token_planner or TokenBudgetPlanner()
+        self.max_parallel_calls = max_parallel_calls
+        self.provider_parallel_calls = provider_parallel_calls or {}
         self.max_retries = 2  # Retry on parse failure
+        self.clients: dict[str, ClaudeClient | VLLMClient] = {"claude": claude_client}
+        if vllm_client:
+            self.clients["vllm"] = vllm_client
+        self.provider_selector = provider_selector or ProviderSelector(list(self.clients))
+        self.hedger = hedger
+        self.repair_engine = repair_engine or RepairEngine(constraint_validator)
+        self.structured_output = structured_output
+        self.json_schemas = json_schema_converter or JSONSchemaConverter()
+        self.compact_output = compact_output
 
     async def generate(
         self,
@@ -45,6 +166,10 @@ class LLMGenerator(BaseGenerator):
     ) -> GenerationResult:
         """Generate data using LLM.
 
+        Records left over from earlier calls with the same schema and context
+        are served from the reservoir first; the LLM is only called for the
+        shortfall, plus a small surplus that is stored for later requests.
+
         Args:
             request: Generate data request
             context: Optional context (e.g., schema_dict, rag_examples)
@@ -53,12 +178,94 @@ class LLMGenerator(BaseGenerator):
             GenerationResult with generated data and metadata
         """
         start_time = time.time()
+        if not self.reservoir or not self.reservoir.enabled_for(request):
+            return await self._generate_llm(request, context, start_time)
+
+        schema_dict = context.get("schema_dict", {}) if context else {}
+        pool_name = self.reservoir.pool_name(request, schema_dict)
+        served = await self.reservoir.take(pool_name, request.count, request.entity)
+        shortfall = request.count - len(served)
+
+        if shortfall <= 0:
+            logger.info(
+                "llm_reservoir_hit",
+                request_id=request.request_id,
+                records=len(served),
+            )
+            return GenerationResult(
+                data=self._add_metadata_fields(served),
+                metadata={
+                    "generation_path": "llm",
+                    "llm_provider": "reservoir",
+                    "llm_tokens_used": 0,
+                    "llm_tokens_planned": 0,
+                    "generation_time_ms": (time.time() - start_time) * 1000,
+                    "coherence_score": 0.0,
+                    "reservoir_records": len(served),
+                },
+            )
+
+        surplus = self.reservoir.surplus(shortfall)
+        llm_request = test_data_pb2.GenerateRequest()
+        llm_request.CopyFrom(request)
+        llm_request.count = shortfall + surplus
+
+        try:
+            result = await self._generate_llm(llm_request, context, start_time)
+        except BaseException:
+            # Don't lose the records taken for this request
+            await self.reservoir.restore(pool_name, served, request.entity)
+            raise
+        generated, extra = result.data[:shortfall], result.data[shortfall:]
+        if extra:
+            await self.reservoir.put(pool_name, extra, request.entity, schema_dict)
+
+        logger.info(
+            "llm_reservoir_topup",
+            request_id=request.request_id,
+            served=len(served),
+            generated=len(generated),
+            stored_candidates=len(extra),
+        )
+        return GenerationResult(
+            data=self._add_metadata_fields(served + generated),
+            metadata={
+                **result.metadata,
+                "generation_time_ms": (time.time() - start_time) * 1000,
+                "reservoir_records": len(served),
+            },
+        )
+
+    async def _generate_llm(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        context: dict | None,
+        start_time: float,
+    ) -> GenerationResult:
+        """Generate data with the LLM providers, retrying on parse failures.
+
+        Args:
+            request: Generate data request
+            context: Optional context (e.g., schema_dict, rag_examples)
+            start_time: Start time for duration calculation
+
+        Returns:
+            GenerationResult with generated data and metadata
+        """
         schema_dict = context.get("schema_dict", {}) if context else {}
         rag_examples = context.get("rag_examples") if context else None
 
-        # Build prompts
-        system_prompt, user_prompt = self.prompt_builder.build_prompt(
-            request, schema_dict, rag_examples
+        # Size max_tokens and records per call from the expected output per record
+        parts = self.prompt_builder.build_prompt_parts(
+            request, schema_dict, rag_examples, compact=self.compact_output
+        )
+        plan = self.token_planner.plan(
+            schema_dict,
+            request.count,
+            prompt_tokens=self.token_planner.estimate_prompt_tokens(
+                parts.system, parts.prefix, parts.suffix
+            ),
+            budget=request.token_budget,
         )
 
         logger.info(
@@ -66,140 +273,484 @@ class LLMGenerator(BaseGenerator):
             request_id=request.request_id,
             count=request.count,
             entity=request.entity,
+            calls=plan.calls,
+            max_tokens=plan.max_tokens,
+            planned_tokens=plan.planned_tokens,
         )
 
-        # Try to generate with retries
-        for attempt in range(self.max_retries + 1):
+        # Try the provider expected to finish first, then the others in turn
+        choice = self.provider_selector.select(list(self.clients))
+        for attempt, provider in enumerate(choice.ranking):
             try:
-                # Try Claude first
-                logger.debug("calling_claude_api", request_id=request.request_id)
-                response = await self.claude_client.generate_json(
-                    system=system_prompt,
-                    user=user_prompt,
+                result = await self._generate_planned(
+                    provider,
+                    self.clients[provider],
+                    request,
+                    plan,
+                    schema_dict,
+                    rag_examples,
+                    start_time,
                 )
-                logger.debug(
-                    "claude_api_returned",
+                break
+            except Exception as e:
+                logger.error(
+                    "llm_generate_error",
                     request_id=request.request_id,
-                    response_type=type(response).__name__,
-                )
-
-                # Parse and validate
-                logger.debug("starting_parse_validate", request_id=request.request_id)
-                data = self._parse_and_validate(response, schema_dict, request)
-                logger.debug(
-                    "parse_validate_complete", request_id=request.request_id, record_count=len(data)
+                    provider=provider,
+                    error=str(e),
+                    type=type(e).__name__,
                 )
-
-                duration = time.time() - start_time
-
+                if attempt == len(choice.ranking) - 1:
+                    raise
                 logger.info(
-                    "llm_generate_success",
+                    "llm_provider_fallback",
                     request_id=request.request_id,
-                    records=len(data),
-                    duration=duration,
+                    failed=provider,
+                    next=choice.ranking[attempt + 1],
                 )
 
-                return GenerationResult(
-                    data=data,
-                    metadata={
-                        "generation_path": "llm",
-                        "llm_provider": "claude",
-                        "tokens_used": 0,  # Claude client handles this
-                        "generation_time_ms": duration * 1000,
-                        "coherence_score": 0.0,  # Will be calculated by coherence scorer
-                        "attempts": attempt + 1,
-                    },
-                )
+        metrics.record_llm_token_usage(
+            result.metadata["llm_provider"],
+            planned=plan.planned_tokens,
+            used=result.metadata["llm_tokens_used"],
+        )
+        return result
 
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(
-                    "llm_parse_error",
-                    request_id=request.request_id,
-                    attempt=attempt + 1,
-                    error=str(e),
-                )
+    async def _generate_planned(
+        self,
+        provider: str,
+        client: ClaudeClient | VLLMClient,
+        request: test_data_pb2.GenerateRequest,
+        plan: TokenPlan,
+        schema_dict: dict,
+        rag_examples: list[dict] | None,
+        start_time: float,
+    ) -> GenerationResult:
+        """Run the planned calls for a request with one provider.
 
-                if attempt < self.max_retries:
-                    # Retry with stricter prompt
-                    user_prompt = self._make_stricter_prompt(user_prompt, schema_dict)
-                    continue
-                else:
-                    # All retries exhausted, try fallback
-                    if self.vllm_client:
-                        logger.info("llm_fallback_to_vllm", request_id=request.request_id)
-                        return await self._generate_with_vllm(
-                            request, system_prompt, user_prompt, schema_dict, start_time
-                        )
-                    raise
+        Requests larger than one call's output capacity are split into
+        chunks generated concurrently, each with its share of the budget.
 
-            except Exception as e:
-                logger.error(
-                    "llm_generate_error",
-                    request_id=request.request_id,
-                    error=str(e),
-                    type=type(e).__name__,
+        Args:
+            provider: Provider name (claude, vllm)
+            client: LLM client
+            request: Generate data request
+            plan: Token plan for the request
+            schema_dict: Schema dictionary
+            rag_examples: Optional RAG examples included in the prompt
+            start_time: Start time for duration calculation
+
+        Returns:
+            GenerationResult with records from all chunks
+        """
+        chunks = plan.chunk_counts(request.count)
+        if len(chunks) == 1:
+            result = await self._generate_with_provider(
+                provider, client, request, schema_dict, rag_examples, start_time, plan.budget
+            )
+            result.metadata["llm_tokens_planned"] = plan.planned_tokens
+            return result
+
+        semaphore = asyncio.Semaphore(
+            self.provider_parallel_calls.get(provider, self.max_parallel_calls)
+        )
+        shares = split_scenario_counts(request, chunks) or [None] * len(chunks)
+
+        async def run_chunk(count: int, scenario_counts: dict[str, int] | None) -> GenerationResult:
+            chunk_budget = math.ceil(plan.budget * count / request.count) if plan.budget else 0
+            async with semaphore:
+                return await self._generate_with_provider(
+                    provider,
+                    client,
+                    chunk_request(request, count, scenario_counts),
+                    schema_dict,
+                    rag_examples,
+                    start_time,
+                    chunk_budget,
                 )
 
-                # Try fallback
-                if self.vllm_client and attempt == 0:
-                    logger.info("llm_fallback_to_vllm_on_error", request_id=request.request_id)
-                    return await self._generate_with_vllm(
-                        request, system_prompt, user_prompt, schema_dict, start_time
-                    )
-                raise
+        results = await asyncio.gather(
+            *(run_chunk(count, share) for count, share in zip(chunks, shares))
+        )
+        data = self._add_metadata_fields([record for result in results for record in result.data])
 
-        # Should not reach here
-        raise ValueError(f"Failed to generate data after {self.max_retries + 1} attempts")
+        return GenerationResult(
+            data=data,
+            metadata={
+                "generation_path": "llm",
+                "llm_provider": provider,
+                "llm_tokens_used": sum(r.metadata["llm_tokens_used"] for r in results),
+                "llm_tokens_planned": plan.planned_tokens,
+                "generation_time_ms": (time.time() - start_time) * 1000,
+                "coherence_score": 0.0,
+                "llm_calls": len(chunks),
+                "attempts": sum(r.metadata["attempts"] for r in results),
+                "recovered_records": sum(r.metadata["recovered_records"] for r in results),
+                "wasted_tokens": sum(r.metadata["wasted_tokens"] for r in results),
+                "repaired_fields": dict(
+                    sum((Counter(r.metadata["repaired_fields"]) for r in results), Counter())
+                ),
+                "unrepairable_records": sum(r.metadata["unrepairable_records"] for r in results),
+                "output_mode": results[0].metadata["output_mode"],
+                "output_format": results[0].metadata["output_format"],
+            },
+        )
 
-    async def _generate_with_vllm(
+    async def _generate_with_provider(
         self,
+        provider: str,
+        client: ClaudeClient | VLLMClient,
         request: test_data_pb2.GenerateRequest,
-        system_prompt: str,
-        user_prompt: str,
         schema_dict: dict,
+        rag_examples: list[dict] | None,
         start_time: float,
+        token_budget: int = 0,
     ) -> GenerationResult:
-        """Generate with vLLM fallback.
+        """Generate records with one provider, salvaging partial output.
+
+        Every complete record is kept from each response, even if the model
+        stopped at ``max_tokens`` mid-array or emitted a malformed element.
+        With structured output the provider is held to the schema's JSON
+        Schema, so responses parse by construction. Constraint violations are
+        repaired in place; records that cannot be repaired are dropped.
+        Follow-up calls ask only for the records still missing. A response
+        cut off at ``max_tokens`` before its first complete record (e.g. a
+        truncated tool call) is retried asking for half as many records per
+        call; any other free-text response with no usable records is retried
+        with a stricter prompt.
+        Retries after a response without usable records spend from the
+        request's retry budget; follow-ups for missing records are progress,
+        not retries, and are bounded by ``max_retries`` alone.
 
         Args:
+            provider: Provider name (claude, vllm)
+            client: LLM client
             request: Generate data request
-            system_prompt: System prompt
-            user_prompt: User prompt
             schema_dict: Schema dictionary
+            rag_examples: Optional RAG examples included in the prompt
             start_time: Start time for duration calculation
+            token_budget: Tokens this request may use (0 = unlimited)
 
         Returns:
             GenerationResult
+
+        Raises:
+            ValueError: If no attempt produced a usable record
         """
-        try:
-            response = await self.vllm_client.generate_json(
-                system=system_prompt,
+        # Build prompts; the stable prefix is sent as a cacheable block
+        parts = self.prompt_builder.build_prompt_parts(
+            request, schema_dict, rag_examples, compact=self.compact_output
+        )
+        row_format = parts.row_format
+        records: list[dict] = []
+        user_prompt = parts.suffix
+        tokens_used = 0
+        wasted_tokens = 0
+        recovered = 0
+        attempts = 0
+        repaired_fields: Counter = Counter()
+        unrepairable = 0
+        constraints = constraints_to_dict(request.constraints)
+        json_schema = self._output_schema(
+            request, schema_dict, constraints, row_format, parts.extra_fields
+        )
+        output_mode = "structured" if json_schema is not None else "free_text"
+        per_call = request.count  # Records asked for per call
+        retrying = False  # The last response had no usable records
+
+        while attempts <= self.max_retries:
+            if token_budget and tokens_used >= token_budget:
+                logger.warning(
+                    "llm_token_budget_exhausted",
+                    request_id=request.request_id,
+                    provider=provider,
+                    budget=token_budget,
+                    tokens_used=tokens_used,
+                    records=len(records),
+                )
+                break
+            if attempts and retrying and not try_spend_retry():
+                # Retries after a response without records share the request's retry budget
+                logger.warning(
+                    "llm_retry_budget_exhausted",
+                    request_id=request.request_id,
+                    provider=provider,
+                    attempts=attempts,
+                    records=len(records),
+                )
+                break
+
+            attempts += 1
+            missing = request.count - len(records)
+            asked = min(per_call, missing)
+            response = await self._call_provider(
+                provider,
+                client,
+                system=parts.system,
                 user=user_prompt,
+                max_tokens=self.token_planner.max_tokens_for(schema_dict, asked),
+                cached_prefix=parts.prefix,
+                json_schema=json_schema,
             )
+            tokens_used += response.tokens_used
+            salvage = recover_records(response.content, row_format)
+            self.token_planner.observe(schema_dict, response.output_tokens, len(salvage.records))
+            metrics.record_llm_response(provider, output_mode, parsed=bool(salvage.records))
+            retrying = not salvage.records
 
-            data = self._parse_and_validate(response, schema_dict, request)
-            duration = time.time() - start_time
+            if not salvage.records:
+                wasted_tokens += response.tokens_used
+                logger.warning(
+                    "llm_parse_error",
+                    request_id=request.request_id,
+                    provider=provider,
+                    attempt=attempts,
+                    output_mode=output_mode,
+                    stop_reason=response.stop_reason,
+                )
+                if response.stop_reason in TRUNCATED_STOP_REASONS and asked > 1:
+                    # Not even one record fit: the same prompt would be cut off again
+                    per_call = asked // 2
+                    user_prompt = self._make_continuation_prompt(
+                        request, schema_dict, rag_examples, len(records), per_call
+                    )
+                elif not records and json_schema is None and row_format is None:
+                    user_prompt = self._make_stricter_prompt(parts.suffix, schema_dict)
+                continue
 
-            logger.info(
-                "vllm_generate_success",
-                request_id=request.request_id,
-                records=len(data),
-                duration=duration,
+            if not salvage.clean:
+                recovered += min(len(salvage.records), missing)
+                logger.info(
+                    "llm_partial_output_recovered",
+                    request_id=request.request_id,
+                    provider=provider,
+                    attempt=attempts,
+                    records=len(salvage.records),
+                    truncated=salvage.truncated,
+                    skipped=salvage.errors,
+                    stop_reason=response.stop_reason,
+                )
+
+            candidates = salvage.records
+            if self._should_repair(request, schema_dict):
+                summary = self.repair_engine.repair_batch(candidates, schema_dict, constraints)
+                candidates = summary.records
+                repaired_fields.update(summary.repaired_fields)
+                unrepairable += len(summary.unrepairable)
+
+            asked_for_all = asked == missing
+            records.extend(candidates[:missing])
+            missing = request.count - len(records)
+            if missing <= 0 or (
+                asked_for_all and salvage.clean and len(candidates) == len(salvage.records)
+            ):
+                # A clean response is taken as the model's complete answer
+                break
+
+            user_prompt = self._make_continuation_prompt(
+                request, schema_dict, rag_examples, len(records), min(per_call, missing)
             )
 
-            return GenerationResult(
-                data=data,
-                metadata={
-                    "generation_path": "llm",
-                    "llm_provider": "vllm",
-                    "tokens_used": 0,
-                    "generation_time_ms": duration * 1000,
-                    "coherence_score": 0.0,
-                },
+        if not records:
+            raise ValueError(f"Failed to parse JSON from {provider} after {attempts} attempts")
+
+        data = self._parse_and_validate(records, schema_dict, request)
+        duration = time.time() - start_time
+        metrics.record_repairs(request.entity, repaired_fields)
+        metrics.record_unrepairable(request.entity, "llm", unrepairable)
+
+        logger.info(
+            "llm_generate_success",
+            request_id=request.request_id,
+            provider=provider,
+            records=len(data),
+            attempts=attempts,
+            recovered=recovered,
+            duration=duration,
+        )
+
+        return GenerationResult(
+            data=data,
+            metadata={
+                "generation_path": "llm",
+                "llm_provider": provider,
+                "llm_tokens_used": tokens_used,
+                "generation_time_ms": duration * 1000,
+                "coherence_score": 0.0,  # Will be calculated by coherence scorer
+                "llm_calls": 1,
+                "attempts": attempts,
+                "recovered_records": recovered,
+                "wasted_tokens": wasted_tokens,
+                "repaired_fields": dict(repaired_fields),
+                "unrepairable_records": unrepairable,
+                "output_mode": output_mode,
+                "output_format": "rows" if row_format else "objects",
+            },
+        )
+
+    def batch_calls(self, request: test_data_pb2.GenerateRequest, schema_dict: dict) -> list[dict]:
+        """Plan a request as independent calls for an offline message batch.
+
+        The request is chunked like an interactive one, but every chunk is a
+        single call: there are no follow-up or stricter-prompt retries, so
+        chunks that come back short simply yield fewer records.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            Keyword arguments for ``ClaudeClient.generate``, one dict per chunk
+
+        Raises:
+            TokenBudgetExceededError: If the request does not fit its token budget
+        """
+        parts = self.prompt_builder.build_prompt_parts(
+            request, schema_dict, compact=self.compact_output
+        )
+        plan = self.token_planner.plan(
+            schema_dict,
+            request.count,
+            prompt_tokens=self.token_planner.estimate_prompt_tokens(
+                parts.system, parts.prefix, parts.suffix
+            ),
+            budget=request.token_budget,
+        )
+        constraints = constraints_to_dict(request.constraints)
+        chunks = plan.chunk_counts(request.count)
+        shares = split_scenario_counts(request, chunks) or [None] * len(chunks)
+
+        calls = []
+        for count, share in zip(chunks, shares):
+            chunk = chunk_request(request, count, share)
+            chunk_parts = self.prompt_builder.build_prompt_parts(
+                chunk, schema_dict, compact=self.compact_output
             )
-        except Exception as e:
-            logger.error("vllm_generate_error", error=str(e))
-            raise
+            calls.append(
+                {
+                    "system": chunk_parts.system,
+                    "user": chunk_parts.suffix,
+                    "max_tokens": self.token_planner.max_tokens_for(schema_dict, count),
+                    "cached_prefix": chunk_parts.prefix,
+                    "json_schema": self._output_schema(
+                        chunk,
+                        schema_dict,
+                        constraints,
+                        chunk_parts.row_format,
+                        chunk_parts.extra_fields,
+                    ),
+                }
+            )
+        return calls
+
+    def records_from_responses(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        schema_dict: dict,
+        responses: list[ClaudeResponse],
+    ) -> GenerationResult:
+        """Turn the responses to ``batch_calls`` into validated records.
+
+        Responses go through the same salvage, repair and validation as
+        interactive ones.
+
+        Args:
+            request: Generate data request the calls were planned for
+            schema_dict: Schema dictionary
+            responses: Responses of the calls that succeeded, in chunk order
+
+        Returns:
+            GenerationResult with up to ``request.count`` records
+
+        Raises:
+            ValueError: If no response held a usable record
+        """
+        row_format = self.prompt_builder.build_prompt_parts(
+            request, schema_dict, compact=self.compact_output
+        ).row_format
+        constraints = constraints_to_dict(request.constraints)
+        records: list[dict] = []
+        repaired_fields: Counter = Counter()
+        unrepairable = 0
+        recovered = 0
+        wasted_tokens = 0
+
+        for response in responses:
+            salvage = recover_records(response.content, row_format)
+            self.token_planner.observe(schema_dict, response.output_tokens, len(salvage.records))
+            if not salvage.records:
+                wasted_tokens += response.tokens_used
+                continue
+            if not salvage.clean:
+                recovered += len(salvage.records)
+            candidates = salvage.records
+            if self._should_repair(request, schema_dict):
+                summary = self.repair_engine.repair_batch(candidates, schema_dict, constraints)
+                candidates = summary.records
+                repaired_fields.update(summary.repaired_fields)
+                unrepairable += len(summary.unrepairable)
+            records.extend(candidates)
+
+        if not records:
+            raise ValueError(
+                f"No usable records in {len(responses)} batch responses "
+                f"({unrepairable} unrepairable)"
+            )
+
+        data = self._parse_and_validate(records[: request.count], schema_dict, request)
+        metrics.record_repairs(request.entity, repaired_fields)
+        metrics.record_unrepairable(request.entity, "llm_batch", unrepairable)
+
+        return GenerationResult(
+            data=data,
+            metadata={
+                "generation_path": "llm_batch",
+                "llm_provider": "claude",
+                "llm_tokens_used": sum(response.tokens_used for response in responses),
+                "coherence_score": 0.0,
+                "llm_calls": len(responses),
+                "recovered_records": recovered,
+                "wasted_tokens": wasted_tokens,
+                "repaired_fields": dict(repaired_fields),
+                "unrepairable_records": unrepairable,
+                "output_format": "rows" if row_format else "objects",
+            },
+        )
+
+    async def _call_provider(
+        self, provider: str, client: ClaudeClient | VLLMClient, **kwargs
+    ) -> ClaudeResponse | VLLMResponse:
+        """Make one LLM call, hedging it when hedging is enabled.
+
+        The backup call goes to the other provider, or to the same provider
+        when it is the only one.
+
+        Args:
+            provider: Provider name (claude, vllm)
+            client: LLM client
+            **kwargs: Arguments for ``client.generate``
+
+        Returns:
+            Response of the first call to succeed
+        """
+
+        async def call(name: str, llm_client: ClaudeClient | VLLMClient):
+            async with self.provider_selector.track(name):
+                return await llm_client.generate(**kwargs)
+
+        if not self.hedger:
+            return await call(provider, client)
+
+        others = [name for name in self.clients if name != provider]
+        backup = others[0] if others else provider
+
+        result = await self.hedger.run(
+            lambda: call(provider, client),
+            lambda: call(backup, self.clients[backup]),
+            delay=self.hedger.delay_for(self.provider_selector.stats[provider].latency),
+            provider=provider,
+        )
+        return result.value
 
     def _parse_and_validate(
         self, response: dict | list, schema_dict: dict, request: test_data_pb2.GenerateRequest
@@ -244,6 +795,52 @@ class LLMGenerator(BaseGenerator):
 
         return data
 
+    @staticmethod
+    def _should_repair(request: test_data_pb2.GenerateRequest, schema_dict: dict) -> bool:
+        """Check if generated records should be repaired against the schema.
+
+        Defect-triggering requests ask for constraint violations on purpose.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            True if constraint repair applies
+        """
+        return bool(schema_dict) and not request.defect_triggering
+
+    def _output_schema(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        schema_dict: dict,
+        constraints: dict,
+        row_format: RowFormat | None = None,
+        extra_fields: tuple[str, ...] = (),
+    ) -> dict | None:
+        """JSON Schema the provider output is held to, if any.
+
+        Rows are only held to their shape. Defect-triggering requests ask for
+        invalid values, so their records are otherwise left unconstrained.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+            constraints: Request constraints by field
+            row_format: Row format when records are requested as rows
+            extra_fields: Fields the prompt template asks for beyond the schema
+
+        Returns:
+            JSON Schema of the response array, or None for free-text output
+        """
+        if not self.structured_output or not schema_dict:
+            return None
+        if row_format is not None:
+            return row_format.json_schema()
+        if request.defect_triggering:
+            return None
+        return self.json_schemas.records_schema(schema_dict, constraints, extra_fields)
+
     def _make_stricter_prompt(self, original_prompt: str, schema_dict: dict) -> str:
         """Make prompt stricter to improve JSON parsing success.
 
@@ -264,14 +861,12 @@ Example format:
   {
     "field1": "value1",
     "field2": 123,
-    "_scenario": "default",
-    "_index": 0
+    "_scenario": "default"
   },
   {
     "field1": "value2",
     "field2": 456,
-    "_scenario": "default",
-    "_index": 1
+    "_scenario": "default"
   }
 ]
 
@@ -280,6 +875,38 @@ Do not include markdown code blocks, explanations, or any other text. Only the J
         )
         return stricter
 
+    def _make_continuation_prompt(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        schema_dict: dict,
+        rag_examples: list[dict] | None,
+        generated: int,
+        missing: int,
+    ) -> str:
+        """Build a follow-up prompt asking only for the missing records.
+
+        The stable prefix is unchanged, so the continuation reuses the cached
+        prompt prefix. With nothing generated yet, this is the request's own
+        prompt for ``missing`` records.
+
+        Args:
+            request: Original request
+            schema_dict: Schema dictionary
+            rag_examples: Optional RAG examples included in the prompt
+            generated: Records already recovered
+            missing: Records still needed
+
+        Returns:
+            User prompt suffix for the continuation call
+        """
+        remaining = test_data_pb2.GenerateRequest()
+        remaining.CopyFrom(request)
+        remaining.count = missing
+        parts = self.prompt_builder.build_prompt_parts(remaining, schema_dict, rag_examples)
+        if not generated:
+            return parts.suffix
+        return parts.suffix + CONTINUATION_NOTE.format(generated=generated, missing=missing)
+
     def supports(self, request: test_data_pb2.GenerateRequest) -> bool:
         """Check if LLM generator can handle this request.
 
@@ -321,27 +948,289 @@ Do not include markdown code blocks, explanations, or any other text. Only the J
         batch_size: int = 50,
         context: dict | None = None,
     ):
-        """Stream LLM-generated records in batches.
+        """Stream records, serving reservoir records before calling the LLM.
+
+        Records available in the reservoir are yielded immediately; the LLM is
+        streamed only for the shortfall. Streaming requests do not
+        over-generate, since they already stop reading once enough records
+        have arrived.
 
         Args:
             request: Generate data request
             batch_size: Number of records per batch
-            context: Optional context
+            context: Optional context (e.g., schema_dict, rag_examples)
 
         Yields:
             GenerationResult for each batch
         """
-        # Use default implementation from BaseGenerator
-        result = await self.generate(request, context)
+        if not self.reservoir or not self.reservoir.enabled_for(request):
+            async for batch in self._stream_llm(request, batch_size, context):
+                yield batch
+            return
 
-        # Yield in batches
-        for i in range(0, len(result.data), batch_size):
-            batch = result.data[i : i + batch_size]
+        start_time = time.time()
+        schema_dict = context.get("schema_dict", {}) if context else {}
+        pool_name = self.reservoir.pool_name(request, schema_dict)
+        served = await self.reservoir.take(pool_name, request.count, request.entity)
+        served = self._add_metadata_fields(served)
+
+        batch_index = 0
+        for i in range(0, len(served), batch_size):
+            batch = served[i : i + batch_size]
             yield GenerationResult(
                 data=batch,
                 metadata={
-                    **result.metadata,
-                    "batch_index": i // batch_size,
+                    "generation_path": "llm",
+                    "llm_provider": "reservoir",
+                    "generation_time_ms": (time.time() - start_time) * 1000,
+                    "coherence_score": 0.0,
+                    "batch_index": batch_index,
                     "batch_size": len(batch),
                 },
             )
+            batch_index += 1
+
+        shortfall = request.count - len(served)
+        if shortfall <= 0:
+            return
+
+        llm_request = test_data_pb2.GenerateRequest()
+        llm_request.CopyFrom(request)
+        llm_request.count = shortfall
+
+        async for batch in self._stream_llm(llm_request, batch_size, context):
+            for record in batch.data:
+                record["_index"] = record.get("_index", 0) + len(served)
+            batch.metadata["batch_index"] = batch_index
+            batch_index += 1
+            yield batch
+
+    async def _stream_llm(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        batch_size: int,
+        context: dict | None,
+    ):
+        """Stream LLM-generated records as the model produces them.
+
+        The provider response is streamed token by token through an
+        incremental JSON array parser, so each record is forwarded as soon as
+        its closing brace arrives. Records are repaired as they arrive and
+        unrepairable ones skipped. The first batch is flushed with whatever
+        records are ready; later batches are up to ``batch_size`` records.
+
+        Requests larger than one call's output capacity are streamed as the
+        planned chunks, one after the other, and records still missing at the
+        end are asked for with continuation calls like in ``generate``. Falls
+        back to non-streaming generation if the first call fails before any
+        record is parsed.
+
+        Args:
+            request: Generate data request
+            batch_size: Number of records per batch
+            context: Optional context (e.g., schema_dict, rag_examples)
+
+        Yields:
+            GenerationResult for each batch
+        """
+        start_time = time.time()
+        schema_dict = context.get("schema_dict", {}) if context else {}
+        rag_examples = context.get("rag_examples") if context else None
+
+        parts = self.prompt_builder.build_prompt_parts(
+            request, schema_dict, rag_examples, compact=self.compact_output
+        )
+        row_format = parts.row_format
+        plan = self.token_planner.plan(
+            schema_dict,
+            request.count,
+            prompt_tokens=self.token_planner.estimate_prompt_tokens(
+                parts.system, parts.prefix, parts.suffix
+            ),
+            budget=request.token_budget,
+        )
+        chunks = plan.chunk_counts(request.count)
+        shares = split_scenario_counts(request, chunks) or [None] * len(chunks)
+        chunk_parts = [
+            self.prompt_builder.build_prompt_parts(
+                chunk_request(request, count, share),
+                schema_dict,
+                rag_examples,
+                compact=self.compact_output,
+            )
+            for count, share in zip(chunks, shares)
+        ]
+
+        choice = self.provider_selector.select(list(self.clients))
+        providers = [(name, self.clients[name]) for name in choice.ranking]
+
+        logger.info(
+            "llm_stream_start",
+            request_id=request.request_id,
+            count=request.count,
+            entity=request.entity,
+            calls=len(chunks),
+        )
+
+        repair = self._should_repair(request, schema_dict)
+        constraints = constraints_to_dict(request.constraints)
+        pending: list[dict] = []
+        emitted = 0
+        batch_index = 0
+        tokens_used = 0
+        parse_errors = 0
+        provider = choice.provider
+
+        def make_batch(records: list[dict]) -> GenerationResult:
+            return GenerationResult(
+                data=records,
+                metadata={
+                    "generation_path": "llm",
+                    "llm_provider": provider,
+                    "streamed": True,
+                    "generation_time_ms": (time.time() - start_time) * 1000,
+                    "coherence_score": 0.0,
+                    "batch_index": batch_index,
+                    "batch_size": len(records),
+                },
+            )
+
+        def accept(element) -> dict | None:
+            """Decode and repair a streamed element (None if it is dropped)."""
+            if row_format is not None:
+                element = row_format.decode(element)
+            if not isinstance(element, dict) or emitted + len(pending) >= request.count:
+                return None
+            if repair:
+                repaired = self.repair_engine.repair(element, schema_dict, constraints)
+                if not repaired.valid:
+                    metrics.record_unrepairable(request.entity, "llm", 1)
+                    return None
+                element = repaired.record
+                metrics.record_repairs(request.entity, Counter(map(field_key, repaired.repairs)))
+            element["_index"] = emitted + len(pending)
+            element.setdefault("_scenario", "default")
+            return element
+
+        def ready_batches() -> list[GenerationResult]:
+            """Flush the first records immediately, then in full batches."""
+            nonlocal pending, emitted, batch_index
+            batches = []
+            while pending and (batch_index == 0 or len(pending) >= batch_size):
+                batch, pending = pending[:batch_size], pending[batch_size:]
+                if batch_index == 0:
+                    metrics.record_time_to_first_record(provider, time.time() - start_time)
+                batches.append(make_batch(batch))
+                emitted += len(batch)
+                batch_index += 1
+            return batches
+
+        async def stream_call(client, call_parts, user: str, count: int):
+            """Stream one call, yielding up to ``count`` accepted records."""
+            nonlocal tokens_used, parse_errors
+            parser = JSONArrayStreamParser()
+            taken = 0
+            stream = client.stream(
+                system=call_parts.system,
+                user=user,
+                max_tokens=self.token_planner.max_tokens_for(schema_dict, count),
+                cached_prefix=call_parts.prefix,
+            )
+            async with aclosing(stream):
+                async for chunk in stream:
+                    if chunk.response is not None:
+                        tokens_used += chunk.response.tokens_used
+                        continue
+                    for element in parser.feed(chunk.text):
+                        record = accept(element) if taken < count else None
+                        if record is not None:
+                            taken += 1
+                            yield record
+                    if taken >= count:
+                        # Enough records; stop paying for output tokens
+                        break
+            parse_errors += parser.errors
+
+        # The first call may fall back to the next provider until one streams a record
+        for provider, client in providers:
+            try:
+                async with aclosing(
+                    stream_call(client, chunk_parts[0], chunk_parts[0].suffix, chunks[0])
+                ) as records:
+                    async for record in records:
+                        pending.append(record)
+                        for batch in ready_batches():
+                            yield batch
+            except Exception as e:
+                if emitted or pending:
+                    raise
+                logger.warning(
+                    "llm_stream_failed",
+                    request_id=request.request_id,
+                    provider=provider,
+                    error=str(e),
+                    type=type(e).__name__,
+                )
+                continue
+
+            if emitted or pending:
+                break
+
+        if emitted == 0 and not pending:
+            # Nothing streamed; use the non-streaming path with its retries and fallback
+            result = await self._generate_llm(request, context, start_time)
+            for i in range(0, len(result.data), batch_size):
+                batch = result.data[i : i + batch_size]
+                yield GenerationResult(
+                    data=batch,
+                    metadata={
+                        **result.metadata,
+                        "batch_index": i // batch_size,
+                        "batch_size": len(batch),
+                    },
+                )
+            return
+
+        # Remaining chunks stream one after the other from the provider that answered
+        calls = [
+            (call_parts, call_parts.suffix, count)
+            for call_parts, count in zip(chunk_parts[1:], chunks[1:])
+        ]
+        follow_ups = 0
+        while True:
+            if not calls:
+                missing = request.count - emitted - len(pending)
+                if missing <= 0 or follow_ups >= self.max_retries:
+                    break
+                # Continuations make progress; they don't spend the request's retry budget
+                follow_ups += 1
+                user = self._make_continuation_prompt(
+                    request, schema_dict, rag_examples, emitted + len(pending), missing
+                )
+                calls.append((parts, user, missing))
+
+            call_parts, user, count = calls.pop(0)
+            before = emitted + len(pending)
+            async with aclosing(stream_call(client, call_parts, user, count)) as records:
+                async for record in records:
+                    pending.append(record)
+                    for batch in ready_batches():
+                        yield batch
+            if follow_ups and emitted + len(pending) == before:
+                break  # A continuation produced nothing; more of the same won't help
+
+        if pending:
+            yield make_batch(pending)
+            emitted += len(pending)
+            batch_index += 1
+
+        logger.info(
+            "llm_stream_complete",
+            request_id=request.request_id,
+            records=emitted,
+            batches=batch_index,
+            tokens_used=tokens_used,
+            parse_errors=parse_errors,
+            follow_ups=follow_ups,
+            duration=time.time() - start_time,
+        )
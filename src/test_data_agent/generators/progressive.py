@@ -0,0 +1,180 @@
+"""Progressive streaming: traditional records first, upgraded by LLM output.
+
+An LLM-routed stream sends nothing until the model's first records arrive,
+often many seconds in. In progressive mode every record is first sent from
+the traditional engine, which takes milliseconds, and LLM records follow as
+upgrades that replace the record with the same ``_index``. Clients can start
+working on the first batch at once and swap in the higher-coherence records as
+they come; if the deadline hits first, the stream ends with what has been
+upgraded so far.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import AsyncIterator
+
+from test_data_agent.generators.base import BaseGenerator, GenerationResult
+from test_data_agent.generators.traditional import TraditionalGenerator
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ProgressiveGenerator(BaseGenerator):
+    """Streams traditional records, then LLM replacements matched by ``_index``."""
+
+    def __init__(
+        self,
+        traditional_generator: TraditionalGenerator,
+        upgrade_generator: BaseGenerator,
+    ):
+        """Initialize progressive generator.
+
+        Args:
+            traditional_generator: Engine producing the immediate records
+            upgrade_generator: Generator streaming the replacement records
+        """
+        self.traditional_generator = traditional_generator
+        self.upgrade_generator = upgrade_generator
+
+    async def generate(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        context: dict | None = None,
+    ) -> GenerationResult:
+        """Generate with the upgrade generator (progressive output needs a stream).
+
+        Args:
+            request: Generate data request
+            context: Optional context (e.g., schema_dict)
+
+        Returns:
+            GenerationResult from the upgrade generator
+        """
+        return await self.upgrade_generator.generate(request, context)
+
+    async def generate_stream(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        batch_size: int = 50,
+        context: dict | None = None,
+        deadline: float | None = None,
+        upgrade_generator: BaseGenerator | None = None,
+    ) -> AsyncIterator[GenerationResult]:
+        """Stream traditional batches, then upgrade batches until done or out of time.
+
+        Upgrade batches carry ``"upgrade": True`` in their metadata. Each LLM
+        record takes the ``_index`` of the first not yet upgraded record of
+        the same scenario (or of any scenario once those run out).
+
+        Args:
+            request: Generate data request
+            batch_size: Number of records per batch
+            context: Optional context passed to the upgrade generator
+            deadline: ``time.monotonic()`` value after which no more upgrades
+                are waited for (None = no deadline)
+            upgrade_generator: Generator for this request's upgrades (defaults
+                to the one given at construction)
+
+        Yields:
+            GenerationResult for each batch
+        """
+        start_time = time.time()
+        generator = upgrade_generator or self.upgrade_generator
+        base = await self.traditional_generator.generate(request)
+        records = base.data
+        batch_index = 0
+
+        def make_batch(batch: list[dict], upgrade: bool) -> GenerationResult:
+            return GenerationResult(
+                data=batch,
+                metadata={
+                    "generation_path": "llm" if upgrade else "traditional",
+                    "upgrade": upgrade,
+                    "streamed": True,
+                    "generation_time_ms": (time.time() - start_time) * 1000,
+                    "batch_index": batch_index,
+                    "batch_size": len(batch),
+                },
+            )
+
+        for i in range(0, len(records), batch_size):
+            yield make_batch(records[i : i + batch_size], upgrade=False)
+            batch_index += 1
+
+        by_scenario: dict[str, deque[int]] = {}
+        for record in records:
+            by_scenario.setdefault(record.get("_scenario", "default"), deque()).append(
+                record["_index"]
+            )
+        unclaimed = deque(record["_index"] for record in records)
+        claimed: set[int] = set()
+
+        def claim(scenario: str | None) -> int | None:
+            for queue in (by_scenario.get(scenario or "default", deque()), unclaimed):
+                while queue:
+                    index = queue.popleft()
+                    if index not in claimed:
+                        claimed.add(index)
+                        return index
+            return None
+
+        stream = generator.generate_stream(request, batch_size=batch_size, context=context)
+        reason = "complete"
+        try:
+            while len(claimed) < len(records):
+                timeout = None if deadline is None else deadline - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    reason = "deadline"
+                    break
+                try:
+                    result = await asyncio.wait_for(anext(stream), timeout)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    reason = "deadline"
+                    break
+                except Exception as e:
+                    logger.warning(
+                        "progressive_upgrade_failed",
+                        request_id=request.request_id,
+                        error=str(e) or type(e).__name__,
+                    )
+                    reason = "error"
+                    break
+
+                upgrades = []
+                for record in result.data:
+                    index = claim(record.get("_scenario"))
+                    if index is None:
+                        break
+                    upgrades.append(
+                        {**record, "_index": index, "_scenario": records[index]["_scenario"]}
+                    )
+                if upgrades:
+                    yield make_batch(upgrades, upgrade=True)
+                    batch_index += 1
+        finally:
+            await stream.aclose()
+
+        logger.info(
+            "progressive_stream_complete",
+            request_id=request.request_id,
+            records=len(records),
+            upgraded=len(claimed),
+            reason=reason,
+            duration=time.time() - start_time,
+        )
+
+    def supports(self, request: test_data_pb2.GenerateRequest) -> bool:
+        """Check if progressive streaming suits this request.
+
+        Args:
+            request: Generate data request
+
+        Returns:
+            True if the request asked for progressive output
+        """
+        return request.progressive
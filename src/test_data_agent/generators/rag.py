@@ -8,24 +8,41 @@ import uuid
 
 from test_data_agent.generators.base import BaseGenerator, GenerationResult
 from test_data_agent.clients.weaviate_client import WeaviateClient
+from test_data_agent.prompts.builder import PATTERN_ID_KEY
 from test_data_agent.proto import test_data_pb2
 from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+from test_data_agent.validators.constraint import constraints_to_dict
+from test_data_agent.validators.repair import RepairEngine
 
 logger = get_logger(__name__)
+metrics = MetricsCollector()
 
 
 class RAGGenerator(BaseGenerator):
     """Generator that retrieves patterns from vector DB for data generation."""
 
-    def __init__(self, weaviate_client: WeaviateClient, top_k: int = 5):
+    def __init__(
+        self,
+        weaviate_client: WeaviateClient,
+        top_k: int = 5,
+        repair_engine: RepairEngine | None = None,
+        max_repair_rounds: int = 2,
+    ):
         """Initialize RAG generator.
 
         Args:
             weaviate_client: Weaviate client for pattern retrieval
             top_k: Number of examples to retrieve
+            repair_engine: Engine repairing constraint violations in generated
+                records (None disables repair)
+            max_repair_rounds: Extra rounds of variations generated to replace
+                unrepairable records
         """
         self.weaviate_client = weaviate_client
         self.top_k = top_k
+        self.repair_engine = repair_engine
+        self.max_repair_rounds = max_repair_rounds
 
     async def generate(
         self,
@@ -84,6 +101,11 @@ class RAGGenerator(BaseGenerator):
 
         # Generate data from patterns
         data = self._generate_from_patterns(patterns, request)
+        schema_dict = context.get("schema_dict", {}) if context else {}
+        repaired_fields: dict[str, int] = {}
+        if self.repair_engine and schema_dict and not request.defect_triggering:
+            data, repaired_fields = self._repair(data, patterns, request, schema_dict)
+        examples = self._pattern_examples(patterns)
 
         duration = time.time() - start_time
 
@@ -101,6 +123,9 @@ class RAGGenerator(BaseGenerator):
                 "generation_path": "rag",
                 "rag_collection": collection,
                 "patterns_found": len(patterns),
+                "pattern_ids": [example[PATTERN_ID_KEY] for example in examples],
+                "rag_examples": examples,
+                "repaired_fields": repaired_fields,
                 "generation_time_ms": duration * 1000,
                 "coherence_score": 0.0,  # RAG patterns are pre-validated
             },
@@ -215,6 +240,48 @@ class RAGGenerator(BaseGenerator):
 
         return query
 
+    def _repair(
+        self,
+        data: list[dict],
+        patterns: list[dict[str, Any]],
+        request: test_data_pb2.GenerateRequest,
+        schema_dict: dict,
+    ) -> tuple[list[dict], dict[str, int]]:
+        """Repair constraint violations, replacing unrepairable records.
+
+        Args:
+            data: Records generated from patterns
+            patterns: Retrieved patterns
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            Tuple of (valid records, repairs per field)
+        """
+        constraints = constraints_to_dict(request.constraints)
+        summary = self.repair_engine.repair_batch(data, schema_dict, constraints)
+        valid, repaired_fields = summary.records, summary.repaired_fields
+        unrepairable = len(summary.unrepairable)
+
+        for _ in range(self.max_repair_rounds):
+            missing = request.count - len(valid)
+            if missing <= 0:
+                break
+            retry_request = test_data_pb2.GenerateRequest()
+            retry_request.CopyFrom(request)
+            retry_request.count = missing
+            retry = self._generate_from_patterns(patterns, retry_request)
+            summary = self.repair_engine.repair_batch(retry[:missing], schema_dict, constraints)
+            valid.extend(summary.records)
+            repaired_fields.update(summary.repaired_fields)
+            unrepairable += len(summary.unrepairable)
+
+        metrics.record_repairs(request.entity, repaired_fields)
+        metrics.record_unrepairable(request.entity, "rag", unrepairable)
+        for index, record in enumerate(valid):
+            record["_index"] = index
+        return valid, dict(repaired_fields)
+
     def _generate_from_patterns(
         self,
         patterns: list[dict[str, Any]],
@@ -236,33 +303,9 @@ class RAGGenerator(BaseGenerator):
         remainder = request.count % len(patterns)
 
         for idx, pattern in enumerate(patterns):
-            # Get pattern data
-            pattern_data = pattern.get("data", {})
-
-            # Parse JSON if it's a string
-            if isinstance(pattern_data, str):
-                try:
-                    pattern_data = json.loads(pattern_data)
-                except json.JSONDecodeError:
-                    logger.warning("rag_pattern_parse_error", pattern_id=pattern.get("id"))
-                    continue
-
-            # Determine collection-specific data field
-            if "data" in pattern_data:
-                example_data = pattern_data["data"]
-            elif "trigger_data" in pattern_data:
-                example_data = pattern_data["trigger_data"]
-            elif "anonymized_data" in pattern_data:
-                example_data = pattern_data["anonymized_data"]
-            else:
-                example_data = pattern_data
-
-            # Parse if string
-            if isinstance(example_data, str):
-                try:
-                    example_data = json.loads(example_data)
-                except json.JSONDecodeError:
-                    example_data = pattern_data
+            example_data = self._extract_example(pattern)
+            if example_data is None:
+                continue
 
             # Generate variations of this pattern
             num_variations = records_per_pattern + (1 if idx < remainder else 0)
@@ -283,6 +326,64 @@ class RAGGenerator(BaseGenerator):
 
         return generated[: request.count]
 
+    def _extract_example(self, pattern: dict[str, Any]) -> dict | None:
+        """Extract the example record stored in a retrieved pattern.
+
+        Args:
+            pattern: Retrieved pattern from vector DB
+
+        Returns:
+            Example record, or None if the pattern data cannot be parsed
+        """
+        # Get pattern data
+        pattern_data = pattern.get("data", {})
+
+        # Parse JSON if it's a string
+        if isinstance(pattern_data, str):
+            try:
+                pattern_data = json.loads(pattern_data)
+            except json.JSONDecodeError:
+                logger.warning("rag_pattern_parse_error", pattern_id=pattern.get("id"))
+                return None
+
+        # Determine collection-specific data field
+        if "data" in pattern_data:
+            example_data = pattern_data["data"]
+        elif "trigger_data" in pattern_data:
+            example_data = pattern_data["trigger_data"]
+        elif "anonymized_data" in pattern_data:
+            example_data = pattern_data["anonymized_data"]
+        else:
+            example_data = pattern_data
+
+        # Parse if string
+        if isinstance(example_data, str):
+            try:
+                example_data = json.loads(example_data)
+            except json.JSONDecodeError:
+                example_data = pattern_data
+
+        return example_data
+
+    def _pattern_examples(self, patterns: list[dict[str, Any]]) -> list[dict]:
+        """Unmodified pattern examples tagged with their pattern id.
+
+        Unlike generated variations, these are identical every time a pattern
+        is retrieved, so prompts built from them can be cached.
+
+        Args:
+            patterns: Retrieved patterns from vector DB
+
+        Returns:
+            Example records with a ``_pattern_id`` key
+        """
+        examples = []
+        for pattern in patterns:
+            example_data = self._extract_example(pattern)
+            if isinstance(example_data, dict):
+                examples.append({**example_data, PATTERN_ID_KEY: pattern.get("id", "")})
+        return examples
+
     def _create_variation(self, template: dict, index: int) -> dict:
         """Create a variation of a template record.
 
@@ -0,0 +1,247 @@
+"""Targeted regeneration of records below the coherence threshold.
+
+Re-running a whole request to fix a few incoherent records repeats every
+call it made. After generation, each record is scored and only the ones
+below ``coherence_threshold`` are handled: first by deterministic local
+fixes (recomputed totals, chronological timestamps, positive quantities),
+then by one batched LLM call per attempt for whatever is still low, within
+an attempt and time budget.
+"""
+
+import asyncio
+import copy
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from test_data_agent.cache.reservoir import BYPASS_HINT
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.prompts.templates import COHERENCE_REGENERATION_NOTE
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+from test_data_agent.validators.coherence import CoherenceScorer
+from test_data_agent.validators.derived import recompute_totals
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+# Fields carried over from a replaced record to its replacement
+KEPT_METADATA = ("_scenario", "_index")
+
+
+@dataclass
+class RefinementResult:
+    """Records after refinement, with their coherence scores."""
+
+    records: list[dict]
+    scores: list[float]
+    fixed_locally: int = 0  # Raised over the threshold by local fixes
+    regenerated: int = 0  # Replaced by regenerated records
+    unresolved: int = 0  # Still below the threshold
+    llm_tokens_used: int = 0
+    attempts: int = 0  # LLM regeneration calls made
+
+
+class CoherenceRefiner:
+    """Raises low-scoring records over the coherence threshold."""
+
+    def __init__(
+        self,
+        coherence_scorer: CoherenceScorer,
+        llm_generator: LLMGenerator | None = None,
+        threshold: float = 0.85,
+        max_attempts: int = 2,
+        time_budget_seconds: float = 15.0,
+    ):
+        """Initialize coherence refiner.
+
+        Args:
+            coherence_scorer: Scorer deciding which records are low
+            llm_generator: Generator for replacement records (None = local fixes only)
+            threshold: Minimum acceptable coherence score
+            max_attempts: Batched LLM regeneration calls per request
+            time_budget_seconds: Time all regeneration calls of a request may take
+        """
+        self.coherence_scorer = coherence_scorer
+        self.llm_generator = llm_generator
+        self.threshold = threshold
+        self.max_attempts = max_attempts
+        self.time_budget_seconds = time_budget_seconds
+
+    async def refine(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        records: list[dict],
+        schema_dict: dict | None = None,
+        regenerate: bool = True,
+    ) -> RefinementResult:
+        """Score records and fix or regenerate those below the threshold.
+
+        Args:
+            request: Generate data request the records were generated for
+            records: Generated records (fixed records are replaced in a copy)
+            schema_dict: Schema dictionary passed on to the LLM generator
+            regenerate: Allow LLM regeneration (False = local fixes only)
+
+        Returns:
+            RefinementResult with the records and their scores (records of
+            defect-triggering requests are returned unchanged)
+        """
+        entity = request.entity
+        records = list(records)
+        scores = [self.coherence_scorer.score(record, entity) for record in records]
+        result = RefinementResult(records=records, scores=scores)
+        if request.defect_triggering or not self.coherence_scorer.scores_entity(entity):
+            # Defect-triggering records are incoherent on purpose
+            return result
+
+        low = [i for i, score in enumerate(scores) if score < self.threshold]
+        if not low:
+            return result
+
+        for i in low:
+            fixed = self._fix_locally(records[i])
+            fixed_score = self.coherence_scorer.score(fixed, entity)
+            if fixed_score > scores[i]:
+                records[i], scores[i] = fixed, fixed_score
+        still_low = [i for i in low if scores[i] < self.threshold]
+        result.fixed_locally = len(low) - len(still_low)
+
+        if regenerate and self.llm_generator is not None and still_low:
+            still_low = await self._regenerate(request, schema_dict, result, still_low)
+
+        result.unresolved = len(still_low)
+        metrics.record_coherence_refinement(
+            entity, result.fixed_locally, result.regenerated, result.unresolved
+        )
+        logger.info(
+            "coherence_refined",
+            request_id=request.request_id,
+            entity=entity,
+            below_threshold=len(low),
+            fixed_locally=result.fixed_locally,
+            regenerated=result.regenerated,
+            unresolved=result.unresolved,
+            attempts=result.attempts,
+        )
+        return result
+
+    async def _regenerate(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        schema_dict: dict | None,
+        result: RefinementResult,
+        low: list[int],
+    ) -> list[int]:
+        """Replace low records with batched LLM regenerations.
+
+        A replacement is kept only if it scores higher than the record it
+        replaces; the worst records get the best replacements.
+
+        Returns:
+            Indices still below the threshold
+        """
+        deadline = time.monotonic() + self.time_budget_seconds
+        entity = request.entity
+
+        while low and result.attempts < self.max_attempts:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.info("coherence_regeneration_out_of_time", request_id=request.request_id)
+                break
+            result.attempts += 1
+            try:
+                generated = await asyncio.wait_for(
+                    self.llm_generator.generate(
+                        self._sub_request(request, len(low)), {"schema_dict": schema_dict}
+                    ),
+                    timeout=remaining,
+                )
+            except Exception as e:
+                logger.warning(
+                    "coherence_regeneration_failed",
+                    request_id=request.request_id,
+                    attempt=result.attempts,
+                    error=str(e) or type(e).__name__,
+                )
+                break
+
+            result.llm_tokens_used += generated.metadata.get("llm_tokens_used", 0)
+            candidates = sorted(
+                ((self.coherence_scorer.score(r, entity), r) for r in generated.data),
+                key=lambda pair: pair[0],
+                reverse=True,
+            )
+            for i, (score, candidate) in zip(
+                sorted(low, key=lambda i: result.scores[i]), candidates
+            ):
+                if score <= result.scores[i]:
+                    continue
+                original = result.records[i]
+                replacement = {k: v for k, v in candidate.items() if k not in KEPT_METADATA}
+                replacement.update({k: original[k] for k in KEPT_METADATA if k in original})
+                result.records[i], result.scores[i] = replacement, score
+                result.regenerated += 1
+
+            low = [i for i in low if result.scores[i] < self.threshold]
+
+        return low
+
+    def _sub_request(
+        self, request: test_data_pb2.GenerateRequest, count: int
+    ) -> test_data_pb2.GenerateRequest:
+        """Build the request for ``count`` replacement records.
+
+        Scenarios are dropped (replacements keep the scenario of the record
+        they replace) and the reservoir is bypassed so only fresh records
+        come back.
+        """
+        sub_request = test_data_pb2.GenerateRequest()
+        sub_request.CopyFrom(request)
+        sub_request.count = count
+        del sub_request.scenarios[:]
+        sub_request.hints.append(BYPASS_HINT)
+        sub_request.context = (
+            f"{request.context}\n\n{COHERENCE_REGENERATION_NOTE}"
+            if request.context
+            else COHERENCE_REGENERATION_NOTE
+        )
+        if request.token_budget:
+            sub_request.token_budget = math.ceil(
+                request.token_budget * count / max(request.count, 1)
+            )
+        return sub_request
+
+    def _fix_locally(self, record: dict) -> dict:
+        """Apply deterministic coherence fixes to a copy of a record."""
+        fixed = copy.deepcopy(record)
+        items = fixed.get("items")
+        if isinstance(items, list):
+            for item in items:
+                quantity = item.get("quantity") if isinstance(item, dict) else None
+                if isinstance(quantity, int) and not isinstance(quantity, bool) and quantity < 1:
+                    item["quantity"] = 1
+            recompute_totals(fixed)
+        self._order_timestamps(fixed)
+        return fixed
+
+    def _order_timestamps(self, record: dict) -> None:
+        """Reassign a record's timestamps so they occur in ``DATE_FIELDS`` order."""
+        present = []
+        for name in self.coherence_scorer.DATE_FIELDS:
+            value = record.get(name)
+            if not isinstance(value, str):
+                continue
+            try:
+                present.append((name, datetime.fromisoformat(value.replace("Z", "+00:00"))))
+            except ValueError:
+                continue
+        try:
+            ordered = sorted(present, key=lambda pair: pair[1])
+        except TypeError:  # Naive and aware timestamps mixed
+            return
+        originals = {name: record[name] for name, _ in present}
+        for (name, _), (source, _) in zip(present, ordered):
+            record[name] = originals[source]
@@ -0,0 +1,464 @@
+"""Spec-driven generation: the LLM describes the data once, records are synthesized locally.
+
+A generation spec captures what the LLM knows about an entity in a context
+(value vocabularies, categorical weights, numeric ranges, correlated field
+groups and text templates) as JSON. Specs are cached by (schema, context)
+fingerprint, so a context costs one LLM call and every later request runs at
+traditional generation speed.
+"""
+
+import json
+import math
+import random
+import re
+import time
+from typing import Any, AsyncIterator
+
+from google.protobuf.json_format import MessageToDict
+
+from test_data_agent.cache.reservoir import BYPASS_HINT
+from test_data_agent.clients.claude import ClaudeClient
+from test_data_agent.clients.redis_client import RedisClient
+from test_data_agent.clients.vllm import VLLMClient
+from test_data_agent.generators.base import BaseGenerator, GenerationResult
+from test_data_agent.generators.traditional import TraditionalGenerator
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.utils.fingerprint import fingerprint, schema_fingerprint
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.lru import LRUCache
+from test_data_agent.utils.metrics import MetricsCollector
+from test_data_agent.validators.derived import recompute_totals
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+SLOT_PATTERN = re.compile(r"\{(\w+)\}")
+DISTRIBUTIONS = {"uniform", "normal", "lognormal"}
+TAX_RATE_RANGE = (0.0625, 0.1025)  # US combined sales tax rates
+
+
+def normalize_spec(spec: Any, fields: dict) -> dict:
+    """Keep only well-formed spec entries for fields in the schema.
+
+    Args:
+        spec: Spec as returned by the LLM
+        fields: Schema field definitions (empty to accept any field)
+
+    Returns:
+        Normalized spec with "fields" and "groups" keys
+    """
+    if not isinstance(spec, dict):
+        return {"fields": {}, "groups": []}
+
+    normalized_fields = {}
+    for name, field_spec in (spec.get("fields") or {}).items():
+        if fields and name not in fields:
+            continue
+        entry = _normalize_field(field_spec, fields.get(name, {}))
+        if entry:
+            normalized_fields[name] = entry
+
+    groups = []
+    for group in spec.get("groups") or []:
+        if not isinstance(group, dict):
+            continue
+        names = group.get("fields")
+        rows = group.get("rows")
+        if not isinstance(names, list) or not isinstance(rows, list):
+            continue
+        if fields and any(n not in fields for n in names):
+            continue
+        rows = [row for row in rows if isinstance(row, list) and len(row) == len(names)]
+        if rows:
+            groups.append({"fields": names, "rows": rows, "weights": _weights(group, len(rows))})
+
+    return {"fields": normalized_fields, "groups": groups}
+
+
+def _normalize_field(field_spec: Any, field_def: dict) -> dict | None:
+    """Normalize one field entry, or return None if it is unusable."""
+    if not isinstance(field_spec, dict):
+        return None
+
+    if isinstance(field_spec.get("choice"), list) and field_spec["choice"]:
+        values = field_spec["choice"]
+        return {"choice": values, "weights": _weights(field_spec, len(values))}
+
+    bounds = field_spec.get("range")
+    if (
+        isinstance(bounds, list)
+        and len(bounds) == 2
+        and all(isinstance(b, (int, float)) and not isinstance(b, bool) for b in bounds)
+    ):
+        low, high = sorted(bounds)
+        distribution = field_spec.get("distribution", "uniform")
+        decimals = field_spec.get("decimals")
+        if field_def.get("type") == "integer" or (
+            decimals is None and isinstance(low, int) and isinstance(high, int)
+        ):
+            decimals = 0
+        return {
+            "range": [low, high],
+            "distribution": distribution if distribution in DISTRIBUTIONS else "uniform",
+            "decimals": decimals if isinstance(decimals, int) else 2,
+        }
+
+    if isinstance(field_spec.get("template"), str):
+        slots = {
+            slot: values
+            for slot, values in (field_spec.get("slots") or {}).items()
+            if isinstance(values, list) and values
+        }
+        return {"template": field_spec["template"], "slots": slots}
+
+    if isinstance(field_spec.get("item"), dict):
+        count = field_spec.get("count", [1, 3])
+        if not (
+            isinstance(count, list) and len(count) == 2 and all(isinstance(c, int) for c in count)
+        ):
+            count = [1, 3]
+        item_schema = field_def.get("item_schema", {})
+        return {
+            "count": sorted(max(0, c) for c in count),
+            "item": normalize_spec(field_spec["item"], item_schema.get("fields", {})),
+        }
+
+    if "value" in field_spec:
+        return {"value": field_spec["value"]}
+
+    return None
+
+
+def _weights(entry: dict, size: int) -> list[float] | None:
+    """Return usable weights for ``size`` options, or None for uniform."""
+    weights = entry.get("weights")
+    if (
+        isinstance(weights, list)
+        and len(weights) == size
+        and all(isinstance(w, (int, float)) and w >= 0 for w in weights)
+        and sum(weights) > 0
+    ):
+        return weights
+    return None
+
+
+class SpecGenerator(BaseGenerator):
+    """Executes LLM-derived generation specs with the traditional engine."""
+
+    def __init__(
+        self,
+        claude_client: ClaudeClient,
+        vllm_client: VLLMClient | None,
+        prompt_builder: PromptBuilder,
+        traditional_generator: TraditionalGenerator,
+        redis_client: RedisClient | None = None,
+        spec_ttl_seconds: int = 604800,
+        cache_size: int = 128,
+        rng: random.Random | None = None,
+    ):
+        """Initialize spec generator.
+
+        Args:
+            claude_client: Claude API client
+            vllm_client: Optional vLLM client (fallback)
+            prompt_builder: Prompt builder
+            traditional_generator: Engine filling fields the spec does not cover
+            redis_client: Optional Redis client sharing specs across replicas
+            spec_ttl_seconds: How long specs are kept in Redis
+            cache_size: Specs kept in process memory
+            rng: Random number generator (for reproducible output)
+        """
+        self.claude_client = claude_client
+        self.vllm_client = vllm_client
+        self.prompt_builder = prompt_builder
+        self.traditional_generator = traditional_generator
+        self.redis_client = redis_client
+        self.spec_ttl_seconds = spec_ttl_seconds
+        self.rng = rng or random.Random()
+        self._specs: LRUCache[dict] = LRUCache(cache_size)
+
+    async def generate(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        context: dict | None = None,
+    ) -> GenerationResult:
+        """Generate records by executing the (cached) spec for the request.
+
+        Args:
+            request: Generate data request
+            context: Optional context (e.g., schema_dict)
+
+        Returns:
+            GenerationResult with generated data and metadata
+        """
+        start_time = time.time()
+        schema_dict = (context or {}).get("schema_dict") or {}
+        spec, source, tokens_used = await self.get_spec(request, schema_dict)
+
+        traditional = self.traditional_generator
+        schema = schema_dict or traditional._get_schema(request)
+        records = []
+        for scenario_name, scenario_count in traditional._calculate_scenario_distribution(
+            request
+        ).items():
+            overrides = traditional._get_scenario_overrides(request, scenario_name)
+            for _ in range(scenario_count):
+                record = self._generate_record(schema, spec)
+                record.update(overrides)
+                record["_scenario"] = scenario_name
+                records.append(record)
+
+        records = self._add_metadata_fields(records)
+        duration = time.time() - start_time
+
+        logger.info(
+            "spec_generate_success",
+            request_id=request.request_id,
+            count=len(records),
+            spec_source=source,
+            duration=duration,
+        )
+
+        return GenerationResult(
+            data=records,
+            metadata={
+                "generation_path": "spec",
+                "llm_provider": source,
+                "llm_tokens_used": tokens_used,
+                "spec_source": source,
+                "generation_time_ms": duration * 1000,
+                "coherence_score": 0.0,  # Will be calculated by coherence scorer
+            },
+        )
+
+    async def generate_stream(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        batch_size: int = 50,
+        context: dict | None = None,
+    ) -> AsyncIterator[GenerationResult]:
+        """Stream records in batches.
+
+        Args:
+            request: Generate data request
+            batch_size: Records per batch
+            context: Optional context
+
+        Yields:
+            GenerationResult for each batch
+        """
+        # Records are synthesized locally, so the default batching is enough
+        async for batch in super().generate_stream(request, batch_size, context):
+            yield batch
+
+    def supports(self, request: test_data_pb2.GenerateRequest) -> bool:
+        """Check if spec generation suits this request.
+
+        Args:
+            request: Generate data request
+
+        Returns:
+            True - any request can be described by a spec
+        """
+        return True
+
+    def spec_key(self, request: test_data_pb2.GenerateRequest, schema_dict: dict) -> str:
+        """Build the cache key for a request's spec.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            Key built from the schema and context fingerprints
+        """
+        context = {
+            "domain": request.domain,
+            "entity": request.entity,
+            "context": request.context,
+            "hints": sorted(h.lower() for h in request.hints if h.lower() != BYPASS_HINT),
+            "constraints": MessageToDict(request.constraints),
+        }
+        entity = request.entity or "unknown"
+        return f"spec:{entity}:{schema_fingerprint(schema_dict)}:{fingerprint(context)}"
+
+    async def has_cached_spec(
+        self, request: test_data_pb2.GenerateRequest, schema_dict: dict
+    ) -> bool:
+        """Check whether a request's spec would be served without an LLM call.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            True if the spec is in memory or Redis and the request doesn't bypass caches
+        """
+        if BYPASS_HINT in [h.lower() for h in request.hints]:
+            return False
+        key = self.spec_key(request, schema_dict)
+        if self._specs.get(key) is not None:
+            return True
+        return bool(self.redis_client and await self.redis_client.get(key))
+
+    async def get_spec(
+        self, request: test_data_pb2.GenerateRequest, schema_dict: dict
+    ) -> tuple[dict, str, int]:
+        """Return the spec for a request, asking the LLM only on a cache miss.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            Tuple of (spec, source, LLM tokens used); source is memory, redis or
+            the LLM provider name
+        """
+        key = self.spec_key(request, schema_dict)
+        bypass = BYPASS_HINT in [h.lower() for h in request.hints]
+
+        if not bypass:
+            spec = self._specs.get(key)
+            if spec is not None:
+                metrics.record_spec_lookup(request.entity, "memory")
+                return spec, "memory", 0
+
+            if self.redis_client:
+                cached = await self.redis_client.get(key)
+                if cached:
+                    spec = json.loads(cached)
+                    self._specs.put(key, spec)
+                    metrics.record_spec_lookup(request.entity, "redis")
+                    return spec, "redis", 0
+
+        spec, provider, tokens_used = await self._request_spec(request, schema_dict)
+        self._specs.put(key, spec)
+        if self.redis_client:
+            await self.redis_client.set(key, json.dumps(spec), ttl=self.spec_ttl_seconds)
+        metrics.record_spec_lookup(request.entity, "llm")
+        return spec, provider, tokens_used
+
+    async def _request_spec(
+        self, request: test_data_pb2.GenerateRequest, schema_dict: dict
+    ) -> tuple[dict, str, int]:
+        """Ask the LLM for a spec (Claude first, vLLM as fallback).
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary
+
+        Returns:
+            Tuple of (normalized spec, provider, tokens used)
+
+        Raises:
+            ValueError: If no provider returns a usable spec
+        """
+        system, user = self.prompt_builder.build_spec_prompt(request, schema_dict)
+        fields = schema_dict.get("fields", {}) if schema_dict else {}
+
+        providers = [("claude", self.claude_client), ("vllm", self.vllm_client)]
+        for provider, client in providers:
+            if client is None:
+                continue
+            try:
+                response = await client.generate(system=system, user=user)
+                spec = normalize_spec(self._parse_spec(response.content), fields)
+            except Exception as e:
+                logger.warning(
+                    "spec_request_error",
+                    request_id=request.request_id,
+                    provider=provider,
+                    error=str(e),
+                )
+                continue
+
+            if spec["fields"] or spec["groups"]:
+                logger.info(
+                    "spec_created",
+                    request_id=request.request_id,
+                    provider=provider,
+                    fields=len(spec["fields"]),
+                    groups=len(spec["groups"]),
+                )
+                return spec, provider, response.tokens_used
+
+        raise ValueError(f"No usable generation spec for {request.entity or 'request'}")
+
+    @staticmethod
+    def _parse_spec(content: str) -> Any:
+        """Parse the JSON object in an LLM response, ignoring surrounding text."""
+        start, end = content.find("{"), content.rfind("}")
+        if start == -1 or end < start:
+            raise ValueError("Response contains no JSON object")
+        return json.loads(content[start : end + 1])
+
+    def _generate_record(self, schema: dict, spec: dict) -> dict:
+        """Generate one record: traditional values overlaid with spec samples."""
+        record = self.traditional_generator._generate_record(schema, {})
+        fields = schema.get("fields", {})
+        self._apply_spec(record, spec, fields)
+
+        if "items" in spec["fields"] and "tax" not in spec["fields"]:
+            recompute_totals(record, tax_rate=self.rng.uniform(*TAX_RATE_RANGE))
+        return record
+
+    def _apply_spec(self, record: dict, spec: dict, fields: dict) -> None:
+        """Overwrite record fields with values sampled from a spec."""
+        for group in spec["groups"]:
+            row = self.rng.choices(group["rows"], weights=group["weights"])[0]
+            record.update(zip(group["fields"], row))
+
+        for name, field_spec in spec["fields"].items():
+            record[name] = self._sample(field_spec, fields.get(name, {}))
+
+    def _sample(self, field_spec: dict, field_def: dict) -> Any:
+        """Sample one value from a normalized field entry."""
+        if "choice" in field_spec:
+            return self.rng.choices(field_spec["choice"], weights=field_spec["weights"])[0]
+
+        if "range" in field_spec:
+            return self._sample_range(field_spec)
+
+        if "template" in field_spec:
+            slots = field_spec["slots"]
+            return SLOT_PATTERN.sub(
+                lambda m: (
+                    str(self.rng.choice(slots[m.group(1)])) if m.group(1) in slots else m.group(0)
+                ),
+                field_spec["template"],
+            )
+
+        if "item" in field_spec:
+            item_schema = field_def.get("item_schema", {})
+            items = []
+            for _ in range(self.rng.randint(*field_spec["count"])):
+                if item_schema.get("type") == "object":
+                    item = self.traditional_generator._generate_object(item_schema)
+                else:
+                    item = {}
+                self._apply_spec(item, field_spec["item"], item_schema.get("fields", {}))
+                items.append(item)
+            return items
+
+        return field_spec["value"]
+
+    def _sample_range(self, field_spec: dict) -> int | float:
+        """Sample a number from a range entry."""
+        low, high = field_spec["range"]
+        distribution = field_spec["distribution"]
+
+        if distribution == "normal":
+            value = self.rng.gauss((low + high) / 2, (high - low) / 6)
+        elif distribution == "lognormal" and low > 0:
+            # Skewed towards the low end, as prices and quantities usually are
+            log_low, log_high = math.log(low), math.log(high)
+            value = math.exp(
+                self.rng.gauss(log_low + (log_high - log_low) / 3, (log_high - log_low) / 4)
+            )
+        else:
+            value = self.rng.uniform(low, high)
+
+        value = min(max(value, low), high)
+        decimals = field_spec["decimals"]
+        return int(round(value)) if decimals == 0 else round(value, decimals)
@@ -0,0 +1,7 @@
+"""Parsers for LLM output formats."""
+
+from test_data_agent.parsers.compact import RowFormat
+from test_data_agent.parsers.json_stream import JSONArrayStreamParser
+from test_data_agent.parsers.tolerant import RecoveredRecords, recover_records
+
+__all__ = ["JSONArrayStreamParser", "RecoveredRecords", "RowFormat", "recover_records"]
@@ -0,0 +1,168 @@
+"""Compact row-oriented record format for LLM output.
+
+A JSON array of objects repeats every key name in every record, and output
+tokens dominate LLM latency. In the row format the prompt lists the columns
+once and the model writes one JSON array of values per record:
+
+    ["order_id", "items[sku,name,quantity,price]", "shipping_address.city", ...]
+    ["ORD-2025-0000001", [["SKU-1", "Running Shoes", 1, 89.99]], "Denver", ...]
+
+Nested objects are flattened into dotted columns and arrays of objects hold
+one row per element. Rows are still JSON, so the streaming and tolerant
+parsers handle them unchanged; :meth:`RowFormat.decode` rebuilds the records.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+SCENARIO_COLUMN = "_scenario"
+
+
+@dataclass(frozen=True)
+class Column:
+    """One value position in a row."""
+
+    path: tuple[str, ...]  # Keys leading to the value in the record
+    items: tuple["Column", ...] = ()  # Element columns for arrays of objects
+
+    @property
+    def label(self) -> str:
+        """Column name shown in the header."""
+        name = ".".join(self.path)
+        if self.items:
+            name += "[" + ",".join(column.label for column in self.items) + "]"
+        return name
+
+
+def columns_for(fields: dict) -> tuple[Column, ...]:
+    """Lay out columns for a mapping of schema field definitions.
+
+    Args:
+        fields: Schema field definitions
+
+    Returns:
+        Columns in schema order
+    """
+    columns: list[Column] = []
+    for name, field_def in fields.items():
+        if not isinstance(field_def, dict):
+            continue
+        field_type = field_def.get("type")
+        if field_type == "object" and field_def.get("fields"):
+            columns.extend(
+                Column((name, *column.path), column.items)
+                for column in columns_for(field_def["fields"])
+            )
+            continue
+        item_def = field_def.get("item_schema") or {}
+        if field_type == "array" and item_def.get("type") == "object" and item_def.get("fields"):
+            columns.append(Column((name,), columns_for(item_def["fields"])))
+            continue
+        columns.append(Column((name,)))
+    return tuple(columns)
+
+
+@dataclass(frozen=True)
+class RowFormat:
+    """Column layout for one schema, encoding and decoding rows."""
+
+    columns: tuple[Column, ...]
+
+    @classmethod
+    def from_schema(
+        cls, schema_dict: dict | None, extra_fields: tuple[str, ...] = ()
+    ) -> "RowFormat | None":
+        """Build the row format for a schema.
+
+        Args:
+            schema_dict: Schema dictionary
+            extra_fields: Additional top-level fields the prompt asks for
+                (e.g. ``_edge_case_type``)
+
+        Returns:
+            RowFormat, or None if the schema has no fields to lay out
+        """
+        fields = schema_dict.get("fields") if schema_dict else None
+        if not fields:
+            return None
+        extra = tuple(Column((name,)) for name in (*extra_fields, SCENARIO_COLUMN))
+        return cls(columns_for(fields) + extra)
+
+    @property
+    def header(self) -> str:
+        """Header row listing the column labels, as JSON."""
+        return json.dumps([column.label for column in self.columns], ensure_ascii=False)
+
+    def json_schema(self) -> dict:
+        """JSON Schema for a response of rows (an array of fixed-length arrays)."""
+        width = len(self.columns)
+        return {
+            "type": "array",
+            "items": {"type": "array", "minItems": width, "maxItems": width},
+        }
+
+    def encode(self, record: dict) -> list:
+        """Encode a record as a row.
+
+        Args:
+            record: Record dictionary
+
+        Returns:
+            Row of values in column order (null for missing values)
+        """
+        return self._encode(record, self.columns)
+
+    def decode(self, element: Any) -> dict | None:
+        """Rebuild a record from a parsed response element.
+
+        Objects are passed through, so a model that ignores the row format
+        still yields usable records.
+
+        Args:
+            element: Top-level element parsed from the response
+
+        Returns:
+            Record dictionary, or None if the element is not a valid row
+        """
+        if isinstance(element, dict):
+            return element
+        if not isinstance(element, list) or len(element) != len(self.columns):
+            return None
+        return self._decode(element, self.columns)
+
+    def _encode(self, record: dict, columns: tuple[Column, ...]) -> list:
+        """Encode a record against a column layout."""
+        row = []
+        for column in columns:
+            value: Any = record
+            for key in column.path:
+                value = value.get(key) if isinstance(value, dict) else None
+            if column.items and isinstance(value, list):
+                value = [
+                    self._encode(item, column.items) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            row.append(value)
+        return row
+
+    def _decode(self, row: list, columns: tuple[Column, ...]) -> dict:
+        """Decode a row against a column layout; null values are left out."""
+        record: dict = {}
+        for column, value in zip(columns, row):
+            if value is None:
+                continue
+            if column.items and isinstance(value, list):
+                value = [
+                    (
+                        self._decode(item, column.items)
+                        if isinstance(item, list) and len(item) == len(column.items)
+                        else item
+                    )
+                    for item in value
+                ]
+            target = record
+            for key in column.path[:-1]:
+                target = target.setdefault(key, {})
+            target[column.path[-1]] = value
+        return record
@@ -0,0 +1,129 @@
+"""Incremental parser for JSON arrays streamed token by token from an LLM."""
+
+import json
+from typing import Any
+
+from test_data_agent.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class JSONArrayStreamParser:
+    """Emits each top-level element of a JSON array as soon as it is complete.
+
+    Text before the opening bracket (preamble, markdown fences) is skipped.
+    If the response is a single top-level object instead of an array, that
+    object is emitted as the only element. Elements that fail to decode are
+    counted in ``errors`` and skipped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize parser state."""
+        self.started = False
+        self.complete = False
+        self.errors = 0
+        self._single_object = False
+        self._depth = 0  # Nesting depth inside the current element
+        self._in_string = False
+        self._escape = False
+        self._element: list[str] = []
+
+    def feed(self, text: str) -> list[Any]:
+        """Consume a chunk of streamed text.
+
+        Args:
+            text: Next chunk of model output
+
+        Returns:
+            Elements completed by this chunk, in order
+        """
+        completed: list[Any] = []
+
+        for char in text:
+            if self.complete:
+                break
+
+            if not self.started:
+                if char == "[":
+                    self.started = True
+                elif char == "{":
+                    self.started = True
+                    self._single_object = True
+                    self._begin_element(char)
+                continue
+
+            if self._element:
+                self._consume_element_char(char, completed)
+                continue
+
+            # Between elements at the top level of the array
+            if char in " \t\r\n,":
+                continue
+            if char == "]":
+                self.complete = True
+                continue
+            self._begin_element(char)
+
+        return completed
+
+    @property
+    def pending(self) -> str:
+        """Text of the element currently being accumulated."""
+        return "".join(self._element)
+
+    def _begin_element(self, char: str) -> None:
+        """Start accumulating a new element."""
+        self._element = [char]
+        if char in "{[":
+            self._depth = 1
+        elif char == '"':
+            self._in_string = True
+
+    def _consume_element_char(self, char: str, completed: list[Any]) -> None:
+        """Add a character to the current element and emit it if complete."""
+        if self._in_string:
+            self._element.append(char)
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._depth == 0:
+                    self._emit(completed)
+            return
+
+        if self._depth == 0:
+            # Inside a scalar element
+            if char in ",]":
+                self._emit(completed)
+                if char == "]":
+                    self.complete = True
+                return
+            self._element.append(char)
+            return
+
+        self._element.append(char)
+        if char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                self._emit(completed)
+                if self._single_object:
+                    self.complete = True
+
+    def _emit(self, completed: list[Any]) -> None:
+        """Decode the accumulated element and append it to ``completed``."""
+        raw = "".join(self._element).strip()
+        self._element = []
+        self._depth = 0
+        if not raw:
+            return
+        try:
+            completed.append(json.loads(raw))
+        except json.JSONDecodeError as e:
+            self.errors += 1
+            logger.warning("stream_element_parse_error", error=str(e), element=raw[:200])
@@ -0,0 +1,49 @@
+"""Tolerant recovery of records from truncated or malformed LLM output."""
+
+from dataclasses import dataclass
+
+from test_data_agent.parsers.compact import RowFormat
+from test_data_agent.parsers.json_stream import JSONArrayStreamParser
+
+
+@dataclass
+class RecoveredRecords:
+    """Records salvaged from an LLM response."""
+
+    records: list[dict]
+    truncated: bool  # Response ended before the closing bracket
+    errors: int  # Elements that could not be decoded and were skipped
+
+    @property
+    def clean(self) -> bool:
+        """True if the response parsed completely without dropping anything."""
+        return not self.truncated and self.errors == 0
+
+
+def recover_records(content: str, row_format: RowFormat | None = None) -> RecoveredRecords:
+    """Recover every complete record from an LLM response.
+
+    Preamble text and markdown fences are ignored, malformed elements are
+    skipped, and a trailing element cut off by ``max_tokens`` is dropped
+    instead of failing the whole response.
+
+    Args:
+        content: Raw model output
+        row_format: Row format the records were requested in, if any
+
+    Returns:
+        RecoveredRecords with the complete records in order
+    """
+    parser = JSONArrayStreamParser()
+    elements = parser.feed(content)
+    if row_format is not None:
+        decoded = (row_format.decode(element) for element in elements)
+        records = [record for record in decoded if record is not None]
+    else:
+        records = [element for element in elements if isinstance(element, dict)]
+
+    return RecoveredRecords(
+        records=records,
+        truncated=parser.started and not parser.complete,
+        errors=parser.errors + len(elements) - len(records),
+    )
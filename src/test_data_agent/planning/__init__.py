@@ -0,0 +1,16 @@
+"""Planning of LLM token usage, cost and latency for generation requests."""
+
+from test_data_agent.planning.estimator import GenerationEstimate, GenerationEstimator
+from test_data_agent.planning.token_budget import (
+    TokenBudgetExceededError,
+    TokenBudgetPlanner,
+    TokenPlan,
+)
+
+__all__ = [
+    "GenerationEstimate",
+    "GenerationEstimator",
+    "TokenBudgetExceededError",
+    "TokenBudgetPlanner",
+    "TokenPlan",
+]
@@ -0,0 +1,319 @@
+"""Cost and latency estimates for generation requests.
+
+Runs the same routing and token planning as a real request, then prices the
+planned tokens and predicts latency from live statistics, without calling
+an LLM or generating records. Schedulers use estimates to batch, defer or
+downgrade requests before running them.
+
+Latency comes from the most specific statistics available: observed
+latency of the path (per record for local paths, per wave of parallel LLM
+calls otherwise), then the chosen provider's per-call latency, then a
+static model from the planned output tokens.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from test_data_agent.planning.token_budget import TokenBudgetPlanner, TokenPlan
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.router.intelligence_router import GenerationPath, IntelligenceRouter
+from test_data_agent.utils.latency import LatencyWindow
+from test_data_agent.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from test_data_agent.config import Settings
+    from test_data_agent.generators.base import BaseGenerator
+    from test_data_agent.generators.field_level import FieldLevelGenerator
+    from test_data_agent.generators.llm import LLMGenerator
+    from test_data_agent.generators.spec import SpecGenerator
+
+logger = get_logger(__name__)
+
+# Paths whose latency is dominated by waves of parallel LLM calls
+LLM_PATHS = {GenerationPath.LLM.value, GenerationPath.HYBRID.value, GenerationPath.AMPLIFIED.value}
+
+# Static latency model used until enough requests have been observed
+PRIOR_SECONDS_PER_RECORD = {"traditional": 0.0005, "rag": 0.002}
+PRIOR_OUTPUT_TOKENS_PER_SECOND = 60.0
+PRIOR_CALL_OVERHEAD_SECONDS = 1.0
+PRIOR_P95_FACTOR = 2.0
+SPEC_OUTPUT_TOKENS = 600  # A generation spec is small whatever the record count
+
+# Plan without the budget check; the estimate reports overruns instead
+UNLIMITED_BUDGET = 2**31 - 1
+
+
+@dataclass
+class GenerationEstimate:
+    """Expected path, latency, tokens and cost of a generation request."""
+
+    path: str
+    reason: str
+    provider: str  # LLM provider expected to serve the calls ("" without LLM calls)
+    latency_p50_seconds: float
+    latency_p95_seconds: float
+    latency_source: str  # observed, provider or model
+    llm_calls: int
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float
+    cache_hit_likely: bool  # Spec would be served from the spec cache
+    pool_hit_likely: bool  # Reservoir holds enough records for the whole request
+    within_token_budget: bool
+
+
+class GenerationEstimator:
+    """Predicts what a request will cost without running it."""
+
+    def __init__(
+        self,
+        router: IntelligenceRouter,
+        llm_generator: LLMGenerator,
+        settings: Settings,
+        spec_generator: SpecGenerator | None = None,
+        llm_generator_for: (
+            Callable[[test_data_pb2.GenerateRequest, dict], BaseGenerator] | None
+        ) = None,
+        min_samples: int = 5,
+    ):
+        """Initialize estimator.
+
+        Args:
+            router: Router that picks the generation path
+            llm_generator: LLM generator whose planner, provider selector,
+                prompt builder and reservoir the estimate reuses
+            settings: Application settings (prices, seed count, RAG token budget)
+            spec_generator: Spec generator consulted for cached specs
+            llm_generator_for: Picks the generator serving an LLM-path request,
+                as the server does (the field-level generator when it applies)
+            min_samples: Observed requests per path before their latency is trusted
+        """
+        self.router = router
+        self.llm_generator = llm_generator
+        self.settings = settings
+        self.spec_generator = spec_generator
+        self.llm_generator_for = llm_generator_for
+        self.min_samples = min_samples
+        self._latency: dict[str, LatencyWindow] = {}
+
+    def observe(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        schema_dict: dict,
+        path: str,
+        seconds: float,
+    ) -> None:
+        """Record how long a completed request took on a path.
+
+        Args:
+            request: Completed request
+            schema_dict: Schema dictionary of the request
+            path: Generation path that served the request
+            seconds: Generation time
+        """
+        waves = 0
+        if path in LLM_PATHS:
+            count = self._seed_count(request, path)
+            provider = self.llm_generator.provider_selector.rank().provider
+            plan = self._plan(request, schema_dict, path, count)
+            waves = math.ceil(plan.calls / self._parallel_calls(provider))
+        units = self._latency_units(path, request.count, waves)
+        self._latency.setdefault(path, LatencyWindow()).record(seconds / max(units, 1))
+
+    async def estimate(
+        self, request: test_data_pb2.GenerateRequest, schema_dict: dict
+    ) -> GenerationEstimate:
+        """Estimate a request's path, latency, tokens and cost.
+
+        Args:
+            request: Generate data request
+            schema_dict: Schema dictionary of the request
+
+        Returns:
+            GenerationEstimate for the request
+        """
+        decision = self.router.route(request)
+        path = decision.path.value
+        provider = ""
+        calls = input_tokens = output_tokens = 0
+        cache_hit = pool_hit = False
+        waves = 0
+
+        if path == GenerationPath.SPEC.value:
+            cache_hit = bool(
+                self.spec_generator
+                and await self.spec_generator.has_cached_spec(request, schema_dict)
+            )
+            if not cache_hit:
+                provider = "claude"
+                calls = 1
+                system, user = self.llm_generator.prompt_builder.build_spec_prompt(
+                    request, schema_dict
+                )
+                input_tokens = TokenBudgetPlanner.estimate_prompt_tokens(system, user)
+                output_tokens = SPEC_OUTPUT_TOKENS
+        elif path in LLM_PATHS:
+            count = await self._llm_record_count(request, schema_dict, path)
+            pool_hit = count == 0
+            if count:
+                provider = self.llm_generator.provider_selector.rank().provider
+                plan = self._plan(request, schema_dict, path, count)
+                calls = plan.calls
+                input_tokens = plan.planned_tokens - math.ceil(count * plan.tokens_per_record)
+                output_tokens = plan.planned_tokens - input_tokens
+                waves = math.ceil(calls / self._parallel_calls(provider))
+
+        p50, p95, source = self._latency_for(
+            path, request.count, waves, provider, output_tokens / max(calls, 1)
+        )
+        budget = request.token_budget or self.llm_generator.token_planner.default_budget
+        estimate = GenerationEstimate(
+            path=path,
+            reason=decision.reason,
+            provider=provider,
+            latency_p50_seconds=p50,
+            latency_p95_seconds=p95,
+            latency_source=source,
+            llm_calls=calls,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=self._cost(provider, input_tokens, output_tokens),
+            cache_hit_likely=cache_hit,
+            pool_hit_likely=pool_hit,
+            within_token_budget=not budget or input_tokens + output_tokens <= budget,
+        )
+
+        logger.info(
+            "generation_estimated",
+            request_id=request.request_id,
+            path=path,
+            provider=provider,
+            llm_calls=calls,
+            tokens=input_tokens + output_tokens,
+            cost_usd=round(estimate.cost_usd, 6),
+            latency_p50=round(p50, 3),
+            latency_source=source,
+        )
+        return estimate
+
+    def _seed_count(self, request: test_data_pb2.GenerateRequest, path: str) -> int:
+        """Records an LLM path asks the LLM for, before the reservoir is consulted."""
+        if path == GenerationPath.AMPLIFIED.value:
+            return min(request.count, self.settings.amplification_seed_count)
+        return request.count
+
+    async def _llm_record_count(
+        self, request: test_data_pb2.GenerateRequest, schema_dict: dict, path: str
+    ) -> int:
+        """Records the LLM would be asked for once the reservoir has been drained."""
+        count = self._seed_count(request, path)
+        reservoir = self.llm_generator.reservoir
+        if self._field_level(request, schema_dict, path) is not None:
+            return count  # Text for locally built records is never pooled
+        if path == GenerationPath.LLM.value and reservoir and reservoir.enabled_for(request):
+            pooled = await reservoir.redis_client.get_pool_size(
+                reservoir.pool_name(request, schema_dict)
+            )
+            count = max(0, count - pooled)
+            if count:
+                count += reservoir.surplus(count)
+        return count
+
+    def _plan(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        schema_dict: dict,
+        path: str,
+        count: int,
+    ) -> TokenPlan:
+        """Token plan for the LLM share of a request."""
+        field_level = self._field_level(request, schema_dict, path)
+        if field_level is not None:
+            # The LLM writes only the text fields of locally built records
+            schema_dict = field_level.text_schema(schema_dict)
+        parts = self.llm_generator.prompt_builder.build_prompt_parts(
+            request, schema_dict, compact=self.llm_generator.compact_output
+        )
+        prompt_tokens = TokenBudgetPlanner.estimate_prompt_tokens(
+            parts.system, parts.prefix, parts.suffix
+        )
+        if path == GenerationPath.HYBRID.value:
+            prompt_tokens += self.settings.rag_prompt_token_budget
+        return self.llm_generator.token_planner.plan(
+            schema_dict, count, prompt_tokens=prompt_tokens, budget=UNLIMITED_BUDGET
+        )
+
+    def _field_level(
+        self, request: test_data_pb2.GenerateRequest, schema_dict: dict, path: str
+    ) -> FieldLevelGenerator | None:
+        """Field-level generator serving an LLM-path request, if the server would use it."""
+        # Imported here: the generators import the planning package
+        from test_data_agent.generators.field_level import FieldLevelGenerator
+
+        if path != GenerationPath.LLM.value or self.llm_generator_for is None:
+            return None
+        generator = self.llm_generator_for(request, schema_dict)
+        return generator if isinstance(generator, FieldLevelGenerator) else None
+
+    def _parallel_calls(self, provider: str) -> int:
+        """Calls the LLM generator runs at once for a provider."""
+        return self.llm_generator.provider_parallel_calls.get(
+            provider, self.llm_generator.max_parallel_calls
+        )
+
+    @staticmethod
+    def _latency_units(path: str, count: int, waves: int) -> int:
+        """What a path's latency scales with: waves of LLM calls, one spec, or records."""
+        if path in LLM_PATHS:
+            return waves
+        if path == GenerationPath.SPEC.value:
+            return 1
+        return max(count, 1)
+
+    def _latency_for(
+        self, path: str, count: int, waves: int, provider: str, output_tokens_per_call: float
+    ) -> tuple[float, float, str]:
+        """Expected p50 and p95 latency and where the numbers came from."""
+        units = self._latency_units(path, count, waves)
+        window = self._latency.get(path)
+        if units and window is not None and len(window) >= self.min_samples:
+            return (
+                window.percentile(0.5) * units,
+                window.percentile(0.95) * units,
+                "observed",
+            )
+
+        if provider and waves:
+            stats = self.llm_generator.provider_selector.stats.get(provider)
+            if stats is not None and len(stats.latency) >= self.min_samples:
+                return (
+                    stats.latency.percentile(0.5) * waves,
+                    stats.latency.percentile(0.95) * waves,
+                    "provider",
+                )
+
+        if provider:
+            per_call = (
+                PRIOR_CALL_OVERHEAD_SECONDS
+                + output_tokens_per_call / PRIOR_OUTPUT_TOKENS_PER_SECOND
+            )
+            seconds = per_call * max(waves, 1)
+        else:
+            per_record = PRIOR_SECONDS_PER_RECORD.get(path, PRIOR_SECONDS_PER_RECORD["traditional"])
+            seconds = per_record * max(count, 1)
+        return seconds, seconds * PRIOR_P95_FACTOR, "model"
+
+    def _cost(self, provider: str, input_tokens: int, output_tokens: int) -> float:
+        """Price of the planned tokens in USD."""
+        if provider == "claude":
+            return (
+                input_tokens * self.settings.claude_input_cost_per_mtok
+                + output_tokens * self.settings.claude_output_cost_per_mtok
+            ) / 1_000_000
+        if provider == "vllm":
+            return (input_tokens + output_tokens) * self.settings.vllm_cost_per_mtok / 1_000_000
+        return 0.0
@@ -0,0 +1,259 @@
+"""Token budget planner for LLM generation calls.
+
+Estimates output tokens per record for each schema, starting from a static
+estimate based on the schema's fields and refined with a moving average of
+observed usage. The estimate sizes ``max_tokens`` and the number of records
+requested per call so responses are rarely truncated and calls do not reserve
+far more output than they need.
+"""
+
+import math
+from dataclasses import dataclass
+
+from test_data_agent.utils.fingerprint import schema_fingerprint
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.lru import LRUCache
+
+logger = get_logger(__name__)
+
+# Approximate output tokens for a JSON value of each schema type
+VALUE_TOKENS = {
+    "string": 8,
+    "integer": 3,
+    "float": 4,
+    "boolean": 2,
+    "enum": 4,
+    "date": 7,
+    "datetime": 12,
+    "email": 9,
+    "phone": 7,
+    "uuid": 20,
+    "address": 30,
+}
+DEFAULT_VALUE_TOKENS = 8
+KEY_TOKENS = 4  # Quoted key, colon and separator
+RECORD_OVERHEAD_TOKENS = 14  # Braces plus the _scenario metadata field
+RESPONSE_OVERHEAD_TOKENS = 32  # Array brackets and any stray preamble
+DEFAULT_ARRAY_ITEMS = 3
+LONG_TEXT_FIELDS = {"body", "comment", "content", "description", "message", "notes", "text"}
+LONG_TEXT_TOKENS = 60
+CHARS_PER_TOKEN = 4
+
+
+class TokenBudgetExceededError(ValueError):
+    """Raised when a request is planned to use more tokens than its budget."""
+
+    def __init__(self, planned: int, budget: int):
+        """Initialize error.
+
+        Args:
+            planned: Planned token usage
+            budget: Token budget for the request
+        """
+        super().__init__(f"Planned LLM usage of {planned} tokens exceeds the budget of {budget}")
+        self.planned = planned
+        self.budget = budget
+
+
+@dataclass
+class TokenPlan:
+    """How a request is split into LLM calls."""
+
+    records_per_call: int
+    calls: int
+    max_tokens: int  # max_tokens for each call
+    tokens_per_record: float  # Expected output tokens per record
+    planned_tokens: int  # Expected input + output tokens for the whole request
+    budget: int = 0  # Token budget for the request (0 = unlimited)
+
+    def chunk_counts(self, count: int) -> list[int]:
+        """Split ``count`` records into per-call counts.
+
+        Args:
+            count: Total records requested
+
+        Returns:
+            Record count for each call
+        """
+        return [
+            min(self.records_per_call, count - start)
+            for start in range(0, count, self.records_per_call)
+        ]
+
+
+class TokenBudgetPlanner:
+    """Plans ``max_tokens`` and records per call from per-schema token estimates."""
+
+    def __init__(
+        self,
+        max_output_tokens: int = 4096,
+        safety_margin: float = 1.25,
+        smoothing: float = 0.2,
+        default_budget: int = 0,
+    ):
+        """Initialize planner.
+
+        Args:
+            max_output_tokens: Largest max_tokens a single call may use
+            safety_margin: Multiplier applied to the per-record estimate
+            smoothing: Weight of each new observation in the moving average
+            default_budget: Token budget for requests without their own (0 = unlimited)
+        """
+        self.max_output_tokens = max_output_tokens
+        self.safety_margin = safety_margin
+        self.smoothing = smoothing
+        self.default_budget = default_budget
+        self._observed: dict[str, float] = {}
+        self._static: LRUCache[float] = LRUCache(maxsize=256)
+
+    def static_estimate(self, schema_dict: dict) -> float:
+        """Estimate output tokens per record from the schema alone.
+
+        Args:
+            schema_dict: Schema dictionary
+
+        Returns:
+            Estimated output tokens per record
+        """
+        fields = schema_dict.get("fields", {}) if schema_dict else {}
+        if not fields:
+            # Unknown schema; assume a modest flat record
+            return RECORD_OVERHEAD_TOKENS + 10 * (KEY_TOKENS + DEFAULT_VALUE_TOKENS)
+        return self._static.get_or_compute(
+            schema_fingerprint(schema_dict),
+            lambda: RECORD_OVERHEAD_TOKENS + self._estimate_fields(fields),
+        )
+
+    def tokens_per_record(self, schema_dict: dict) -> float:
+        """Current output tokens per record estimate for a schema.
+
+        Args:
+            schema_dict: Schema dictionary
+
+        Returns:
+            Observed moving average if available, otherwise the static estimate
+        """
+        observed = self._observed.get(schema_fingerprint(schema_dict))
+        return observed if observed is not None else self.static_estimate(schema_dict)
+
+    def observe(self, schema_dict: dict, output_tokens: int, records: int) -> None:
+        """Fold an observed response into the moving average.
+
+        Args:
+            schema_dict: Schema dictionary
+            output_tokens: Output tokens reported by the provider
+            records: Complete records recovered from the response
+        """
+        if output_tokens <= 0 or records <= 0:
+            return
+        key = schema_fingerprint(schema_dict)
+        sample = output_tokens / records
+        previous = self._observed.get(key)
+        if previous is None:
+            previous = self.static_estimate(schema_dict)
+        self._observed[key] = previous + self.smoothing * (sample - previous)
+
+    def max_tokens_for(self, schema_dict: dict, count: int) -> int:
+        """max_tokens for a single call producing ``count`` records.
+
+        Args:
+            schema_dict: Schema dictionary
+            count: Records requested in the call
+
+        Returns:
+            max_tokens, capped at ``max_output_tokens``
+        """
+        reserve = self.tokens_per_record(schema_dict) * self.safety_margin
+        return min(self.max_output_tokens, math.ceil(count * reserve + RESPONSE_OVERHEAD_TOKENS))
+
+    def plan(
+        self, schema_dict: dict, count: int, prompt_tokens: int = 0, budget: int = 0
+    ) -> TokenPlan:
+        """Plan the LLM calls for a request.
+
+        Args:
+            schema_dict: Schema dictionary
+            count: Records requested
+            prompt_tokens: Estimated input tokens per call
+            budget: Token budget for the request (0 uses the default budget)
+
+        Returns:
+            TokenPlan for the request
+
+        Raises:
+            TokenBudgetExceededError: If the plan exceeds the budget
+        """
+        count = max(count, 1)
+        per_record = self.tokens_per_record(schema_dict)
+        reserve = per_record * self.safety_margin
+        capacity = max(1, int((self.max_output_tokens - RESPONSE_OVERHEAD_TOKENS) // reserve))
+
+        calls = math.ceil(count / capacity)
+        records_per_call = math.ceil(count / calls)  # Balance records across calls
+        plan = TokenPlan(
+            records_per_call=records_per_call,
+            calls=calls,
+            max_tokens=self.max_tokens_for(schema_dict, records_per_call),
+            tokens_per_record=per_record,
+            planned_tokens=calls * prompt_tokens + math.ceil(count * per_record),
+            budget=budget or self.default_budget,
+        )
+
+        logger.debug(
+            "token_plan",
+            count=count,
+            calls=plan.calls,
+            records_per_call=plan.records_per_call,
+            max_tokens=plan.max_tokens,
+            tokens_per_record=round(per_record, 1),
+            planned_tokens=plan.planned_tokens,
+            budget=plan.budget,
+        )
+
+        if plan.budget and plan.planned_tokens > plan.budget:
+            raise TokenBudgetExceededError(plan.planned_tokens, plan.budget)
+        return plan
+
+    @staticmethod
+    def estimate_prompt_tokens(*texts: str) -> int:
+        """Roughly estimate input tokens for prompt text.
+
+        Args:
+            *texts: Prompt pieces sent with each call
+
+        Returns:
+            Estimated token count
+        """
+        return sum(len(text) for text in texts) // CHARS_PER_TOKEN
+
+    def _estimate_fields(self, fields: dict) -> float:
+        """Estimate tokens for a mapping of field definitions."""
+        return sum(
+            KEY_TOKENS + self._estimate_value(name, field_def)
+            for name, field_def in fields.items()
+            if isinstance(field_def, dict)
+        )
+
+    def _estimate_value(self, name: str, field_def: dict) -> float:
+        """Estimate tokens for a single field value."""
+        field_type = field_def.get("type", "string")
+
+        if field_type == "object":
+            return 2 + self._estimate_fields(field_def.get("fields", {}))
+
+        if field_type == "array":
+            item_def = field_def.get("item_schema") or {
+                "type": field_def.get("item_type", "string")
+            }
+            items = max(field_def.get("min", 0), DEFAULT_ARRAY_ITEMS)
+            return 2 + items * (1 + self._estimate_value(name, item_def))
+
+        if field_type == "string":
+            max_length = field_def.get("max_length")
+            if max_length and max_length > 200:
+                # Free text usually fills a fraction of its limit
+                return min(max_length / (2 * CHARS_PER_TOKEN), 250)
+            if name in LONG_TEXT_FIELDS:
+                return LONG_TEXT_TOKENS
+
+        return VALUE_TOKENS.get(field_type, DEFAULT_VALUE_TOKENS)
@@ -8,7 +8,8 @@ from test_data_agent.prompts.templates import (
     COHERENT_TEMPLATE,
     TEXT_CONTENT_TEMPLATE,
 )
-from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.prompts.builder import PromptBuilder, PromptParts
+from test_data_agent.prompts.examples import ExampleSelector
 
 __all__ = [
     "SYSTEM_PROMPT",
@@ -18,4 +19,6 @@ __all__ = [
     "COHERENT_TEMPLATE",
     "TEXT_CONTENT_TEMPLATE",
     "PromptBuilder",
+    "PromptParts",
+    "ExampleSelector",
 ]
@@ -1,21 +1,104 @@
-"""Prompt builder for dynamic LLM prompt construction."""
+"""Prompt builder for dynamic LLM prompt construction.
 
-import json
+Prompt assembly runs once per LLM call, and chunked requests, continuations
+and retries make several calls per request. Everything that only depends on
+the schema, RAG patterns, constraints or scenarios is rendered once and
+memoized, and templates are pre-split into literal and placeholder segments
+so assembly is plain string concatenation.
+"""
+
+from dataclasses import dataclass
+from string import Formatter
 from typing import Any
 
-from test_data_agent.prompts.system import SYSTEM_PROMPT
+from test_data_agent.parsers.compact import RowFormat
+from test_data_agent.prompts.examples import PATTERN_ID_KEY, ExampleSelector, render_example
+from test_data_agent.prompts.system import SPEC_SYSTEM_PROMPT, SYSTEM_PROMPT
 from test_data_agent.prompts.templates import (
     GENERAL_TEMPLATE,
     RAG_TEMPLATE,
     EDGE_CASE_TEMPLATE,
     COHERENT_TEMPLATE,
     TEXT_CONTENT_TEMPLATE,
+    SPEC_TEMPLATE,
+    TEMPLATE_PARTS,
+    ROW_FORMAT_NOTE,
+    TEMPLATE_EXTRA_FIELDS,
 )
+from test_data_agent.utils.fingerprint import fingerprint, schema_fingerprint
+from test_data_agent.utils.lru import LRUCache
+
+Segments = tuple[tuple[str, str | None], ...]
+
+
+def compile_template(template: str) -> Segments:
+    """Split a format template into (literal, placeholder) segments.
+
+    Args:
+        template: ``str.format`` template
+
+    Returns:
+        Segments for :func:`render_template`
+    """
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+def render_template(segments: Segments, values: dict[str, str]) -> str:
+    """Render pre-split template segments by concatenation.
+
+    Args:
+        segments: Segments from :func:`compile_template`
+        values: Placeholder values
+
+    Returns:
+        Rendered string
+    """
+    return "".join(literal + values[field] if field else literal for literal, field in segments)
+
+
+# Pre-split (prefix, suffix) segments for each full template
+COMPILED_TEMPLATE_PARTS = {
+    template: (compile_template(prefix), compile_template(suffix))
+    for template, (prefix, suffix) in TEMPLATE_PARTS.items()
+}
+
+COMPILED_SPEC_TEMPLATE = compile_template(SPEC_TEMPLATE)
+
+
+@dataclass
+class PromptParts:
+    """Prompt split into cacheable and per-request parts."""
+
+    system: str  # System prompt (stable)
+    prefix: str  # Stable user prefix: instructions, examples, schema
+    suffix: str  # Variable user suffix: count, context, constraints, scenarios
+    row_format: RowFormat | None = None  # Set when records are requested as compact rows
+    extra_fields: tuple[str, ...] = ()  # Fields the template asks for beyond the schema
+
+    @property
+    def user(self) -> str:
+        """Full user prompt."""
+        return self.prefix + self.suffix
 
 
 class PromptBuilder:
     """Builds prompts for LLM-based data generation."""
 
+    def __init__(self, cache_size: int = 256, example_selector: ExampleSelector | None = None):
+        """Initialize prompt builder.
+
+        Args:
+            cache_size: Entries kept in each memoized fragment cache
+            example_selector: Picks and compacts the RAG examples shown in prompts
+        """
+        self.example_selector = example_selector or ExampleSelector()
+        self._prefix_cache: LRUCache[str] = LRUCache(cache_size)
+        self._schema_cache: LRUCache[str] = LRUCache(cache_size)
+        self._constraints_cache: LRUCache[str] = LRUCache(cache_size)
+        self._scenarios_cache: LRUCache[str] = LRUCache(cache_size)
+        self._example_cache: LRUCache[str] = LRUCache(cache_size * 4)
+        self._row_format_cache: LRUCache[RowFormat | None] = LRUCache(cache_size)
+
     def build_prompt(
         self,
         request: Any,
@@ -32,35 +115,119 @@ class PromptBuilder:
         Returns:
             Tuple of (system_prompt, user_prompt)
         """
+        parts = self.build_prompt_parts(request, schema_dict, rag_context)
+        return (parts.system, parts.user)
+
+    def build_prompt_parts(
+        self,
+        request: Any,
+        schema_dict: dict | None,
+        rag_context: list[dict] | None = None,
+        compact: bool = False,
+    ) -> PromptParts:
+        """Build prompts split into a stable prefix and a variable suffix.
+
+        The prefix only depends on the template, schema, RAG examples and
+        output format, so it is byte-identical across requests for the same
+        entity and can be cached by the LLM provider.
+
+        Args:
+            request: GenerateRequest proto message
+            schema_dict: Schema dictionary from registry (can be None)
+            rag_context: Optional RAG examples
+            compact: Ask for records as compact rows (ignored without schema fields)
+
+        Returns:
+            PromptParts with system prompt, user prefix, user suffix and the
+            row format when rows were requested
+        """
         # Select template based on request characteristics
         template = self.select_template(request, rag_context)
+        prefix_segments, suffix_segments = COMPILED_TEMPLATE_PARTS[template]
+        row_format = self.row_format(template, schema_dict) if compact else None
+
+        # The prefix depends only on template, schema, examples and output format
+        prefix_key = (
+            template,
+            schema_fingerprint(schema_dict),
+            self._examples_key(rag_context),
+            row_format is not None,
+        )
 
-        # Format schema
-        schema_str = self.format_schema(schema_dict)
-
-        # Format constraints
-        constraints_str = self.format_constraints(request.constraints)
-
-        # Format scenarios
-        scenarios_str = self.format_scenarios(request.scenarios)
-
-        # Build user prompt from template
-        user_prompt = template.format(
-            count=request.count,
-            domain=request.domain,
-            entity=request.entity,
-            entity_type=request.entity,
-            content_type=f"{request.entity}s",
-            context=request.context or "No specific context provided.",
-            schema=schema_str,
-            constraints=constraints_str,
-            scenarios=scenarios_str,
-            rag_examples=self.format_rag_examples(rag_context) if rag_context else "",
-            defect_patterns=self.format_rag_examples(rag_context) if rag_context else "",
-            sentiment_distribution="Mixed: 60% positive, 30% neutral, 10% negative",
+        def render_prefix() -> str:
+            examples_str = self.format_rag_examples(rag_context, schema_dict) if rag_context else ""
+            note = ROW_FORMAT_NOTE.format(header=row_format.header) if row_format else ""
+            return note + render_template(
+                prefix_segments,
+                {
+                    "schema": self.format_schema(schema_dict),
+                    "rag_examples": examples_str,
+                    "defect_patterns": examples_str,
+                },
+            )
+
+        prefix = self._prefix_cache.get_or_compute(prefix_key, render_prefix)
+        suffix = render_template(
+            suffix_segments,
+            {
+                "count": str(request.count),
+                "domain": request.domain,
+                "entity": request.entity,
+                "entity_type": request.entity,
+                "content_type": f"{request.entity}s",
+                "context": request.context or "No specific context provided.",
+                "constraints": self.format_constraints(request.constraints),
+                "scenarios": self.format_scenarios(request.scenarios),
+                "sentiment_distribution": "Mixed: 60% positive, 30% neutral, 10% negative",
+            },
         )
 
-        return (SYSTEM_PROMPT, user_prompt)
+        return PromptParts(
+            system=SYSTEM_PROMPT,
+            prefix=prefix,
+            suffix=suffix,
+            row_format=row_format,
+            extra_fields=TEMPLATE_EXTRA_FIELDS.get(template, ()),
+        )
+
+    def row_format(self, template: str, schema_dict: dict | None) -> RowFormat | None:
+        """Row format for a template and schema, memoized.
+
+        Args:
+            template: Selected template
+            schema_dict: Schema dictionary (can be None)
+
+        Returns:
+            RowFormat, or None if the schema has no fields
+        """
+        if not schema_dict:
+            return None
+        return self._row_format_cache.get_or_compute(
+            (template, schema_fingerprint(schema_dict)),
+            lambda: RowFormat.from_schema(schema_dict, TEMPLATE_EXTRA_FIELDS.get(template, ())),
+        )
+
+    def build_spec_prompt(self, request: Any, schema_dict: dict | None) -> tuple[str, str]:
+        """Build prompts asking for a generation spec instead of records.
+
+        Args:
+            request: GenerateRequest proto message
+            schema_dict: Schema dictionary from registry (can be None)
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
+        user = render_template(
+            COMPILED_SPEC_TEMPLATE,
+            {
+                "schema": self.format_schema(schema_dict),
+                "entity": request.entity,
+                "domain": request.domain,
+                "context": request.context or "No specific context provided.",
+                "constraints": self.format_constraints(request.constraints),
+            },
+        )
+        return (SPEC_SYSTEM_PROMPT, user)
 
     def select_template(self, request: Any, rag_context: list[dict] | None = None) -> str:
         """Select appropriate template based on request characteristics.
@@ -106,6 +273,12 @@ class PromptBuilder:
         if not schema_dict:
             return "No specific schema provided. Generate data based on entity name and context."
 
+        return self._schema_cache.get_or_compute(
+            schema_fingerprint(schema_dict), lambda: self._render_schema(schema_dict)
+        )
+
+    def _render_schema(self, schema_dict: dict) -> str:
+        """Render a schema section (uncached)."""
         lines = []
         lines.append(f"Entity: {schema_dict.get('name', 'unknown')}")
         lines.append(f"Domain: {schema_dict.get('domain', 'unknown')}")
@@ -154,6 +327,13 @@ class PromptBuilder:
         if not constraints or not constraints.field_constraints:
             return "No specific constraints."
 
+        return self._constraints_cache.get_or_compute(
+            constraints.SerializeToString(deterministic=True),
+            lambda: self._render_constraints(constraints),
+        )
+
+    def _render_constraints(self, constraints: Any) -> str:
+        """Render a constraints section (uncached)."""
         lines = []
         for field_name, constraint in constraints.field_constraints.items():
             parts = [f"{field_name}:"]
@@ -189,6 +369,13 @@ class PromptBuilder:
         if not scenarios:
             return "Generate all records with default scenario."
 
+        return self._scenarios_cache.get_or_compute(
+            tuple(scenario.SerializeToString(deterministic=True) for scenario in scenarios),
+            lambda: self._render_scenarios(scenarios),
+        )
+
+    def _render_scenarios(self, scenarios: list[Any]) -> str:
+        """Render a scenarios section (uncached)."""
         lines = []
         for scenario in scenarios:
             parts = [f"{scenario.name}: {scenario.count} records"]
@@ -201,22 +388,44 @@ class PromptBuilder:
 
         return "\n".join(lines)
 
-    def format_rag_examples(self, examples: list[dict] | None) -> str:
-        """Format RAG examples into readable string.
+    def format_rag_examples(
+        self, examples: list[dict] | None, schema_dict: dict | None = None
+    ) -> str:
+        """Format RAG examples into a compact string.
+
+        The selector strips examples to the schema's fields and keeps the
+        most diverse ones within its token budget. Examples tagged with
+        ``_pattern_id`` are rendered once per pattern and schema.
 
         Args:
-            examples: List of example data dicts
+            examples: List of example data dicts, most relevant first
+            schema_dict: Schema dictionary (can be None)
 
         Returns:
             Formatted examples string
         """
-        if not examples:
+        selected = self.example_selector.select(examples, schema_dict)
+        if not selected:
             return "No examples provided."
 
-        lines = []
-        for i, example in enumerate(examples[:5]):  # Limit to 5 examples
-            lines.append(f"Example {i + 1}:")
-            lines.append(json.dumps(example, indent=2))
-            lines.append("")
+        return "\n".join(
+            f"Example {i + 1}: {self._render_example(example, schema_dict)}"
+            for i, example in enumerate(selected)
+        )
 
-        return "\n".join(lines)
+    def _render_example(self, example: dict, schema_dict: dict | None) -> str:
+        """Render one stripped RAG example, cached by pattern id and schema."""
+        pattern_id = example.get(PATTERN_ID_KEY)
+        if pattern_id is None:
+            return render_example(example)
+        return self._example_cache.get_or_compute(
+            (pattern_id, schema_fingerprint(schema_dict)), lambda: render_example(example)
+        )
+
+    def _examples_key(self, examples: list[dict] | None) -> tuple | str | None:
+        """Cache key for the examples a prompt prefix is rendered from."""
+        if not examples:
+            return None
+        if all(PATTERN_ID_KEY in example for example in examples):
+            return tuple(example[PATTERN_ID_KEY] for example in examples)
+        return fingerprint(examples)
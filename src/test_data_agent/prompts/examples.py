@@ -0,0 +1,149 @@
+"""Selection and compaction of RAG examples for prompts.
+
+RAG results often include several near-identical variations of one pattern,
+and pretty-printed examples cost input tokens on every call. Examples are
+stripped to the schema's fields, the most diverse ones are picked greedily by
+field-value distance (starting from the most relevant), and they are
+rendered as compact JSON within an input-token budget.
+"""
+
+import json
+from typing import Any
+
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+
+# Key added to RAG examples so their rendering can be cached per pattern
+PATTERN_ID_KEY = "_pattern_id"
+
+
+def render_example(example: dict) -> str:
+    """Render an example as compact JSON without its pattern id.
+
+    Args:
+        example: Example record
+
+    Returns:
+        Minified JSON
+    """
+    return json.dumps(
+        {k: v for k, v in example.items() if k != PATTERN_ID_KEY},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def strip_to_schema(value: Any, fields: dict | None) -> Any:
+    """Drop fields the schema doesn't define, recursively.
+
+    Args:
+        value: Example record or nested value
+        fields: Schema field definitions for ``value`` (None keeps everything)
+
+    Returns:
+        Copy holding only schema fields (and the pattern id)
+    """
+    if not fields or not isinstance(value, dict):
+        return value
+    stripped = {}
+    for name, field_value in value.items():
+        if name == PATTERN_ID_KEY:
+            stripped[name] = field_value
+            continue
+        field_def = fields.get(name)
+        if not isinstance(field_def, dict):
+            continue
+        if field_def.get("type") == "object":
+            field_value = strip_to_schema(field_value, field_def.get("fields"))
+        elif field_def.get("type") == "array" and isinstance(field_value, list):
+            item_fields = (field_def.get("item_schema") or {}).get("fields")
+            field_value = [strip_to_schema(item, item_fields) for item in field_value]
+        stripped[name] = field_value
+    return stripped
+
+
+def example_distance(a: dict, b: dict) -> float:
+    """Mean per-field distance between two examples.
+
+    Numbers differ by their relative difference, other values by equality.
+    Identifier fields are unique by construction and are ignored.
+
+    Args:
+        a: First example
+        b: Second example
+
+    Returns:
+        Distance from 0.0 (same values) to 1.0 (no value in common)
+    """
+    keys = {k for k in a.keys() | b.keys() if k != PATTERN_ID_KEY and not k.endswith("_id")}
+    if not keys:
+        return 0.0
+    total = 0.0
+    for key in keys:
+        x, y = a.get(key), b.get(key)
+        if _is_number(x) and _is_number(y):
+            scale = max(abs(x), abs(y))
+            total += min(1.0, abs(x - y) / scale) if scale else 0.0
+        elif x != y:
+            total += 1.0
+    return total / len(keys)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ExampleSelector:
+    """Picks diverse, schema-stripped RAG examples within a token budget."""
+
+    def __init__(self, max_examples: int = 5, token_budget: int = 1500):
+        """Initialize example selector.
+
+        Args:
+            max_examples: Most examples put in a prompt
+            token_budget: Estimated input tokens the rendered examples may use
+                (0 = unlimited)
+        """
+        self.max_examples = max_examples
+        self.token_budget = token_budget
+
+    def select(self, examples: list[dict] | None, schema_dict: dict | None = None) -> list[dict]:
+        """Select examples for a prompt.
+
+        The first example (the best retrieval match) is taken first; each
+        following pick is the one farthest from those already chosen.
+        Examples that would exceed the token budget are skipped.
+
+        Args:
+            examples: Retrieved examples, most relevant first
+            schema_dict: Schema the examples are stripped to (None keeps all fields)
+
+        Returns:
+            Stripped examples in selection order
+        """
+        fields = schema_dict.get("fields") if schema_dict else None
+        candidates: list[dict] = []
+        seen: set[str] = set()
+        for example in examples or []:
+            stripped = strip_to_schema(example, fields)
+            rendered = render_example(stripped)
+            if rendered not in seen:
+                seen.add(rendered)
+                candidates.append(stripped)
+
+        costs = [TokenBudgetPlanner.estimate_prompt_tokens(render_example(c)) for c in candidates]
+        nearest = [float("inf")] * len(candidates)  # Distance to the closest chosen example
+        remaining = list(range(len(candidates)))
+        chosen: list[int] = []
+        tokens = 0
+
+        while remaining and len(chosen) < self.max_examples:
+            pick = max(remaining, key=lambda i: (nearest[i], -i))
+            remaining.remove(pick)
+            if self.token_budget and tokens + costs[pick] > self.token_budget:
+                continue
+            chosen.append(pick)
+            tokens += costs[pick]
+            for i in remaining:
+                nearest[i] = min(nearest[i], example_distance(candidates[i], candidates[pick]))
+
+        return [candidates[i] for i in chosen]
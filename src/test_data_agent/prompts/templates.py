@@ -1,14 +1,23 @@
-"""Prompt templates for different generation scenarios."""
+"""Prompt templates for different generation scenarios.
+
+Each template is split into a stable PREFIX (instructions, reference examples
+and schema, identical for every request on the same entity) and a variable
+SUFFIX (count, context, constraints, scenarios). Keeping the prefix first lets
+the LLM provider cache it across requests. The full ``*_TEMPLATE`` strings are
+the concatenation of both parts.
+"""
 
 # Template for general data generation
-GENERAL_TEMPLATE = """Generate {count} test data records for the {domain} domain.
+GENERAL_TEMPLATE_PREFIX = """SCHEMA:
+{schema}
+
+"""
+
+GENERAL_TEMPLATE_SUFFIX = """Generate {count} test data records for the {domain} domain.
 
 CONTEXT:
 {context}
 
-SCHEMA:
-{schema}
-
 CONSTRAINTS:
 {constraints}
 
@@ -17,31 +26,32 @@ SCENARIOS:
 
 Generate exactly {count} records distributed across the scenarios as specified. Output valid JSON array only."""
 
-# Template with RAG examples
-RAG_TEMPLATE = """Generate {count} test data records for the {domain} domain.
-
-CONTEXT:
-{context}
+GENERAL_TEMPLATE = GENERAL_TEMPLATE_PREFIX + GENERAL_TEMPLATE_SUFFIX
 
-REFERENCE EXAMPLES (from similar successful test data):
+# Template with RAG examples
+RAG_TEMPLATE_PREFIX = """REFERENCE EXAMPLES (from similar successful test data):
 Study these examples to understand the expected patterns and quality:
 {rag_examples}
 
 SCHEMA:
 {schema}
 
+"""
+
+RAG_TEMPLATE_SUFFIX = """Generate {count} test data records for the {domain} domain.
+
+CONTEXT:
+{context}
+
 CONSTRAINTS:
 {constraints}
 
 Generate data that matches the quality and patterns shown in the examples while conforming to the schema. Output valid JSON array only."""
 
-# Template for edge cases
-EDGE_CASE_TEMPLATE = """Generate {count} EDGE CASE test data records designed to stress-test the system.
-
-CONTEXT:
-{context}
+RAG_TEMPLATE = RAG_TEMPLATE_PREFIX + RAG_TEMPLATE_SUFFIX
 
-HISTORICAL DEFECT PATTERNS (from past bugs):
+# Template for edge cases
+EDGE_CASE_TEMPLATE_PREFIX = """HISTORICAL DEFECT PATTERNS (from past bugs):
 These data patterns have caused bugs before. Generate similar data to catch regressions:
 {defect_patterns}
 
@@ -56,15 +66,19 @@ EDGE CASES TO INCLUDE:
 SCHEMA:
 {schema}
 
-Each record should target a specific edge case. Include '_edge_case_type' field describing what edge case it tests. Output valid JSON array only."""
+"""
 
-# Template for coherent entities (carts, orders)
-COHERENT_TEMPLATE = """Generate a COHERENT {entity_type} with logically related items.
+EDGE_CASE_TEMPLATE_SUFFIX = """Generate {count} EDGE CASE test data records designed to stress-test the system.
 
 CONTEXT:
 {context}
 
-COHERENCE REQUIREMENTS:
+Each record should target a specific edge case. Include '_edge_case_type' field describing what edge case it tests. Output valid JSON array only."""
+
+EDGE_CASE_TEMPLATE = EDGE_CASE_TEMPLATE_PREFIX + EDGE_CASE_TEMPLATE_SUFFIX
+
+# Template for coherent entities (carts, orders)
+COHERENT_TEMPLATE_PREFIX = """COHERENCE REQUIREMENTS:
 - Items must logically belong together (what a real customer would buy)
 - Consider: shopping occasion, category affinity, complementary products
 - Amounts must be mathematically consistent (subtotal + tax = total)
@@ -79,25 +93,101 @@ COHERENT SET EXAMPLES:
 SCHEMA:
 {schema}
 
-Include '_shopping_occasion' field describing the coherent theme. Output valid JSON only."""
+"""
 
-# Template for text content (reviews, comments)
-TEXT_CONTENT_TEMPLATE = """Generate {count} realistic {content_type} entries.
+COHERENT_TEMPLATE_SUFFIX = """Generate a COHERENT {entity_type} with logically related items.
 
 CONTEXT:
 {context}
 
-TEXT QUALITY REQUIREMENTS:
+Include '_shopping_occasion' field describing the coherent theme. Output valid JSON only."""
+
+COHERENT_TEMPLATE = COHERENT_TEMPLATE_PREFIX + COHERENT_TEMPLATE_SUFFIX
+
+# Template for text content (reviews, comments)
+TEXT_CONTENT_TEMPLATE_PREFIX = """TEXT QUALITY REQUIREMENTS:
 - Write like a real customer, not a marketer or AI
 - Include natural imperfections (casual grammar, abbreviations)
 - Vary length and detail level across entries
 - Reference specific product attributes when relevant
 - Include emotional language where appropriate
 
+SCHEMA:
+{schema}
+
+"""
+
+TEXT_CONTENT_TEMPLATE_SUFFIX = """Generate {count} realistic {content_type} entries.
+
+CONTEXT:
+{context}
+
 SENTIMENT DISTRIBUTION:
 {sentiment_distribution}
 
-SCHEMA:
+Include '_sentiment' field (positive/negative/neutral). Output valid JSON array only."""
+
+TEXT_CONTENT_TEMPLATE = TEXT_CONTENT_TEMPLATE_PREFIX + TEXT_CONTENT_TEMPLATE_SUFFIX
+
+# Put before the template prefix when records are requested as compact rows
+ROW_FORMAT_NOTE = """OUTPUT FORMAT:
+Write each record as a JSON array of values instead of a JSON object, and output a JSON array of these rows. Do not repeat the column names. Values follow exactly this column order:
+{header}
+
+Dotted columns are fields of nested objects. A column written as name[a,b] holds a list with one row per element, with values in the order a, b. Use null for an optional field left empty.
+
+"""
+
+# Template-specific fields the model is asked to add to each record
+TEMPLATE_EXTRA_FIELDS = {
+    EDGE_CASE_TEMPLATE: ("_edge_case_type",),
+    COHERENT_TEMPLATE: ("_shopping_occasion",),
+    TEXT_CONTENT_TEMPLATE: ("_sentiment",),
+}
+
+# Added to the request context when the LLM only writes some fields of each record
+FIELD_LEVEL_NOTE = """The other fields of each record are already set. Write one entry per line below, matching its values, and copy the line's _record number into the entry:
+{records}"""
+
+# Added to the request context when replacing records that failed coherence scoring
+COHERENCE_REGENERATION_NOTE = """These records replace ones that failed coherence checks. Make every record internally consistent: items from one related category, realistic quantities, totals equal to subtotal plus tax (plus shipping, minus discount), and timestamps in chronological order."""
+
+# Appended to the suffix when asking for records missing from a truncated response
+CONTINUATION_NOTE = """
+
+An earlier response already produced {generated} records but was cut off. Generate only the remaining {missing} records, different from the earlier ones. Output valid JSON array only."""
+
+# Template asking for a generation spec instead of records
+SPEC_TEMPLATE = """SCHEMA:
 {schema}
 
-Include '_sentiment' field (positive/negative/neutral). Output valid JSON array only."""
+Describe how to generate realistic {entity} records for the {domain} domain.
+
+CONTEXT:
+{context}
+
+{constraints}
+
+Return a JSON object of this shape:
+{{
+  "fields": {{
+    "<field>": {{"choice": ["value", ...], "weights": [0.6, ...]}},
+    "<field>": {{"range": [min, max], "distribution": "uniform|normal|lognormal", "decimals": 2}},
+    "<field>": {{"template": "text with {{slot}} placeholders", "slots": {{"slot": ["value", ...]}}}},
+    "<array field>": {{"count": [min, max], "item": {{"fields": {{...}}, "groups": [...]}}}}
+  }},
+  "groups": [
+    {{"fields": ["<field>", "<field>"], "rows": [[value, value], ...], "weights": [...]}}
+  ]
+}}
+
+Use "groups" for fields that must stay consistent with each other (product name with its price range and category, city with state and zip prefix). Weights are optional. Omit fields that need no context-specific values. Output valid JSON only."""
+
+# Stable prefix and variable suffix for each full template
+TEMPLATE_PARTS = {
+    GENERAL_TEMPLATE: (GENERAL_TEMPLATE_PREFIX, GENERAL_TEMPLATE_SUFFIX),
+    RAG_TEMPLATE: (RAG_TEMPLATE_PREFIX, RAG_TEMPLATE_SUFFIX),
+    EDGE_CASE_TEMPLATE: (EDGE_CASE_TEMPLATE_PREFIX, EDGE_CASE_TEMPLATE_SUFFIX),
+    COHERENT_TEMPLATE: (COHERENT_TEMPLATE_PREFIX, COHERENT_TEMPLATE_SUFFIX),
+    TEXT_CONTENT_TEMPLATE: (TEXT_CONTENT_TEMPLATE_PREFIX, TEXT_CONTENT_TEMPLATE_SUFFIX),
+}
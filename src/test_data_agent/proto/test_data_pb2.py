@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: test_data.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'test_data.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0ftest_data.proto\x12\x0btestdata.v1\"\xb9\x04\n\x0fGenerateRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x0e\n\x06\x64omain\x18\x02 \x01(\t\x12\x0e\n\x06\x65ntity\x18\x03 \x01(\t\x12#\n\x06schema\x18\x04 \x01(\x0b\x32\x13.testdata.v1.Schema\x12-\n\x0b\x63onstraints\x18\x05 \x01(\x0b\x32\x18.testdata.v1.Constraints\x12(\n\tscenarios\x18\x06 \x03(\x0b\x32\x15.testdata.v1.Scenario\x12\x0f\n\x07\x63ontext\x18\x07 \x01(\t\x12\r\n\x05hints\x18\x08 \x03(\t\x12\x30\n\routput_format\x18\t \x01(\x0e\x32\x19.testdata.v1.OutputFormat\x12\r\n\x05\x63ount\x18\n \x01(\x05\x12\x11\n\tuse_cache\x18\x0b \x01(\x08\x12\x1a\n\x12learn_from_history\x18\x0c \x01(\x08\x12\x19\n\x11\x64\x65\x66\x65\x63t_triggering\x18\r \x01(\x08\x12\x17\n\x0fproduction_like\x18\x0e \x01(\x08\x12\x15\n\rinline_schema\x18\x0f \x01(\t\x12\x38\n\x11generation_method\x18\x10 \x01(\x0e\x32\x1d.testdata.v1.GenerationMethod\x12\x15\n\rcustom_schema\x18\x11 \x01(\t\x12\x14\n\x0ctoken_budget\x18\x12 \x01(\x05\x12\x1d\n\x15include_record_scores\x18\x13 \x01(\x08\x12\x13\n\x0bprogressive\x18\x14 \x01(\x08\"G\n\x06Schema\x12\"\n\x06\x66ields\x18\x01 \x03(\x0b\x32\x12.testdata.v1.Field\x12\x19\n\x11predefined_schema\x18\x02 \x01(\t\"\x8d\x01\n\x05\x46ield\x12\x0c\n\x04name\x18\x01 \x01(\t\x12$\n\x04type\x18\x02 \x01(\x0e\x32\x16.testdata.v1.FieldType\x12\x10\n\x08required\x18\x03 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12)\n\rnested_fields\x18\x05 \x03(\x0b\x32\x12.testdata.v1.Field\"\xaf\x01\n\x0b\x43onstraints\x12I\n\x11\x66ield_constraints\x18\x01 \x03(\x0b\x32..testdata.v1.Constraints.FieldConstraintsEntry\x1aU\n\x15\x46ieldConstraintsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.testdata.v1.FieldConstraint:\x02\x38\x01\"\xe8\x01\n\x0f\x46ieldConstraint\x12\x10\n\x03min\x18\x01 \x01(\x01H\x00\x88\x01\x01\x12\x10\n\x03max\x18\x02 \x01(\x01H\x01\x88\x01\x01\x12\x13\n\x0b\x65num_values\x18\x03 \x03(\t\x12\x12\n\x05regex\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x17\n\nmin_length\x18\x05 \x01(\x05H\x03\x88\x01\x01\x12\x17\n\nmax_length\x18\x06 \x01(\x05H\x04\x88\x01\x01\x12\x13\n\x06\x66ormat\x18\x07 \x01(\tH\x05\x88\x01\x01\x42\x06\n\x04_minB\x06\n\x04_maxB\x08\n\x06_regexB\r\n\x0b_min_lengthB\r\n\x0b_max_lengthB\t\n\x07_format\"\xa7\x01\n\x08Scenario\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12\x37\n\toverrides\x18\x03 \x03(\x0b\x32$.testdata.v1.Scenario.OverridesEntry\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x1a\x30\n\x0eOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x9d\x01\n\x10GenerateResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\t\x12\x14\n\x0crecord_count\x18\x04 \x01(\x05\x12\x31\n\x08metadata\x18\x05 \x01(\x0b\x32\x1f.testdata.v1.GenerationMetadata\x12\r\n\x05\x65rror\x18\x06 \x01(\t\"\x86\x03\n\x12GenerationMetadata\x12\x17\n\x0fgeneration_path\x18\x01 \x01(\t\x12\x17\n\x0fllm_tokens_used\x18\x02 \x01(\x05\x12\x1a\n\x12generation_time_ms\x18\x03 \x01(\x02\x12\x17\n\x0f\x63oherence_score\x18\x04 \x01(\x02\x12L\n\x0fscenario_counts\x18\x05 \x03(\x0b\x32\x33.testdata.v1.GenerationMetadata.ScenarioCountsEntry\x12\x1a\n\x12llm_tokens_planned\x18\x06 \x01(\x05\x12\x1f\n\x17record_coherence_scores\x18\x07 \x03(\x02\x12\x17\n\x0frecords_refined\x18\x08 \x01(\x05\x12\x13\n\x0bllm_retries\x18\t \x01(\x05\x12\x19\n\x11llm_retry_wait_ms\x18\n \x01(\x02\x1a\x35\n\x13ScenarioCountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"h\n\tDataChunk\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\t\x12\x13\n\x0b\x63hunk_index\x18\x03 \x01(\x05\x12\x10\n\x08is_final\x18\x04 \x01(\x08\x12\x12\n\nis_upgrade\x18\x05 \x01(\x08\"\xe8\x02\n\x12GenerationEstimate\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x17\n\x0fgeneration_path\x18\x02 \x01(\t\x12\x16\n\x0erouting_reason\x18\x03 \x01(\t\x12\x14\n\x0cllm_provider\x18\x04 \x01(\t\x12\x16\n\x0elatency_p50_ms\x18\x05 \x01(\x02\x12\x16\n\x0elatency_p95_ms\x18\x06 \x01(\x02\x12\x16\n\x0elatency_source\x18\x07 \x01(\t\x12\x11\n\tllm_calls\x18\x08 \x01(\x05\x12\x14\n\x0cinput_tokens\x18\t \x01(\x05\x12\x15\n\routput_tokens\x18\n \x01(\x05\x12\x10\n\x08\x63ost_usd\x18\x0b \x01(\x01\x12\x18\n\x10\x63\x61\x63he_hit_likely\x18\x0c \x01(\x08\x12\x17\n\x0fpool_hit_likely\x18\r \x01(\x08\x12\x1b\n\x13within_token_budget\x18\x0e \x01(\x08\x12\r\n\x05\x65rror\x18\x0f \x01(\t\"7\n\x0f\x42\x61tchJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x14\n\x0cinclude_data\x18\x02 \x01(\x08\"\xd0\x01\n\x0e\x42\x61tchJobStatus\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12\x10\n\x08\x62\x61tch_id\x18\x03 \x01(\t\x12\x11\n\tllm_calls\x18\x04 \x01(\x05\x12\x14\n\x0c\x66\x61iled_calls\x18\x05 \x01(\x05\x12\x14\n\x0crecord_count\x18\x06 \x01(\x05\x12\x0c\n\x04\x64\x61ta\x18\x07 \x01(\t\x12\x31\n\x08metadata\x18\x08 \x01(\x0b\x32\x1f.testdata.v1.GenerationMetadata\x12\r\n\x05\x65rror\x18\t \x01(\t\"#\n\x11GetSchemasRequest\x12\x0e\n\x06\x64omain\x18\x01 \x01(\t\">\n\x12GetSchemasResponse\x12(\n\x07schemas\x18\x01 \x03(\x0b\x32\x17.testdata.v1.SchemaInfo\"m\n\nSchemaInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x64omain\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12,\n\x06\x66ields\x18\x04 \x03(\x0b\x32\x1c.testdata.v1.SchemaFieldInfo\"e\n\x0fSchemaFieldInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08required\x18\x03 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07\x65xample\x18\x05 \x01(\t\"\x14\n\x12HealthCheckRequest\"\x9e\x01\n\x13HealthCheckResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x44\n\ncomponents\x18\x02 \x03(\x0b\x32\x30.testdata.v1.HealthCheckResponse.ComponentsEntry\x1a\x31\n\x0f\x43omponentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01*\xa2\x01\n\tFieldType\x12\n\n\x06STRING\x10\x00\x12\x0b\n\x07INTEGER\x10\x01\x12\t\n\x05\x46LOAT\x10\x02\x12\x0b\n\x07\x42OOLEAN\x10\x03\x12\x08\n\x04\x44\x41TE\x10\x04\x12\x0c\n\x08\x44\x41TETIME\x10\x05\x12\t\n\x05\x45MAIL\x10\x06\x12\t\n\x05PHONE\x10\x07\x12\x0b\n\x07\x41\x44\x44RESS\x10\x08\x12\x08\n\x04UUID\x10\t\x12\x08\n\x04\x45NUM\x10\n\x12\n\n\x06OBJECT\x10\x0b\x12\t\n\x05\x41RRAY\x10\x0c*Z\n\x10GenerationMethod\x12\x0f\n\x0bTRADITIONAL\x10\x00\x12\x07\n\x03LLM\x10\x01\x12\x07\n\x03RAG\x10\x02\x12\n\n\x06HYBRID\x10\x03\x12\r\n\tAMPLIFIED\x10\x04\x12\x08\n\x04SPEC\x10\x05**\n\x0cOutputFormat\x12\x08\n\x04JSON\x10\x00\x12\x07\n\x03\x43SV\x10\x01\x12\x07\n\x03SQL\x10\x02\x32\xb9\x04\n\x0fTestDataService\x12K\n\x0cGenerateData\x12\x1c.testdata.v1.GenerateRequest\x1a\x1d.testdata.v1.GenerateResponse\x12L\n\x12GenerateDataStream\x12\x1c.testdata.v1.GenerateRequest\x1a\x16.testdata.v1.DataChunk0\x01\x12S\n\x12\x45stimateGeneration\x12\x1c.testdata.v1.GenerateRequest\x1a\x1f.testdata.v1.GenerationEstimate\x12K\n\x0eSubmitBatchJob\x12\x1c.testdata.v1.GenerateRequest\x1a\x1b.testdata.v1.BatchJobStatus\x12H\n\x0bGetBatchJob\x12\x1c.testdata.v1.BatchJobRequest\x1a\x1b.testdata.v1.BatchJobStatus\x12M\n\nGetSchemas\x12\x1e.testdata.v1.GetSchemasRequest\x1a\x1f.testdata.v1.GetSchemasResponse\x12P\n\x0bHealthCheck\x12\x1f.testdata.v1.HealthCheckRequest\x1a .testdata.v1.HealthCheckResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'test_data_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_CONSTRAINTS_FIELDCONSTRAINTSENTRY']._loaded_options = None
+  _globals['_CONSTRAINTS_FIELDCONSTRAINTSENTRY']._serialized_options = b'8\001'
+  _globals['_SCENARIO_OVERRIDESENTRY']._loaded_options = None
+  _globals['_SCENARIO_OVERRIDESENTRY']._serialized_options = b'8\001'
+  _globals['_GENERATIONMETADATA_SCENARIOCOUNTSENTRY']._loaded_options = None
+  _globals['_GENERATIONMETADATA_SCENARIOCOUNTSENTRY']._serialized_options = b'8\001'
+  _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._loaded_options = None
+  _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._serialized_options = b'8\001'
+  _globals['_FIELDTYPE']._serialized_start=3193
+  _globals['_FIELDTYPE']._serialized_end=3355
+  _globals['_GENERATIONMETHOD']._serialized_start=3357
+  _globals['_GENERATIONMETHOD']._serialized_end=3447
+  _globals['_OUTPUTFORMAT']._serialized_start=3449
+  _globals['_OUTPUTFORMAT']._serialized_end=3491
+  _globals['_GENERATEREQUEST']._serialized_start=33
+  _globals['_GENERATEREQUEST']._serialized_end=602
+  _globals['_SCHEMA']._serialized_start=604
+  _globals['_SCHEMA']._serialized_end=675
+  _globals['_FIELD']._serialized_start=678
+  _globals['_FIELD']._serialized_end=819
+  _globals['_CONSTRAINTS']._serialized_start=822
+  _globals['_CONSTRAINTS']._serialized_end=997
+  _globals['_CONSTRAINTS_FIELDCONSTRAINTSENTRY']._serialized_start=912
+  _globals['_CONSTRAINTS_FIELDCONSTRAINTSENTRY']._serialized_end=997
+  _globals['_FIELDCONSTRAINT']._serialized_start=1000
+  _globals['_FIELDCONSTRAINT']._serialized_end=1232
+  _globals['_SCENARIO']._serialized_start=1235
+  _globals['_SCENARIO']._serialized_end=1402
+  _globals['_SCENARIO_OVERRIDESENTRY']._serialized_start=1354
+  _globals['_SCENARIO_OVERRIDESENTRY']._serialized_end=1402
+  _globals['_GENERATERESPONSE']._serialized_start=1405
+  _globals['_GENERATERESPONSE']._serialized_end=1562
+  _globals['_GENERATIONMETADATA']._serialized_start=1565
+  _globals['_GENERATIONMETADATA']._serialized_end=1955
+  _globals['_GENERATIONMETADATA_SCENARIOCOUNTSENTRY']._serialized_start=1902
+  _globals['_GENERATIONMETADATA_SCENARIOCOUNTSENTRY']._serialized_end=1955
+  _globals['_DATACHUNK']._serialized_start=1957
+  _globals['_DATACHUNK']._serialized_end=2061
+  _globals['_GENERATIONESTIMATE']._serialized_start=2064
+  _globals['_GENERATIONESTIMATE']._serialized_end=2424
+  _globals['_BATCHJOBREQUEST']._serialized_start=2426
+  _globals['_BATCHJOBREQUEST']._serialized_end=2481
+  _globals['_BATCHJOBSTATUS']._serialized_start=2484
+  _globals['_BATCHJOBSTATUS']._serialized_end=2692
+  _globals['_GETSCHEMASREQUEST']._serialized_start=2694
+  _globals['_GETSCHEMASREQUEST']._serialized_end=2729
+  _globals['_GETSCHEMASRESPONSE']._serialized_start=2731
+  _globals['_GETSCHEMASRESPONSE']._serialized_end=2793
+  _globals['_SCHEMAINFO']._serialized_start=2795
+  _globals['_SCHEMAINFO']._serialized_end=2904
+  _globals['_SCHEMAFIELDINFO']._serialized_start=2906
+  _globals['_SCHEMAFIELDINFO']._serialized_end=3007
+  _globals['_HEALTHCHECKREQUEST']._serialized_start=3009
+  _globals['_HEALTHCHECKREQUEST']._serialized_end=3029
+  _globals['_HEALTHCHECKRESPONSE']._serialized_start=3032
+  _globals['_HEALTHCHECKRESPONSE']._serialized_end=3190
+  _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._serialized_start=3141
+  _globals['_HEALTHCHECKRESPONSE_COMPONENTSENTRY']._serialized_end=3190
+  _globals['_TESTDATASERVICE']._serialized_start=3494
+  _globals['_TESTDATASERVICE']._serialized_end=4063
+# @@protoc_insertion_point(module_scope)
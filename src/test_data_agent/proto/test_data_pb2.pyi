@@ -0,0 +1,359 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class FieldType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    STRING: _ClassVar[FieldType]
+    INTEGER: _ClassVar[FieldType]
+    FLOAT: _ClassVar[FieldType]
+    BOOLEAN: _ClassVar[FieldType]
+    DATE: _ClassVar[FieldType]
+    DATETIME: _ClassVar[FieldType]
+    EMAIL: _ClassVar[FieldType]
+    PHONE: _ClassVar[FieldType]
+    ADDRESS: _ClassVar[FieldType]
+    UUID: _ClassVar[FieldType]
+    ENUM: _ClassVar[FieldType]
+    OBJECT: _ClassVar[FieldType]
+    ARRAY: _ClassVar[FieldType]
+
+class GenerationMethod(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    TRADITIONAL: _ClassVar[GenerationMethod]
+    LLM: _ClassVar[GenerationMethod]
+    RAG: _ClassVar[GenerationMethod]
+    HYBRID: _ClassVar[GenerationMethod]
+    AMPLIFIED: _ClassVar[GenerationMethod]
+    SPEC: _ClassVar[GenerationMethod]
+
+class OutputFormat(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    JSON: _ClassVar[OutputFormat]
+    CSV: _ClassVar[OutputFormat]
+    SQL: _ClassVar[OutputFormat]
+STRING: FieldType
+INTEGER: FieldType
+FLOAT: FieldType
+BOOLEAN: FieldType
+DATE: FieldType
+DATETIME: FieldType
+EMAIL: FieldType
+PHONE: FieldType
+ADDRESS: FieldType
+UUID: FieldType
+ENUM: FieldType
+OBJECT: FieldType
+ARRAY: FieldType
+TRADITIONAL: GenerationMethod
+LLM: GenerationMethod
+RAG: GenerationMethod
+HYBRID: GenerationMethod
+AMPLIFIED: GenerationMethod
+SPEC: GenerationMethod
+JSON: OutputFormat
+CSV: OutputFormat
+SQL: OutputFormat
+
+class GenerateRequest(_message.Message):
+    __slots__ = ("request_id", "domain", "entity", "schema", "constraints", "scenarios", "context", "hints", "output_format", "count", "use_cache", "learn_from_history", "defect_triggering", "production_like", "inline_schema", "generation_method", "custom_schema", "token_budget", "include_record_scores", "progressive")
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    DOMAIN_FIELD_NUMBER: _ClassVar[int]
+    ENTITY_FIELD_NUMBER: _ClassVar[int]
+    SCHEMA_FIELD_NUMBER: _ClassVar[int]
+    CONSTRAINTS_FIELD_NUMBER: _ClassVar[int]
+    SCENARIOS_FIELD_NUMBER: _ClassVar[int]
+    CONTEXT_FIELD_NUMBER: _ClassVar[int]
+    HINTS_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    USE_CACHE_FIELD_NUMBER: _ClassVar[int]
+    LEARN_FROM_HISTORY_FIELD_NUMBER: _ClassVar[int]
+    DEFECT_TRIGGERING_FIELD_NUMBER: _ClassVar[int]
+    PRODUCTION_LIKE_FIELD_NUMBER: _ClassVar[int]
+    INLINE_SCHEMA_FIELD_NUMBER: _ClassVar[int]
+    GENERATION_METHOD_FIELD_NUMBER: _ClassVar[int]
+    CUSTOM_SCHEMA_FIELD_NUMBER: _ClassVar[int]
+    TOKEN_BUDGET_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_RECORD_SCORES_FIELD_NUMBER: _ClassVar[int]
+    PROGRESSIVE_FIELD_NUMBER: _ClassVar[int]
+    request_id: str
+    domain: str
+    entity: str
+    schema: Schema
+    constraints: Constraints
+    scenarios: _containers.RepeatedCompositeFieldContainer[Scenario]
+    context: str
+    hints: _containers.RepeatedScalarFieldContainer[str]
+    output_format: OutputFormat
+    count: int
+    use_cache: bool
+    learn_from_history: bool
+    defect_triggering: bool
+    production_like: bool
+    inline_schema: str
+    generation_method: GenerationMethod
+    custom_schema: str
+    token_budget: int
+    include_record_scores: bool
+    progressive: bool
+    def __init__(self, request_id: _Optional[str] = ..., domain: _Optional[str] = ..., entity: _Optional[str] = ..., schema: _Optional[_Union[Schema, _Mapping]] = ..., constraints: _Optional[_Union[Constraints, _Mapping]] = ..., scenarios: _Optional[_Iterable[_Union[Scenario, _Mapping]]] = ..., context: _Optional[str] = ..., hints: _Optional[_Iterable[str]] = ..., output_format: _Optional[_Union[OutputFormat, str]] = ..., count: _Optional[int] = ..., use_cache: bool = ..., learn_from_history: bool = ..., defect_triggering: bool = ..., production_like: bool = ..., inline_schema: _Optional[str] = ..., generation_method: _Optional[_Union[GenerationMethod, str]] = ..., custom_schema: _Optional[str] = ..., token_budget: _Optional[int] = ..., include_record_scores: bool = ..., progressive: bool = ...) -> None: ...
+
+class Schema(_message.Message):
+    __slots__ = ("fields", "predefined_schema")
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    PREDEFINED_SCHEMA_FIELD_NUMBER: _ClassVar[int]
+    fields: _containers.RepeatedCompositeFieldContainer[Field]
+    predefined_schema: str
+    def __init__(self, fields: _Optional[_Iterable[_Union[Field, _Mapping]]] = ..., predefined_schema: _Optional[str] = ...) -> None: ...
+
+class Field(_message.Message):
+    __slots__ = ("name", "type", "required", "description", "nested_fields")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    REQUIRED_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    NESTED_FIELDS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    type: FieldType
+    required: bool
+    description: str
+    nested_fields: _containers.RepeatedCompositeFieldContainer[Field]
+    def __init__(self, name: _Optional[str] = ..., type: _Optional[_Union[FieldType, str]] = ..., required: bool = ..., description: _Optional[str] = ..., nested_fields: _Optional[_Iterable[_Union[Field, _Mapping]]] = ...) -> None: ...
+
+class Constraints(_message.Message):
+    __slots__ = ("field_constraints",)
+    class FieldConstraintsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: FieldConstraint
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[FieldConstraint, _Mapping]] = ...) -> None: ...
+    FIELD_CONSTRAINTS_FIELD_NUMBER: _ClassVar[int]
+    field_constraints: _containers.MessageMap[str, FieldConstraint]
+    def __init__(self, field_constraints: _Optional[_Mapping[str, FieldConstraint]] = ...) -> None: ...
+
+class FieldConstraint(_message.Message):
+    __slots__ = ("min", "max", "enum_values", "regex", "min_length", "max_length", "format")
+    MIN_FIELD_NUMBER: _ClassVar[int]
+    MAX_FIELD_NUMBER: _ClassVar[int]
+    ENUM_VALUES_FIELD_NUMBER: _ClassVar[int]
+    REGEX_FIELD_NUMBER: _ClassVar[int]
+    MIN_LENGTH_FIELD_NUMBER: _ClassVar[int]
+    MAX_LENGTH_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    min: float
+    max: float
+    enum_values: _containers.RepeatedScalarFieldContainer[str]
+    regex: str
+    min_length: int
+    max_length: int
+    format: str
+    def __init__(self, min: _Optional[float] = ..., max: _Optional[float] = ..., enum_values: _Optional[_Iterable[str]] = ..., regex: _Optional[str] = ..., min_length: _Optional[int] = ..., max_length: _Optional[int] = ..., format: _Optional[str] = ...) -> None: ...
+
+class Scenario(_message.Message):
+    __slots__ = ("name", "count", "overrides", "description")
+    class OverridesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    OVERRIDES_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    count: int
+    overrides: _containers.ScalarMap[str, str]
+    description: str
+    def __init__(self, name: _Optional[str] = ..., count: _Optional[int] = ..., overrides: _Optional[_Mapping[str, str]] = ..., description: _Optional[str] = ...) -> None: ...
+
+class GenerateResponse(_message.Message):
+    __slots__ = ("request_id", "success", "data", "record_count", "metadata", "error")
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    RECORD_COUNT_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    request_id: str
+    success: bool
+    data: str
+    record_count: int
+    metadata: GenerationMetadata
+    error: str
+    def __init__(self, request_id: _Optional[str] = ..., success: bool = ..., data: _Optional[str] = ..., record_count: _Optional[int] = ..., metadata: _Optional[_Union[GenerationMetadata, _Mapping]] = ..., error: _Optional[str] = ...) -> None: ...
+
+class GenerationMetadata(_message.Message):
+    __slots__ = ("generation_path", "llm_tokens_used", "generation_time_ms", "coherence_score", "scenario_counts", "llm_tokens_planned", "record_coherence_scores", "records_refined", "llm_retries", "llm_retry_wait_ms")
+    class ScenarioCountsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    GENERATION_PATH_FIELD_NUMBER: _ClassVar[int]
+    LLM_TOKENS_USED_FIELD_NUMBER: _ClassVar[int]
+    GENERATION_TIME_MS_FIELD_NUMBER: _ClassVar[int]
+    COHERENCE_SCORE_FIELD_NUMBER: _ClassVar[int]
+    SCENARIO_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    LLM_TOKENS_PLANNED_FIELD_NUMBER: _ClassVar[int]
+    RECORD_COHERENCE_SCORES_FIELD_NUMBER: _ClassVar[int]
+    RECORDS_REFINED_FIELD_NUMBER: _ClassVar[int]
+    LLM_RETRIES_FIELD_NUMBER: _ClassVar[int]
+    LLM_RETRY_WAIT_MS_FIELD_NUMBER: _ClassVar[int]
+    generation_path: str
+    llm_tokens_used: int
+    generation_time_ms: float
+    coherence_score: float
+    scenario_counts: _containers.ScalarMap[str, int]
+    llm_tokens_planned: int
+    record_coherence_scores: _containers.RepeatedScalarFieldContainer[float]
+    records_refined: int
+    llm_retries: int
+    llm_retry_wait_ms: float
+    def __init__(self, generation_path: _Optional[str] = ..., llm_tokens_used: _Optional[int] = ..., generation_time_ms: _Optional[float] = ..., coherence_score: _Optional[float] = ..., scenario_counts: _Optional[_Mapping[str, int]] = ..., llm_tokens_planned: _Optional[int] = ..., record_coherence_scores: _Optional[_Iterable[float]] = ..., records_refined: _Optional[int] = ..., llm_retries: _Optional[int] = ..., llm_retry_wait_ms: _Optional[float] = ...) -> None: ...
+
+class DataChunk(_message.Message):
+    __slots__ = ("request_id", "data", "chunk_index", "is_final", "is_upgrade")
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_INDEX_FIELD_NUMBER: _ClassVar[int]
+    IS_FINAL_FIELD_NUMBER: _ClassVar[int]
+    IS_UPGRADE_FIELD_NUMBER: _ClassVar[int]
+    request_id: str
+    data: str
+    chunk_index: int
+    is_final: bool
+    is_upgrade: bool
+    def __init__(self, request_id: _Optional[str] = ..., data: _Optional[str] = ..., chunk_index: _Optional[int] = ..., is_final: bool = ..., is_upgrade: bool = ...) -> None: ...
+
+class GenerationEstimate(_message.Message):
+    __slots__ = ("request_id", "generation_path", "routing_reason", "llm_provider", "latency_p50_ms", "latency_p95_ms", "latency_source", "llm_calls", "input_tokens", "output_tokens", "cost_usd", "cache_hit_likely", "pool_hit_likely", "within_token_budget", "error")
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    GENERATION_PATH_FIELD_NUMBER: _ClassVar[int]
+    ROUTING_REASON_FIELD_NUMBER: _ClassVar[int]
+    LLM_PROVIDER_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_P50_MS_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_P95_MS_FIELD_NUMBER: _ClassVar[int]
+    LATENCY_SOURCE_FIELD_NUMBER: _ClassVar[int]
+    LLM_CALLS_FIELD_NUMBER: _ClassVar[int]
+    INPUT_TOKENS_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_TOKENS_FIELD_NUMBER: _ClassVar[int]
+    COST_USD_FIELD_NUMBER: _ClassVar[int]
+    CACHE_HIT_LIKELY_FIELD_NUMBER: _ClassVar[int]
+    POOL_HIT_LIKELY_FIELD_NUMBER: _ClassVar[int]
+    WITHIN_TOKEN_BUDGET_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    request_id: str
+    generation_path: str
+    routing_reason: str
+    llm_provider: str
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_source: str
+    llm_calls: int
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float
+    cache_hit_likely: bool
+    pool_hit_likely: bool
+    within_token_budget: bool
+    error: str
+    def __init__(self, request_id: _Optional[str] = ..., generation_path: _Optional[str] = ..., routing_reason: _Optional[str] = ..., llm_provider: _Optional[str] = ..., latency_p50_ms: _Optional[float] = ..., latency_p95_ms: _Optional[float] = ..., latency_source: _Optional[str] = ..., llm_calls: _Optional[int] = ..., input_tokens: _Optional[int] = ..., output_tokens: _Optional[int] = ..., cost_usd: _Optional[float] = ..., cache_hit_likely: bool = ..., pool_hit_likely: bool = ..., within_token_budget: bool = ..., error: _Optional[str] = ...) -> None: ...
+
+class BatchJobRequest(_message.Message):
+    __slots__ = ("job_id", "include_data")
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_DATA_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    include_data: bool
+    def __init__(self, job_id: _Optional[str] = ..., include_data: bool = ...) -> None: ...
+
+class BatchJobStatus(_message.Message):
+    __slots__ = ("job_id", "state", "batch_id", "llm_calls", "failed_calls", "record_count", "data", "metadata", "error")
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    BATCH_ID_FIELD_NUMBER: _ClassVar[int]
+    LLM_CALLS_FIELD_NUMBER: _ClassVar[int]
+    FAILED_CALLS_FIELD_NUMBER: _ClassVar[int]
+    RECORD_COUNT_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    state: str
+    batch_id: str
+    llm_calls: int
+    failed_calls: int
+    record_count: int
+    data: str
+    metadata: GenerationMetadata
+    error: str
+    def __init__(self, job_id: _Optional[str] = ..., state: _Optional[str] = ..., batch_id: _Optional[str] = ..., llm_calls: _Optional[int] = ..., failed_calls: _Optional[int] = ..., record_count: _Optional[int] = ..., data: _Optional[str] = ..., metadata: _Optional[_Union[GenerationMetadata, _Mapping]] = ..., error: _Optional[str] = ...) -> None: ...
+
+class GetSchemasRequest(_message.Message):
+    __slots__ = ("domain",)
+    DOMAIN_FIELD_NUMBER: _ClassVar[int]
+    domain: str
+    def __init__(self, domain: _Optional[str] = ...) -> None: ...
+
+class GetSchemasResponse(_message.Message):
+    __slots__ = ("schemas",)
+    SCHEMAS_FIELD_NUMBER: _ClassVar[int]
+    schemas: _containers.RepeatedCompositeFieldContainer[SchemaInfo]
+    def __init__(self, schemas: _Optional[_Iterable[_Union[SchemaInfo, _Mapping]]] = ...) -> None: ...
+
+class SchemaInfo(_message.Message):
+    __slots__ = ("name", "domain", "description", "fields")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    DOMAIN_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    domain: str
+    description: str
+    fields: _containers.RepeatedCompositeFieldContainer[SchemaFieldInfo]
+    def __init__(self, name: _Optional[str] = ..., domain: _Optional[str] = ..., description: _Optional[str] = ..., fields: _Optional[_Iterable[_Union[SchemaFieldInfo, _Mapping]]] = ...) -> None: ...
+
+class SchemaFieldInfo(_message.Message):
+    __slots__ = ("name", "type", "required", "description", "example")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    REQUIRED_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    EXAMPLE_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    type: str
+    required: bool
+    description: str
+    example: str
+    def __init__(self, name: _Optional[str] = ..., type: _Optional[str] = ..., required: bool = ..., description: _Optional[str] = ..., example: _Optional[str] = ...) -> None: ...
+
+class HealthCheckRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class HealthCheckResponse(_message.Message):
+    __slots__ = ("status", "components")
+    class ComponentsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    COMPONENTS_FIELD_NUMBER: _ClassVar[int]
+    status: str
+    components: _containers.ScalarMap[str, str]
+    def __init__(self, status: _Optional[str] = ..., components: _Optional[_Mapping[str, str]] = ...) -> None: ...
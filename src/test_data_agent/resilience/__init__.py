@@ -0,0 +1,35 @@
+"""Resilience helpers for calls to external dependencies."""
+
+from test_data_agent.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+    get_circuit_breakers,
+)
+from test_data_agent.resilience.hedging import HedgeBudget, HedgeResult, RequestHedger
+from test_data_agent.resilience.retry import (
+    RetryBudget,
+    RetryPolicy,
+    current_retry_budget,
+    retry_after_seconds,
+    start_retry_budget,
+    try_spend_retry,
+)
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "CircuitState",
+    "get_circuit_breakers",
+    "HedgeBudget",
+    "HedgeResult",
+    "RequestHedger",
+    "RetryBudget",
+    "RetryPolicy",
+    "current_retry_budget",
+    "retry_after_seconds",
+    "start_retry_budget",
+    "try_spend_retry",
+]
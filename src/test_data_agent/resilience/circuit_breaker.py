@@ -0,0 +1,204 @@
+"""Circuit breakers around external dependencies.
+
+Each dependency (Claude, vLLM, Weaviate, Redis) has one breaker shared by
+every generator in the process. After ``failure_threshold`` consecutive
+failures the circuit opens and calls fail immediately with
+:class:`CircuitOpenError`, so callers go straight to their fallback path.
+After ``recovery_timeout`` seconds one probe call is let through
+(half-open); its outcome closes or re-opens the circuit.
+"""
+
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from enum import Enum
+
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls are rejected immediately
+    HALF_OPEN = "half_open"  # One probe call decides whether to close
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected by an open circuit."""
+
+    def __init__(self, name: str, retry_after: float):
+        """Initialize error.
+
+        Args:
+            name: Dependency name
+            retry_after: Seconds until the circuit lets a probe through
+        """
+        super().__init__(f"Circuit for {name} is open; retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one dependency."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """Initialize breaker.
+
+        Args:
+            name: Dependency name (metrics label)
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a probe
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        metrics.record_circuit_state(name, self._state.value)
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit turns half-open once its timeout passes)."""
+        if self._state == CircuitState.OPEN and self._retry_after() <= 0:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def allow(self) -> bool:
+        """Check whether a call may proceed.
+
+        A caller that is allowed through must report the outcome with
+        :meth:`record_success` or :meth:`record_failure`.
+
+        Returns:
+            True if the call may proceed
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        metrics.record_circuit_rejection(self.name)
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        self._probe_in_flight = False
+        self._failures = 0
+        if self._state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        self._probe_in_flight = False
+        self._failures += 1
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED and self._failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._transition(CircuitState.OPEN)
+
+    @asynccontextmanager
+    async def guard(
+        self, is_failure: Callable[[Exception], bool] | None = None
+    ) -> AsyncIterator[None]:
+        """Run a block under the breaker.
+
+        Args:
+            is_failure: Decides whether an exception means the dependency is
+                unhealthy (defaults to every exception); other exceptions leave
+                the breaker state unchanged
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the call
+        """
+        if not self.allow():
+            raise CircuitOpenError(self.name, self._retry_after())
+        try:
+            yield
+        except Exception as e:
+            if is_failure is None or is_failure(e):
+                self.record_failure()
+            else:
+                # Says nothing about the dependency's health; just release the probe slot
+                self._probe_in_flight = False
+            raise
+        except BaseException:
+            # Cancelled: the outcome is unknown
+            self._probe_in_flight = False
+            raise
+        else:
+            self.record_success()
+
+    def _retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state."""
+        logger.warning(
+            "circuit_state_changed",
+            dependency=self.name,
+            old_state=self._state.value,
+            new_state=state.value,
+            failures=self._failures,
+        )
+        self._state = state
+        metrics.record_circuit_state(self.name, state.value)
+
+
+class CircuitBreakerRegistry:
+    """Process-wide breakers, one per dependency."""
+
+    def __init__(self):
+        """Initialize registry."""
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(
+        self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0
+    ) -> CircuitBreaker:
+        """Get the breaker for a dependency, creating it on first use.
+
+        Args:
+            name: Dependency name
+            failure_threshold: Consecutive failures that open the circuit (first use only)
+            recovery_timeout: Seconds before a probe is allowed (first use only)
+
+        Returns:
+            Shared CircuitBreaker
+        """
+        if name not in self._breakers:
+            self._breakers[name] = CircuitBreaker(name, failure_threshold, recovery_timeout)
+        return self._breakers[name]
+
+    def states(self) -> dict[str, str]:
+        """Current state of every breaker.
+
+        Returns:
+            Mapping of dependency name to state
+        """
+        return {name: breaker.state.value for name, breaker in sorted(self._breakers.items())}
+
+    def clear(self) -> None:
+        """Forget all breakers."""
+        self._breakers.clear()
+
+
+# Global registry instance
+_circuit_breakers: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get or create the global circuit breaker registry."""
+    global _circuit_breakers
+    if _circuit_breakers is None:
+        _circuit_breakers = CircuitBreakerRegistry()
+    return _circuit_breakers
@@ -0,0 +1,151 @@
+"""Hedged requests to cut tail latency.
+
+If a call has not completed by a percentile of recent latency, a second
+(backup) call is started; the first successful response wins and the other
+call is cancelled. A per-minute budget caps how many hedges are sent, so
+hedging cannot double token spend.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from test_data_agent.utils.latency import LatencyWindow
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+T = TypeVar("T")
+
+
+class HedgeBudget:
+    """Sliding one-minute cap on the number of hedges sent."""
+
+    def __init__(self, per_minute: int):
+        """Initialize budget.
+
+        Args:
+            per_minute: Hedges allowed in any 60 second window
+        """
+        self.per_minute = per_minute
+        self._sent: deque[float] = deque()
+
+    def try_acquire(self) -> bool:
+        """Take one hedge from the budget if any is left.
+
+        Returns:
+            True if a hedge may be sent
+        """
+        now = time.monotonic()
+        while self._sent and now - self._sent[0] >= 60:
+            self._sent.popleft()
+        if len(self._sent) >= self.per_minute:
+            return False
+        self._sent.append(now)
+        return True
+
+
+@dataclass
+class HedgeResult(Generic[T]):
+    """Outcome of a hedged call."""
+
+    value: T
+    hedged: bool  # A backup call was sent
+    winner: str  # primary or backup
+
+
+class RequestHedger:
+    """Sends a backup call when the primary is slower than usual."""
+
+    def __init__(
+        self,
+        budget_per_minute: int = 10,
+        percentile: float = 0.95,
+        min_delay: float = 1.0,
+        min_samples: int = 10,
+    ):
+        """Initialize hedger.
+
+        Args:
+            budget_per_minute: Hedges allowed per minute
+            percentile: Latency percentile after which the backup is sent
+            min_delay: Lower bound on the hedge delay in seconds
+            min_samples: Latency samples needed before hedging starts
+        """
+        self.budget = HedgeBudget(budget_per_minute)
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+
+    def delay_for(self, window: LatencyWindow) -> float | None:
+        """Hedge delay for a provider's recent latency.
+
+        Args:
+            window: Recent latency of the primary provider
+
+        Returns:
+            Seconds to wait before hedging, or None if there is too little data
+        """
+        if len(window) < self.min_samples:
+            return None
+        return max(self.min_delay, window.percentile(self.percentile))
+
+    async def run(
+        self,
+        primary: Callable[[], Awaitable[T]],
+        backup: Callable[[], Awaitable[T]],
+        delay: float | None,
+        provider: str = "unknown",
+    ) -> HedgeResult[T]:
+        """Run ``primary``, hedging with ``backup`` after ``delay`` seconds.
+
+        Args:
+            primary: Factory for the primary call
+            backup: Factory for the backup call
+            delay: Seconds to wait before hedging (None disables hedging)
+            provider: Primary provider name (metrics label)
+
+        Returns:
+            HedgeResult with the first successful response
+
+        Raises:
+            Exception: The primary's error if both calls fail
+        """
+        if delay is None:
+            return HedgeResult(await primary(), hedged=False, winner="primary")
+
+        primary_task = asyncio.ensure_future(primary())
+        tasks = {primary_task}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self.budget.try_acquire():
+                if not done:
+                    metrics.record_hedge(provider, "budget_exhausted")
+                return HedgeResult(await primary_task, hedged=False, winner="primary")
+
+            logger.info("llm_hedge_sent", provider=provider, delay=round(delay, 2))
+            backup_task = asyncio.ensure_future(backup())
+            tasks.add(backup_task)
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = "backup" if task is backup_task else "primary"
+                        metrics.record_hedge(provider, f"{winner}_won")
+                        return HedgeResult(task.result(), hedged=True, winner=winner)
+
+            metrics.record_hedge(provider, "both_failed")
+            return HedgeResult(primary_task.result(), hedged=True, winner="primary")
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            # Let cancelled calls release their connections before returning
+            await asyncio.gather(*losers, return_exceptions=True)
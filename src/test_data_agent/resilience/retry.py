@@ -0,0 +1,176 @@
+"""Retry policy shared by the LLM clients.
+
+Failed calls are retried with decorrelated jitter (each delay is drawn
+between the base delay and three times the previous one), so replicas that
+were rate limited together don't retry together. A ``retry-after`` from the
+provider takes precedence over the computed delay.
+
+Every retry also spends from a per-request :class:`RetryBudget`, shared by
+the clients and the generator's parse retries, so a request makes a bounded
+number of extra calls and sleeps a bounded time however its calls fail.
+"""
+
+import random
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """Read the ``retry-after`` (or ``retry-after-ms``) header from an API error.
+
+    Args:
+        error: Exception raised by the API call
+
+    Returns:
+        Seconds to wait, or None if the response did not say
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return float(headers.get(header)) * scale
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+@dataclass
+class RetryBudget:
+    """Retries and backoff one request may spend across all of its LLM calls."""
+
+    max_retries: int
+    max_wait_seconds: float
+    retries: int = 0
+    waited_seconds: float = 0.0
+
+    def try_spend(self, delay: float) -> bool:
+        """Take one retry and its delay from the budget if both fit.
+
+        Args:
+            delay: Seconds the retry will wait first
+
+        Returns:
+            True if the retry may go ahead
+        """
+        if self.retries >= self.max_retries:
+            return False
+        if self.waited_seconds + delay > self.max_wait_seconds:
+            return False
+        self.retries += 1
+        self.waited_seconds += delay
+        return True
+
+
+_budget: ContextVar[RetryBudget | None] = ContextVar("retry_budget", default=None)
+
+
+def start_retry_budget(max_retries: int, max_wait_seconds: float) -> RetryBudget:
+    """Give the current request a fresh retry budget.
+
+    Tasks spawned by the request inherit the budget and spend from it.
+
+    Args:
+        max_retries: Retries allowed across all calls of the request
+        max_wait_seconds: Total backoff allowed across all calls of the request
+
+    Returns:
+        The new budget, for reporting once the request is done
+    """
+    budget = RetryBudget(max_retries=max_retries, max_wait_seconds=max_wait_seconds)
+    _budget.set(budget)
+    return budget
+
+
+def current_retry_budget() -> RetryBudget | None:
+    """Retry budget of the current request, if one was started."""
+    return _budget.get()
+
+
+def try_spend_retry(delay: float = 0.0) -> bool:
+    """Spend one retry from the current request's budget.
+
+    Args:
+        delay: Seconds the retry will wait first
+
+    Returns:
+        True if the retry may go ahead (always, outside a budgeted request)
+    """
+    budget = _budget.get()
+    return budget is None or budget.try_spend(delay)
+
+
+class RetryPolicy:
+    """Decides whether and after how long a failed call is retried."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 20.0,
+        rng: random.Random | None = None,
+    ):
+        """Initialize policy.
+
+        Args:
+            max_attempts: Calls made for one request to a provider, first included
+            base_delay: Smallest backoff in seconds
+            max_delay: Largest computed backoff in seconds (retry-after may exceed it)
+            rng: Random source for jitter
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random.Random()
+
+    def backoff(self, previous: float | None) -> float:
+        """Decorrelated-jitter delay following ``previous``.
+
+        Args:
+            previous: Previous delay of the same call (None before the first retry)
+
+        Returns:
+            Seconds to wait
+        """
+        upper = max(self.base_delay, (previous or self.base_delay) * 3)
+        return min(self.max_delay, self.rng.uniform(self.base_delay, upper))
+
+    def next_delay(
+        self,
+        provider: str,
+        attempt: int,
+        previous: float | None = None,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """Delay before retrying a failed call, spending from the request's budget.
+
+        Args:
+            provider: LLM provider (metrics label)
+            attempt: Zero-based number of the call that failed
+            previous: Delay before the call that failed (None for the first call)
+            retry_after: Wait requested by the provider, if any
+
+        Returns:
+            Seconds to wait before retrying, or None if the call must not be retried
+        """
+        if attempt + 1 >= self.max_attempts:
+            metrics.record_retry(provider, "attempts_exhausted")
+            return None
+        delay = retry_after if retry_after is not None else self.backoff(previous)
+        if not try_spend_retry(delay):
+            budget = current_retry_budget()
+            logger.warning(
+                "retry_budget_exhausted",
+                provider=provider,
+                retries=budget.retries,
+                waited_seconds=budget.waited_seconds,
+                retry_delay=delay,
+            )
+            metrics.record_retry(provider, "budget_exhausted")
+            return None
+        metrics.record_retry(provider, "retried", delay)
+        return delay
@@ -5,5 +5,12 @@ from test_data_agent.router.intelligence_router import (
     GenerationPath,
     RoutingDecision,
 )
+from test_data_agent.router.provider_selector import ProviderChoice, ProviderSelector
 
-__all__ = ["IntelligenceRouter", "GenerationPath", "RoutingDecision"]
+__all__ = [
+    "IntelligenceRouter",
+    "GenerationPath",
+    "RoutingDecision",
+    "ProviderChoice",
+    "ProviderSelector",
+]
@@ -16,6 +16,8 @@ class GenerationPath(Enum):
     LLM = "llm"  # Claude/vLLM for intelligent, coherent data
     RAG = "rag"  # Retrieve patterns from vector DB
     HYBRID = "hybrid"  # RAG + LLM combined
+    AMPLIFIED = "amplified"  # Small LLM seed set expanded locally
+    SPEC = "spec"  # LLM-derived generation spec executed locally
 
 
 @dataclass
@@ -27,9 +29,22 @@ class RoutingDecision:
     confidence: float  # 0.0 to 1.0
 
 
+# Entities whose records carry enough structure (items, prices, totals) to amplify
+AMPLIFIABLE_ENTITIES = {"cart", "order"}
+
+
 class IntelligenceRouter:
     """Routes generation requests to the optimal generation path."""
 
+    def __init__(self, amplify_min_count: int = 0):
+        """Initialize router.
+
+        Args:
+            amplify_min_count: Smallest LLM-worthy cart/order request routed to
+                amplification without an "amplify" hint (0 disables)
+        """
+        self.amplify_min_count = amplify_min_count
+
     def route(self, request: test_data_pb2.GenerateRequest) -> RoutingDecision:
         """Determine the best generation path for a request.
 
@@ -40,12 +55,14 @@ class IntelligenceRouter:
             RoutingDecision with path, reason, and confidence
         """
         # Priority 0: Respect explicit generation_method if set (non-zero means explicitly chosen)
-        # Proto enum: TRADITIONAL=0, LLM=1, RAG=2, HYBRID=3
+        # Proto enum: TRADITIONAL=0, LLM=1, RAG=2, HYBRID=3, AMPLIFIED=4, SPEC=5
         if request.generation_method > 0:
             method_map = {
                 test_data_pb2.LLM: GenerationPath.LLM,
                 test_data_pb2.RAG: GenerationPath.RAG,
                 test_data_pb2.HYBRID: GenerationPath.HYBRID,
+                test_data_pb2.AMPLIFIED: GenerationPath.AMPLIFIED,
+                test_data_pb2.SPEC: GenerationPath.SPEC,
             }
             path = method_map.get(request.generation_method, GenerationPath.TRADITIONAL)
             return RoutingDecision(
@@ -56,6 +73,14 @@ class IntelligenceRouter:
 
         hints = [h.lower() for h in request.hints]
 
+        # Spec generation is opt-in via hint
+        if "spec" in hints:
+            return RoutingDecision(
+                path=GenerationPath.SPEC,
+                reason="Spec: LLM-derived generation spec requested via hints",
+                confidence=1.0,
+            )
+
         # Priority 1: HYBRID (RAG + LLM) - Most sophisticated
         if self._should_use_hybrid(request, hints):
             return RoutingDecision(
@@ -72,7 +97,18 @@ class IntelligenceRouter:
                 confidence=0.85,
             )
 
-        # Priority 3: LLM - Intelligent, coherent generation
+        # Priority 3: AMPLIFIED - LLM quality at volume
+        if self._should_use_amplified(request, hints):
+            return RoutingDecision(
+                path=GenerationPath.AMPLIFIED,
+                reason=(
+                    f"Amplified: {request.count} {request.entity} records expanded "
+                    "from an LLM seed set"
+                ),
+                confidence=0.8,
+            )
+
+        # Priority 4: LLM - Intelligent, coherent generation
         if self._should_use_llm(request, hints):
             return RoutingDecision(
                 path=GenerationPath.LLM,
@@ -138,6 +174,30 @@ class IntelligenceRouter:
 
         return False
 
+    def _should_use_amplified(
+        self, request: test_data_pb2.GenerateRequest, hints: list[str]
+    ) -> bool:
+        """Check if AMPLIFIED path should be used.
+
+        Args:
+            request: Generation request
+            hints: Lowercased hints
+
+        Returns:
+            True if the request needs LLM quality at a volume worth amplifying
+        """
+        if not self._should_use_llm(request, hints):
+            return False
+
+        if "amplify" in hints:
+            return True
+
+        return (
+            self.amplify_min_count > 0
+            and request.entity in AMPLIFIABLE_ENTITIES
+            and request.count >= self.amplify_min_count
+        )
+
     def _should_use_llm(self, request: test_data_pb2.GenerateRequest, hints: list[str]) -> bool:
         """Check if LLM path should be used.
 
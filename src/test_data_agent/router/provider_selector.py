@@ -0,0 +1,175 @@
+"""Latency-aware selection between LLM providers.
+
+Tracks live per-provider latency (moving average and p95), error rate and
+in-flight calls, and routes each new call to the provider expected to finish
+first. Providers are listed in quality order; a lower-quality provider is only
+preferred when it is expected to be faster by more than ``quality_preference``.
+"""
+
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from test_data_agent.utils.latency import LatencyWindow
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.utils.metrics import MetricsCollector
+
+logger = get_logger(__name__)
+metrics = MetricsCollector()
+
+
+@dataclass
+class ProviderStats:
+    """Live statistics for one provider."""
+
+    latency: LatencyWindow = field(default_factory=LatencyWindow)
+    error_rate: float = 0.0  # Moving average of failed calls
+    in_flight: int = 0
+
+
+@dataclass
+class ProviderChoice:
+    """Result of a provider selection."""
+
+    provider: str
+    reason: str  # only_available, preferred, faster, preferred_unhealthy
+    ranking: list[str]  # Providers in the order they should be tried
+
+
+class ProviderSelector:
+    """Routes LLM calls to the provider expected to finish first."""
+
+    def __init__(
+        self,
+        providers: list[str],
+        quality_preference: float = 1.5,
+        max_error_rate: float = 0.5,
+        concurrency: dict[str, int] | None = None,
+        error_smoothing: float = 0.2,
+        min_samples: int = 3,
+    ):
+        """Initialize selector.
+
+        Args:
+            providers: Provider names in quality order (best first)
+            quality_preference: How many times faster a lower-quality provider
+                must be expected to finish before it is preferred
+            max_error_rate: Error rate above which a provider is tried last
+            concurrency: Calls each provider serves without queueing
+            error_smoothing: Weight of each call outcome in the error rate
+            min_samples: Latency samples needed before estimates are trusted
+        """
+        self.providers = providers
+        self.quality_preference = quality_preference
+        self.max_error_rate = max_error_rate
+        self.concurrency = concurrency or {}
+        self.error_smoothing = error_smoothing
+        self.min_samples = min_samples
+        self.stats = {provider: ProviderStats() for provider in providers}
+
+    def expected_seconds(self, provider: str) -> float | None:
+        """Expected time for a new call to the provider to succeed.
+
+        The moving-average latency is scaled by queueing when in-flight calls
+        exceed the provider's concurrency, and by the expected number of
+        attempts given its error rate.
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            Expected seconds, or None without enough samples
+        """
+        stats = self.stats[provider]
+        if len(stats.latency) < self.min_samples:
+            return None
+        load = max(1.0, (stats.in_flight + 1) / self.concurrency.get(provider, 1_000_000))
+        return stats.latency.ewma * load / max(1.0 - stats.error_rate, 0.05)
+
+    def rank(self, available: list[str] | None = None) -> ProviderChoice:
+        """Rank providers for a new call without recording a selection.
+
+        Args:
+            available: Providers that may be used (defaults to all)
+
+        Returns:
+            ProviderChoice with the provider that would be chosen and fallback order
+        """
+        candidates = [p for p in self.providers if available is None or p in available]
+        if not candidates:
+            raise ValueError("No LLM provider available")
+        if len(candidates) == 1:
+            return ProviderChoice(candidates[0], "only_available", candidates)
+        return self._choose(candidates)
+
+    def select(self, available: list[str] | None = None) -> ProviderChoice:
+        """Choose the provider for a new call.
+
+        Args:
+            available: Providers that may be used (defaults to all)
+
+        Returns:
+            ProviderChoice with the chosen provider and fallback order
+        """
+        choice = self.rank(available)
+        metrics.record_provider_selection(choice.provider, choice.reason)
+        logger.debug(
+            "llm_provider_selected",
+            provider=choice.provider,
+            reason=choice.reason,
+            expected={p: self.expected_seconds(p) for p in choice.ranking},
+        )
+        return choice
+
+    @asynccontextmanager
+    async def track(self, provider: str) -> AsyncIterator[None]:
+        """Track one call to a provider.
+
+        Successful calls update the latency window; exceptions count as
+        errors. Cancelled calls (e.g. losing hedges) are not counted.
+
+        Args:
+            provider: Provider name
+        """
+        stats = self.stats[provider]
+        stats.in_flight += 1
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            stats.error_rate += self.error_smoothing * (1.0 - stats.error_rate)
+            raise
+        else:
+            stats.latency.record(time.perf_counter() - start)
+            stats.error_rate -= self.error_smoothing * stats.error_rate
+        finally:
+            stats.in_flight -= 1
+            metrics.record_provider_stats(
+                provider,
+                ewma=stats.latency.ewma,
+                p95=stats.latency.percentile(0.95),
+                error_rate=stats.error_rate,
+            )
+
+    def _choose(self, candidates: list[str]) -> ProviderChoice:
+        """Pick among several candidates (in quality order)."""
+        healthy = [p for p in candidates if self.stats[p].error_rate <= self.max_error_rate]
+        unhealthy = [p for p in candidates if p not in healthy]
+        if not healthy:
+            return ProviderChoice(candidates[0], "preferred", candidates)
+
+        preferred = healthy[0]
+        reason = "preferred" if preferred == candidates[0] else "preferred_unhealthy"
+        chosen = preferred
+
+        preferred_seconds = self.expected_seconds(preferred)
+        if preferred_seconds is not None:
+            for provider in healthy[1:]:
+                seconds = self.expected_seconds(provider)
+                if seconds is not None and seconds * self.quality_preference < preferred_seconds:
+                    chosen, reason = provider, "faster"
+                    preferred_seconds = seconds * self.quality_preference
+
+        ranking = [chosen] + [p for p in healthy if p != chosen] + unhealthy
+        return ProviderChoice(chosen, reason, ranking)
@@ -1,5 +1,6 @@
 """Schema definitions and registry for test data entities."""
 
+from test_data_agent.schemas.json_schema import JSONSchemaConverter
 from test_data_agent.schemas.registry import SchemaRegistry, get_registry
 
-__all__ = ["SchemaRegistry", "get_registry"]
+__all__ = ["JSONSchemaConverter", "SchemaRegistry", "get_registry"]
@@ -31,11 +31,13 @@ NOTIFICATION_SCHEMA = {
         },
         "subject": {
             "type": "string",
+            "llm": True,
             "required": True,
             "description": "Notification subject",
         },
         "content": {
             "type": "string",
+            "llm": True,
             "required": True,
             "description": "Notification content",
         },
@@ -31,6 +31,7 @@ REVIEW_SCHEMA = {
         },
         "title": {
             "type": "string",
+            "llm": True,
             "min_length": 5,
             "max_length": 100,
             "required": True,
@@ -38,6 +39,7 @@ REVIEW_SCHEMA = {
         },
         "body": {
             "type": "string",
+            "llm": True,
             "min_length": 10,
             "max_length": 5000,
             "required": True,
@@ -30,11 +30,13 @@ SUPPORT_TICKET_SCHEMA = {
         },
         "subject": {
             "type": "string",
+            "llm": True,
             "required": True,
             "description": "Ticket subject",
         },
         "description": {
             "type": "string",
+            "llm": True,
             "required": True,
             "description": "Issue description",
         },
@@ -0,0 +1,143 @@
+"""Conversion of registry schemas to JSON Schema for structured LLM output.
+
+The JSON Schema is handed to the provider so decoding itself is constrained:
+Claude receives it as the input schema of a forced tool call and vLLM as
+``guided_json``. Registry schemas are converted once and memoized by
+fingerprint, together with the request constraints that tighten them.
+"""
+
+from typing import Any
+
+from test_data_agent.utils.fingerprint import fingerprint, schema_fingerprint
+from test_data_agent.utils.lru import LRUCache
+from test_data_agent.validators.constraint import TEMPLATE_PLACEHOLDER
+
+# Registry types without a JSON Schema counterpart are plain strings
+JSON_TYPES = {
+    "string": "string",
+    "integer": "integer",
+    "float": "number",
+    "boolean": "boolean",
+}
+
+# Bookkeeping fields the prompt asks the model to add to every record
+RECORD_METADATA = {
+    "_scenario": {"type": "string"},
+    "_index": {"type": "integer"},
+}
+
+
+class JSONSchemaConverter:
+    """Converts registry schemas to JSON Schema for an array of records."""
+
+    def __init__(self, cache_size: int = 256):
+        """Initialize converter.
+
+        Args:
+            cache_size: Converted schemas kept in memory
+        """
+        self._cache: LRUCache[dict] = LRUCache(cache_size)
+
+    def records_schema(
+        self,
+        schema_dict: dict,
+        constraints: dict | None = None,
+        extra_fields: tuple[str, ...] = (),
+    ) -> dict:
+        """JSON Schema for a response holding an array of records.
+
+        Args:
+            schema_dict: Registry schema dictionary
+            constraints: Request constraints by field (from ``constraints_to_dict``)
+            extra_fields: Additional top-level fields the prompt asks for
+                (e.g. ``_sentiment``)
+
+        Returns:
+            JSON Schema of an array whose items are records of the schema
+        """
+        key = (schema_fingerprint(schema_dict), fingerprint(constraints or {}), extra_fields)
+        return self._cache.get_or_compute(
+            key,
+            lambda: {
+                "type": "array",
+                "items": self.record_schema(schema_dict, constraints, extra_fields),
+            },
+        )
+
+    def record_schema(
+        self,
+        schema_dict: dict,
+        constraints: dict | None = None,
+        extra_fields: tuple[str, ...] = (),
+    ) -> dict:
+        """JSON Schema for a single record.
+
+        Args:
+            schema_dict: Registry schema dictionary
+            constraints: Request constraints by field (override schema bounds)
+            extra_fields: Additional top-level string fields the prompt asks for;
+                they are required, like the prompt says
+
+        Returns:
+            JSON Schema object with the schema's fields and record metadata
+        """
+        record = self._object_schema(schema_dict.get("fields", {}), constraints or {})
+        record["properties"].update(RECORD_METADATA)
+        for name in extra_fields:
+            record["properties"][name] = {"type": "string"}
+            record["required"].append(name)
+        return record
+
+    def _object_schema(self, fields: dict, constraints: dict) -> dict:
+        """Convert a mapping of field definitions to an object schema."""
+        properties = {
+            name: self._field_schema(field_def, constraints.get(name) or {})
+            for name, field_def in fields.items()
+            if isinstance(field_def, dict)
+        }
+        required = [
+            name
+            for name, field_def in fields.items()
+            if isinstance(field_def, dict) and field_def.get("required", False)
+        ]
+        return {
+            "type": "object",
+            "properties": properties,
+            "required": required,
+            "additionalProperties": False,
+        }
+
+    def _field_schema(self, field_def: dict, constraint: dict) -> dict[str, Any]:
+        """Convert one field definition, applying request constraints over it."""
+        field_type = field_def.get("type", "string")
+
+        if field_type == "object":
+            return self._object_schema(field_def.get("fields", {}), {})
+
+        if field_type == "array":
+            item_def = field_def.get("item_schema") or {
+                "type": field_def.get("item_type", "string")
+            }
+            return {"type": "array", "items": self._field_schema(item_def, {})}
+
+        if field_type == "enum":
+            values = constraint.get("enum_values") or field_def.get("values", [])
+            return {"enum": list(values)} if values else {"type": "string"}
+
+        result: dict[str, Any] = {"type": JSON_TYPES.get(field_type, "string")}
+        if result["type"] in ("integer", "number"):
+            for bound, keyword in (("min", "minimum"), ("max", "maximum")):
+                value = constraint.get(bound, field_def.get(bound))
+                if value is not None:
+                    result[keyword] = value
+        elif result["type"] == "string":
+            for bound, keyword in (("min_length", "minLength"), ("max_length", "maxLength")):
+                value = constraint.get(bound, field_def.get(bound))
+                if value is not None:
+                    result[keyword] = value
+            pattern = constraint.get("regex") or field_def.get("pattern") or field_def.get("regex")
+            if pattern and not TEMPLATE_PLACEHOLDER.search(pattern):
+                result["pattern"] = pattern
+            if constraint.get("enum_values"):
+                result = {"enum": list(constraint["enum_values"])}
+        return result
@@ -1,6 +1,8 @@
 """gRPC server implementation for Test Data Service."""
 
+import asyncio
 import json
+import time
 from concurrent import futures
 from typing import AsyncIterator
 
@@ -8,17 +10,37 @@ import grpc
 from grpc_reflection.v1alpha import reflection
 
 from test_data_agent.config import Settings
+from test_data_agent.generators.base import BaseGenerator
 from test_data_agent.generators.traditional import TraditionalGenerator
 from test_data_agent.generators.llm import LLMGenerator
 from test_data_agent.generators.rag import RAGGenerator
 from test_data_agent.generators.hybrid import HybridGenerator
+from test_data_agent.generators.amplified import AmplifiedGenerator
+from test_data_agent.generators.field_level import FieldLevelGenerator
+from test_data_agent.generators.spec import SpecGenerator
+from test_data_agent.generators.refiner import CoherenceRefiner
+from test_data_agent.generators.progressive import ProgressiveGenerator
+from test_data_agent.generators.batch_job import BatchJob, BatchJobRunner, BatchJobState
+from test_data_agent.cache.reservoir import BYPASS_HINT, RecordReservoir
+from test_data_agent.cache.response_cache import build_response_cache, set_response_cache_bypass
 from test_data_agent.clients.claude import ClaudeClient
+from test_data_agent.clients.message_batches import AnthropicMessageBatches
+from test_data_agent.clients.rate_limiter import ClusterRateLimiter, set_request_deadline
+from test_data_agent.clients.redis_client import RedisClient
 from test_data_agent.clients.vllm import VLLMClient
 from test_data_agent.clients.weaviate_client import WeaviateClient
+from test_data_agent.planning.estimator import GenerationEstimator
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
 from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.prompts.examples import ExampleSelector
 from test_data_agent.validators.constraint import ConstraintValidator
 from test_data_agent.validators.coherence import CoherenceScorer
+from test_data_agent.validators.repair import RepairEngine
 from test_data_agent.router.intelligence_router import IntelligenceRouter, GenerationPath
+from test_data_agent.resilience.circuit_breaker import CircuitState, get_circuit_breakers
+from test_data_agent.resilience.hedging import RequestHedger
+from test_data_agent.resilience.retry import RetryBudget, start_retry_budget
+from test_data_agent.router.provider_selector import ProviderSelector
 from test_data_agent.proto import test_data_pb2, test_data_pb2_grpc
 from test_data_agent.schemas.registry import get_registry
 from test_data_agent.utils.logging import bind_request_id, clear_request_context, get_logger
@@ -27,6 +49,9 @@ from test_data_agent.utils.metrics import MetricsCollector
 logger = get_logger(__name__)
 metrics = MetricsCollector()
 
+# Generation paths whose low-coherence records may be regenerated by the LLM
+REGENERATING_PATHS = ("llm", "hybrid", "amplified")
+
 
 class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
     """Implementation of TestDataService gRPC service."""
@@ -44,21 +69,83 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
         # Initialize generators
         self.traditional_generator = TraditionalGenerator()
 
-        # Initialize LLM clients
-        self.claude_client = ClaudeClient(settings)
-        self.vllm_client = VLLMClient(settings) if settings.use_local_llm else None
+        # Redis backs the record reservoir and the cluster-wide rate limiter
+        self.redis_client = RedisClient(settings)
+        self.rate_limiter = None
+        if settings.anthropic_requests_per_minute or settings.anthropic_tokens_per_minute:
+            self.rate_limiter = ClusterRateLimiter(
+                redis_client=self.redis_client,
+                name="anthropic",
+                requests_per_minute=settings.anthropic_requests_per_minute,
+                tokens_per_minute=settings.anthropic_tokens_per_minute,
+                max_wait=settings.rate_limit_max_wait_seconds,
+            )
+
+        # Initialize LLM clients (behind the exact-match response cache, if enabled)
+        self.response_cache = build_response_cache(settings, self.redis_client)
+        self.claude_client = ClaudeClient(
+            settings, rate_limiter=self.rate_limiter, response_cache=self.response_cache
+        )
+        self.vllm_client = (
+            VLLMClient(settings, response_cache=self.response_cache)
+            if settings.use_local_llm
+            else None
+        )
 
         # Initialize supporting components
-        self.prompt_builder = PromptBuilder()
+        self.prompt_builder = PromptBuilder(
+            example_selector=ExampleSelector(
+                max_examples=settings.rag_prompt_max_examples,
+                token_budget=settings.rag_prompt_token_budget,
+            )
+        )
         self.constraint_validator = ConstraintValidator()
+        self.repair_engine = RepairEngine(self.constraint_validator)
         self.coherence_scorer = CoherenceScorer()
 
+        # Initialize Redis-backed reservoir of surplus LLM records
+        self.reservoir = RecordReservoir(
+            redis_client=self.redis_client,
+            settings=settings,
+            constraint_validator=self.constraint_validator,
+            coherence_scorer=self.coherence_scorer,
+        )
+
         # Initialize LLM generator
         self.llm_generator = LLMGenerator(
             claude_client=self.claude_client,
             vllm_client=self.vllm_client,
             prompt_builder=self.prompt_builder,
             constraint_validator=self.constraint_validator,
+            repair_engine=self.repair_engine,
+            structured_output=settings.llm_structured_output,
+            compact_output=settings.llm_compact_output,
+            reservoir=self.reservoir,
+            token_planner=TokenBudgetPlanner(
+                max_output_tokens=settings.claude_max_tokens,
+                safety_margin=settings.llm_token_safety_margin,
+                default_budget=settings.llm_token_budget,
+            ),
+            max_parallel_calls=settings.llm_max_parallel_calls,
+            provider_parallel_calls={"vllm": settings.vllm_max_concurrency},
+            provider_selector=ProviderSelector(
+                ["claude", "vllm"] if self.vllm_client else ["claude"],
+                quality_preference=settings.llm_quality_preference,
+                max_error_rate=settings.llm_max_error_rate,
+                concurrency={
+                    "claude": settings.claude_max_connections,
+                    "vllm": settings.vllm_max_concurrency,
+                },
+            ),
+            hedger=(
+                RequestHedger(
+                    budget_per_minute=settings.llm_hedge_budget_per_minute,
+                    percentile=settings.llm_hedge_percentile,
+                    min_delay=settings.llm_hedge_min_delay_seconds,
+                )
+                if settings.llm_hedging_enabled
+                else None
+            ),
         )
 
         # Initialize Weaviate client for RAG
@@ -68,6 +155,7 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
         self.rag_generator = RAGGenerator(
             weaviate_client=self.weaviate_client,
             top_k=settings.rag_top_k,
+            repair_engine=self.repair_engine,
         )
 
         # Initialize Hybrid generator
@@ -76,8 +164,68 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
             llm_generator=self.llm_generator,
         )
 
+        # Initialize Amplified generator (LLM seeds expanded locally)
+        self.amplified_generator = AmplifiedGenerator(
+            llm_generator=self.llm_generator,
+            coherence_scorer=self.coherence_scorer,
+            repair_engine=self.llm_generator.repair_engine,
+            seed_count=settings.amplification_seed_count,
+            coherence_threshold=settings.coherence_threshold,
+        )
+
+        # Initialize Field-level generator (LLM writes only free-text fields)
+        self.field_level_generator = FieldLevelGenerator(
+            llm_generator=self.llm_generator,
+            traditional_generator=self.traditional_generator,
+        )
+
+        # Initialize Spec generator (LLM-derived specs run by the traditional engine)
+        self.spec_generator = SpecGenerator(
+            claude_client=self.claude_client,
+            vllm_client=self.vllm_client,
+            prompt_builder=self.prompt_builder,
+            traditional_generator=self.traditional_generator,
+            redis_client=self.redis_client,
+            spec_ttl_seconds=settings.spec_cache_ttl_seconds,
+        )
+
+        # Initialize Progressive generator (traditional records upgraded by LLM output)
+        self.progressive_generator = ProgressiveGenerator(
+            traditional_generator=self.traditional_generator,
+            upgrade_generator=self.llm_generator,
+        )
+
+        # Initialize coherence refiner (targeted fixes for low-scoring records)
+        self.coherence_refiner = CoherenceRefiner(
+            coherence_scorer=self.coherence_scorer,
+            llm_generator=self.llm_generator,
+            threshold=settings.coherence_threshold,
+            max_attempts=settings.coherence_refine_max_attempts,
+            time_budget_seconds=settings.coherence_refine_timeout_seconds,
+        )
+
         # Initialize intelligence router
-        self.router = IntelligenceRouter()
+        self.router = IntelligenceRouter(amplify_min_count=settings.amplification_min_count)
+
+        # Initialize estimator (cost and latency of a request without running it)
+        self.estimator = GenerationEstimator(
+            router=self.router,
+            llm_generator=self.llm_generator,
+            settings=settings,
+            spec_generator=self.spec_generator,
+            llm_generator_for=self._llm_generator_for,
+        )
+
+        # Initialize offline batch jobs (Message Batches, results kept in Redis)
+        self.batch_jobs = BatchJobRunner(
+            llm_generator=self.llm_generator,
+            backend=AnthropicMessageBatches(self.claude_client),
+            redis_client=self.redis_client,
+            coherence_refiner=self.coherence_refiner,
+            poll_interval_seconds=settings.llm_batch_poll_interval_seconds,
+            ttl_seconds=settings.llm_batch_job_ttl_seconds,
+        )
+        self._batch_tasks: dict[str, asyncio.Task] = {}
 
         logger.info(
             "test_data_servicer_initialized",
@@ -87,6 +235,24 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
             rag_enabled=True,
         )
 
+    async def connect(self) -> None:
+        """Connect long-lived backing services (Redis reservoir, rate limiter, caches, jobs)."""
+        uses_redis = (
+            self.settings.llm_response_cache_backend.lower() == "redis"
+            or self.settings.llm_batch_enabled
+        )
+        if self.settings.reservoir_enabled or self.rate_limiter is not None or uses_redis:
+            await self.redis_client.connect()
+
+    async def close(self) -> None:
+        """Release long-lived client resources (HTTP connection pools, Redis, job pollers)."""
+        for task in list(self._batch_tasks.values()):
+            task.cancel()
+        await self.claude_client.close()
+        if self.vllm_client is not None:
+            await self.vllm_client.close()
+        await self.redis_client.disconnect()
+
     async def GenerateData(
         self,
         request: test_data_pb2.GenerateRequest,
@@ -105,6 +271,9 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
         # Bind request ID for logging
         if request.request_id:
             bind_request_id(request.request_id)
+        set_request_deadline(context.time_remaining())
+        set_response_cache_bypass(BYPASS_HINT in [h.lower() for h in request.hints])
+        retry_budget = self._start_retry_budget()
 
         logger.info(
             "generate_data_request",
@@ -142,55 +311,28 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
                 confidence=routing_decision.confidence,
             )
 
-            # Get schema dict for context
-            schema_dict = {}
-            if request.inline_schema:
-                # Parse inline schema JSON
-                try:
-                    schema_dict = json.loads(request.inline_schema)
-                    # Register temporarily if it has a name
-                    if "name" in schema_dict:
-                        self.registry.register_schema(schema_dict)
-                    logger.info(
-                        "inline_schema_loaded",
-                        request_id=request.request_id,
-                        schema_name=schema_dict.get("name", "anonymous"),
-                    )
-                except json.JSONDecodeError as e:
-                    logger.error(
-                        "inline_schema_parse_error",
-                        request_id=request.request_id,
-                        error=str(e),
-                    )
-            elif request.schema and request.schema.predefined_schema:
-                found_schema = self.registry.get_schema(request.schema.predefined_schema)
-                if found_schema:
-                    schema_dict = found_schema
-                else:
-                    logger.warning(
-                        "predefined_schema_not_found",
-                        request_id=request.request_id,
-                        schema_name=request.schema.predefined_schema,
-                        msg="Will generate without predefined schema",
-                    )
-            elif request.entity:
-                # Try to find schema by entity name
-                found_schema = self.registry.get_schema(request.entity)
-                if found_schema:
-                    schema_dict = found_schema
-                else:
-                    logger.debug(
-                        "entity_schema_not_found",
-                        request_id=request.request_id,
-                        entity=request.entity,
-                        msg="Will generate without predefined schema",
-                    )
+            schema_dict = self._resolve_schema(request)
 
             # Generate using selected path
             if routing_decision.path == GenerationPath.LLM:
                 # LLM generation
                 context = {"schema_dict": schema_dict}
-                result = await self.llm_generator.generate(request, context=context)
+                result = await self._llm_generator_for(request, schema_dict).generate(
+                    request, context=context
+                )
+            elif routing_decision.path == GenerationPath.AMPLIFIED:
+                # LLM seed set expanded by local mutation
+                context = {"schema_dict": schema_dict}
+                result = await self.amplified_generator.generate(request, context=context)
+            elif routing_decision.path == GenerationPath.SPEC:
+                # LLM-derived spec executed locally
+                context = {"schema_dict": schema_dict}
+                try:
+                    result = await self.spec_generator.generate(request, context=context)
+                except Exception as e:
+                    logger.error("spec_error", error=str(e), request_id=request.request_id)
+                    # Fall back to Traditional if no spec could be obtained
+                    result = await self.traditional_generator.generate(request)
             elif routing_decision.path == GenerationPath.TRADITIONAL:
                 # Traditional generation
                 result = await self.traditional_generator.generate(request)
@@ -232,12 +374,29 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
                 # Unknown path, use Traditional
                 result = await self.traditional_generator.generate(request)
 
-            # Calculate coherence score for all entities
+            # Calculate coherence score for all entities, refining low-scoring records
             coherence_score = result.metadata.get("coherence_score", 0.0)
+            coherence_scores: list[float] = []
+            records_refined = 0
             if result.data:
-                coherence_scores = [
-                    self.coherence_scorer.score(record, request.entity) for record in result.data
-                ]
+                if self.settings.coherence_refine_enabled:
+                    refinement = await self.coherence_refiner.refine(
+                        request,
+                        result.data,
+                        schema_dict,
+                        regenerate=result.metadata.get("generation_path") in REGENERATING_PATHS,
+                    )
+                    result.data = refinement.records
+                    coherence_scores = refinement.scores
+                    records_refined = refinement.fixed_locally + refinement.regenerated
+                    result.metadata["llm_tokens_used"] = (
+                        result.metadata.get("llm_tokens_used", 0) + refinement.llm_tokens_used
+                    )
+                else:
+                    coherence_scores = [
+                        self.coherence_scorer.score(record, request.entity)
+                        for record in result.data
+                    ]
                 coherence_score = (
                     sum(coherence_scores) / len(coherence_scores) if coherence_scores else 0.0
                 )
@@ -258,9 +417,15 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
             metadata = test_data_pb2.GenerationMetadata(
                 generation_path=generation_path,
                 llm_tokens_used=result.metadata.get("llm_tokens_used", 0),
+                llm_tokens_planned=result.metadata.get("llm_tokens_planned", 0),
                 generation_time_ms=duration_ms,
                 coherence_score=coherence_score,
+                records_refined=records_refined,
+                llm_retries=retry_budget.retries,
+                llm_retry_wait_ms=retry_budget.waited_seconds * 1000,
             )
+            if request.include_record_scores:
+                metadata.record_coherence_scores.extend(coherence_scores)
 
             # Record metrics
             metrics.record_request(
@@ -270,6 +435,7 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
                 status="success",
                 duration=duration_ms / 1000,  # Convert ms to seconds
             )
+            self.estimator.observe(request, schema_dict, generation_path, duration_ms / 1000)
             metrics.record_records_generated(
                 domain=request.domain,
                 entity=request.entity,
@@ -280,6 +446,8 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
                 "generate_data_success",
                 request_id=request.request_id,
                 record_count=len(result.data),
+                llm_retries=retry_budget.retries,
+                llm_retry_wait_seconds=retry_budget.waited_seconds,
             )
 
             return test_data_pb2.GenerateResponse(
@@ -334,6 +502,9 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
         # Bind request ID for logging
         if request.request_id:
             bind_request_id(request.request_id)
+        set_request_deadline(context.time_remaining())
+        set_response_cache_bypass(BYPASS_HINT in [h.lower() for h in request.hints])
+        retry_budget = self._start_retry_budget()
 
         logger.info(
             "generate_data_stream_request",
@@ -353,49 +524,7 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
                 reason=routing_decision.reason,
             )
 
-            # Get schema dict for context
-            schema_dict = {}
-            if request.inline_schema:
-                # Parse inline schema JSON
-                try:
-                    schema_dict = json.loads(request.inline_schema)
-                    # Register temporarily if it has a name
-                    if "name" in schema_dict:
-                        self.registry.register_schema(schema_dict)
-                    logger.info(
-                        "inline_schema_loaded_stream",
-                        request_id=request.request_id,
-                        schema_name=schema_dict.get("name", "anonymous"),
-                    )
-                except json.JSONDecodeError as e:
-                    logger.error(
-                        "inline_schema_parse_error_stream",
-                        request_id=request.request_id,
-                        error=str(e),
-                    )
-            elif request.schema and request.schema.predefined_schema:
-                found_schema = self.registry.get_schema(request.schema.predefined_schema)
-                if found_schema:
-                    schema_dict = found_schema
-                else:
-                    logger.warning(
-                        "predefined_schema_not_found",
-                        request_id=request.request_id,
-                        schema_name=request.schema.predefined_schema,
-                        msg="Will generate without predefined schema",
-                    )
-            elif request.entity:
-                # Try to find schema by entity name
-                found_schema = self.registry.get_schema(request.entity)
-                if found_schema:
-                    schema_dict = found_schema
-                else:
-                    logger.debug(
-                        "entity_schema_not_found",
-                        request_id=request.request_id,
-                        entity=request.entity,
-                        msg="Will generate without predefined schema",
-                    )
+            schema_dict = self._resolve_schema(request)
 
             # Determine batch size (default or from settings)
             batch_size = getattr(self.settings, "default_batch_size", 50)
@@ -407,7 +536,62 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
             if routing_decision.path == GenerationPath.LLM:
                 # LLM generation stream
                 gen_context = {"schema_dict": schema_dict}
-                async for result in self.llm_generator.generate_stream(
+                generator = self._llm_generator_for(request, schema_dict)
+                if request.progressive:
+                    # Traditional records at once, then LLM upgrades until the deadline
+                    stream = self.progressive_generator.generate_stream(
+                        request,
+                        batch_size=batch_size,
+                        context=gen_context,
+                        deadline=self._upgrade_deadline(context),
+                        upgrade_generator=generator,
+                    )
+                else:
+                    stream = generator.generate_stream(
+                        request, batch_size=batch_size, context=gen_context
+                    )
+                async for result in stream:
+                    data_json = json.dumps(result.data)
+                    is_upgrade = result.metadata.get("upgrade", False)
+                    if not is_upgrade:
+                        total_records += len(result.data)
+
+                    yield test_data_pb2.DataChunk(
+                        request_id=request.request_id,
+                        data=data_json,
+                        chunk_index=chunk_index,
+                        is_final=False,
+                        is_upgrade=is_upgrade,
+                    )
+                    chunk_index += 1
+
+            elif routing_decision.path == GenerationPath.AMPLIFIED:
+                # Amplified generation stream
+                gen_context = {"schema_dict": schema_dict}
+                async for result in self.amplified_generator.generate_stream(
+                    request, batch_size=batch_size, context=gen_context
+                ):
+                    data_json = json.dumps(result.data)
+                    total_records += len(result.data)
+
+                    yield test_data_pb2.DataChunk(
+                        request_id=request.request_id,
+                        data=data_json,
+                        chunk_index=chunk_index,
+                        is_final=False,
+                    )
+                    chunk_index += 1
+
+            elif routing_decision.path == GenerationPath.SPEC:
+                # Spec generation stream (spec fetched once, records batched locally)
+                gen_context = {"schema_dict": schema_dict}
+                try:
+                    await self.spec_generator.get_spec(request, schema_dict or {})
+                    generator = self.spec_generator
+                except Exception as e:
+                    logger.error("spec_stream_error", error=str(e), request_id=request.request_id)
+                    generator = self.traditional_generator
+                async for result in generator.generate_stream(
                     request, batch_size=batch_size, context=gen_context
                 ):
                     data_json = json.dumps(result.data)
@@ -525,6 +709,8 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
                 request_id=request.request_id,
                 total_chunks=chunk_index + 1,
                 total_records=total_records,
+                llm_retries=retry_budget.retries,
+                llm_retry_wait_seconds=retry_budget.waited_seconds,
             )
 
         except Exception as e:
@@ -544,6 +730,253 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
         finally:
             clear_request_context()
 
+    def _start_retry_budget(self) -> RetryBudget:
+        """Give the current request its share of LLM retries and backoff.
+
+        Returns:
+            The request's retry budget
+        """
+        return start_retry_budget(
+            self.settings.llm_retry_budget, self.settings.llm_retry_budget_wait_seconds
+        )
+
+    def _upgrade_deadline(self, context: grpc.aio.ServicerContext) -> float | None:
+        """Monotonic time by which a progressive stream stops waiting for upgrades.
+
+        Args:
+            context: gRPC context
+
+        Returns:
+            Deadline leaving time to send the final chunk, or None without a
+            client deadline
+        """
+        time_remaining = context.time_remaining()
+        if time_remaining is None:
+            return None
+        return time.monotonic() + time_remaining - self.settings.progressive_deadline_margin_seconds
+
+    def _llm_generator_for(
+        self, request: test_data_pb2.GenerateRequest, schema_dict: dict | None
+    ) -> BaseGenerator:
+        """Pick the generator for an LLM-routed request.
+
+        Args:
+            request: Generate data request
+            schema_dict: Entity schema, if known
+
+        Returns:
+            Field-level generator when enabled and the schema has free-text
+            fields, otherwise the full LLM generator
+        """
+        if (
+            self.settings.llm_field_level
+            and schema_dict
+            and self.field_level_generator.applies_to(request, schema_dict)
+        ):
+            return self.field_level_generator
+        return self.llm_generator
+
+    async def EstimateGeneration(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> test_data_pb2.GenerationEstimate:
+        """
+        Estimate a generation request without running it.
+
+        Args:
+            request: Generate data request to estimate
+            context: gRPC context
+
+        Returns:
+            Expected path, latency percentiles, tokens and cost
+        """
+        try:
+            estimate = await self.estimator.estimate(request, self._resolve_schema(request))
+        except Exception as e:
+            logger.error("estimate_generation_error", request_id=request.request_id, error=str(e))
+            return test_data_pb2.GenerationEstimate(request_id=request.request_id, error=str(e))
+
+        return test_data_pb2.GenerationEstimate(
+            request_id=request.request_id,
+            generation_path=estimate.path,
+            routing_reason=estimate.reason,
+            llm_provider=estimate.provider,
+            latency_p50_ms=estimate.latency_p50_seconds * 1000,
+            latency_p95_ms=estimate.latency_p95_seconds * 1000,
+            latency_source=estimate.latency_source,
+            llm_calls=estimate.llm_calls,
+            input_tokens=estimate.input_tokens,
+            output_tokens=estimate.output_tokens,
+            cost_usd=estimate.cost_usd,
+            cache_hit_likely=estimate.cache_hit_likely,
+            pool_hit_likely=estimate.pool_hit_likely,
+            within_token_budget=estimate.within_token_budget,
+        )
+
+    async def SubmitBatchJob(
+        self,
+        request: test_data_pb2.GenerateRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> test_data_pb2.BatchJobStatus:
+        """
+        Submit an LLM generation request as an offline message batch.
+
+        The job is polled in the background; its records are fetched with
+        GetBatchJob once it has completed.
+
+        Args:
+            request: Generate data request (always generated by the LLM)
+            context: gRPC context
+
+        Returns:
+            Status of the new job
+        """
+        if not self.settings.llm_batch_enabled:
+            return test_data_pb2.BatchJobStatus(
+                state=BatchJobState.FAILED.value,
+                error="Batch jobs are disabled (set LLM_BATCH_ENABLED)",
+            )
+
+        try:
+            job = await self.batch_jobs.submit(request, self._resolve_schema(request))
+        except Exception as e:
+            logger.error("submit_batch_job_error", request_id=request.request_id, error=str(e))
+            return test_data_pb2.BatchJobStatus(state=BatchJobState.FAILED.value, error=str(e))
+
+        self._run_batch_job(job)
+        return self._batch_job_status(job)
+
+    async def GetBatchJob(
+        self,
+        request: test_data_pb2.BatchJobRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> test_data_pb2.BatchJobStatus:
+        """
+        Report on an offline batch job, with its records once completed.
+
+        A job in progress that no poller on this replica is watching (e.g.
+        after a restart) is checked once on the spot.
+
+        Args:
+            request: Batch job request
+            context: gRPC context
+
+        Returns:
+            Status of the job
+        """
+        job = await self.batch_jobs.get(request.job_id)
+        if job is None:
+            return test_data_pb2.BatchJobStatus(
+                job_id=request.job_id, error="Unknown or expired batch job"
+            )
+
+        if job.state == BatchJobState.IN_PROGRESS.value and job.job_id not in self._batch_tasks:
+            try:
+                job = await self.batch_jobs.poll(job)
+            except Exception as e:
+                logger.warning("batch_job_poll_error", job_id=job.job_id, error=str(e))
+
+        data = ""
+        if request.include_data and job.state == BatchJobState.COMPLETED.value:
+            data = json.dumps(await self.batch_jobs.records(job.job_id), indent=2)
+        return self._batch_job_status(job, data)
+
+    def _run_batch_job(self, job: BatchJob) -> None:
+        """Poll a submitted job in the background until it has finished.
+
+        Args:
+            job: Job in progress
+        """
+        task = asyncio.create_task(self.batch_jobs.run(job))
+        self._batch_tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._batch_tasks.pop(job.job_id, None))
+
+    @staticmethod
+    def _batch_job_status(job: BatchJob, data: str = "") -> test_data_pb2.BatchJobStatus:
+        """Convert a batch job to its gRPC status.
+
+        Args:
+            job: Batch job
+            data: JSON records to include
+
+        Returns:
+            BatchJobStatus message
+        """
+        duration_ms = (job.finished_at - job.submitted_at) * 1000 if job.finished_at else 0
+        return test_data_pb2.BatchJobStatus(
+            job_id=job.job_id,
+            state=job.state,
+            batch_id=job.batch_id,
+            llm_calls=job.llm_calls,
+            failed_calls=job.failed_calls,
+            record_count=job.record_count,
+            data=data,
+            metadata=test_data_pb2.GenerationMetadata(
+                generation_path="llm_batch",
+                llm_tokens_used=job.llm_tokens_used,
+                generation_time_ms=duration_ms,
+                coherence_score=job.coherence_score,
+                records_refined=job.records_refined,
+            ),
+            error=job.error,
+        )
+
+    def _resolve_schema(self, request: test_data_pb2.GenerateRequest) -> dict:
+        """Resolve a request's schema: inline, predefined or by entity name.
+
+        Inline schemas with a name are registered, so later requests can
+        refer to them.
+
+        Args:
+            request: Generate data request
+
+        Returns:
+            Schema dictionary ({} if none is found; generation goes on without one)
+        """
+        if request.inline_schema:
+            try:
+                schema_dict = json.loads(request.inline_schema)
+            except json.JSONDecodeError as e:
+                logger.error(
+                    "inline_schema_parse_error",
+                    request_id=request.request_id,
+                    error=str(e),
+                )
+                return {}
+            if "name" in schema_dict:
+                self.registry.register_schema(schema_dict)
+            logger.info(
+                "inline_schema_loaded",
+                request_id=request.request_id,
+                schema_name=schema_dict.get("name", "anonymous"),
+            )
+            return schema_dict
+
+        if request.schema and request.schema.predefined_schema:
+            schema_dict = self.registry.get_schema(request.schema.predefined_schema)
+            if not schema_dict:
+                logger.warning(
+                    "predefined_schema_not_found",
+                    request_id=request.request_id,
+                    schema_name=request.schema.predefined_schema,
+                    msg="Will generate without predefined schema",
+                )
+            return schema_dict or {}
+
+        if request.entity:
+            schema_dict = self.registry.get_schema(request.entity)
+            if not schema_dict:
+                logger.debug(
+                    "entity_schema_not_found",
+                    request_id=request.request_id,
+                    entity=request.entity,
+                    msg="Will generate without predefined schema",
+                )
+            return schema_dict or {}
+
+        return {}
+
     async def GetSchemas(
         self,
         request: test_data_pb2.GetSchemasRequest,
@@ -613,11 +1046,14 @@ class TestDataServiceServicer(test_data_pb2_grpc.TestDataServiceServicer):
         Returns:
             Health status
         """
+        dependencies = get_circuit_breakers().states()
+        degraded = CircuitState.OPEN.value in dependencies.values()
         return test_data_pb2.HealthCheckResponse(
-            status="healthy",
+            status="degraded" if degraded else "healthy",
             components={
                 "grpc_server": "healthy",
                 "config": "healthy",
+                **{f"circuit_{name}": state for name, state in dependencies.items()},
             },
         )
 
@@ -662,6 +1098,9 @@ class GrpcServer:
         await self.server.start()
         logger.info("grpc_server_started", address=listen_addr)
 
+        # Requests are served without the reservoir until Redis is reachable
+        await self.servicer.connect()
+
         try:
             await self.server.wait_for_termination()
         except KeyboardInterrupt:
@@ -678,4 +1117,5 @@ class GrpcServer:
         if self.server:
             logger.info("grpc_server_stopping", grace_period=grace)
             await self.server.stop(grace)
+            await self.servicer.close()
             logger.info("grpc_server_stopped")
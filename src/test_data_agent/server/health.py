@@ -10,6 +10,8 @@ from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 import uvicorn
 
 from test_data_agent.config import Settings
+from test_data_agent.resilience.circuit_breaker import CircuitState, get_circuit_breakers
+from test_data_agent.server.http_routes import add_estimate_route
 from test_data_agent.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -63,13 +65,16 @@ class HealthApp:
             General health endpoint.
 
             Returns:
-                Health status and service info
+                Health status, service info and dependency circuit states
             """
+            dependencies = get_circuit_breakers().states()
+            degraded = CircuitState.OPEN.value in dependencies.values()
             return {
-                "status": "healthy",
+                "status": "degraded" if degraded else "healthy",
                 "service": self.settings.service_name,
                 "version": "0.1.0",
                 "environment": self.settings.environment,
+                "dependencies": dependencies,
             }
 
         @self.app.get("/health/live")
@@ -108,6 +113,8 @@ class HealthApp:
                 "grpc_port": self.settings.grpc_port,
             }
 
+        add_estimate_route(self.app, self.settings)
+
         @self.app.get("/metrics")
         async def metrics() -> Response:
             """
@@ -25,6 +25,7 @@ class GenerateRequest(BaseModel):
     options: Optional[dict[str, bool]] = None
     generationPath: Optional[str] = None
     inlineSchema: Optional[str] = None
+    tokenBudget: Optional[int] = None
 
 
 class SchemaInfo(BaseModel):
@@ -36,6 +37,79 @@ class SchemaInfo(BaseModel):
     domain: Optional[str] = None
 
 
+def build_grpc_request(request: GenerateRequest) -> test_data_pb2.GenerateRequest:
+    """Convert an HTTP generation request to its gRPC message."""
+    grpc_request = test_data_pb2.GenerateRequest(
+        request_id=f"http-{request.entity}-{request.count}",
+        domain=request.domain,
+        entity=request.entity,
+        count=request.count,
+    )
+
+    if request.context:
+        grpc_request.context = request.context
+
+    if request.scenarios:
+        for scenario in request.scenarios:
+            grpc_scenario = grpc_request.scenarios.add()
+            grpc_scenario.name = scenario.get("name", "")
+            grpc_scenario.description = scenario.get("description", "")
+            grpc_scenario.weight = scenario.get("weight", 1)
+
+    if request.hints:
+        grpc_request.hints.extend(request.hints)
+
+    if request.inlineSchema:
+        grpc_request.inline_schema = request.inlineSchema
+
+    if request.tokenBudget:
+        grpc_request.token_budget = request.tokenBudget
+
+    if (
+        request.generationPath
+        and request.generationPath.upper() in test_data_pb2.GenerationMethod.keys()
+    ):
+        grpc_request.generation_method = test_data_pb2.GenerationMethod.Value(
+            request.generationPath.upper()
+        )
+
+    return grpc_request
+
+
+def add_estimate_route(app, settings):
+    """Add the cost and latency estimate endpoint."""
+
+    @app.post("/estimate")
+    async def estimate_generation(request: GenerateRequest):
+        """Estimate path, latency, tokens and cost of a request without running it."""
+        try:
+            async with grpc.aio.insecure_channel(f"localhost:{settings.grpc_port}") as channel:
+                stub = test_data_pb2_grpc.TestDataServiceStub(channel)
+                estimate = await stub.EstimateGeneration(build_grpc_request(request))
+        except grpc.RpcError as e:
+            logger.error("grpc_error_in_http_estimate", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+
+        if estimate.error:
+            raise HTTPException(status_code=500, detail=estimate.error)
+
+        return {
+            "requestId": estimate.request_id,
+            "generationPath": estimate.generation_path,
+            "routingReason": estimate.routing_reason,
+            "llmProvider": estimate.llm_provider or None,
+            "latencyMs": {"p50": estimate.latency_p50_ms, "p95": estimate.latency_p95_ms},
+            "latencySource": estimate.latency_source,
+            "llmCalls": estimate.llm_calls,
+            "inputTokens": estimate.input_tokens,
+            "outputTokens": estimate.output_tokens,
+            "costUsd": estimate.cost_usd,
+            "cacheHitLikely": estimate.cache_hit_likely,
+            "poolHitLikely": estimate.pool_hit_likely,
+            "withinTokenBudget": estimate.within_token_budget,
+        }
+
+
 def add_http_routes(app, settings):
     """Add HTTP routes for UI integration."""
 
@@ -48,28 +122,7 @@ def add_http_routes(app, settings):
             stub = test_data_pb2_grpc.TestDataServiceStub(channel)
 
             # Build gRPC request
-            grpc_request = test_data_pb2.GenerateRequest(
-                request_id=f"http-{request.entity}-{request.count}",
-                domain=request.domain,
-                entity=request.entity,
-                count=request.count,
-            )
-
-            if request.context:
-                grpc_request.context = request.context
-
-            if request.scenarios:
-                for scenario in request.scenarios:
-                    grpc_scenario = grpc_request.scenarios.add()
-                    grpc_scenario.name = scenario.get("name", "")
-                    grpc_scenario.description = scenario.get("description", "")
-                    grpc_scenario.weight = scenario.get("weight", 1)
-
-            if request.hints:
-                grpc_request.hints.extend(request.hints)
-
-            if request.inlineSchema:
-                grpc_request.inline_schema = request.inlineSchema
+            grpc_request = build_grpc_request(request)
 
             # Make gRPC call
             response = stub.GenerateData(grpc_request)
@@ -91,6 +144,11 @@ def add_http_routes(app, settings):
                         if response.metadata and response.metadata.llm_tokens_used
                         else None
                     ),
+                    "llmTokensPlanned": (
+                        response.metadata.llm_tokens_planned
+                        if response.metadata and response.metadata.llm_tokens_planned
+                        else None
+                    ),
                     "generationTimeMs": (
                         response.metadata.generation_time_ms
                         if response.metadata and response.metadata.generation_time_ms
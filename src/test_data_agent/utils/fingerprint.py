@@ -0,0 +1,49 @@
+"""Stable fingerprints for schemas and request context."""
+
+import hashlib
+import json
+from typing import Any
+
+from test_data_agent.utils.lru import LRUCache
+
+# id(schema) -> (schema, fingerprint); holding the schema keeps its id from being reused
+_schema_fingerprints: LRUCache[tuple[Any, str]] = LRUCache(maxsize=512)
+
+
+def fingerprint(value: Any, length: int = 16) -> str:
+    """Compute a stable hash of a JSON-serializable value.
+
+    Dict keys are sorted so logically equal values always produce the same
+    fingerprint regardless of insertion order.
+
+    Args:
+        value: Value to fingerprint
+        length: Number of hex characters to keep
+
+    Returns:
+        Hex digest prefix
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:length]
+
+
+def schema_fingerprint(schema_dict: dict | None) -> str:
+    """Fingerprint a schema dict, memoized by object identity.
+
+    Registry schemas are shared, never-mutated dicts looked up on every
+    request, so hashing each one once avoids re-serializing it on the hot
+    path. Callers must not mutate a schema after fingerprinting it.
+
+    Args:
+        schema_dict: Schema dictionary
+
+    Returns:
+        Schema fingerprint
+    """
+    if not schema_dict:
+        return fingerprint(schema_dict or {})
+
+    _, digest = _schema_fingerprints.get_or_compute(
+        id(schema_dict), lambda: (schema_dict, fingerprint(schema_dict))
+    )
+    return digest
@@ -0,0 +1,55 @@
+"""Sliding-window latency statistics."""
+
+import math
+from collections import deque
+
+
+class LatencyWindow:
+    """Exponentially weighted mean and percentiles over recent latencies."""
+
+    def __init__(self, size: int = 200, smoothing: float = 0.2):
+        """Initialize window.
+
+        Args:
+            size: Number of recent samples kept for percentiles
+            smoothing: Weight of each new sample in the moving average
+        """
+        self.smoothing = smoothing
+        self._samples: deque[float] = deque(maxlen=size)
+        self._ewma: float | None = None
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample.
+
+        Args:
+            seconds: Observed latency
+        """
+        self._samples.append(seconds)
+        if self._ewma is None:
+            self._ewma = seconds
+        else:
+            self._ewma += self.smoothing * (seconds - self._ewma)
+
+    @property
+    def ewma(self) -> float | None:
+        """Moving average latency, or None before the first sample."""
+        return self._ewma
+
+    def percentile(self, q: float) -> float | None:
+        """Latency at quantile ``q`` of the recent window (nearest rank).
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Latency in seconds, or None before the first sample
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q * len(ordered)))
+        return ordered[rank - 1]
+
+    def __len__(self) -> int:
+        """Number of samples in the window."""
+        return len(self._samples)
@@ -1,6 +1,6 @@
 """Prometheus metrics collection."""
 
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 # Define metrics
 testdata_requests_total = Counter(
@@ -40,6 +40,180 @@ testdata_coherence_score = Histogram(
     buckets=[0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0],
 )
 
+testdata_llm_inflight_requests = Gauge(
+    "testdata_llm_inflight_requests",
+    "Number of LLM API calls currently in flight",
+    ["provider"],
+)
+
+testdata_llm_http_pool_connections = Gauge(
+    "testdata_llm_http_pool_connections",
+    "Connections held by the LLM client HTTP pool",
+    ["provider", "state"],
+)
+
+testdata_llm_time_to_first_record_seconds = Histogram(
+    "testdata_llm_time_to_first_record_seconds",
+    "Time from request start until the first streamed LLM record is ready",
+    ["provider"],
+    buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 45.0],
+)
+
+testdata_llm_prompt_cache_tokens_total = Counter(
+    "testdata_llm_prompt_cache_tokens_total",
+    "Input tokens read from or written to the LLM provider prompt cache",
+    ["provider", "operation"],
+)
+
+testdata_llm_tokens_total = Counter(
+    "testdata_llm_tokens_total",
+    "LLM tokens planned before generation and actually used",
+    ["provider", "kind"],
+)
+
+testdata_llm_responses_total = Counter(
+    "testdata_llm_responses_total",
+    "LLM responses by output mode and whether any record could be parsed from them",
+    ["provider", "output_mode", "outcome"],
+)
+
+testdata_llm_response_cache_requests_total = Counter(
+    "testdata_llm_response_cache_requests_total",
+    "LLM response cache lookups by outcome (hit, miss)",
+    ["provider", "outcome"],
+)
+
+testdata_llm_response_cache_saved_tokens_total = Counter(
+    "testdata_llm_response_cache_saved_tokens_total",
+    "Tokens of LLM calls answered from the response cache",
+    ["provider"],
+)
+
+testdata_coherence_refined_records_total = Counter(
+    "testdata_coherence_refined_records_total",
+    "Records below the coherence threshold by outcome (fixed_locally, regenerated, unresolved)",
+    ["entity", "outcome"],
+)
+
+testdata_reservoir_requests_total = Counter(
+    "testdata_reservoir_requests_total",
+    "Reservoir lookups by outcome (hit, partial, miss)",
+    ["entity", "outcome"],
+)
+
+testdata_reservoir_records_total = Counter(
+    "testdata_reservoir_records_total",
+    "Records served from, stored in or expired out of the LLM record reservoir",
+    ["entity", "operation"],
+)
+
+testdata_reservoir_depth = Gauge(
+    "testdata_reservoir_depth",
+    "Records waiting in the most recently touched reservoir pool",
+    ["entity"],
+)
+
+testdata_reservoir_record_age_seconds = Histogram(
+    "testdata_reservoir_record_age_seconds",
+    "Age of reservoir records when they are served",
+    ["entity"],
+    buckets=[60, 300, 900, 3600, 10800, 21600, 86400],
+)
+
+testdata_spec_requests_total = Counter(
+    "testdata_spec_requests_total",
+    "Generation spec lookups by outcome (memory, redis, llm)",
+    ["entity", "outcome"],
+)
+
+testdata_llm_provider_selections_total = Counter(
+    "testdata_llm_provider_selections_total",
+    "LLM provider selections by reason (only_available, preferred, faster, preferred_unhealthy)",
+    ["provider", "reason"],
+)
+
+testdata_llm_provider_latency_seconds = Gauge(
+    "testdata_llm_provider_latency_seconds",
+    "Live LLM provider call latency used for provider selection",
+    ["provider", "stat"],
+)
+
+testdata_llm_provider_error_rate = Gauge(
+    "testdata_llm_provider_error_rate",
+    "Moving average of failed calls per LLM provider",
+    ["provider"],
+)
+
+testdata_llm_hedges_total = Counter(
+    "testdata_llm_hedges_total",
+    "Hedged LLM calls by outcome (primary_won, backup_won, both_failed, budget_exhausted)",
+    ["provider", "outcome"],
+)
+
+testdata_circuit_breaker_state = Gauge(
+    "testdata_circuit_breaker_state",
+    "Circuit breaker state per dependency (0 = closed, 1 = half-open, 2 = open)",
+    ["dependency"],
+)
+
+testdata_circuit_breaker_rejections_total = Counter(
+    "testdata_circuit_breaker_rejections_total",
+    "Calls rejected by an open circuit breaker",
+    ["dependency"],
+)
+
+testdata_rate_limit_wait_seconds = Histogram(
+    "testdata_rate_limit_wait_seconds",
+    "Time spent waiting for cluster-wide rate-limit capacity before an LLM call",
+    ["provider"],
+    buckets=[0.01, 0.1, 0.5, 1.0, 5.0, 15.0, 30.0],
+)
+
+testdata_rate_limit_rejections_total = Counter(
+    "testdata_rate_limit_rejections_total",
+    "LLM calls failed fast because rate-limit capacity would arrive after their deadline",
+    ["provider", "reason"],
+)
+
+testdata_llm_retries_total = Counter(
+    "testdata_llm_retries_total",
+    "Failed LLM calls by retry decision (retried, attempts_exhausted, budget_exhausted)",
+    ["provider", "outcome"],
+)
+
+testdata_llm_retry_wait_seconds = Histogram(
+    "testdata_llm_retry_wait_seconds",
+    "Backoff slept before retrying a failed LLM call",
+    ["provider"],
+    buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+)
+
+testdata_llm_batch_jobs_total = Counter(
+    "testdata_llm_batch_jobs_total",
+    "Offline LLM batch jobs by state reached (submitted, completed, failed)",
+    ["state"],
+)
+
+testdata_llm_batch_job_seconds = Histogram(
+    "testdata_llm_batch_job_seconds",
+    "Time from submitting an offline LLM batch job to its result",
+    buckets=[60, 300, 900, 1800, 3600, 7200, 21600, 86400],
+)
+
+testdata_record_repairs_total = Counter(
+    "testdata_record_repairs_total",
+    "Constraint violations repaired without regenerating the record",
+    ["entity", "field"],
+)
+
+testdata_unrepairable_records_total = Counter(
+    "testdata_unrepairable_records_total",
+    "Generated records dropped because their constraint violations could not be repaired",
+    ["entity", "path"],
+)
+
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
 
 class MetricsCollector:
     """Collector for test data generation metrics."""
@@ -109,3 +283,331 @@ class MetricsCollector:
             score: Coherence score (0.0 to 1.0)
         """
         testdata_coherence_score.labels(domain=domain).observe(score)
+
+    @staticmethod
+    def llm_request_started(provider: str) -> None:
+        """
+        Record the start of an LLM API call.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+        """
+        testdata_llm_inflight_requests.labels(provider=provider).inc()
+
+    @staticmethod
+    def llm_request_finished(provider: str) -> None:
+        """
+        Record the end of an LLM API call.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+        """
+        testdata_llm_inflight_requests.labels(provider=provider).dec()
+
+    @staticmethod
+    def record_http_pool(provider: str, active: int, idle: int) -> None:
+        """
+        Record HTTP connection pool state.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            active: Connections currently serving requests
+            idle: Keep-alive connections waiting for reuse
+        """
+        testdata_llm_http_pool_connections.labels(provider=provider, state="active").set(active)
+        testdata_llm_http_pool_connections.labels(provider=provider, state="idle").set(idle)
+
+    @staticmethod
+    def record_time_to_first_record(provider: str, seconds: float) -> None:
+        """
+        Record time to first streamed LLM record.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            seconds: Seconds from request start to first record
+        """
+        testdata_llm_time_to_first_record_seconds.labels(provider=provider).observe(seconds)
+
+    @staticmethod
+    def record_prompt_cache_tokens(provider: str, read: int, write: int) -> None:
+        """
+        Record prompt cache token usage.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            read: Input tokens served from the cache
+            write: Input tokens written to the cache
+        """
+        testdata_llm_prompt_cache_tokens_total.labels(provider=provider, operation="read").inc(read)
+        testdata_llm_prompt_cache_tokens_total.labels(provider=provider, operation="write").inc(
+            write
+        )
+
+    @staticmethod
+    def record_llm_token_usage(provider: str, planned: int, used: int) -> None:
+        """
+        Record planned versus actual LLM token usage.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            planned: Tokens the planner expected the request to use
+            used: Tokens reported by the provider
+        """
+        testdata_llm_tokens_total.labels(provider=provider, kind="planned").inc(planned)
+        testdata_llm_tokens_total.labels(provider=provider, kind="used").inc(used)
+
+    @staticmethod
+    def record_llm_response(provider: str, output_mode: str, parsed: bool) -> None:
+        """
+        Record whether an LLM response could be parsed.
+
+        Unparsed responses are retried, so the ratio of ``unparsed`` to all
+        responses is the parse-retry rate for each output mode.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            output_mode: Output mode (structured, free_text)
+            parsed: True if at least one record was recovered
+        """
+        testdata_llm_responses_total.labels(
+            provider=provider,
+            output_mode=output_mode,
+            outcome="parsed" if parsed else "unparsed",
+        ).inc()
+
+    @staticmethod
+    def record_response_cache_lookup(provider: str, hit: bool, saved_tokens: int = 0) -> None:
+        """
+        Record an LLM response cache lookup.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            hit: True if the response was served from the cache
+            saved_tokens: Tokens the cached call originally used
+        """
+        testdata_llm_response_cache_requests_total.labels(
+            provider=provider, outcome="hit" if hit else "miss"
+        ).inc()
+        if hit:
+            testdata_llm_response_cache_saved_tokens_total.labels(provider=provider).inc(
+                saved_tokens
+            )
+
+    @staticmethod
+    def record_coherence_refinement(
+        entity: str, fixed_locally: int, regenerated: int, unresolved: int
+    ) -> None:
+        """
+        Record the outcome of coherence refinement for one request.
+
+        Args:
+            entity: Entity type
+            fixed_locally: Records raised over the threshold by local fixes
+            regenerated: Records replaced by regenerated ones
+            unresolved: Records still below the threshold
+        """
+        for outcome, count in (
+            ("fixed_locally", fixed_locally),
+            ("regenerated", regenerated),
+            ("unresolved", unresolved),
+        ):
+            testdata_coherence_refined_records_total.labels(entity=entity, outcome=outcome).inc(
+                count
+            )
+
+    @staticmethod
+    def record_reservoir_lookup(entity: str, outcome: str, served: int, expired: int) -> None:
+        """
+        Record a reservoir lookup.
+
+        Args:
+            entity: Entity type
+            outcome: Lookup outcome (hit, partial, miss)
+            served: Records served from the reservoir
+            expired: Stale records discarded during the lookup
+        """
+        testdata_reservoir_requests_total.labels(entity=entity, outcome=outcome).inc()
+        testdata_reservoir_records_total.labels(entity=entity, operation="served").inc(served)
+        testdata_reservoir_records_total.labels(entity=entity, operation="expired").inc(expired)
+
+    @staticmethod
+    def record_reservoir_stored(entity: str, count: int) -> None:
+        """
+        Record surplus records stored in the reservoir.
+
+        Args:
+            entity: Entity type
+            count: Number of records stored
+        """
+        testdata_reservoir_records_total.labels(entity=entity, operation="stored").inc(count)
+
+    @staticmethod
+    def record_reservoir_depth(entity: str, depth: int) -> None:
+        """
+        Record reservoir pool depth.
+
+        Args:
+            entity: Entity type
+            depth: Records currently in the pool
+        """
+        testdata_reservoir_depth.labels(entity=entity).set(depth)
+
+    @staticmethod
+    def record_reservoir_age(entity: str, seconds: float) -> None:
+        """
+        Record the age of a served reservoir record.
+
+        Args:
+            entity: Entity type
+            seconds: Seconds since the record was stored
+        """
+        testdata_reservoir_record_age_seconds.labels(entity=entity).observe(seconds)
+
+    @staticmethod
+    def record_spec_lookup(entity: str, outcome: str) -> None:
+        """
+        Record where a generation spec was obtained.
+
+        Args:
+            entity: Entity type
+            outcome: Spec source (memory, redis, llm)
+        """
+        testdata_spec_requests_total.labels(entity=entity, outcome=outcome).inc()
+
+    @staticmethod
+    def record_provider_selection(provider: str, reason: str) -> None:
+        """
+        Record an LLM provider selection.
+
+        Args:
+            provider: Chosen provider (claude, vllm)
+            reason: Selection reason
+        """
+        testdata_llm_provider_selections_total.labels(provider=provider, reason=reason).inc()
+
+    @staticmethod
+    def record_provider_stats(
+        provider: str, ewma: float | None, p95: float | None, error_rate: float
+    ) -> None:
+        """
+        Record live provider statistics.
+
+        Args:
+            provider: LLM provider (claude, vllm)
+            ewma: Moving average latency in seconds (None before the first sample)
+            p95: 95th percentile latency in seconds (None before the first sample)
+            error_rate: Moving average of failed calls
+        """
+        if ewma is not None:
+            testdata_llm_provider_latency_seconds.labels(provider=provider, stat="ewma").set(ewma)
+        if p95 is not None:
+            testdata_llm_provider_latency_seconds.labels(provider=provider, stat="p95").set(p95)
+        testdata_llm_provider_error_rate.labels(provider=provider).set(error_rate)
+
+    @staticmethod
+    def record_hedge(provider: str, outcome: str) -> None:
+        """
+        Record a hedging decision.
+
+        Args:
+            provider: Primary LLM provider (claude, vllm)
+            outcome: Hedge outcome
+        """
+        testdata_llm_hedges_total.labels(provider=provider, outcome=outcome).inc()
+
+    @staticmethod
+    def record_circuit_state(dependency: str, state: str) -> None:
+        """
+        Record a circuit breaker state.
+
+        Args:
+            dependency: Dependency name (claude, vllm, weaviate, redis)
+            state: Breaker state (closed, half_open, open)
+        """
+        testdata_circuit_breaker_state.labels(dependency=dependency).set(
+            CIRCUIT_STATE_VALUES[state]
+        )
+
+    @staticmethod
+    def record_circuit_rejection(dependency: str) -> None:
+        """
+        Record a call rejected by an open circuit.
+
+        Args:
+            dependency: Dependency name (claude, vllm, weaviate, redis)
+        """
+        testdata_circuit_breaker_rejections_total.labels(dependency=dependency).inc()
+
+    @staticmethod
+    def record_rate_limit_wait(provider: str, seconds: float) -> None:
+        """
+        Record time spent waiting for rate-limit capacity.
+
+        Args:
+            provider: LLM provider
+            seconds: Wait time
+        """
+        testdata_rate_limit_wait_seconds.labels(provider=provider).observe(seconds)
+
+    @staticmethod
+    def record_rate_limit_rejection(provider: str, reason: str) -> None:
+        """
+        Record a call failed fast by the rate limiter.
+
+        Args:
+            provider: LLM provider
+            reason: Rejection reason (deadline, queue_timeout)
+        """
+        testdata_rate_limit_rejections_total.labels(provider=provider, reason=reason).inc()
+
+    @staticmethod
+    def record_retry(provider: str, outcome: str, delay: float = 0.0) -> None:
+        """
+        Record a retry decision for a failed LLM call.
+
+        Args:
+            provider: LLM provider
+            outcome: Decision (retried, attempts_exhausted, budget_exhausted)
+            delay: Backoff slept before the retry
+        """
+        testdata_llm_retries_total.labels(provider=provider, outcome=outcome).inc()
+        if outcome == "retried":
+            testdata_llm_retry_wait_seconds.labels(provider=provider).observe(delay)
+
+    @staticmethod
+    def record_batch_job(state: str, duration: float | None = None) -> None:
+        """
+        Record an offline LLM batch job reaching a state.
+
+        Args:
+            state: State reached (submitted, completed, failed)
+            duration: Seconds since submission, for finished jobs
+        """
+        testdata_llm_batch_jobs_total.labels(state=state).inc()
+        if duration is not None:
+            testdata_llm_batch_job_seconds.observe(duration)
+
+    @staticmethod
+    def record_repairs(entity: str, repaired_fields: dict[str, int]) -> None:
+        """
+        Record constraint repairs.
+
+        Args:
+            entity: Entity type
+            repaired_fields: Repairs per field path (array indices removed)
+        """
+        for field, count in repaired_fields.items():
+            testdata_record_repairs_total.labels(entity=entity, field=field).inc(count)
+
+    @staticmethod
+    def record_unrepairable(entity: str, path: str, count: int) -> None:
+        """
+        Record records dropped as unrepairable.
+
+        Args:
+            entity: Entity type
+            path: Generation path (llm, rag)
+            count: Number of records
+        """
+        if count:
+            testdata_unrepairable_records_total.labels(entity=entity, path=path).inc(count)
@@ -4,7 +4,20 @@ from test_data_agent.validators.constraint import (
     ConstraintValidator,
     ValidationError,
     ValidationResult,
+    constraints_to_dict,
 )
 from test_data_agent.validators.coherence import CoherenceScorer
+from test_data_agent.validators.derived import recompute_totals
+from test_data_agent.validators.repair import RepairEngine, RepairResult, RepairSummary
 
-__all__ = ["ConstraintValidator", "ValidationError", "ValidationResult", "CoherenceScorer"]
+__all__ = [
+    "ConstraintValidator",
+    "ValidationError",
+    "ValidationResult",
+    "constraints_to_dict",
+    "CoherenceScorer",
+    "recompute_totals",
+    "RepairEngine",
+    "RepairResult",
+    "RepairSummary",
+]
@@ -29,6 +29,23 @@ class CoherenceScorer:
         "kitchen": {"cookware", "utensils", "dishes", "glassware", "cutting board", "knives"},
     }
 
+    # Entities with real scoring rules; all others get a neutral score
+    SCORED_ENTITIES = ("cart", "order")
+
+    # Timestamp fields in the order they must occur
+    DATE_FIELDS = ("created_at", "updated_at", "shipped_at", "completed_at")
+
+    def scores_entity(self, entity_type: str) -> bool:
+        """Check if an entity type has coherence rules.
+
+        Args:
+            entity_type: Type of entity (cart, order, etc.)
+
+        Returns:
+            True if scores for this entity reflect the record's content
+        """
+        return entity_type in self.SCORED_ENTITIES
+
     def score(self, data: dict, entity_type: str) -> float:
         """Score the coherence of a generated record.
 
@@ -185,6 +202,9 @@ class CoherenceScorer:
             qty = item.get("quantity", 1)
             total += 1
 
+            # Missing or non-numeric quantities (e.g. "2" or null from an LLM) are wrong
+            if not isinstance(qty, (int, float)) or isinstance(qty, bool):
+                continue
             # Reasonable quantities are 1-10 for most items
             if 1 <= qty <= 10:
                 reasonable += 1
@@ -214,11 +234,15 @@ class CoherenceScorer:
         total = cart.get("total", 0)
 
         # Check if total = subtotal + tax (within 0.01 tolerance for floating point)
-        expected_total = subtotal + tax
-        if abs(total - expected_total) < 0.01:
+        try:
+            expected_total = subtotal + tax
+            error = abs(total - expected_total)
+        except TypeError:  # Non-numeric amounts can't add up
+            return 0.0
+        if error < 0.01:
             return 1.0
         # Close but not exact
-        elif abs(total - expected_total) < 1.0:
+        elif error < 1.0:
             return 0.7
         # Way off
         else:
@@ -240,11 +264,15 @@ class CoherenceScorer:
         discount = order.get("discount", 0)
         total = order.get("total", 0)
 
-        expected_total = subtotal + tax + shipping - discount
+        try:
+            expected_total = subtotal + tax + shipping - discount
+            error = abs(total - expected_total)
+        except TypeError:  # Non-numeric amounts can't add up
+            return 0.0
 
-        if abs(total - expected_total) < 0.01:
+        if error < 0.01:
             return 1.0
-        elif abs(total - expected_total) < 1.0:
+        elif error < 1.0:
             return 0.7
         else:
             return 0.0
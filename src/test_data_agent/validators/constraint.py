@@ -4,10 +4,36 @@ import re
 from dataclasses import dataclass
 from typing import Any, List, Optional
 
+from test_data_agent.proto import test_data_pb2
 from test_data_agent.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Schema "pattern" values such as "{category}-{random_int:6}" are format
+# templates for the traditional generator, not regular expressions
+TEMPLATE_PLACEHOLDER = re.compile(r"\{[A-Za-z_]")
+
+
+def constraints_to_dict(constraints: test_data_pb2.Constraints) -> dict[str, dict]:
+    """Convert request constraints to the dict form used by the validator.
+
+    Args:
+        constraints: Constraints from a gRPC request
+
+    Returns:
+        Mapping of field name to its set constraint values
+    """
+    result: dict[str, dict] = {}
+    for field_name, constraint in constraints.field_constraints.items():
+        values: dict[str, Any] = {}
+        for key in ("min", "max", "regex", "min_length", "max_length", "format"):
+            if constraint.HasField(key):
+                values[key] = getattr(constraint, key)
+        if constraint.enum_values:
+            values["enum_values"] = list(constraint.enum_values)
+        result[field_name] = values
+    return result
+
 
 @dataclass
 class ValidationError:
@@ -16,6 +42,8 @@ class ValidationError:
     field: str
     message: str
     value: Any
+    code: str = ""  # required, type, min, max, min_length, max_length, pattern, enum
+    expected: Any = None  # Violated bound, expected type, pattern or allowed values
 
 
 @dataclass
@@ -64,6 +92,7 @@ class ConstraintValidator:
                         field=field_name,
                         message=f"Required field '{field_name}' is missing",
                         value=None,
+                        code="required",
                     )
                 )
                 continue
@@ -80,7 +109,9 @@ class ConstraintValidator:
                 field_constraint = constraints.get(field_name)
 
             # Validate the field
-            field_errors = self.validate_field(value, field_def, field_constraint)
+            field_errors = self.validate_field(
+                value, {**field_def, "name": field_name}, field_constraint
+            )
             errors.extend(field_errors)
 
         result = ValidationResult(
@@ -143,6 +174,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Expected integer, got {type(value).__name__}",
                     value=value,
+                    code="type",
+                    expected="integer",
                 )
             )
             return errors
@@ -162,6 +195,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Value {value} is less than minimum {min_val}",
                     value=value,
+                    code="min",
+                    expected=min_val,
                 )
             )
 
@@ -171,6 +206,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Value {value} is greater than maximum {max_val}",
                     value=value,
+                    code="max",
+                    expected=max_val,
                 )
             )
 
@@ -188,6 +225,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Expected number, got {type(value).__name__}",
                     value=value,
+                    code="type",
+                    expected="float",
                 )
             )
             return errors
@@ -206,6 +245,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Value {value} is less than minimum {min_val}",
                     value=value,
+                    code="min",
+                    expected=min_val,
                 )
             )
 
@@ -215,6 +256,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Value {value} is greater than maximum {max_val}",
                     value=value,
+                    code="max",
+                    expected=max_val,
                 )
             )
 
@@ -232,6 +275,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Expected string, got {type(value).__name__}",
                     value=value,
+                    code="type",
+                    expected="string",
                 )
             )
             return errors
@@ -250,6 +295,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"String length {len(value)} is less than minimum {min_length}",
                     value=value,
+                    code="min_length",
+                    expected=min_length,
                 )
             )
 
@@ -259,6 +306,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"String length {len(value)} is greater than maximum {max_length}",
                     value=value,
+                    code="max_length",
+                    expected=max_length,
                 )
             )
 
@@ -267,13 +316,15 @@ class ConstraintValidator:
         if constraint:
             pattern = constraint.get("pattern") or constraint.get("regex", pattern)
 
-        if pattern:
+        if pattern and not TEMPLATE_PLACEHOLDER.search(pattern):
             if not re.match(pattern, value):
                 errors.append(
                     ValidationError(
                         field=field_name,
                         message=f"String does not match pattern {pattern}",
                         value=value,
+                        code="pattern",
+                        expected=pattern,
                     )
                 )
 
@@ -296,6 +347,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Value '{value}' not in allowed values: {allowed}",
                     value=value,
+                    code="enum",
+                    expected=allowed,
                 )
             )
 
@@ -313,6 +366,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Expected array, got {type(value).__name__}",
                     value=value,
+                    code="type",
+                    expected="array",
                 )
             )
             return errors
@@ -351,6 +406,8 @@ class ConstraintValidator:
                     field=field_name,
                     message=f"Expected object, got {type(value).__name__}",
                     value=value,
+                    code="type",
+                    expected="object",
                 )
             )
             return errors
@@ -375,6 +432,7 @@ class ConstraintValidator:
                         field=f"{field_name}.{nested_field_name}",
                         message=f"Required nested field '{nested_field_name}' is missing",
                         value=None,
+                        code="required",
                     )
                 )
 
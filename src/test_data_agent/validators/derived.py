@@ -0,0 +1,79 @@
+"""Recomputation of derived fields (line totals, subtotals, totals)."""
+
+# Per-item fields holding quantity * price, when a schema has one
+LINE_TOTAL_FIELDS = ("line_total", "total_price", "subtotal")
+
+
+def _number(value) -> float | None:
+    """Numeric value of a field, or None if it is missing or not a number.
+
+    LLM records may hold numbers as strings (``"2"``) or nulls; numeric
+    strings are coerced, anything else is left alone.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def recompute_totals(record: dict, tax_rate: float | None = None) -> dict:
+    """Recompute item line totals, subtotal, tax and total in place.
+
+    Tax keeps the record's existing tax rate unless ``tax_rate`` is given. The
+    total follows the coherence rules used by ``CoherenceScorer``:
+    ``subtotal + tax`` plus shipping minus discount when those fields are
+    present.
+
+    Items whose price or quantity is not numeric are left out of the
+    subtotal instead of failing the record, and non-numeric tax, shipping
+    or discount count as zero.
+
+    Args:
+        record: Record with an ``items`` list (other records are left unchanged)
+        tax_rate: Tax rate to apply instead of the record's current one
+
+    Returns:
+        The same record, for chaining
+    """
+    items = record.get("items")
+    if not isinstance(items, list):
+        return record
+
+    subtotal = 0.0
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        price = _number(item.get("price", item.get("unit_price")))
+        quantity = _number(item.get("quantity", 1))
+        if price is None or quantity is None:
+            continue
+        line_total = round(quantity * price, 2)
+        for field in LINE_TOTAL_FIELDS:
+            if field in item:
+                item[field] = line_total
+        subtotal += line_total
+    subtotal = round(subtotal, 2)
+
+    old_subtotal = _number(record.get("subtotal")) or 0
+    old_tax = _number(record.get("tax")) or 0
+    if tax_rate is None:
+        tax_rate = old_tax / old_subtotal if old_subtotal else 0.0
+
+    if "subtotal" in record:
+        record["subtotal"] = subtotal
+    tax = round(subtotal * tax_rate, 2)
+    if "tax" in record:
+        record["tax"] = tax
+
+    if "total" in record:
+        shipping = _number(record.get("shipping_cost", record.get("shipping"))) or 0
+        discount = _number(record.get("discount")) or 0
+        record["total"] = round(subtotal + tax + shipping - discount, 2)
+
+    return record
@@ -0,0 +1,338 @@
+"""Deterministic repair of constraint violations.
+
+Repairs are driven by the ``ValidationError``s from ``ConstraintValidator``:
+numbers are clamped to their bounds, values coerced to the expected type,
+strings truncated or padded to their length bounds, invalid enum values
+snapped to the closest allowed value, and fields failing a regex
+regenerated from it. Derived totals are recomputed afterwards. Only records
+that still fail validation need to be generated again.
+"""
+
+import copy
+import difflib
+import json
+import math
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from re import _parser as sre_parse
+from typing import Any
+
+from test_data_agent.utils.logging import get_logger
+from test_data_agent.validators.constraint import ConstraintValidator, ValidationError
+from test_data_agent.validators.derived import recompute_totals
+
+logger = get_logger(__name__)
+
+PATH_TOKEN = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+ARRAY_INDEX = re.compile(r"\[\d+\]")
+DERIVED_FIELDS = ("subtotal", "tax", "total")
+MAX_REPEAT = 8  # Cap for open-ended regex repeats (*, +, {n,})
+PAD_CHAR = "x"
+LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+CATEGORY_CHARS = {
+    "CATEGORY_DIGIT": "0123456789",
+    "CATEGORY_NOT_DIGIT": LETTERS,
+    "CATEGORY_WORD": LETTERS + "0123456789_",
+    "CATEGORY_NOT_WORD": "-",
+    "CATEGORY_SPACE": " ",
+    "CATEGORY_NOT_SPACE": LETTERS + "0123456789",
+}
+
+
+def field_key(path: str) -> str:
+    """Normalize a field path for reporting (``items[3].price`` -> ``items[].price``).
+
+    Args:
+        path: Field path from a validation error
+
+    Returns:
+        Path with array indices removed
+    """
+    return ARRAY_INDEX.sub("[]", path)
+
+
+def sample_regex(pattern: str, rng: random.Random | None = None) -> str:
+    """Generate a string matching a regular expression.
+
+    Supports literals, character classes, repeats, groups and alternation,
+    which covers the patterns used in schemas and request constraints.
+
+    Args:
+        pattern: Regular expression
+        rng: Random number generator
+
+    Returns:
+        A string matching ``pattern``
+
+    Raises:
+        ValueError: If the pattern uses unsupported constructs
+    """
+    rng = rng or random.Random()
+    return "".join(_sample_nodes(sre_parse.parse(pattern), rng))
+
+
+def _sample_nodes(nodes, rng: random.Random) -> list[str]:
+    """Generate text for a parsed regex sequence."""
+    out: list[str] = []
+    for op, arg in nodes:
+        name = str(op)
+        if name == "LITERAL":
+            out.append(chr(arg))
+        elif name == "ANY":
+            out.append(rng.choice(CATEGORY_CHARS["CATEGORY_NOT_SPACE"]))
+        elif name == "IN":
+            out.append(_sample_class(arg, rng))
+        elif name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+            low, high, sub = arg
+            high = min(high, max(low, MAX_REPEAT))
+            for _ in range(rng.randint(low, high)):
+                out.extend(_sample_nodes(sub, rng))
+        elif name == "SUBPATTERN":
+            out.extend(_sample_nodes(arg[-1], rng))
+        elif name == "BRANCH":
+            out.extend(_sample_nodes(rng.choice(arg[1]), rng))
+        elif name == "AT":
+            continue  # Anchors produce no text
+        else:
+            raise ValueError(f"Unsupported regex construct: {name}")
+    return out
+
+
+def _sample_class(items, rng: random.Random) -> str:
+    """Pick one character from a parsed character class."""
+    if items and str(items[0][0]) == "NEGATE":
+        raise ValueError("Negated character classes are not supported")
+    chars: list[str] = []
+    for op, arg in items:
+        name = str(op)
+        if name == "LITERAL":
+            chars.append(chr(arg))
+        elif name == "RANGE":
+            chars.extend(chr(c) for c in range(arg[0], arg[1] + 1))
+        elif name == "CATEGORY":
+            if str(arg) not in CATEGORY_CHARS:
+                raise ValueError(f"Unsupported character category: {arg}")
+            chars.extend(CATEGORY_CHARS[str(arg)])
+    if not chars:
+        raise ValueError("Empty character class")
+    return rng.choice(chars)
+
+
+@dataclass
+class RepairResult:
+    """Outcome of repairing one record."""
+
+    record: dict
+    repairs: list[str] = field(default_factory=list)  # Field path of each repair applied
+    errors: list[ValidationError] = field(default_factory=list)  # Violations left
+
+    @property
+    def valid(self) -> bool:
+        """True if the record passes validation after repair."""
+        return not self.errors
+
+
+@dataclass
+class RepairSummary:
+    """Outcome of repairing a batch of records."""
+
+    records: list[dict]  # Valid records (repaired or untouched), in input order
+    repaired_fields: Counter  # Repairs per normalized field path
+    unrepairable: list[RepairResult]  # Records that still fail validation
+
+
+class RepairEngine:
+    """Repairs constraint violations in generated records without an LLM call."""
+
+    def __init__(
+        self,
+        validator: ConstraintValidator | None = None,
+        max_passes: int = 3,
+        rng: random.Random | None = None,
+    ):
+        """Initialize repair engine.
+
+        Args:
+            validator: Validator producing the errors to repair
+            max_passes: Validate/repair rounds per record (a repair such as a
+                type coercion can expose a further violation)
+            rng: Random number generator used for regex regeneration
+        """
+        self.validator = validator or ConstraintValidator()
+        self.max_passes = max_passes
+
+        self.rng = rng or random.Random()
+
+    def repair(self, record: dict, schema: dict, constraints: dict | None = None) -> RepairResult:
+        """Validate a record and repair what can be repaired.
+
+        Args:
+            record: Generated record (not modified)
+            schema: Schema definition
+            constraints: Optional request constraints (see ``constraints_to_dict``)
+
+        Returns:
+            RepairResult with a repaired copy of the record
+        """
+        result = RepairResult(record=record)
+        errors = self.validator.validate(record, schema, constraints).errors
+        if not errors:
+            return result
+
+        result.record = copy.deepcopy(record)
+        for _ in range(self.max_passes):
+            applied = [e.field for e in errors if self._apply(result.record, e)]
+            if not applied:
+                break
+            result.repairs.extend(applied)
+            result.repairs.extend(self._recompute_derived(result.record))
+            errors = self.validator.validate(result.record, schema, constraints).errors
+            if not errors:
+                break
+
+        result.errors = errors
+        return result
+
+    def repair_batch(
+        self, records: list[dict], schema: dict, constraints: dict | None = None
+    ) -> RepairSummary:
+        """Repair a batch of records.
+
+        Args:
+            records: Generated records
+            schema: Schema definition
+            constraints: Optional request constraints
+
+        Returns:
+            RepairSummary with the valid records and per-field repair counts
+        """
+        summary = RepairSummary(records=[], repaired_fields=Counter(), unrepairable=[])
+        for record in records:
+            result = self.repair(record, schema, constraints)
+            if result.valid:
+                summary.records.append(result.record)
+                summary.repaired_fields.update(field_key(path) for path in result.repairs)
+            else:
+                summary.unrepairable.append(result)
+
+        if summary.repaired_fields or summary.unrepairable:
+            logger.info(
+                "records_repaired",
+                records=len(records),
+                repaired_fields=dict(summary.repaired_fields),
+                unrepairable=len(summary.unrepairable),
+            )
+        return summary
+
+    def _apply(self, record: dict, error: ValidationError) -> bool:
+        """Apply the repair for one validation error in place.
+
+        Returns:
+            True if the value was changed
+        """
+        container, key = self._resolve(record, error.field)
+        if not self._contains(container, key):
+            # Missing required fields have no value to repair
+            return False
+
+        repaired, value = self._repaired_value(error, container[key])
+        if not repaired or value == container[key]:
+            return False
+        container[key] = value
+        return True
+
+    def _repaired_value(self, error: ValidationError, value: Any) -> tuple[bool, Any]:
+        """Compute the repaired value for a violation.
+
+        Returns:
+            Tuple of (repairable, new value)
+        """
+        code, expected = error.code, error.expected
+
+        if code == "type":
+            return self._coerce(value, expected)
+        if code == "min":
+            return True, math.ceil(expected) if isinstance(value, int) else expected
+        if code == "max":
+            return True, math.floor(expected) if isinstance(value, int) else expected
+        if code == "max_length":
+            return True, value[:expected]
+        if code == "min_length":
+            filler = value or PAD_CHAR
+            return True, (value + filler * expected)[:expected]
+        if code == "enum":
+            return self._nearest_allowed(value, expected)
+        if code == "pattern":
+            try:
+                return True, sample_regex(expected, self.rng)
+            except (ValueError, re.error):
+                return False, value
+        return False, value
+
+    @staticmethod
+    def _coerce(value: Any, expected: str) -> tuple[bool, Any]:
+        """Coerce a value to the expected schema type."""
+        try:
+            if expected == "integer" and not isinstance(value, bool):
+                number = float(value)
+                if number.is_integer():
+                    return True, int(number)
+            elif expected == "float" and not isinstance(value, bool):
+                number = float(value)
+                if math.isfinite(number):
+                    return True, number
+            elif expected == "string" and isinstance(value, (int, float, bool)):
+                return True, str(value)
+            elif expected in ("array", "object") and isinstance(value, str):
+                parsed = json.loads(value)
+                if isinstance(parsed, list if expected == "array" else dict):
+                    return True, parsed
+        except (TypeError, ValueError):
+            pass
+        return False, value
+
+    @staticmethod
+    def _nearest_allowed(value: Any, allowed: list) -> tuple[bool, Any]:
+        """Snap a value to the closest allowed enum value."""
+        if not allowed:
+            return False, value
+        text = str(value).strip().lower()
+        by_text = {str(option).lower(): option for option in allowed}
+        if text in by_text:
+            return True, by_text[text]
+        match = difflib.get_close_matches(text, list(by_text), n=1, cutoff=0.0)
+        return True, by_text[match[0]] if match else allowed[0]
+
+    @staticmethod
+    def _recompute_derived(record: dict) -> list[str]:
+        """Recompute totals after a repair and report which ones changed."""
+        if not isinstance(record.get("items"), list):
+            return []
+        before = {name: record.get(name) for name in DERIVED_FIELDS}
+        recompute_totals(record)
+        return [name for name in DERIVED_FIELDS if record.get(name) != before[name]]
+
+    @staticmethod
+    def _resolve(record: dict, path: str) -> tuple[Any, Any]:
+        """Find the container and key for the value at ``path`` (the key may be absent)."""
+        tokens = [name if name else int(index) for name, index in PATH_TOKEN.findall(path)]
+        if not tokens:
+            return None, None
+        container: Any = record
+        for token in tokens[:-1]:
+            try:
+                container = container[token]
+            except (KeyError, IndexError, TypeError):
+                return None, None
+        return container, tokens[-1]
+
+    @staticmethod
+    def _contains(container: Any, key: Any) -> bool:
+        """Check that ``container[key]`` exists."""
+        if isinstance(container, dict):
+            return key in container
+        if isinstance(container, list):
+            return isinstance(key, int) and key < len(container)
+        return False
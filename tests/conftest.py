@@ -1,9 +1,13 @@
 """Pytest configuration and shared fixtures."""
 
 import os
+from collections.abc import Callable
+
 import pytest
 
 from test_data_agent.config import load_settings, Settings
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.resilience.circuit_breaker import get_circuit_breakers
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -15,6 +19,13 @@ def setup_test_env():
     # Cleanup not needed as env vars are process-local
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Give every test fresh (closed) circuit breakers."""
+    get_circuit_breakers().clear()
+    yield
+
+
 @pytest.fixture
 def settings() -> Settings:
     """Fixture for test configuration."""
@@ -23,3 +34,19 @@ def settings() -> Settings:
         environment="test",
         log_level="INFO",
     )
+
+
+@pytest.fixture
+def make_request() -> Callable[..., test_data_pb2.GenerateRequest]:
+    """Factory fixture for GenerateRequest messages.
+
+    Builds ecommerce requests (four reviews unless told otherwise); any other
+    GenerateRequest field can be passed as a keyword argument.
+    """
+
+    def factory(entity: str = "review", count: int = 4, **fields) -> test_data_pb2.GenerateRequest:
+        fields.setdefault("request_id", f"test-{entity}")
+        fields.setdefault("domain", "ecommerce")
+        return test_data_pb2.GenerateRequest(entity=entity, count=count, **fields)
+
+    return factory
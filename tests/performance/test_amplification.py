@@ -0,0 +1,142 @@
+"""Benchmark: pure LLM generation vs exemplar amplification.
+
+The LLM client is simulated with a fixed per-call latency plus per-output-token
+latency, and reports token usage, so the comparison reflects call shape rather
+than network noise. Run directly for a report:
+
+    python tests/performance/test_amplification.py
+"""
+
+import asyncio
+import json
+import re
+import time
+
+import pytest
+
+from test_data_agent.clients.claude import ClaudeResponse
+from test_data_agent.generators.amplified import AmplifiedGenerator
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.schemas.registry import get_registry
+from test_data_agent.validators.coherence import CoherenceScorer
+from test_data_agent.validators.constraint import ConstraintValidator
+
+CALL_LATENCY = 0.05  # Seconds of fixed latency per call
+TOKEN_LATENCY = 0.00002  # Seconds per output token
+TOKENS_PER_RECORD = 150
+COUNT = 200
+CONTEXT = "Orders from returning fitness customers"
+
+
+class SimulatedClient:
+    """LLM client returning valid, coherent orders with simulated latency and usage."""
+
+    def __init__(self):
+        self.calls = 0
+        self.tokens = 0
+
+    async def generate(self, system, user, max_tokens=None, **kwargs):
+        count = int(re.search(r"Generate (\d+)", user).group(1))
+        output_tokens = count * TOKENS_PER_RECORD
+        await asyncio.sleep(CALL_LATENCY + output_tokens * TOKEN_LATENCY)
+        self.calls += 1
+        self.tokens += output_tokens + len(system + user) // 4
+
+        records = [
+            {
+                "order_id": f"ORD-2025-{self.calls:03d}{i:04d}",
+                "customer_id": f"USR-{i:07d}",
+                "shipping_address": {
+                    "street": "1 Main St",
+                    "city": "Springfield",
+                    "state": "IL",
+                    "zip": "62701",
+                    "country": "US",
+                },
+                "payment_method": "credit_card",
+                "status": "confirmed",
+                "created_at": "2025-03-01T10:00:00Z",
+                "items": [
+                    {"name": "Running Shoes", "sku": f"SKU-{i}", "quantity": 1, "price": 89.99},
+                    {"name": "Water Bottle", "sku": f"SKU-{i}9", "quantity": 2, "price": 12.50},
+                ],
+                "subtotal": 114.99,
+                "tax": 9.2,
+                "shipping": 0.0,
+                "total": 124.19,
+            }
+            for i in range(count)
+        ]
+        return ClaudeResponse(
+            content=json.dumps(records),
+            tokens_used=output_tokens,
+            model="simulated",
+            stop_reason="end_turn",
+            output_tokens=output_tokens,
+        )
+
+
+def make_llm(client: SimulatedClient) -> LLMGenerator:
+    """LLM generator over the simulated client."""
+    return LLMGenerator(
+        claude_client=client,
+        vllm_client=None,
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+        token_planner=TokenBudgetPlanner(max_output_tokens=8192),
+    )
+
+
+async def run(path: str, request: test_data_pb2.GenerateRequest) -> dict:
+    """Generate the requested orders via one path and collect cost figures."""
+    client = SimulatedClient()
+    llm = make_llm(client)
+    context = {"schema_dict": get_registry().get_schema("order")}
+    scorer = CoherenceScorer()
+
+    if path == "amplified":
+        generator = AmplifiedGenerator(llm_generator=llm, coherence_scorer=scorer, seed_count=20)
+    else:
+        generator = llm
+
+    start = time.perf_counter()
+    result = await generator.generate(request, context=context)
+    elapsed = time.perf_counter() - start
+
+    scores = [scorer.score(record, "order") for record in result.data]
+    return {
+        "records": len(result.data),
+        "seconds": elapsed,
+        "calls": client.calls,
+        "tokens": client.tokens,
+        "coherence": sum(scores) / len(scores),
+    }
+
+
+@pytest.mark.asyncio
+async def test_amplification_is_cheaper_than_pure_llm(make_request):
+    """Test that amplification uses fewer tokens and less time at equal coherence."""
+    request = make_request("order", COUNT, context=CONTEXT)
+    llm = await run("llm", request)
+    amplified = await run("amplified", request)
+
+    assert amplified["records"] == llm["records"] == COUNT
+    assert amplified["tokens"] < llm["tokens"] / 4
+    assert amplified["seconds"] < llm["seconds"]
+    assert amplified["coherence"] >= 0.85
+
+
+if __name__ == "__main__":
+    request = test_data_pb2.GenerateRequest(
+        request_id="bench", domain="ecommerce", entity="order", count=COUNT, context=CONTEXT
+    )
+    for name in ("llm", "amplified"):
+        stats = asyncio.run(run(name, request))
+        print(
+            f"{name:>9}: {stats['records']} records in {stats['seconds']:.2f}s, "
+            f"{stats['calls']} calls, {stats['tokens']} tokens, "
+            f"coherence {stats['coherence']:.2f}"
+        )
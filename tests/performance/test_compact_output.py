@@ -0,0 +1,69 @@
+"""Output size of compact rows versus JSON objects.
+
+Output tokens dominate LLM latency, so the compact row format is measured
+on wide registry schemas against the JSON array of objects the model would
+otherwise write. Run directly for a report:
+
+    python tests/performance/test_compact_output.py
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from test_data_agent.generators.traditional import TraditionalGenerator
+from test_data_agent.parsers.compact import RowFormat
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.schemas.registry import get_registry
+
+RECORDS = 25
+ENTITIES = ("order", "customer", "payment", "review")
+
+
+def sample_records(entity: str) -> list[dict]:
+    """Generate records shaped like LLM output for an entity."""
+    schema = get_registry().get_schema(entity)
+    request = test_data_pb2.GenerateRequest(
+        request_id="bench", domain="ecommerce", entity=entity, count=RECORDS
+    )
+    result = asyncio.run(TraditionalGenerator().generate(request, {"schema_dict": schema}))
+    return [{k: v for k, v in record.items() if k != "_index"} for record in result.data]
+
+
+def measure(entity: str) -> tuple[int, int]:
+    """Estimated output tokens as minified JSON objects and as compact rows."""
+    records = sample_records(entity)
+    row_format = RowFormat.from_schema(get_registry().get_schema(entity))
+    objects = json.dumps(records, ensure_ascii=False)
+    rows = json.dumps([row_format.encode(record) for record in records], ensure_ascii=False)
+    estimate = TokenBudgetPlanner.estimate_prompt_tokens
+    return estimate(objects), estimate(rows)
+
+
+@pytest.mark.parametrize("entity", ["order", "customer"])
+def test_rows_cut_output_tokens_on_wide_schemas(entity):
+    """Test that rows need at least 30% fewer output tokens than objects."""
+    objects, rows = measure(entity)
+
+    assert rows <= objects * 0.7
+
+
+def test_rows_round_trip():
+    """Test that decoding encoded rows rebuilds the records."""
+    row_format = RowFormat.from_schema(get_registry().get_schema("order"))
+    records = sample_records("order")
+
+    decoded = [row_format.decode(row_format.encode(record)) for record in records]
+
+    assert decoded == [{k: v for k, v in r.items() if v is not None} for r in records]
+
+
+if __name__ == "__main__":
+    for name in ENTITIES:
+        objects, rows = measure(name)
+        print(
+            f"{name:10s} objects: {objects:6d} tokens  rows: {rows:6d} tokens  "
+            f"saved: {1 - rows / objects:6.1%}"
+        )
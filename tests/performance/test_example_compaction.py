@@ -0,0 +1,70 @@
+"""Prompt size of selected, compacted RAG examples.
+
+Hybrid prompts used to show the first five retrieved examples pretty-printed
+with ``indent=2``. Selection strips fields the schema doesn't define, skips
+near-duplicates and renders minified JSON. Run directly for a report:
+
+    python tests/performance/test_example_compaction.py
+"""
+
+import asyncio
+import json
+
+from test_data_agent.generators.traditional import TraditionalGenerator
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.schemas.registry import get_registry
+
+ENTITIES = ("cart", "order", "review")
+
+
+def retrieved_examples(entity: str) -> list[dict]:
+    """RAG-style examples: records carrying bookkeeping fields the schema lacks."""
+    request = test_data_pb2.GenerateRequest(
+        request_id="bench", domain="ecommerce", entity=entity, count=10
+    )
+    result = asyncio.run(TraditionalGenerator().generate(request))
+    return [{**record, "_pattern_id": f"{entity}-{i}"} for i, record in enumerate(result.data)]
+
+
+def measure(entity: str) -> tuple[int, int]:
+    """Estimated input tokens of the examples before and after compaction."""
+    examples = retrieved_examples(entity)
+    schema = get_registry().get_schema(entity)
+    before = "\n".join(
+        json.dumps({k: v for k, v in e.items() if k != "_pattern_id"}, indent=2)
+        for e in examples[:5]
+    )
+    after = PromptBuilder().format_rag_examples(examples, schema)
+    estimate = TokenBudgetPlanner.estimate_prompt_tokens
+    return estimate(before), estimate(after)
+
+
+def test_compacted_examples_use_fewer_tokens():
+    """Test that compaction cuts example tokens by at least a tenth."""
+    for entity in ENTITIES:
+        before, after = measure(entity)
+        assert after <= before * 0.9, entity
+
+
+def test_selection_covers_distinct_patterns():
+    """Test that variations of one pattern don't crowd out the others."""
+    patterns = retrieved_examples("cart")[:3]
+    variations = [
+        {**pattern, "cart_id": f"{pattern['cart_id']}-{v}", "_pattern_id": f"{i}-{v}"}
+        for i, pattern in enumerate(patterns)
+        for v in range(4)
+    ]
+
+    selected = PromptBuilder().example_selector.select(
+        variations, get_registry().get_schema("cart")
+    )
+
+    assert {example["_pattern_id"].split("-")[0] for example in selected[:3]} == {"0", "1", "2"}
+
+
+if __name__ == "__main__":
+    for entity in ENTITIES:
+        before, after = measure(entity)
+        print(f"{entity:8s} {before:6d} -> {after:6d} tokens ({1 - after / before:.1%} saved)")
@@ -0,0 +1,100 @@
+"""Micro-benchmark for prompt assembly.
+
+Chunked requests, continuations and retries call ``build_prompt_parts``
+several times per request, so assembly sits on the hot path. Run directly for
+a timing report:
+
+    python tests/performance/test_prompt_assembly.py
+"""
+
+import timeit
+
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.schemas.registry import get_registry
+
+ITERATIONS = 2000
+ORDERS = {"context": "Holiday season orders from returning customers", "hints": ["realistic"]}
+
+
+def add_constraints(request: test_data_pb2.GenerateRequest) -> test_data_pb2.GenerateRequest:
+    """Give an order request field constraints and scenarios."""
+    request.constraints.field_constraints["total"].min = 10
+    request.constraints.field_constraints["total"].max = 5000
+    for name in ("happy_path", "large_order", "discounted"):
+        scenario = request.scenarios.add()
+        scenario.name = name
+        scenario.count = 8
+        scenario.description = f"{name.replace('_', ' ')} orders"
+    return request
+
+
+def make_examples(count: int = 5) -> list[dict]:
+    """Build RAG examples tagged with pattern ids."""
+    return [
+        {
+            "_pattern_id": f"pattern-{i}",
+            "order_id": f"ORD-2025-{i:07d}",
+            "items": [{"sku": f"SKU-{j}", "quantity": j + 1, "price": 9.99} for j in range(4)],
+            "subtotal": 49.95,
+            "tax": 4.0,
+            "total": 53.95,
+        }
+        for i in range(count)
+    ]
+
+
+def measure(builder_factory, request, schema, examples) -> float:
+    """Average seconds per build_prompt_parts call."""
+    builder = builder_factory()
+    seconds = timeit.timeit(
+        lambda: builder.build_prompt_parts(request, schema, examples), number=ITERATIONS
+    )
+    return seconds / ITERATIONS
+
+
+def cold_builder() -> PromptBuilder:
+    """Builder whose caches never retain anything (pre-memoization behaviour)."""
+    return PromptBuilder(cache_size=0)
+
+
+def test_memoized_assembly_matches_cold_assembly(make_request):
+    """Test that cached prompts are byte-identical to freshly rendered ones."""
+    schema = get_registry().get_schema("order")
+    request = add_constraints(make_request("order", 25, **ORDERS))
+    examples = make_examples()
+
+    warm = PromptBuilder()
+    warm.build_prompt_parts(request, schema, examples)
+
+    assert warm.build_prompt_parts(request, schema, examples) == cold_builder().build_prompt_parts(
+        request, schema, examples
+    )
+
+
+def test_memoized_assembly_is_faster(make_request):
+    """Test that repeated assembly benefits from the fragment caches."""
+    schema = get_registry().get_schema("order")
+    request = add_constraints(make_request("order", 25, **ORDERS))
+    examples = make_examples()
+
+    cold = measure(cold_builder, request, schema, examples)
+    warm = measure(PromptBuilder, request, schema, examples)
+
+    assert warm < cold
+
+
+if __name__ == "__main__":
+    schema = get_registry().get_schema("order")
+    request = add_constraints(
+        test_data_pb2.GenerateRequest(
+            request_id="bench", domain="ecommerce", entity="order", count=25, **ORDERS
+        )
+    )
+    examples = make_examples()
+
+    cold = measure(cold_builder, request, schema, examples)
+    warm = measure(PromptBuilder, request, schema, examples)
+    print(f"cold assembly:     {cold * 1e6:8.1f} us/call")
+    print(f"memoized assembly: {warm * 1e6:8.1f} us/call")
+    print(f"speedup:           {cold / warm:8.1f}x")
@@ -0,0 +1,110 @@
+"""Throughput of concurrent vLLM prompts against an OpenAI-compatible stub.
+
+vLLM's continuous batching decodes every in-flight request in the same step,
+so throughput depends on how many prompts the client keeps in flight. The
+stub server answers each chat completion after a fixed latency, like a GPU
+decode step that costs the same for one request or many. Run directly for
+a report:
+
+    python tests/performance/test_vllm_batching.py
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from test_data_agent.clients.vllm import VLLMClient, VLLMResponse
+from test_data_agent.config import load_settings
+
+LATENCY_SECONDS = 0.05
+PROMPTS = 64
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers /v1/chat/completions with a canned response after a fixed delay."""
+
+    def do_POST(self):  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(LATENCY_SECONDS)
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": '{"records": []}'},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 20, "completion_tokens": 5, "total_tokens": 25},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stub server with room in its accept queue for a full batch."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def measure(server: ThreadingHTTPServer, batch_size: int) -> float:
+    """Prompts per second when keeping ``batch_size`` requests in flight."""
+    settings = load_settings(
+        anthropic_api_key="test-api-key",
+        vllm_base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+        vllm_max_concurrency=batch_size,
+    )
+
+    async def run() -> float:
+        client = VLLMClient(settings)
+        prompts = [("system", f"prompt {i}") for i in range(PROMPTS)]
+        started = time.monotonic()
+        results = await asyncio.gather(*(client.generate(system, user) for system, user in prompts))
+        elapsed = time.monotonic() - started
+        await client.close()
+        assert all(isinstance(result, VLLMResponse) for result in results)
+        return PROMPTS / elapsed
+
+    return asyncio.run(run())
+
+
+def start_server() -> ThreadingHTTPServer:
+    """Start the stub server on a free port."""
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_batching_raises_throughput():
+    """Test that a full batch is several times faster than one prompt at a time."""
+    server = start_server()
+    try:
+        sequential = measure(server, 1)
+        batched = measure(server, 32)
+    finally:
+        server.shutdown()
+
+    assert batched >= sequential * 5
+
+
+if __name__ == "__main__":
+    server = start_server()
+    try:
+        for batch_size in (1, 4, 16, 32):
+            print(f"batch {batch_size:3d}: {measure(server, batch_size):8.1f} prompts/s")
+    finally:
+        server.shutdown()
@@ -0,0 +1,171 @@
+"""Unit tests for the exemplar amplification generator."""
+
+import random
+
+import pytest
+
+from test_data_agent.generators.amplified import AmplifiedGenerator
+from test_data_agent.generators.base import GenerationResult
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.router.intelligence_router import GenerationPath, IntelligenceRouter
+from test_data_agent.validators.coherence import CoherenceScorer
+from test_data_agent.validators.derived import recompute_totals
+
+SCHEMA = {
+    "fields": {
+        "order_id": {"type": "string"},
+        "created_at": {"type": "datetime"},
+        "shipped_at": {"type": "datetime"},
+        "items": {"type": "array"},
+        "subtotal": {"type": "float"},
+        "tax": {"type": "float"},
+        "total": {"type": "float"},
+    }
+}
+
+
+def make_seed(i: int) -> dict:
+    """Build a coherent fitness order."""
+    return {
+        "order_id": f"ORD-2025-{i:06d}",
+        "created_at": "2025-03-01T10:00:00Z",
+        "shipped_at": "2025-03-02T09:30:00Z",
+        "items": [
+            {"name": "Running Shoes", "sku": "SKU-1001", "quantity": 1, "price": 89.99},
+            {"name": "Yoga Mat", "sku": "SKU-1002", "quantity": 2, "price": 25.00},
+        ],
+        "subtotal": 139.99,
+        "tax": 11.2,
+        "total": 151.19,
+    }
+
+
+class SeedLLMGenerator:
+    """LLMGenerator stand-in returning fixed seed records."""
+
+    def __init__(self):
+        self.requested: list[int] = []
+
+    async def generate(self, request, context=None):
+        self.requested.append(request.count)
+        data = [{**make_seed(i), "_index": i} for i in range(request.count)]
+        return GenerationResult(
+            data=data, metadata={"llm_provider": "claude", "llm_tokens_used": 1200}
+        )
+
+
+def test_recompute_totals_keeps_tax_rate():
+    """Test that totals follow changed quantities and prices."""
+    record = make_seed(1)
+    record["items"][1]["quantity"] = 4
+
+    recompute_totals(record)
+
+    assert record["subtotal"] == 189.99
+    assert record["tax"] == round(189.99 * 11.2 / 139.99, 2)
+    assert record["total"] == round(record["subtotal"] + record["tax"], 2)
+
+
+@pytest.mark.asyncio
+async def test_amplifies_seed_set_to_requested_count(make_request):
+    """Test that only the seed set is requested from the LLM."""
+    llm = SeedLLMGenerator()
+    generator = AmplifiedGenerator(
+        llm_generator=llm,
+        coherence_scorer=CoherenceScorer(),
+        seed_count=5,
+        rng=random.Random(7),
+    )
+
+    result = await generator.generate(make_request("order", 60), context={"schema_dict": SCHEMA})
+
+    assert llm.requested == [5]
+    assert len(result.data) == 60
+    assert [r["_index"] for r in result.data] == list(range(60))
+    assert result.metadata["generation_path"] == "amplified"
+    assert result.metadata["seed_records"] == 5
+    assert result.metadata["amplified_records"] == 55
+    assert len({r["order_id"] for r in result.data}) > 50
+
+
+@pytest.mark.asyncio
+async def test_variations_stay_coherent(make_request):
+    """Test that amplified records keep coherent totals, dates and categories."""
+    scorer = CoherenceScorer()
+    generator = AmplifiedGenerator(
+        llm_generator=SeedLLMGenerator(),
+        coherence_scorer=scorer,
+        seed_count=3,
+        coherence_threshold=0.85,
+        rng=random.Random(11),
+    )
+
+    result = await generator.generate(make_request("order", 40), context={"schema_dict": SCHEMA})
+
+    for record in result.data:
+        assert scorer.score(record, "order") >= 0.85
+        assert record["created_at"] < record["shipped_at"]
+        assert record["total"] == round(record["subtotal"] + record["tax"], 2)
+
+
+@pytest.mark.asyncio
+async def test_variations_respect_request_constraints(make_request):
+    """Test that mutations breaking a request constraint are repaired or re-drawn."""
+    generator = AmplifiedGenerator(
+        llm_generator=SeedLLMGenerator(),
+        coherence_scorer=CoherenceScorer(),
+        seed_count=3,
+        rng=random.Random(5),
+    )
+    request = make_request("order", 60)
+    request.constraints.field_constraints["total"].CopyFrom(test_data_pb2.FieldConstraint(max=152))
+
+    result = await generator.generate(request, context={"schema_dict": SCHEMA})
+
+    assert len(result.data) == 60
+    for record in result.data:
+        assert record["total"] <= 152
+        assert record["total"] == round(record["subtotal"] + record["tax"], 2)
+
+
+@pytest.mark.asyncio
+async def test_swapped_items_take_the_catalog_price(make_request):
+    """Test that a swapped product name comes with that product's seed price."""
+    generator = AmplifiedGenerator(
+        llm_generator=SeedLLMGenerator(),
+        coherence_scorer=CoherenceScorer(),
+        seed_count=3,
+        swap_probability=1.0,
+        rng=random.Random(3),
+    )
+    seed_prices = {"Running Shoes": 89.99, "Yoga Mat": 25.00}
+    seed_skus = {"Running Shoes": "SKU-1001", "Yoga Mat": "SKU-1002"}
+
+    result = await generator.generate(make_request("order", 30), context={"schema_dict": SCHEMA})
+
+    items = [item for record in result.data[3:] for item in record["items"]]
+    assert {item["name"] for item in items} <= set(seed_prices)
+    for item in items:
+        base = seed_prices[item["name"]]
+        assert base * 0.9 - 0.01 <= item["price"] <= base * 1.1 + 0.01
+        assert item["sku"] == seed_skus[item["name"]]
+
+
+def test_router_amplifies_large_coherent_requests(make_request):
+    """Test routing of large LLM-worthy cart/order requests to amplification."""
+    assert (
+        IntelligenceRouter().route(make_request("order", 200, hints=["realistic"])).path
+        == GenerationPath.LLM
+    )
+
+    router = IntelligenceRouter(amplify_min_count=100)
+
+    assert (
+        router.route(make_request("order", 200, hints=["realistic"])).path
+        == GenerationPath.AMPLIFIED
+    )
+    assert router.route(make_request("order", 20, hints=["realistic"])).path == GenerationPath.LLM
+    assert router.route(make_request("review", 200)).path == GenerationPath.LLM
+    assert (
+        router.route(make_request("review", 30, hints=["amplify"])).path == GenerationPath.AMPLIFIED
+    )
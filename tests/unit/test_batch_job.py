@@ -0,0 +1,171 @@
+"""Unit tests for offline LLM batch jobs."""
+
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from test_data_agent.clients.claude import ClaudeClient
+from test_data_agent.clients.message_batches import (
+    AnthropicMessageBatches,
+    BatchCall,
+    LocalMessageBatches,
+)
+from test_data_agent.config import load_settings
+from test_data_agent.generators.batch_job import BatchJobRunner, BatchJobState
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.generators.refiner import CoherenceRefiner
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.validators.coherence import CoherenceScorer
+from test_data_agent.validators.constraint import ConstraintValidator
+
+SCHEMA = {"fields": {}}
+
+
+class InMemoryRedisClient:
+    """RedisClient stand-in keeping keys in process memory."""
+
+    def __init__(self):
+        self.client = object()
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+
+def answer_with_records(call: BatchCall) -> str:
+    """Answer a batch call with as many records as its prompt asks for."""
+    count = int(re.search(r"Generate (\d+)", call.user).group(1))
+    return json.dumps([{"review_id": f"{call.custom_id}-{i}"} for i in range(count)])
+
+
+def make_runner(backend, redis_client=None) -> BatchJobRunner:
+    """Build a runner whose planner splits four reviews into two calls."""
+    generator = LLMGenerator(
+        claude_client=None,
+        vllm_client=None,
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+        token_planner=TokenBudgetPlanner(max_output_tokens=400),
+    )
+    return BatchJobRunner(
+        llm_generator=generator,
+        backend=backend,
+        redis_client=redis_client,
+        coherence_refiner=CoherenceRefiner(CoherenceScorer()),
+        poll_interval_seconds=0,
+        ttl_seconds=3600,
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_runs_chunks_as_one_batch_and_stores_records(make_request):
+    """Test that chunked prompts go out as one batch and come back as validated records."""
+    backend = LocalMessageBatches(answer_with_records, polls_to_end=2)
+    redis_client = InMemoryRedisClient()
+    runner = make_runner(backend, redis_client)
+
+    job = await runner.submit(make_request(), SCHEMA)
+
+    assert job.state == BatchJobState.IN_PROGRESS.value
+    assert job.llm_calls == 2
+    assert [call.custom_id for call in backend.batches[job.batch_id]] == ["chunk-0", "chunk-1"]
+    assert (await runner.poll(job)).state == BatchJobState.IN_PROGRESS.value
+
+    job = await runner.run(job)
+
+    assert job.state == BatchJobState.COMPLETED.value
+    assert job.record_count == 4
+    assert job.llm_tokens_used > 0
+    records = await runner.records(job.job_id)
+    assert [r["_index"] for r in records] == [0, 1, 2, 3]
+    assert [r["review_id"] for r in records] == ["chunk-0-0", "chunk-0-1", "chunk-1-0", "chunk-1-1"]
+    assert redis_client.ttls[runner.job_key(job.job_id)] == 3600
+
+
+@pytest.mark.asyncio
+async def test_job_is_resumed_from_redis_by_another_runner(make_request):
+    """Test that a job submitted before a restart is collected from its stored state."""
+    backend = LocalMessageBatches(answer_with_records)
+    redis_client = InMemoryRedisClient()
+    job = await make_runner(backend, redis_client).submit(make_request(), SCHEMA)
+
+    restarted = make_runner(backend, redis_client)
+    stored = await restarted.get(job.job_id)
+    finished = await restarted.poll(stored)
+
+    assert stored.request["entity"] == "review"
+    assert finished.state == BatchJobState.COMPLETED.value
+    assert len(await restarted.records(job.job_id)) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_only_cost_their_records(make_request):
+    """Test that a failed call is counted while the other calls' records are kept."""
+
+    def respond(call: BatchCall) -> str:
+        if call.custom_id == "chunk-0":
+            raise RuntimeError("expired")
+        return answer_with_records(call)
+
+    runner = make_runner(LocalMessageBatches(respond))
+    job = await runner.run(await runner.submit(make_request(), SCHEMA))
+
+    assert job.state == BatchJobState.COMPLETED.value
+    assert job.failed_calls == 1
+    assert job.record_count == 2
+
+
+@pytest.mark.asyncio
+async def test_job_without_usable_records_fails(make_request):
+    """Test that a batch of unparseable responses fails the job with the reason."""
+    runner = make_runner(LocalMessageBatches(lambda call: "no records today"))
+
+    job = await runner.run(await runner.submit(make_request(), SCHEMA))
+
+    assert job.state == BatchJobState.FAILED.value
+    assert "No usable records" in job.error
+    assert await runner.records(job.job_id) == []
+
+
+@pytest.mark.asyncio
+async def test_anthropic_batches_send_interactive_call_params():
+    """Test that batch requests carry the same params as interactive Claude calls."""
+    settings = load_settings(anthropic_api_key="test-api-key")
+    claude = ClaudeClient(settings)
+    claude.client.messages.batches.create = AsyncMock(return_value=SimpleNamespace(id="b-1"))
+    call = BatchCall(
+        custom_id="chunk-0",
+        system="System",
+        user="Generate 2 reviews",
+        max_tokens=500,
+        cached_prefix="prefix ",
+        json_schema={"type": "array"},
+    )
+
+    batch_id = await AnthropicMessageBatches(claude).submit([call])
+
+    requests = claude.client.messages.batches.create.await_args.kwargs["requests"]
+    assert batch_id == "b-1"
+    assert requests == [
+        {
+            "custom_id": "chunk-0",
+            "params": claude.message_params(
+                "System",
+                "Generate 2 reviews",
+                500,
+                cached_prefix="prefix ",
+                json_schema={"type": "array"},
+            ),
+        }
+    ]
+    assert requests[0]["params"]["tool_choice"]["type"] == "tool"
+    await claude.close()
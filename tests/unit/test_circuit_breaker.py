@@ -0,0 +1,151 @@
+"""Unit tests for dependency circuit breakers."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from anthropic import APIConnectionError, AuthenticationError
+from fastapi.testclient import TestClient
+
+from test_data_agent.clients.claude import ClaudeClient
+from test_data_agent.clients.redis_client import RedisClient
+from test_data_agent.config import load_settings
+from test_data_agent.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    get_circuit_breakers,
+)
+from test_data_agent.resilience.retry import RetryPolicy
+from test_data_agent.server.health import HealthApp
+
+REQUEST = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+
+
+@pytest.fixture
+def settings():
+    """Fixture for settings with a low failure threshold."""
+    return load_settings(
+        anthropic_api_key="test-key",
+        circuit_breaker_failure_threshold=2,
+        circuit_breaker_recovery_seconds=30,
+    )
+
+
+def test_opens_after_consecutive_failures():
+    """Test that the circuit opens at the threshold and successes reset the count."""
+    breaker = CircuitBreaker("test", failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_half_open_allows_a_single_probe():
+    """Test that only one probe passes once the recovery timeout expires."""
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_failed_probe_reopens_circuit():
+    """Test that a failing probe opens the circuit again."""
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.recovery_timeout = 30
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_guard_ignores_errors_that_are_not_outages():
+    """Test that errors rejected by is_failure do not count against the circuit."""
+    breaker = CircuitBreaker("test", failure_threshold=1)
+
+    with pytest.raises(ValueError):
+        async with breaker.guard(is_failure=lambda e: not isinstance(e, ValueError)):
+            raise ValueError("bad request")
+    assert breaker.state == CircuitState.CLOSED
+
+    with pytest.raises(RuntimeError):
+        async with breaker.guard():
+            raise RuntimeError("down")
+    with pytest.raises(CircuitOpenError):
+        async with breaker.guard():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_open_claude_circuit_fails_fast(settings):
+    """Test that an open circuit rejects Claude calls without hitting the API."""
+    client = ClaudeClient(settings)
+    client.retry_policy = RetryPolicy(max_attempts=1)
+    error = APIConnectionError(request=REQUEST)
+
+    with patch.object(client, "_call_api", new=AsyncMock(side_effect=error)) as call_api:
+        for _ in range(2):
+            with pytest.raises(APIConnectionError):
+                await client.generate(system="s", user="u")
+        with pytest.raises(CircuitOpenError):
+            await client.generate(system="s", user="u")
+
+    assert call_api.await_count == 2
+    assert get_circuit_breakers().states()["claude"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_claude_request_errors_do_not_open_circuit(settings):
+    """Test that 4xx errors such as authentication failures leave the circuit closed."""
+    client = ClaudeClient(settings)
+    error = AuthenticationError(
+        "invalid key", response=httpx.Response(401, request=REQUEST), body=None
+    )
+
+    with patch.object(client, "_call_api", new=AsyncMock(side_effect=error)):
+        for _ in range(3):
+            with pytest.raises(AuthenticationError):
+                await client.generate(system="s", user="u")
+
+    assert client.breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_open_redis_circuit_skips_redis(settings):
+    """Test that Redis is skipped like a missing cache while its circuit is open."""
+    client = RedisClient(settings)
+    client.client = AsyncMock()
+    client.client.get.side_effect = ConnectionError("refused")
+
+    assert await client.get("a") is None
+    assert await client.get("b") is None
+    assert await client.get("c") is None
+
+    assert client.client.get.await_count == 2
+    assert client.breaker.state == CircuitState.OPEN
+
+
+def test_health_reports_dependency_states(settings):
+    """Test that /health exposes breaker states and degrades on an open circuit."""
+    breakers = get_circuit_breakers()
+    breakers.get("claude")
+    breakers.get("redis", failure_threshold=1).record_failure()
+
+    response = TestClient(HealthApp(settings).app).get("/health")
+    data = response.json()
+
+    assert data["status"] == "degraded"
+    assert data["dependencies"] == {"claude": "closed", "redis": "open"}
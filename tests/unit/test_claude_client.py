@@ -1,14 +1,17 @@
 """Unit tests for Claude API client."""
 
-from unittest.mock import patch
+import json
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from anthropic import APITimeoutError
 from anthropic.types import Message, Usage
 from anthropic.types.text_block import TextBlock
+from anthropic.types.tool_use_block import ToolUseBlock
 
-from test_data_agent.clients.claude import ClaudeClient
+from test_data_agent.clients.claude import RECORDS_TOOL, ClaudeClient, pool_stats
 from test_data_agent.config import load_settings
+from test_data_agent.utils.metrics import testdata_llm_inflight_requests
 
 
 @pytest.fixture
@@ -19,6 +22,7 @@ def settings():
         claude_model="claude-sonnet-4-20250514",
         claude_max_tokens=4096,
         claude_temperature=0.7,
+        llm_retry_base_delay_seconds=0.01,
     )
 
 
@@ -221,3 +225,136 @@ async def test_generate_json_invalid_raises_error(claude_client):
             await claude_client.generate_json(system="System", user="User")
 
         assert "Failed to parse JSON" in str(exc_info.value)
+
+
+def test_client_uses_async_pooled_http_client(settings):
+    """Test that the client shares one pooled HTTP client configured from settings."""
+    client = ClaudeClient(settings)
+
+    assert client.client._client is client.http_client
+    assert pool_stats(client.http_client) == {"active": 0, "idle": 0}
+
+
+@pytest.mark.asyncio
+async def test_generate_tracks_inflight_requests(claude_client, mock_message):
+    """Test that in-flight gauge returns to zero after a call."""
+    gauge = testdata_llm_inflight_requests.labels(provider="claude")
+
+    with patch.object(claude_client, "_call_api", return_value=mock_message):
+        await claude_client.generate(system="System", user="User")
+
+    assert gauge._value.get() == 0
+
+
+def test_build_messages_marks_cache_breakpoints(claude_client):
+    """Test that the system prompt and stable prefix carry cache_control."""
+    system_param, messages = claude_client._build_messages(
+        "System prompt", "Generate 5 records", cached_prefix="SCHEMA: ..."
+    )
+
+    assert system_param[0]["cache_control"] == {"type": "ephemeral"}
+    content = messages[0]["content"]
+    assert content[0] == {
+        "type": "text",
+        "text": "SCHEMA: ...",
+        "cache_control": {"type": "ephemeral"},
+    }
+    assert content[1] == {"type": "text", "text": "Generate 5 records"}
+
+
+def test_build_messages_without_caching():
+    """Test that disabling prompt caching sends plain strings."""
+    client = ClaudeClient(load_settings(anthropic_api_key="test-key", claude_prompt_caching=False))
+
+    system_param, messages = client._build_messages("System", "suffix", cached_prefix="prefix ")
+
+    assert system_param == "System"
+    assert messages == [{"role": "user", "content": "prefix suffix"}]
+
+
+@pytest.mark.asyncio
+async def test_generate_reports_cache_tokens(claude_client):
+    """Test that cache read/write token counts are surfaced on the response."""
+    message = Message(
+        id="msg_123",
+        type="message",
+        role="assistant",
+        content=[TextBlock(type="text", text="[]")],
+        model="claude-sonnet-4-20250514",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=Usage(
+            input_tokens=20,
+            output_tokens=50,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=0,
+        ),
+    )
+
+    with patch.object(claude_client, "_call_api", return_value=message):
+        response = await claude_client.generate(
+            system="System", user="suffix", cached_prefix="prefix"
+        )
+
+    assert response.cache_read_tokens == 1500
+    assert response.cache_write_tokens == 0
+    assert response.tokens_used == 70
+
+
+@pytest.mark.asyncio
+async def test_cache_writes_count_as_used_tokens(claude_client):
+    """Test that tokens written to the prompt cache are reported and not refunded."""
+    message = Message(
+        id="msg_124",
+        type="message",
+        role="assistant",
+        content=[TextBlock(type="text", text="[]")],
+        model="claude-sonnet-4-20250514",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=Usage(
+            input_tokens=20,
+            output_tokens=50,
+            cache_read_input_tokens=0,
+            cache_creation_input_tokens=1500,
+        ),
+    )
+
+    with patch.object(claude_client, "_call_api", return_value=message):
+        response = await claude_client.generate(
+            system="System", user="suffix", cached_prefix="prefix"
+        )
+
+    assert response.cache_write_tokens == 1500
+    assert response.tokens_used == 1570
+
+
+@pytest.mark.asyncio
+async def test_generate_with_json_schema_forces_records_tool(claude_client):
+    """Test that a JSON Schema is sent as a forced tool and its input returned as JSON."""
+    records = [{"n": 1}, {"n": 2}]
+    message = Message(
+        id="msg_123",
+        type="message",
+        role="assistant",
+        content=[
+            ToolUseBlock(type="tool_use", id="tu_1", name=RECORDS_TOOL, input={"records": records})
+        ],
+        model="claude-sonnet-4-20250514",
+        stop_reason="tool_use",
+        stop_sequence=None,
+        usage=Usage(input_tokens=100, output_tokens=20),
+    )
+    json_schema = {"type": "array", "items": {"type": "object"}}
+
+    with patch.object(
+        claude_client.client.messages, "create", new=AsyncMock(return_value=message)
+    ) as create:
+        response = await claude_client.generate(
+            system="System", user="Generate 2 records", json_schema=json_schema
+        )
+
+    kwargs = create.call_args.kwargs
+    assert kwargs["tool_choice"] == {"type": "tool", "name": RECORDS_TOOL}
+    assert kwargs["tools"][0]["input_schema"]["properties"]["records"] == json_schema
+    assert json.loads(response.content) == records
@@ -0,0 +1,164 @@
+"""Unit tests for coherence-threshold refinement."""
+
+import asyncio
+import copy
+
+import pytest
+
+from test_data_agent.generators.base import GenerationResult
+from test_data_agent.generators.refiner import CoherenceRefiner
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.validators.coherence import CoherenceScorer
+
+
+def make_cart(i: int, **overrides) -> dict:
+    """Build a coherent fitness cart."""
+    cart = {
+        "cart_id": f"CRT-2025-{i:07d}",
+        "items": [
+            {"name": "Running Shoes", "quantity": 1, "price": 89.99},
+            {"name": "Yoga Mat", "quantity": 2, "price": 25.00},
+        ],
+        "subtotal": 139.99,
+        "tax": 11.2,
+        "total": 151.19,
+        "created_at": "2025-03-01T10:00:00Z",
+        "updated_at": "2025-03-01T11:00:00Z",
+        "_scenario": "default",
+        "_index": i,
+    }
+    cart.update(overrides)
+    return cart
+
+
+def incoherent_items() -> list[dict]:
+    """Items from unrelated categories (not fixable locally)."""
+    return [
+        {"name": "Lipstick", "quantity": 1, "price": 20.0},
+        {"name": "Cookware", "quantity": 1, "price": 60.0},
+        {"name": "Diapers", "quantity": 1, "price": 30.0},
+    ]
+
+
+class StubLLMGenerator:
+    """LLMGenerator stand-in returning coherent carts."""
+
+    def __init__(self, delay: float = 0.0):
+        self.requests: list[test_data_pb2.GenerateRequest] = []
+        self.delay = delay
+
+    async def generate(self, request, context=None):
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        data = [make_cart(900 + i, _index=i, _scenario="llm") for i in range(request.count)]
+        return GenerationResult(data=data, metadata={"llm_tokens_used": 400})
+
+
+@pytest.mark.asyncio
+async def test_local_fixes_repair_math_and_dates(make_request):
+    """Test that wrong totals and reversed timestamps are fixed without the LLM."""
+    llm = StubLLMGenerator()
+    refiner = CoherenceRefiner(CoherenceScorer(), llm)
+    broken = make_cart(
+        1, total=999.0, created_at="2025-03-02T10:00:00Z", updated_at="2025-03-01T10:00:00Z"
+    )
+
+    result = await refiner.refine(make_request("cart"), [make_cart(0), broken])
+
+    assert result.fixed_locally == 1
+    assert result.records[1]["total"] == 151.19
+    assert result.records[1]["created_at"] == "2025-03-01T10:00:00Z"
+    assert min(result.scores) >= 0.85
+    assert llm.requests == []
+
+
+@pytest.mark.asyncio
+async def test_only_low_records_are_regenerated_in_one_batch(make_request):
+    """Test that one call replaces just the records local fixes couldn't raise."""
+    llm = StubLLMGenerator()
+    refiner = CoherenceRefiner(CoherenceScorer(), llm)
+    records = [make_cart(i) for i in range(4)]
+    records[1]["items"] = incoherent_items()
+    records[3]["items"] = incoherent_items()
+    originals = copy.deepcopy(records)
+
+    result = await refiner.refine(make_request("cart", hints=["realistic"]), records)
+
+    assert [r.count for r in llm.requests] == [2]
+    assert "no_cache" in llm.requests[0].hints
+    assert result.regenerated == 2
+    assert result.unresolved == 0
+    assert result.records[0] == originals[0]
+    assert result.records[1]["_index"] == 1
+    assert result.records[1]["_scenario"] == "default"
+    assert result.llm_tokens_used == 400
+
+
+@pytest.mark.asyncio
+async def test_time_budget_leaves_records_unresolved(make_request):
+    """Test that a slow regeneration is abandoned and the originals kept."""
+    refiner = CoherenceRefiner(
+        CoherenceScorer(), StubLLMGenerator(delay=1.0), time_budget_seconds=0.05
+    )
+    records = [make_cart(0, items=incoherent_items())]
+
+    result = await refiner.refine(make_request("cart", count=1), records)
+
+    assert result.unresolved == 1
+    assert result.records[0]["items"] == incoherent_items()
+
+
+@pytest.mark.asyncio
+async def test_unscored_entities_and_local_only_mode(make_request):
+    """Test that neutral-score entities are untouched and regeneration can be disabled."""
+    llm = StubLLMGenerator()
+    refiner = CoherenceRefiner(CoherenceScorer(), llm)
+
+    reviews = await refiner.refine(make_request(), [{"review_id": "r"}])
+    carts = await refiner.refine(
+        make_request("cart"), [make_cart(0, items=incoherent_items())], regenerate=False
+    )
+
+    assert reviews.scores == [0.7]
+    assert carts.unresolved == 1
+    assert llm.requests == []
+
+
+@pytest.mark.asyncio
+async def test_defect_triggering_records_are_left_broken(make_request):
+    """Test that intentionally incoherent records are neither fixed nor regenerated."""
+    llm = StubLLMGenerator()
+    refiner = CoherenceRefiner(CoherenceScorer(), llm)
+    broken = make_cart(
+        0,
+        items=[{"name": "Running Shoes", "quantity": 0, "price": 89.99}],
+        total=9999.99,
+        created_at="2025-03-02T10:00:00Z",
+        updated_at="2025-03-01T10:00:00Z",
+    )
+
+    result = await refiner.refine(
+        make_request("cart", count=1, defect_triggering=True), [copy.deepcopy(broken)]
+    )
+
+    assert result.records == [broken]
+    assert result.fixed_locally == result.regenerated == 0
+    assert llm.requests == []
+
+
+@pytest.mark.asyncio
+async def test_non_numeric_quantities_do_not_fail_refinement(make_request):
+    """Test that string and null quantities are coerced or skipped by the local fixes."""
+    refiner = CoherenceRefiner(CoherenceScorer())
+    cart = make_cart(
+        0,
+        items=[
+            {"name": "Running Shoes", "quantity": "2", "price": 89.99},
+            {"name": "Yoga Mat", "quantity": None, "price": 25.00},
+        ],
+        total=999.0,
+    )
+
+    result = await refiner.refine(make_request("cart", count=1), [cart])
+
+    assert result.records[0]["subtotal"] == 179.98
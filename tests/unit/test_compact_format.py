@@ -0,0 +1,71 @@
+"""Unit tests for the compact row output format."""
+
+from test_data_agent.parsers.compact import RowFormat
+from test_data_agent.parsers.tolerant import recover_records
+
+SCHEMA = {
+    "fields": {
+        "order_id": {"type": "string", "required": True},
+        "items": {
+            "type": "array",
+            "item_schema": {
+                "type": "object",
+                "fields": {"sku": {"type": "string"}, "quantity": {"type": "integer"}},
+            },
+        },
+        "address": {
+            "type": "object",
+            "fields": {"city": {"type": "string"}, "zip": {"type": "string"}},
+        },
+        "tags": {"type": "array", "item_type": "string"},
+    }
+}
+
+
+def test_header_flattens_nested_fields():
+    """Test that objects become dotted columns and object arrays list their columns."""
+    row_format = RowFormat.from_schema(SCHEMA, ("_sentiment",))
+
+    assert row_format.header == (
+        '["order_id", "items[sku,quantity]", "address.city", "address.zip", "tags", '
+        '"_sentiment", "_scenario"]'
+    )
+
+
+def test_decode_rebuilds_records():
+    """Test that rows decode to nested records, leaving out nulls."""
+    row_format = RowFormat.from_schema(SCHEMA)
+
+    record = row_format.decode(
+        ["ORD-1", [["SKU-1", 2], ["SKU-2", 1]], "Denver", None, ["gift"], "default"]
+    )
+
+    assert record == {
+        "order_id": "ORD-1",
+        "items": [{"sku": "SKU-1", "quantity": 2}, {"sku": "SKU-2", "quantity": 1}],
+        "address": {"city": "Denver"},
+        "tags": ["gift"],
+        "_scenario": "default",
+    }
+    assert row_format.encode(record) == [
+        "ORD-1",
+        [["SKU-1", 2], ["SKU-2", 1]],
+        "Denver",
+        None,
+        ["gift"],
+        "default",
+    ]
+
+
+def test_recover_records_decodes_rows_and_skips_misaligned_ones():
+    """Test that misaligned rows are dropped and objects pass through."""
+    row_format = RowFormat.from_schema(SCHEMA)
+    content = (
+        '[["ORD-1", [], "Denver", "80202", [], "a"], ["ORD-2", "short"], {"order_id": "ORD-3"}'
+    )
+
+    salvage = recover_records(content, row_format)
+
+    assert [r["order_id"] for r in salvage.records] == ["ORD-1", "ORD-3"]
+    assert salvage.errors == 1
+    assert salvage.truncated
@@ -0,0 +1,169 @@
+"""Unit tests for the generation cost and latency estimator."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from test_data_agent.config import load_settings
+from test_data_agent.generators.field_level import FieldLevelGenerator
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.generators.traditional import TraditionalGenerator
+from test_data_agent.planning.estimator import GenerationEstimator
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.router.intelligence_router import IntelligenceRouter
+from test_data_agent.schemas.registry import get_registry
+from test_data_agent.validators.constraint import ConstraintValidator
+
+
+@pytest.fixture
+def settings():
+    """Fixture for settings with round prices."""
+    return load_settings(
+        anthropic_api_key="test-api-key",
+        claude_input_cost_per_mtok=1.0,
+        claude_output_cost_per_mtok=10.0,
+    )
+
+
+@pytest.fixture
+def llm_generator():
+    """Fixture for an LLM generator whose clients must never be called."""
+    claude = MagicMock()
+    claude.generate = AsyncMock(side_effect=AssertionError("estimate called the LLM"))
+    return LLMGenerator(
+        claude_client=claude,
+        vllm_client=None,
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+        max_parallel_calls=2,
+    )
+
+
+@pytest.fixture
+def estimator(settings, llm_generator):
+    """Fixture for an estimator without a spec generator."""
+    return GenerationEstimator(IntelligenceRouter(), llm_generator, settings)
+
+
+@pytest.mark.asyncio
+async def test_traditional_request_costs_nothing(estimator, make_request):
+    """Test that a traditional request has no tokens, cost or LLM provider."""
+    estimate = await estimator.estimate(
+        make_request("cart", count=1000), get_registry().get_schema("cart")
+    )
+
+    assert estimate.path == "traditional"
+    assert estimate.provider == ""
+    assert estimate.llm_calls == 0
+    assert estimate.cost_usd == 0.0
+    assert estimate.latency_source == "model"
+    assert 0 < estimate.latency_p50_seconds < estimate.latency_p95_seconds
+
+
+@pytest.mark.asyncio
+async def test_llm_request_uses_the_token_plan(estimator, llm_generator, make_request):
+    """Test that LLM calls, tokens and cost follow the planner's plan."""
+    schema = get_registry().get_schema("cart")
+    request = make_request("cart", count=200, generation_method=test_data_pb2.LLM)
+
+    estimate = await estimator.estimate(request, schema)
+
+    plan = llm_generator.token_planner.plan(schema, 200)
+    assert estimate.path == "llm"
+    assert estimate.provider == "claude"
+    assert estimate.llm_calls == plan.calls > 1
+    assert estimate.input_tokens > 0
+    assert estimate.output_tokens == pytest.approx(200 * plan.tokens_per_record, abs=1)
+    assert estimate.cost_usd == pytest.approx(
+        (estimate.input_tokens + 10 * estimate.output_tokens) / 1_000_000
+    )
+    assert estimate.within_token_budget
+    llm_generator.claude_client.generate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_token_budget_overrun_is_reported(estimator, make_request):
+    """Test that a request planned over its budget is flagged instead of raising."""
+    request = make_request("cart", count=200, generation_method=test_data_pb2.LLM, token_budget=500)
+
+    estimate = await estimator.estimate(request, get_registry().get_schema("cart"))
+
+    assert not estimate.within_token_budget
+
+
+@pytest.mark.asyncio
+async def test_observed_latency_replaces_the_model(estimator, make_request):
+    """Test that per-record latency observed on a path scales with the request size."""
+    schema = get_registry().get_schema("cart")
+    for _ in range(5):
+        estimator.observe(make_request("cart", count=100), schema, "traditional", 0.5)
+
+    estimate = await estimator.estimate(make_request("cart", count=1000), schema)
+
+    assert estimate.latency_source == "observed"
+    assert estimate.latency_p50_seconds == pytest.approx(5.0)
+
+
+@pytest.mark.asyncio
+async def test_full_reservoir_pool_skips_the_llm(settings, llm_generator, make_request):
+    """Test that a request the reservoir can serve is estimated without LLM calls."""
+    reservoir = MagicMock()
+    reservoir.enabled_for.return_value = True
+    reservoir.pool_name.return_value = "pool"
+    reservoir.redis_client.get_pool_size = AsyncMock(return_value=50)
+    llm_generator.reservoir = reservoir
+    estimator = GenerationEstimator(IntelligenceRouter(), llm_generator, settings)
+
+    estimate = await estimator.estimate(
+        make_request("cart", count=20, generation_method=test_data_pb2.LLM),
+        get_registry().get_schema("cart"),
+    )
+
+    assert estimate.pool_hit_likely
+    assert estimate.llm_calls == 0
+    assert estimate.cost_usd == 0.0
+
+
+@pytest.mark.asyncio
+async def test_cached_spec_is_reported(settings, llm_generator, make_request):
+    """Test that a cached spec means no LLM call for a spec request."""
+    spec_generator = MagicMock()
+    spec_generator.has_cached_spec = AsyncMock(return_value=True)
+    estimator = GenerationEstimator(IntelligenceRouter(), llm_generator, settings, spec_generator)
+
+    estimate = await estimator.estimate(
+        make_request("cart", count=500, generation_method=test_data_pb2.SPEC),
+        get_registry().get_schema("cart"),
+    )
+
+    assert estimate.path == "spec"
+    assert estimate.cache_hit_likely
+    assert estimate.llm_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_field_level_requests_plan_only_the_text_fields(
+    settings, llm_generator, make_request
+):
+    """Test that a request served field by field is planned on the reduced text schema."""
+    field_level = FieldLevelGenerator(llm_generator, TraditionalGenerator())
+    schema = get_registry().get_schema("review")
+    request = make_request(count=200, generation_method=test_data_pb2.LLM)
+    full = await GenerationEstimator(IntelligenceRouter(), llm_generator, settings).estimate(
+        request, schema
+    )
+    estimator = GenerationEstimator(
+        IntelligenceRouter(),
+        llm_generator,
+        settings,
+        llm_generator_for=lambda request, schema_dict: field_level,
+    )
+
+    estimate = await estimator.estimate(request, schema)
+
+    plan = llm_generator.token_planner.plan(field_level.text_schema(schema), 200)
+    assert estimate.path == "llm"
+    assert estimate.llm_calls == plan.calls
+    assert estimate.output_tokens == pytest.approx(200 * plan.tokens_per_record, abs=1)
+    assert estimate.output_tokens < full.output_tokens
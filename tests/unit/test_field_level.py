@@ -0,0 +1,156 @@
+"""Unit tests for field-level hybrid generation."""
+
+import json
+
+import pytest
+
+from test_data_agent.generators.base import GenerationResult
+from test_data_agent.generators.field_level import RECORD_KEY, FieldLevelGenerator, llm_fields
+from test_data_agent.generators.traditional import TraditionalGenerator
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.schemas.registry import get_registry
+
+
+class TextLLMGenerator:
+    """LLMGenerator stand-in writing text for the records listed in the context."""
+
+    def __init__(self, skip: set[int] | None = None):
+        self.token_planner = TokenBudgetPlanner()
+        self.max_parallel_calls = 2
+        self.skip = skip or set()
+        self.requests: list[test_data_pb2.GenerateRequest] = []
+        self.schemas: list[dict] = []
+
+    def _entries(self, request) -> list[dict]:
+        lines = [line for line in request.context.splitlines() if line.startswith("{")]
+        entries = []
+        for line in lines:
+            fixed = json.loads(line)
+            if fixed[RECORD_KEY] in self.skip:
+                continue
+            entries.append(
+                {
+                    RECORD_KEY: fixed[RECORD_KEY],
+                    "title": f"{fixed['rating']} stars",
+                    "body": f"Rated {fixed['rating']} out of 5.",
+                }
+            )
+        return entries
+
+    async def generate(self, request, context=None):
+        self.requests.append(request)
+        self.schemas.append(context["schema_dict"])
+        return GenerationResult(
+            data=self._entries(request),
+            metadata={"llm_provider": "claude", "llm_tokens_used": 300},
+        )
+
+    async def generate_stream(self, request, batch_size=50, context=None):
+        self.requests.append(request)
+        yield GenerationResult(data=self._entries(request), metadata={"llm_provider": "claude"})
+
+
+def make_generator(llm: TextLLMGenerator) -> FieldLevelGenerator:
+    """Build a field-level generator around a stub LLM."""
+    return FieldLevelGenerator(llm_generator=llm, traditional_generator=TraditionalGenerator())
+
+
+def test_llm_fields_prefers_flags_and_falls_back_to_long_text():
+    """Test that flagged fields win and long unformatted strings are the fallback."""
+    assert llm_fields(get_registry().get_schema("review")) == ["title", "body"]
+
+    schema = {
+        "fields": {
+            "id": {"type": "string", "format": "uuid"},
+            "notes": {"type": "string", "max_length": 2000},
+            "code": {"type": "string", "max_length": 500, "format": "uri"},
+        }
+    }
+    assert llm_fields(schema) == ["notes"]
+    assert llm_fields({"fields": {"notes": {"type": "string", "max_length": 2000}}}) == []
+    assert llm_fields(get_registry().get_schema("order")) == []
+
+
+@pytest.mark.asyncio
+async def test_generate_asks_llm_only_for_text_fields(make_request):
+    """Test that text comes from the LLM and every other field from the traditional engine."""
+    llm = TextLLMGenerator()
+    schema = get_registry().get_schema("review")
+
+    result = await make_generator(llm).generate(make_request(count=6), {"schema_dict": schema})
+
+    assert len(result.data) == 6
+    assert set(llm.schemas[0]["fields"]) == {RECORD_KEY, "title", "body"}
+    assert "no_cache" in llm.requests[0].hints
+    for record in result.data:
+        assert record["title"] == f"{record['rating']} stars"
+        assert record["review_id"]
+        assert RECORD_KEY not in record
+    assert result.metadata["llm_fields"] == ["title", "body"]
+    assert result.metadata["llm_unfilled_records"] == 0
+
+
+@pytest.mark.asyncio
+async def test_chunk_scenario_counts_follow_the_base_records(make_request):
+    """Test that each LLM chunk asks for the scenarios of the records it covers."""
+    llm = TextLLMGenerator()
+    llm.token_planner = TokenBudgetPlanner(max_output_tokens=600)
+    schema = get_registry().get_schema("review")
+    request = make_request(
+        count=6,
+        scenarios=[
+            test_data_pb2.Scenario(name="happy", count=4),
+            test_data_pb2.Scenario(name="edge", count=2),
+        ],
+    )
+
+    result = await make_generator(llm).generate(request, {"schema_dict": schema})
+
+    assert len(llm.requests) > 1
+    totals: dict[str, int] = {}
+    for sub_request in llm.requests:
+        assert sum(s.count for s in sub_request.scenarios) == sub_request.count
+        for scenario in sub_request.scenarios:
+            totals[scenario.name] = totals.get(scenario.name, 0) + scenario.count
+    assert totals == {"happy": 4, "edge": 2}
+    assert len(result.data) == 6
+
+
+@pytest.mark.asyncio
+async def test_records_skipped_by_llm_keep_traditional_values(make_request):
+    """Test that records without an LLM entry are still returned."""
+    llm = TextLLMGenerator(skip={2})
+    schema = get_registry().get_schema("review")
+
+    result = await make_generator(llm).generate(make_request(count=6), {"schema_dict": schema})
+
+    assert len(result.data) == 6
+    assert result.data[2]["title"] != f"{result.data[2]['rating']} stars"
+    assert result.metadata["llm_unfilled_records"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_unfilled_records_last(make_request):
+    """Test that streamed batches cover every record once."""
+    llm = TextLLMGenerator(skip={0})
+    schema = get_registry().get_schema("review")
+
+    batches = [
+        batch
+        async for batch in make_generator(llm).generate_stream(
+            make_request(count=6), batch_size=10, context={"schema_dict": schema}
+        )
+    ]
+
+    assert [len(b.data) for b in batches] == [5, 1]
+    assert batches[-1].metadata["llm_provider"] == "traditional"
+
+
+def test_defect_requests_use_the_full_llm_path(make_request):
+    """Test that defect-triggering requests are not split by field."""
+    generator = make_generator(TextLLMGenerator())
+    schema = get_registry().get_schema("review")
+
+    assert generator.applies_to(make_request(count=6), schema)
+    assert not generator.applies_to(make_request(count=6, defect_triggering=True), schema)
@@ -79,3 +79,8 @@ def test_metrics_endpoint_disabled():
 
     assert response.status_code == 404
     assert "disabled" in response.text.lower()
+
+
+def test_estimate_route_is_served(health_app):
+    """Test that the estimate endpoint is registered on the HTTP app."""
+    assert "/estimate" in [route.path for route in health_app.app.routes]
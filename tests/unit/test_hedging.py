@@ -0,0 +1,127 @@
+"""Unit tests for hedged LLM requests."""
+
+import asyncio
+import json
+
+import pytest
+
+from test_data_agent.clients.claude import ClaudeResponse
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.resilience.hedging import HedgeBudget, RequestHedger
+from test_data_agent.router.provider_selector import ProviderSelector
+from test_data_agent.validators.constraint import ConstraintValidator
+
+
+async def respond(value: str, delay: float) -> str:
+    """Return ``value`` after ``delay`` seconds."""
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_budget_caps_hedges_per_minute():
+    """Test that the budget refuses hedges beyond the per-minute cap."""
+    budget = HedgeBudget(per_minute=2)
+
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    """Test that no backup is sent when the primary beats the delay."""
+    hedger = RequestHedger()
+    backup_calls = []
+
+    async def backup():
+        backup_calls.append(1)
+        return "backup"
+
+    result = await hedger.run(lambda: respond("primary", 0), backup, delay=0.05)
+
+    assert (result.value, result.hedged) == ("primary", False)
+    assert backup_calls == []
+
+
+@pytest.mark.asyncio
+async def test_backup_wins_and_primary_is_cancelled():
+    """Test that a slow primary is cancelled once the backup responds."""
+    hedger = RequestHedger()
+    primary_task = None
+
+    async def primary():
+        nonlocal primary_task
+        primary_task = asyncio.current_task()
+        return await respond("primary", 5)
+
+    result = await hedger.run(primary, lambda: respond("backup", 0.01), delay=0.02)
+    await asyncio.sleep(0)
+
+    assert (result.value, result.winner) == ("backup", "backup")
+    assert primary_task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_waits_for_primary():
+    """Test that no hedge is sent once the budget is spent."""
+    hedger = RequestHedger(budget_per_minute=0)
+
+    result = await hedger.run(
+        lambda: respond("primary", 0.03), lambda: respond("backup", 0), delay=0.01
+    )
+
+    assert (result.value, result.hedged) == ("primary", False)
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_falls_back_to_backup():
+    """Test that the backup's response is used when the primary fails."""
+    hedger = RequestHedger()
+
+    async def primary():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("overloaded")
+
+    result = await hedger.run(primary, lambda: respond("backup", 0.03), delay=0.01)
+
+    assert result.value == "backup"
+
+
+class DelayedClient:
+    """LLM client stub with a fixed delay."""
+
+    def __init__(self, delay: float, record_id: int):
+        self.delay = delay
+        self.record_id = record_id
+
+    async def generate(self, system, user, **kwargs):
+        await asyncio.sleep(self.delay)
+        return ClaudeResponse(
+            content=json.dumps([{"id": self.record_id}]),
+            tokens_used=5,
+            model="test",
+            stop_reason="end_turn",
+        )
+
+
+@pytest.mark.asyncio
+async def test_generator_hedges_slow_primary_to_other_provider():
+    """Test that LLMGenerator hedges to vLLM when Claude runs long."""
+    selector = ProviderSelector(["claude", "vllm"], min_samples=100)
+    for _ in range(10):
+        selector.stats["claude"].latency.record(0.01)
+    generator = LLMGenerator(
+        claude_client=DelayedClient(5, record_id=1),
+        vllm_client=DelayedClient(0.01, record_id=2),
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+        provider_selector=selector,
+        hedger=RequestHedger(min_delay=0.02),
+    )
+    request = test_data_pb2.GenerateRequest(request_id="h", entity="item", count=1)
+
+    result = await asyncio.wait_for(generator.generate(request), timeout=2)
+
+    assert result.data[0]["id"] == 2
+    assert selector.stats["claude"].in_flight == 0
+    assert selector.stats["claude"].error_rate == 0
@@ -0,0 +1,72 @@
+"""Unit tests for registry schema to JSON Schema conversion."""
+
+from test_data_agent.schemas.json_schema import JSONSchemaConverter
+from test_data_agent.schemas.registry import get_registry
+
+
+def test_converts_field_types_and_bounds():
+    """Test that registry types, bounds and nesting map onto JSON Schema."""
+    items = JSONSchemaConverter().record_schema(get_registry().get_schema("order"))
+
+    properties = items["properties"]
+    assert properties["status"] == {
+        "enum": ["pending", "confirmed", "shipped", "delivered", "cancelled"]
+    }
+    assert properties["total"] == {"type": "number", "minimum": 0}
+    assert properties["created_at"] == {"type": "string"}
+    assert properties["items"]["items"]["properties"]["quantity"] == {
+        "type": "integer",
+        "minimum": 1,
+    }
+    assert properties["shipping_address"]["additionalProperties"] is False
+    assert "_index" in properties and "_scenario" in properties
+    assert "order_id" in items["required"] and "updated_at" not in items["required"]
+    assert items["additionalProperties"] is False
+
+
+def test_request_constraints_override_schema():
+    """Test that request constraints tighten the converted schema."""
+    schema = {
+        "fields": {
+            "rating": {"type": "integer", "min": 1, "max": 5},
+            "code": {"type": "string", "pattern": "{category}-{random_int:6}"},
+        }
+    }
+    constraints = {"rating": {"max": 3}, "code": {"regex": "^[A-Z]{3}$"}}
+
+    properties = JSONSchemaConverter().record_schema(schema, constraints)["properties"]
+
+    assert properties["rating"] == {"type": "integer", "minimum": 1, "maximum": 3}
+    assert properties["code"] == {"type": "string", "pattern": "^[A-Z]{3}$"}
+
+
+def test_format_templates_are_not_patterns():
+    """Test that generator format templates are not emitted as regexes."""
+    schema = {"fields": {"sku": {"type": "string", "pattern": "{category}-{random_int:6}"}}}
+
+    assert JSONSchemaConverter().record_schema(schema)["properties"]["sku"] == {"type": "string"}
+
+
+def test_records_schema_is_converted_once():
+    """Test that repeated lookups return the memoized conversion."""
+    converter = JSONSchemaConverter()
+    schema = get_registry().get_schema("payment")
+
+    first = converter.records_schema(schema)
+
+    assert first["type"] == "array"
+    assert converter.records_schema(schema) is first
+    assert converter.records_schema(schema, {"amount": {"max": 10}}) is not first
+
+
+def test_extra_fields_are_required_strings():
+    """Test that template extra fields join the record schema and its cache key."""
+    converter = JSONSchemaConverter()
+    schema = {"fields": {"n": {"type": "integer"}}}
+
+    plain = converter.records_schema(schema)
+    extra = converter.records_schema(schema, extra_fields=("_sentiment",))
+
+    assert "_sentiment" not in plain["items"]["properties"]
+    assert extra["items"]["properties"]["_sentiment"] == {"type": "string"}
+    assert extra["items"]["required"] == ["_sentiment"]
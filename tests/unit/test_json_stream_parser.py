@@ -0,0 +1,83 @@
+"""Unit tests for the incremental JSON array parser."""
+
+from test_data_agent.parsers.json_stream import JSONArrayStreamParser
+from test_data_agent.parsers.tolerant import recover_records
+
+
+def feed_chars(parser: JSONArrayStreamParser, text: str) -> list:
+    """Feed text one character at a time, collecting emitted elements."""
+    elements = []
+    for char in text:
+        elements.extend(parser.feed(char))
+    return elements
+
+
+def test_emits_each_element_when_closed():
+    """Test that elements are emitted as soon as their closing brace arrives."""
+    parser = JSONArrayStreamParser()
+
+    assert parser.feed('[{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(": 2}") == [{"b": 2}]
+    assert not parser.complete
+
+    assert parser.feed("]") == []
+    assert parser.complete
+
+
+def test_skips_markdown_fence_and_preamble():
+    """Test that text before the array is ignored."""
+    parser = JSONArrayStreamParser()
+
+    elements = feed_chars(parser, 'Here you go:\n```json\n[{"id": 1}]\n```')
+
+    assert elements == [{"id": 1}]
+    assert parser.complete
+
+
+def test_brackets_inside_strings_are_ignored():
+    """Test that braces and escaped quotes inside strings don't end elements."""
+    parser = JSONArrayStreamParser()
+
+    elements = feed_chars(parser, r'[{"text": "a}] \"quoted\" [x"}, {"nested": {"b": [1, 2]}}]')
+
+    assert elements == [{"text": 'a}] "quoted" [x'}, {"nested": {"b": [1, 2]}}]
+
+
+def test_single_object_response():
+    """Test that a bare top-level object is emitted as one element."""
+    parser = JSONArrayStreamParser()
+
+    elements = parser.feed('{"cart_id": "CRT-1", "items": []}')
+
+    assert elements == [{"cart_id": "CRT-1", "items": []}]
+    assert parser.complete
+
+
+def test_malformed_element_is_skipped():
+    """Test that an undecodable element is counted and skipped."""
+    parser = JSONArrayStreamParser()
+
+    elements = parser.feed('[{"a": 1}, {bad}, {"c": 3}]')
+
+    assert elements == [{"a": 1}, {"c": 3}]
+    assert parser.errors == 1
+
+
+def test_truncated_stream_keeps_completed_elements():
+    """Test that a stream cut mid-element still yields completed ones."""
+    parser = JSONArrayStreamParser()
+
+    elements = parser.feed('[{"a": 1}, {"b": 2}, {"c": ')
+
+    assert elements == [{"a": 1}, {"b": 2}]
+    assert not parser.complete
+    assert parser.pending == '{"c": '
+
+
+def test_recover_records_from_truncated_response():
+    """Test that complete records survive a response cut at max_tokens."""
+    salvage = recover_records('```json\n[{"a": 1}, {"b": 2}, {"c": 3, "d": "tru')
+
+    assert salvage.records == [{"a": 1}, {"b": 2}]
+    assert salvage.truncated
+    assert not salvage.clean
@@ -0,0 +1,412 @@
+"""Unit tests for LLM generator."""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from test_data_agent.clients.claude import RECORDS_TOOL, ClaudeClient, ClaudeResponse
+from test_data_agent.config import load_settings
+from test_data_agent.clients.streaming import StreamChunk
+from test_data_agent.generators.llm import LLMGenerator, chunk_request, split_scenario_counts
+from test_data_agent.planning.token_budget import TokenBudgetPlanner
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.resilience.retry import start_retry_budget
+from test_data_agent.validators.constraint import ConstraintValidator
+
+
+class FakeStreamingClient:
+    """Client stub that streams a fixed response in small pieces."""
+
+    def __init__(self, content: str, piece_size: int = 7):
+        self.content = content
+        self.piece_size = piece_size
+        self.stream_calls = 0
+
+    async def stream(self, system, user, **kwargs):
+        self.stream_calls += 1
+        for i in range(0, len(self.content), self.piece_size):
+            yield StreamChunk(text=self.content[i : i + self.piece_size])
+        yield StreamChunk(
+            text="",
+            response=ClaudeResponse(
+                content=self.content, tokens_used=42, model="test", stop_reason="end_turn"
+            ),
+        )
+
+
+def make_generator(client) -> LLMGenerator:
+    """Build an LLM generator around a stub client."""
+    return LLMGenerator(
+        claude_client=client,
+        vllm_client=None,
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_stream_yields_first_record_early():
+    """Test that the first streamed batch is flushed before the response completes."""
+    content = "[" + ", ".join(f'{{"review_id": "REV-{i}"}}' for i in range(5)) + "]"
+    generator = make_generator(FakeStreamingClient(content))
+    request = test_data_pb2.GenerateRequest(
+        request_id="stream-1", domain="ecommerce", entity="review", count=5
+    )
+
+    batches = [batch async for batch in generator.generate_stream(request, batch_size=2)]
+
+    assert len(batches[0].data) == 1
+    records = [record for batch in batches for record in batch.data]
+    assert [r["_index"] for r in records] == [0, 1, 2, 3, 4]
+    assert all(batch.metadata["streamed"] for batch in batches)
+
+
+@pytest.mark.asyncio
+async def test_generate_stream_stops_at_requested_count():
+    """Test that surplus streamed records are dropped."""
+    content = "[" + ", ".join(f'{{"n": {i}}}' for i in range(10)) + "]"
+    generator = make_generator(FakeStreamingClient(content))
+    request = test_data_pb2.GenerateRequest(
+        request_id="stream-2", domain="ecommerce", entity="review", count=3
+    )
+
+    batches = [batch async for batch in generator.generate_stream(request, batch_size=50)]
+
+    records = [record for batch in batches for record in batch.data]
+    assert [r["n"] for r in records] == [0, 1, 2]
+
+
+class ScriptedClient:
+    """Client stub returning canned responses in order."""
+
+    def __init__(self, contents: list[str]):
+        self.contents = list(contents)
+        self.prompts: list[str] = []
+        self.json_schemas: list[dict | None] = []
+
+    async def generate(self, system, user, **kwargs):
+        self.prompts.append(user)
+        self.json_schemas.append(kwargs.get("json_schema"))
+        return ClaudeResponse(
+            content=self.contents.pop(0), tokens_used=100, model="test", stop_reason="max_tokens"
+        )
+
+
+@pytest.mark.asyncio
+async def test_generate_continues_truncated_response():
+    """Test that a truncated response is salvaged and only the shortfall re-requested."""
+    client = ScriptedClient(
+        [
+            '[{"n": 0}, {"n": 1}, {"n": 2}, {"n": ',
+            '[{"n": 3}, {"n": 4}]',
+        ]
+    )
+    generator = make_generator(client)
+    request = test_data_pb2.GenerateRequest(
+        request_id="salvage-1", domain="ecommerce", entity="review", count=5
+    )
+
+    result = await generator.generate(request)
+
+    assert [r["n"] for r in result.data] == [0, 1, 2, 3, 4]
+    assert [r["_index"] for r in result.data] == [0, 1, 2, 3, 4]
+    assert "Generate 2 realistic" in client.prompts[1]
+    assert result.metadata["attempts"] == 2
+    assert result.metadata["recovered_records"] == 3
+    assert result.metadata["wasted_tokens"] == 0
+    assert result.metadata["llm_tokens_used"] == 200
+
+
+@pytest.mark.asyncio
+async def test_continuations_do_not_spend_the_retry_budget():
+    """Test that follow-ups for missing records run with the retry budget used up."""
+    client = ScriptedClient(['[{"n": 0}, {"n": 1}, {"n": ', '[{"n": 2}]', "nothing"])
+    generator = make_generator(client)
+    request = test_data_pb2.GenerateRequest(
+        request_id="budget-1", domain="ecommerce", entity="review", count=3
+    )
+    budget = start_retry_budget(max_retries=0, max_wait_seconds=0)
+
+    result = await generator.generate(request)
+
+    assert [r["n"] for r in result.data] == [0, 1, 2]
+    assert budget.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_counts_wasted_tokens_on_unparseable_response():
+    """Test that a response with no usable records is retried and reported as waste."""
+    client = ScriptedClient(["Sorry, I cannot help with that.", '[{"n": 0}]'])
+    generator = make_generator(client)
+    request = test_data_pb2.GenerateRequest(
+        request_id="salvage-2", domain="ecommerce", entity="review", count=1
+    )
+
+    result = await generator.generate(request)
+
+    assert result.data == [{"n": 0, "_index": 0, "_scenario": "default"}]
+    assert "Output ONLY valid JSON array" in client.prompts[1]
+    assert result.metadata["wasted_tokens"] == 100
+
+
+@pytest.mark.asyncio
+async def test_generate_fans_out_planned_chunks():
+    """Test that a request larger than one call is split into concurrent chunks."""
+    client = ScriptedClient(['[{"n": 0}, {"n": 1}]', '[{"n": 2}, {"n": 3}]'])
+    generator = make_generator(client)
+    generator.token_planner = TokenBudgetPlanner(max_output_tokens=400)
+    request = test_data_pb2.GenerateRequest(
+        request_id="plan-1", domain="ecommerce", entity="review", count=4
+    )
+
+    result = await generator.generate(request, context={"schema_dict": {"fields": {}}})
+
+    assert len(client.prompts) == 2
+    assert all("Generate 2 realistic" in prompt for prompt in client.prompts)
+    assert [r["_index"] for r in result.data] == [0, 1, 2, 3]
+    assert result.metadata["llm_calls"] == 2
+    assert result.metadata["llm_tokens_used"] == 200
+    assert result.metadata["llm_tokens_planned"] > 0
+
+
+@pytest.mark.asyncio
+async def test_generate_repairs_records_and_rerequests_unrepairable_ones():
+    """Test that violations are repaired in place and only unrepairable records regenerated."""
+    schema = {
+        "fields": {
+            "n": {"type": "integer", "required": True, "max": 10},
+            "status": {"type": "enum", "values": ["open", "closed"]},
+        }
+    }
+    client = ScriptedClient(
+        [
+            '[{"n": 0, "status": "Open"}, {"status": "open"}, {"n": 99}]',
+            '[{"n": 3}]',
+        ]
+    )
+    generator = make_generator(client)
+    request = test_data_pb2.GenerateRequest(
+        request_id="repair-1", domain="ecommerce", entity="ticket", count=3
+    )
+
+    result = await generator.generate(request, context={"schema_dict": schema})
+
+    assert [(r["n"], r.get("status")) for r in result.data] == [(0, "open"), (10, None), (3, None)]
+    assert "remaining 1 records" in client.prompts[1]
+    assert result.metadata["repaired_fields"] == {"status": 1, "n": 1}
+    assert result.metadata["unrepairable_records"] == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_holds_output_to_the_schema():
+    """Test that schema requests send a JSON Schema, and defect-triggering ones do not."""
+    schema = {"fields": {"n": {"type": "integer", "required": True, "max": 10}}}
+    client = ScriptedClient(['[{"n": 1}]', '[{"n": 99}]'])
+    generator = make_generator(client)
+    request = test_data_pb2.GenerateRequest(
+        request_id="schema-1", domain="ecommerce", entity="ticket", count=1
+    )
+    defects = test_data_pb2.GenerateRequest(
+        request_id="schema-2", domain="ecommerce", entity="ticket", count=1, defect_triggering=True
+    )
+
+    result = await generator.generate(request, context={"schema_dict": schema})
+    defect_result = await generator.generate(defects, context={"schema_dict": schema})
+
+    items = client.json_schemas[0]["items"]
+    assert items["properties"]["n"] == {"type": "integer", "maximum": 10}
+    assert items["required"] == ["n"]
+    assert result.metadata["output_mode"] == "structured"
+    assert client.json_schemas[1] is None
+    assert defect_result.metadata["output_mode"] == "free_text"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("entity", "hints", "extra_field"),
+    [("review", [], "_sentiment"), ("cart", ["realistic"], "_shopping_occasion")],
+)
+async def test_output_schema_allows_template_extra_fields(entity, hints, extra_field):
+    """Test that fields the template asks for are allowed by the JSON Schema."""
+    schema = {"fields": {"n": {"type": "integer", "required": True}}}
+    client = ScriptedClient([f'[{{"n": 1, "{extra_field}": "x"}}]'])
+    generator = make_generator(client)
+    request = test_data_pb2.GenerateRequest(
+        request_id="extra-1", domain="ecommerce", entity=entity, count=1, hints=hints
+    )
+
+    result = await generator.generate(request, context={"schema_dict": schema})
+
+    items = client.json_schemas[0]["items"]
+    assert items["properties"][extra_field] == {"type": "string"}
+    assert extra_field in items["required"]
+    assert items["additionalProperties"] is False
+    assert result.data[0][extra_field] == "x"
+
+
+@pytest.mark.asyncio
+async def test_generate_parses_compact_rows():
+    """Test that rows are decoded into records and indexed by the server."""
+    schema = {
+        "fields": {
+            "n": {"type": "integer", "required": True},
+            "address": {"type": "object", "fields": {"city": {"type": "string"}}},
+        }
+    }
+    client = ScriptedClient(['[[1, "Denver", "default"], [2, null, "default"]]'])
+    generator = LLMGenerator(
+        claude_client=client,
+        vllm_client=None,
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+        compact_output=True,
+    )
+    request = test_data_pb2.GenerateRequest(
+        request_id="rows-1", domain="ecommerce", entity="ticket", count=2
+    )
+
+    result = await generator.generate(request, context={"schema_dict": schema})
+
+    assert result.data == [
+        {"n": 1, "address": {"city": "Denver"}, "_scenario": "default", "_index": 0},
+        {"n": 2, "_scenario": "default", "_index": 1},
+    ]
+    assert result.metadata["output_format"] == "rows"
+    assert client.json_schemas[0]["items"] == {"type": "array", "minItems": 3, "maxItems": 3}
+
+
+class ToolUseClient:
+    """Claude stub answering through the records tool, cut off above ``fits`` records."""
+
+    def __init__(self, fits: int):
+        self.fits = fits
+        self.prompts: list[str] = []
+        self.max_tokens: list[int] = []
+        self.claude = ClaudeClient(load_settings(anthropic_api_key="test-api-key"))
+
+    async def generate(self, system, user, **kwargs):
+        self.prompts.append(user)
+        self.max_tokens.append(kwargs["max_tokens"])
+        count = int(re.search(r"Generate (\d+)", user).group(1))
+        truncated = count > self.fits
+        # A tool call cut off at max_tokens arrives without its (incomplete) input
+        records = [] if truncated else [{"n": i} for i in range(count)]
+        message = SimpleNamespace(
+            content=[
+                SimpleNamespace(type="tool_use", name=RECORDS_TOOL, input={"records": records})
+            ],
+            usage=SimpleNamespace(input_tokens=50, output_tokens=kwargs["max_tokens"]),
+            model="test",
+            stop_reason="max_tokens" if truncated else "tool_use",
+        )
+        return self.claude.to_response(message)
+
+
+@pytest.mark.asyncio
+async def test_truncated_tool_call_asks_for_fewer_records():
+    """Test that a tool call cut off before any record is retried with a smaller ask."""
+    schema = {"fields": {"n": {"type": "integer", "required": True}}}
+    client = ToolUseClient(fits=2)
+    generator = make_generator(client)
+    request = test_data_pb2.GenerateRequest(
+        request_id="truncated-1", domain="ecommerce", entity="ticket", count=4
+    )
+
+    result = await generator.generate(request, context={"schema_dict": schema})
+
+    assert len(result.data) == 4
+    assert result.metadata["output_mode"] == "structured"
+    asks = [int(re.search(r"Generate (\d+)", prompt).group(1)) for prompt in client.prompts]
+    assert asks == [4, 2, 2]
+    assert client.max_tokens[1] < client.max_tokens[0]
+    assert "already produced 2 records" in client.prompts[2]
+    await client.claude.close()
+
+
+class CountingStreamClient:
+    """Streaming client stub answering each prompt with a scripted number of records."""
+
+    def __init__(self, sizes: list[int]):
+        self.sizes = list(sizes)
+        self.prompts: list[str] = []
+
+    async def stream(self, system, user, **kwargs):
+        self.prompts.append(user)
+        start = sum(len(p) for p in self.prompts)  # Distinct values per call
+        records = [{"n": start + i} for i in range(self.sizes.pop(0))]
+        yield StreamChunk(text=json.dumps(records))
+        yield StreamChunk(
+            text="",
+            response=ClaudeResponse(
+                content=json.dumps(records), tokens_used=10, model="test", stop_reason="end_turn"
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_generate_stream_runs_planned_chunks_and_follows_up():
+    """Test that a stream larger than one call streams every chunk, then the shortfall."""
+    client = CountingStreamClient([2, 1, 1])
+    generator = make_generator(client)
+    generator.token_planner = TokenBudgetPlanner(max_output_tokens=400)
+    request = test_data_pb2.GenerateRequest(
+        request_id="stream-3", domain="ecommerce", entity="review", count=4
+    )
+
+    batches = [
+        batch
+        async for batch in generator.generate_stream(
+            request, batch_size=50, context={"schema_dict": {"fields": {}}}
+        )
+    ]
+
+    records = [record for batch in batches for record in batch.data]
+    assert [r["_index"] for r in records] == [0, 1, 2, 3]
+    assert len(client.prompts) == 3
+    assert all("Generate 2 realistic" in prompt for prompt in client.prompts[:2])
+    assert "Generate 1 realistic" in client.prompts[2]
+
+
+@pytest.mark.asyncio
+async def test_chunks_share_out_scenario_counts():
+    """Test that each chunk prompt asks for its share of the scenario counts."""
+    client = ScriptedClient(['[{"n": 0}, {"n": 1}]', '[{"n": 2}, {"n": 3}]'])
+    generator = make_generator(client)
+    generator.token_planner = TokenBudgetPlanner(max_output_tokens=400)
+    request = test_data_pb2.GenerateRequest(
+        request_id="plan-2",
+        domain="ecommerce",
+        entity="widget",
+        count=4,
+        scenarios=[
+            test_data_pb2.Scenario(name="happy", count=3),
+            test_data_pb2.Scenario(name="edge", count=1),
+        ],
+    )
+
+    await generator.generate(request, context={"schema_dict": {"fields": {}}})
+
+    assert "happy: 2 records" in client.prompts[0]
+    assert "edge" not in client.prompts[0]
+    assert "happy: 1 records" in client.prompts[1]
+    assert "edge: 1 records" in client.prompts[1]
+
+
+def test_split_scenario_counts_fills_chunks_in_order():
+    """Test that scenario totals are kept and uncounted scenarios leave prompts alone."""
+    request = test_data_pb2.GenerateRequest(
+        count=10,
+        scenarios=[
+            test_data_pb2.Scenario(name="a", count=6),
+            test_data_pb2.Scenario(name="b", count=3),
+        ],
+    )
+
+    assert split_scenario_counts(request, [4, 4, 2]) == [{"a": 4}, {"a": 2, "b": 2}, {"b": 1}]
+    assert split_scenario_counts(test_data_pb2.GenerateRequest(count=4), [2, 2]) is None
+    chunk = chunk_request(request, 4, {"a": 2, "b": 2})
+    assert [(s.name, s.count) for s in chunk.scenarios] == [("a", 2), ("b", 2)]
+    assert chunk.count == 4
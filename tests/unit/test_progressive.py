@@ -0,0 +1,84 @@
+"""Unit tests for progressive streaming."""
+
+import asyncio
+import time
+
+import pytest
+
+from test_data_agent.generators.base import GenerationResult
+from test_data_agent.generators.progressive import ProgressiveGenerator
+from test_data_agent.generators.traditional import TraditionalGenerator
+
+
+class StreamingLLMGenerator:
+    """LLMGenerator stand-in streaming batches of records after a delay each."""
+
+    def __init__(self, batches: list[list[dict]], delay: float = 0.0):
+        self.batches = batches
+        self.delay = delay
+        self.closed = False
+
+    async def generate_stream(self, request, batch_size=50, context=None):
+        try:
+            for batch in self.batches:
+                await asyncio.sleep(self.delay)
+                yield GenerationResult(data=batch, metadata={"llm_provider": "claude"})
+        finally:
+            self.closed = True
+
+
+async def collect(generator, request, **kwargs) -> list[GenerationResult]:
+    """Collect all batches of a progressive stream."""
+    return [batch async for batch in generator.generate_stream(request, batch_size=10, **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_traditional_records_come_first_then_upgrades(make_request):
+    """Test that every record is sent at once and upgrades take its _index."""
+    llm = StreamingLLMGenerator(
+        [[{"cart_id": "LLM-0"}, {"cart_id": "LLM-1"}], [{"cart_id": "LLM-2"}]]
+    )
+    generator = ProgressiveGenerator(TraditionalGenerator(), llm)
+
+    batches = await collect(generator, make_request("cart", progressive=True))
+
+    assert [b.metadata["upgrade"] for b in batches] == [False, True, True]
+    assert [r["_index"] for r in batches[0].data] == [0, 1, 2, 3]
+    upgrades = [r for b in batches[1:] for r in b.data]
+    assert [(r["cart_id"], r["_index"]) for r in upgrades] == [
+        ("LLM-0", 0),
+        ("LLM-1", 1),
+        ("LLM-2", 2),
+    ]
+    assert llm.closed
+
+
+@pytest.mark.asyncio
+async def test_upgrades_follow_scenarios(make_request):
+    """Test that an upgrade replaces a record of its own scenario."""
+    request = make_request("cart", 2, progressive=True)
+    for name in ("happy_path", "abandoned"):
+        scenario = request.scenarios.add()
+        scenario.name = name
+        scenario.count = 1
+    llm = StreamingLLMGenerator([[{"cart_id": "LLM-A", "_scenario": "abandoned"}]])
+
+    batches = await collect(ProgressiveGenerator(TraditionalGenerator(), llm), request)
+
+    base = {r["_index"]: r["_scenario"] for r in batches[0].data}
+    upgrade = batches[1].data[0]
+    assert base[upgrade["_index"]] == "abandoned"
+
+
+@pytest.mark.asyncio
+async def test_deadline_stops_with_upgrades_so_far(make_request):
+    """Test that the stream ends at the deadline, keeping earlier upgrades."""
+    llm = StreamingLLMGenerator([[{"cart_id": "LLM-0"}], [{"cart_id": "LLM-1"}]], delay=0.05)
+    generator = ProgressiveGenerator(TraditionalGenerator(), llm)
+
+    batches = await collect(
+        generator, make_request("cart", progressive=True), deadline=time.monotonic() + 0.08
+    )
+
+    assert [b.metadata["upgrade"] for b in batches] == [False, True]
+    assert llm.closed
@@ -0,0 +1,104 @@
+"""Unit tests for prompt builder."""
+
+import pytest
+
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.prompts.examples import ExampleSelector
+from test_data_agent.schemas.registry import get_registry
+
+
+@pytest.fixture
+def builder():
+    """Fixture for prompt builder."""
+    return PromptBuilder()
+
+
+def test_prefix_is_stable_across_requests(builder, make_request):
+    """Test that the prefix doesn't depend on count, context or scenarios."""
+    schema = get_registry().get_schema("review")
+
+    first = builder.build_prompt_parts(make_request(count=3, context="winter boots"), schema)
+    second = builder.build_prompt_parts(make_request(count=40, context="summer dresses"), schema)
+
+    assert first.prefix == second.prefix
+    assert first.suffix != second.suffix
+    assert "review_id" in first.prefix
+    assert "winter boots" in first.suffix
+
+
+def test_build_prompt_returns_full_user_prompt(builder, make_request):
+    """Test that build_prompt still returns prefix + suffix as the user prompt."""
+    schema = get_registry().get_schema("cart")
+    request = make_request(entity="cart", hints=["coherent"])
+
+    system, user = builder.build_prompt(request, schema)
+    parts = builder.build_prompt_parts(request, schema)
+
+    assert system == parts.system
+    assert user == parts.prefix + parts.suffix
+    assert "COHERENT cart" in user
+
+
+def test_rag_examples_render_without_pattern_ids(builder):
+    """Test that pattern ids key the example cache but stay out of the prompt."""
+    examples = [{"_pattern_id": "p-1", "cart_id": "CRT-2025-0000001"}]
+
+    first = builder.format_rag_examples(examples)
+    second = builder.format_rag_examples([{"_pattern_id": "p-1", "cart_id": "changed"}])
+
+    assert "_pattern_id" not in first
+    assert "CRT-2025-0000001" in first
+    assert second == first
+
+
+def test_compact_prompt_lists_columns_once(builder, make_request):
+    """Test that compact prompts carry the column header in the cacheable prefix."""
+    schema = get_registry().get_schema("order")
+    request = make_request(entity="order")
+
+    parts = builder.build_prompt_parts(request, schema, compact=True)
+    plain = builder.build_prompt_parts(request, schema)
+
+    assert parts.row_format is not None and plain.row_format is None
+    assert parts.row_format.header in parts.prefix
+    assert "shipping_address.city" in parts.prefix
+    assert parts.suffix == plain.suffix
+    assert "_index" not in parts.system
+
+
+def test_example_selection_prefers_diverse_patterns():
+    """Test that near-duplicate variations give way to a different pattern."""
+    base = {"cart_id": "CRT-1", "status": "active", "total": 120.0, "currency": "USD"}
+    variations = [{**base, "cart_id": f"CRT-{i}", "total": 120.0 + i} for i in range(4)]
+    distinct = {"cart_id": "CRT-9", "status": "abandoned", "total": 15.0, "currency": "EUR"}
+    selector = ExampleSelector(max_examples=2, token_budget=0)
+
+    selected = selector.select([*variations, distinct])
+
+    assert selected == [variations[0], distinct]
+
+
+def test_example_selection_strips_fields_and_keeps_budget():
+    """Test that fields outside the schema are dropped and the budget is enforced."""
+    schema = {"fields": {"cart_id": {"type": "string"}, "total": {"type": "float"}}}
+    examples = [
+        {"cart_id": f"CRT-{i}", "total": float(i), "internal_note": "x" * 400} for i in range(5)
+    ]
+    per_example = len('{"cart_id":"CRT-0","total":0.0}') // 4
+
+    selected = ExampleSelector(max_examples=5, token_budget=per_example * 2).select(
+        examples, schema
+    )
+
+    assert len(selected) == 2
+    assert all(set(example) == {"cart_id", "total"} for example in selected)
+
+
+def test_rag_examples_render_as_compact_json(builder):
+    """Test that examples are minified JSON on one line each."""
+    schema = get_registry().get_schema("cart")
+    examples = [{"cart_id": "CRT-2025-0000001", "unknown_field": 1}]
+
+    rendered = builder.format_rag_examples(examples, schema)
+
+    assert rendered == 'Example 1: {"cart_id":"CRT-2025-0000001"}'
@@ -0,0 +1,120 @@
+"""Unit tests for latency-aware LLM provider selection."""
+
+import asyncio
+import json
+
+import pytest
+
+from test_data_agent.clients.claude import ClaudeResponse
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.router.provider_selector import ProviderSelector
+from test_data_agent.utils.latency import LatencyWindow
+from test_data_agent.validators.constraint import ConstraintValidator
+
+
+def observe(selector: ProviderSelector, provider: str, seconds: float, samples: int = 5):
+    """Feed latency samples directly into a provider's window."""
+    for _ in range(samples):
+        selector.stats[provider].latency.record(seconds)
+
+
+def test_latency_window_percentile_and_ewma():
+    """Test moving average and nearest-rank percentile."""
+    window = LatencyWindow(size=100, smoothing=0.5)
+    for seconds in range(1, 101):
+        window.record(float(seconds))
+
+    assert window.percentile(0.95) == 95.0
+    assert window.percentile(0.5) == 50.0
+    assert 98 < window.ewma < 100
+
+
+def test_prefers_quality_provider_without_data():
+    """Test that the first provider is chosen until latency is known."""
+    selector = ProviderSelector(["claude", "vllm"])
+
+    choice = selector.select()
+
+    assert choice.provider == "claude"
+    assert choice.reason == "preferred"
+    assert choice.ranking == ["claude", "vllm"]
+
+
+def test_switches_only_beyond_quality_preference():
+    """Test that a faster provider wins only by a clear margin."""
+    selector = ProviderSelector(["claude", "vllm"], quality_preference=1.5)
+    observe(selector, "claude", 12.0)
+    observe(selector, "vllm", 10.0)
+    assert selector.select().provider == "claude"
+
+    observe(selector, "claude", 30.0, samples=20)
+    choice = selector.select()
+    assert choice.provider == "vllm"
+    assert choice.reason == "faster"
+    assert choice.ranking == ["vllm", "claude"]
+
+
+def test_accounts_for_in_flight_load():
+    """Test that queueing on a saturated provider raises its expected time."""
+    selector = ProviderSelector(["claude", "vllm"], concurrency={"vllm": 2})
+    observe(selector, "claude", 12.0)
+    observe(selector, "vllm", 4.0)
+    assert selector.select().provider == "vllm"
+
+    selector.stats["vllm"].in_flight = 8
+    assert selector.select().provider == "claude"
+
+
+@pytest.mark.asyncio
+async def test_failing_provider_is_tried_last():
+    """Test that errors push a provider behind healthy ones."""
+    selector = ProviderSelector(["claude", "vllm"], max_error_rate=0.5)
+
+    for _ in range(5):
+        with pytest.raises(RuntimeError):
+            async with selector.track("claude"):
+                raise RuntimeError("rate limited")
+
+    choice = selector.select()
+    assert choice.provider == "vllm"
+    assert choice.reason == "preferred_unhealthy"
+
+
+class TimedClient:
+    """LLM client stub with a fixed delay."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    async def generate(self, system, user, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return ClaudeResponse(
+            content=json.dumps([{"id": 1}]), tokens_used=5, model="test", stop_reason="end_turn"
+        )
+
+
+@pytest.mark.asyncio
+async def test_generator_routes_to_faster_provider():
+    """Test that LLMGenerator sends calls to the provider expected to finish first."""
+    claude, vllm = TimedClient(0.05), TimedClient(0.001)
+    selector = ProviderSelector(["claude", "vllm"], quality_preference=1.5, min_samples=1)
+    observe(selector, "claude", 0.05, samples=1)
+    observe(selector, "vllm", 0.001, samples=1)
+    generator = LLMGenerator(
+        claude_client=claude,
+        vllm_client=vllm,
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+        provider_selector=selector,
+    )
+    request = test_data_pb2.GenerateRequest(request_id="p", entity="item", count=1)
+
+    result = await generator.generate(request)
+
+    assert result.metadata["llm_provider"] == "vllm"
+    assert (claude.calls, vllm.calls) == (0, 1)
+    assert len(selector.stats["vllm"].latency) == 2
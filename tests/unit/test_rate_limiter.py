@@ -0,0 +1,143 @@
+"""Unit tests for the cluster-wide rate limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from test_data_agent.clients.claude import ClaudeClient
+from test_data_agent.clients.rate_limiter import (
+    ACQUIRE_SCRIPT,
+    PAUSE_SCRIPT,
+    REFUND_SCRIPT,
+    ClusterRateLimiter,
+    RateLimitTimeoutError,
+    set_request_deadline,
+)
+from test_data_agent.config import load_settings
+
+
+def make_limiter(*waits_ms, **kwargs) -> ClusterRateLimiter:
+    """Build a limiter whose bucket script returns ``waits_ms`` in turn."""
+    redis_client = MagicMock()
+    redis_client.run_script = AsyncMock(side_effect=list(waits_ms))
+    return ClusterRateLimiter(
+        redis_client, "anthropic", requests_per_minute=60, tokens_per_minute=1000, **kwargs
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_deadline():
+    """Start every test without a request deadline."""
+    set_request_deadline(None)
+
+
+@pytest.mark.asyncio
+async def test_acquire_passes_when_bucket_has_capacity():
+    """Test that a call with capacity proceeds immediately with capped token cost."""
+    limiter = make_limiter(0)
+
+    waited = await limiter.acquire(tokens=5000)
+
+    assert waited < 0.1
+    args = limiter.redis_client.run_script.await_args.kwargs["args"]
+    assert args == [60, 1000, 1000, 1]  # Cost capped at the bucket size
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill():
+    """Test that the caller sleeps for the bucket's reported wait and retries."""
+    limiter = make_limiter(20, 0)
+
+    waited = await limiter.acquire(tokens=10)
+
+    assert waited >= 0.02
+    assert limiter.redis_client.run_script.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_acquire_fails_fast_past_deadline():
+    """Test that a caller whose deadline is before the next refill gives up at once."""
+    limiter = make_limiter(5000)
+    set_request_deadline(1.0)
+
+    with pytest.raises(RateLimitTimeoutError) as exc_info:
+        await limiter.acquire(tokens=10)
+
+    assert exc_info.value.retry_after == pytest.approx(5.0)
+
+
+@pytest.mark.asyncio
+async def test_calls_with_capacity_skip_the_queue():
+    """Test that a call finding capacity does not wait behind the replica's queue lock."""
+    limiter = make_limiter(0)
+    await limiter._queue.acquire()
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(limiter.acquire(tokens=10), timeout=0.05)
+    limiter._queue.release()
+
+    assert await limiter.acquire(tokens=10) < 0.1
+    assert limiter.redis_client.run_script.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_refund_ignores_pause():
+    """Test that refunds use their own script, which applies them while the bucket is paused."""
+    limiter = make_limiter(0)
+
+    await limiter.refund(300)
+
+    call = limiter.redis_client.run_script.await_args
+    assert call.args[0] == REFUND_SCRIPT
+    assert call.kwargs["keys"] == [limiter.bucket_key]
+    assert call.kwargs["args"] == [1000, 300]
+
+
+@pytest.mark.asyncio
+async def test_failed_claude_call_returns_its_reservation():
+    """Test that a failed call refunds everything it reserved."""
+    settings = load_settings(anthropic_api_key="test-key")
+    limiter = make_limiter(0, 0)
+    client = ClaudeClient(settings, rate_limiter=limiter)
+
+    with patch.object(client, "_call_api", side_effect=ValueError("bad request")):
+        with pytest.raises(ValueError):
+            await client.generate(system="System", user="User", max_tokens=500)
+
+    acquire_call, refund_call = limiter.redis_client.run_script.await_args_list
+    assert refund_call.args[0] == REFUND_SCRIPT
+    assert refund_call.kwargs["args"][1] == acquire_call.kwargs["args"][2]
+
+
+@pytest.mark.asyncio
+async def test_unavailable_redis_lets_calls_through():
+    """Test that the limiter does not block calls when Redis is unavailable."""
+    limiter = make_limiter(None)
+
+    assert await limiter.acquire(tokens=10) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_claude_honors_retry_after_cluster_wide():
+    """Test that a retry-after from Claude pauses the shared bucket and sets the delay."""
+    settings = load_settings(anthropic_api_key="test-key")
+    limiter = make_limiter(0, 0, 0, 0, 0)
+    client = ClaudeClient(settings, rate_limiter=limiter)
+
+    class MockRateLimitError(Exception):
+        response = MagicMock(headers={"retry-after": "7"})
+
+    with (
+        patch.object(client, "_call_api", side_effect=[MockRateLimitError(), RuntimeError()]),
+        patch("test_data_agent.clients.claude.RateLimitError", MockRateLimitError),
+        patch("test_data_agent.clients.claude.asyncio.sleep", new=AsyncMock()) as sleep,
+    ):
+        with pytest.raises(RuntimeError):
+            await client.generate(system="System", user="User")
+
+    sleep.assert_awaited_once_with(7.0)
+    scripts = [call.args[0] for call in limiter.redis_client.run_script.await_args_list]
+    assert scripts == [ACQUIRE_SCRIPT, REFUND_SCRIPT, PAUSE_SCRIPT, ACQUIRE_SCRIPT, REFUND_SCRIPT]
+    pause_call = limiter.redis_client.run_script.await_args_list[2]
+    assert pause_call.kwargs["args"] == [7000]
@@ -0,0 +1,115 @@
+"""Unit tests for deterministic constraint repair."""
+
+import random
+import re
+
+from test_data_agent.proto import test_data_pb2
+from test_data_agent.validators.constraint import ConstraintValidator, constraints_to_dict
+from test_data_agent.validators.repair import RepairEngine, sample_regex
+
+SCHEMA = {
+    "fields": {
+        "order_id": {"type": "string", "required": True, "pattern": r"^ORD-\d{6}$"},
+        "status": {"type": "enum", "values": ["pending", "shipped", "delivered"]},
+        "rating": {"type": "integer", "min": 1, "max": 5},
+        "note": {"type": "string", "min_length": 3, "max_length": 10},
+        "items": {
+            "type": "array",
+            "item_schema": {
+                "type": "object",
+                "fields": {
+                    "quantity": {"type": "integer", "min": 1},
+                    "price": {"type": "float", "min": 0.01},
+                },
+            },
+        },
+        "subtotal": {"type": "float"},
+        "total": {"type": "float"},
+    }
+}
+
+
+def valid_record(**overrides) -> dict:
+    """Build a record that satisfies SCHEMA."""
+    record = {
+        "order_id": "ORD-123456",
+        "status": "pending",
+        "rating": 4,
+        "note": "fine",
+        "items": [{"quantity": 2, "price": 5.0}],
+        "subtotal": 10.0,
+        "total": 10.0,
+    }
+    record.update(overrides)
+    return record
+
+
+def test_validator_reports_field_names_and_codes():
+    """Test that validation errors name the failing field and the violated rule."""
+    result = ConstraintValidator().validate(valid_record(rating=9), SCHEMA)
+
+    assert [(e.field, e.code, e.expected) for e in result.errors] == [("rating", "max", 5)]
+
+
+def test_repairs_each_kind_of_violation():
+    """Test clamping, coercion, truncation, padding and enum snapping."""
+    engine = RepairEngine()
+    record = valid_record(rating="7", status="Shiped", note="a" * 20)
+
+    result = engine.repair(record, SCHEMA)
+
+    assert result.valid
+    assert result.record["rating"] == 5
+    assert result.record["status"] == "shipped"
+    assert result.record["note"] == "a" * 10
+    assert record["rating"] == "7"  # Input record is left untouched
+    assert engine.repair(valid_record(note="ok"), SCHEMA).record["note"] == "oko"
+
+
+def test_regenerates_fields_failing_a_regex():
+    """Test that a value failing its pattern is regenerated from the regex."""
+    result = RepairEngine(rng=random.Random(7)).repair(valid_record(order_id="12"), SCHEMA)
+
+    assert result.valid
+    assert re.match(r"^ORD-\d{6}$", result.record["order_id"])
+    assert re.fullmatch(r"[A-Z]{2}-\d{3}", sample_regex(r"^[A-Z]{2}-\d{3}$"))
+
+
+def test_recomputes_totals_after_item_repair():
+    """Test that derived totals follow a repaired item quantity."""
+    record = valid_record(items=[{"quantity": 0, "price": 5.0}], subtotal=0.0, total=0.0)
+
+    result = RepairEngine().repair(record, SCHEMA)
+
+    assert result.record["items"][0]["quantity"] == 1
+    assert result.record["subtotal"] == 5.0
+    assert result.record["total"] == 5.0
+    assert result.repairs == ["items[0].quantity", "subtotal", "total"]
+
+
+def test_request_constraints_override_schema_bounds():
+    """Test that request constraints drive the repair."""
+    constraints = test_data_pb2.Constraints()
+    constraints.field_constraints["rating"].max = 3
+
+    result = RepairEngine().repair(valid_record(), SCHEMA, constraints_to_dict(constraints))
+
+    assert result.record["rating"] == 3
+
+
+def test_batch_reports_repairs_per_field_and_unrepairable_records():
+    """Test per-field repair counts and that unrepairable records are set aside."""
+    missing_id = valid_record()
+    del missing_id["order_id"]
+    records = [
+        valid_record(items=[{"quantity": 0, "price": 1.0}, {"quantity": -2, "price": 1.0}]),
+        valid_record(rating=0),
+        missing_id,
+    ]
+
+    summary = RepairEngine().repair_batch(records, SCHEMA)
+
+    assert len(summary.records) == 2
+    assert summary.repaired_fields["items[].quantity"] == 2
+    assert summary.repaired_fields["rating"] == 1
+    assert [e.code for e in summary.unrepairable[0].errors] == ["required"]
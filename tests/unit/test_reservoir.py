@@ -0,0 +1,152 @@
+"""Unit tests for the LLM record reservoir."""
+
+import json
+import re
+import time
+
+import pytest
+
+from test_data_agent.cache.reservoir import RecordReservoir
+from test_data_agent.clients.claude import ClaudeResponse
+from test_data_agent.config import load_settings
+from test_data_agent.generators.llm import LLMGenerator
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.validators.constraint import ConstraintValidator
+
+
+class InMemoryRedisClient:
+    """RedisClient stand-in keeping pools in process memory."""
+
+    def __init__(self):
+        self.client = object()
+        self.pools: dict[str, list[dict]] = {}
+
+    async def get_from_pool(self, pool_name: str, count: int) -> list[dict]:
+        pool = self.pools.setdefault(pool_name, [])
+        items, self.pools[pool_name] = pool[:count], pool[count:]
+        return items
+
+    async def add_to_pool(self, pool_name: str, data: list[dict]) -> None:
+        self.pools.setdefault(pool_name, []).extend(data)
+
+    async def get_pool_size(self, pool_name: str) -> int:
+        return len(self.pools.get(pool_name, []))
+
+
+class CountingClient:
+    """LLM client stub returning as many records as the prompt asks for."""
+
+    def __init__(self):
+        self.requested: list[int] = []
+
+    async def generate(self, system, user, **kwargs):
+        count = int(re.search(r"Generate (\d+)", user).group(1))
+        self.requested.append(count)
+        records = [{"review_id": f"REV-{len(self.requested)}-{i}"} for i in range(count)]
+        return ClaudeResponse(
+            content=json.dumps(records), tokens_used=10, model="test", stop_reason="end_turn"
+        )
+
+
+@pytest.fixture
+def settings():
+    """Create test settings."""
+    return load_settings(
+        anthropic_api_key="test-key",
+        reservoir_enabled=True,
+        reservoir_overgenerate_ratio=0.5,
+        reservoir_overgenerate_max_count=50,
+    )
+
+
+@pytest.fixture
+def reservoir(settings):
+    """Create a reservoir over in-memory pools."""
+    return RecordReservoir(InMemoryRedisClient(), settings)
+
+
+def test_pool_name_depends_on_context(reservoir, make_request):
+    """Test that pools are shared only by requests with the same shape."""
+    base = reservoir.pool_name(make_request(count=4), {"fields": {}})
+
+    assert reservoir.pool_name(make_request(count=9), {"fields": {}}) == base
+    assert reservoir.pool_name(make_request(hints=["edge_case"]), {"fields": {}}) != base
+    assert reservoir.pool_name(make_request(), {"fields": {"x": {}}}) != base
+
+
+@pytest.mark.asyncio
+async def test_take_discards_stale_records(reservoir, settings, make_request):
+    """Test that records older than the max age are not served."""
+    pool = reservoir.pool_name(make_request(), {})
+    stale = time.time() - settings.reservoir_max_age_seconds - 1
+    await reservoir.redis_client.add_to_pool(
+        pool,
+        [
+            {"record": {"n": 1}, "stored_at": stale},
+            {"record": {"n": 2}, "stored_at": time.time()},
+        ],
+    )
+
+    records = await reservoir.take(pool, 2, "review")
+
+    assert records == [{"n": 2}]
+
+
+def test_bypass_hint_disables_reservoir(reservoir, make_request):
+    """Test that the no_cache hint skips the reservoir."""
+    assert reservoir.enabled_for(make_request())
+    assert not reservoir.enabled_for(make_request(hints=["realistic", "no_cache"]))
+
+
+@pytest.mark.asyncio
+async def test_generate_serves_surplus_on_next_request(reservoir, make_request):
+    """Test that surplus records from one call serve the next request."""
+    client = CountingClient()
+    generator = LLMGenerator(
+        claude_client=client,
+        vllm_client=None,
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+        reservoir=reservoir,
+    )
+
+    first = await generator.generate(make_request(count=4))
+    second = await generator.generate(make_request(count=2))
+
+    assert client.requested == [6]
+    assert len(first.data) == 4
+    assert second.metadata["llm_provider"] == "reservoir"
+    assert [r["_index"] for r in second.data] == [0, 1]
+    assert {r["review_id"] for r in second.data} == {"REV-1-4", "REV-1-5"}
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_returns_taken_records(reservoir, make_request):
+    """Test that records taken for a request go back to the pool if generation fails."""
+    generator = LLMGenerator(
+        claude_client=CountingClient(),
+        vllm_client=None,
+        prompt_builder=PromptBuilder(),
+        constraint_validator=ConstraintValidator(),
+        reservoir=reservoir,
+    )
+    pool = reservoir.pool_name(make_request(count=4), {})
+    await reservoir.redis_client.add_to_pool(
+        pool, [{"record": {"review_id": "REV-0-0"}, "stored_at": time.time()}]
+    )
+
+    async def fail(*args, **kwargs):
+        raise ValueError("provider down")
+
+    generator._generate_llm = fail
+    with pytest.raises(ValueError):
+        await generator.generate(make_request(count=4))
+
+    assert await reservoir.take(pool, 4, "review") == [{"review_id": "REV-0-0"}]
+
+
+def test_reservoir_is_off_by_default(make_request):
+    """Test that over-generation is opt-in."""
+    reservoir = RecordReservoir(InMemoryRedisClient(), load_settings(anthropic_api_key="test-key"))
+
+    assert not reservoir.enabled_for(make_request())
@@ -0,0 +1,141 @@
+"""Unit tests for the LLM response cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anthropic.types import Message, Usage
+from anthropic.types.text_block import TextBlock
+
+from test_data_agent.cache.response_cache import (
+    REDIS_GET_SCRIPT,
+    REDIS_SET_SCRIPT,
+    RedisResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+    build_response_cache,
+    response_key,
+    set_response_cache_bypass,
+)
+from test_data_agent.clients.claude import ClaudeClient
+from test_data_agent.config import load_settings
+from test_data_agent.utils.metrics import testdata_llm_response_cache_saved_tokens_total
+
+
+@pytest.fixture(autouse=True)
+def no_bypass():
+    """Start every test with the cache in use."""
+    set_response_cache_bypass(False)
+
+
+def make_message(text: str = "[]") -> Message:
+    """Build a Claude API message."""
+    return Message(
+        id="msg_1",
+        type="message",
+        role="assistant",
+        content=[TextBlock(type="text", text=text)],
+        model="claude-sonnet-4-20250514",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=Usage(input_tokens=100, output_tokens=50),
+    )
+
+
+def test_response_key_covers_every_input():
+    """Test that each input that shapes the response changes the key."""
+    base = ("model", "system", "user", 0.7, 4096, None)
+    variants = [
+        ("other", "system", "user", 0.7, 4096, None),
+        ("model", "other", "user", 0.7, 4096, None),
+        ("model", "system", "other", 0.7, 4096, None),
+        ("model", "system", "user", 0.2, 4096, None),
+        ("model", "system", "user", 0.7, 1024, None),
+        ("model", "system", "user", 0.7, 4096, {"type": "array"}),
+    ]
+
+    assert response_key(*base) == response_key(*base)
+    assert len({response_key(*v) for v in variants} | {response_key(*base)}) == 7
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_evicts_least_recently_used(tmp_path):
+    """Test that reading an entry protects it from eviction."""
+    backend = SQLiteResponseCache(str(tmp_path / "responses.sqlite3"), max_entries=2)
+
+    await backend.set("a", {"content": "A"})
+    await backend.set("b", {"content": "B"})
+    assert await backend.get("a") == {"content": "A"}
+    await backend.set("c", {"content": "C"})
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") == {"content": "A"}
+    assert await backend.get("c") == {"content": "C"}
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_runs_lru_scripts():
+    """Test that the Redis backend stores and reads through its LRU scripts."""
+    redis_client = MagicMock()
+    redis_client.run_script = AsyncMock(side_effect=[1, '{"content": "A"}'])
+    backend = RedisResponseCache(redis_client, max_entries=5)
+
+    await backend.set("k", {"content": "A"})
+    value = await backend.get("k")
+
+    set_call, get_call = redis_client.run_script.await_args_list
+    assert set_call.args[0] == REDIS_SET_SCRIPT
+    assert set_call.args[1] == ["llmcache:k", "llmcache:lru"]
+    assert set_call.args[2][2] == 5
+    assert get_call.args[0] == REDIS_GET_SCRIPT
+    assert value == {"content": "A"}
+
+
+@pytest.mark.asyncio
+async def test_claude_generate_served_from_cache():
+    """Test that a repeated prompt is answered without calling the API."""
+    settings = load_settings(anthropic_api_key="test-api-key")
+    cache = ResponseCache(SQLiteResponseCache(":memory:"))
+    client = ClaudeClient(settings, response_cache=cache)
+    saved = testdata_llm_response_cache_saved_tokens_total.labels(provider="claude")
+    before = saved._value.get()
+
+    with patch.object(client, "_call_api", return_value=make_message('[{"n": 1}]')) as call:
+        first = await client.generate(system="System", user="User")
+        second = await client.generate(system="System", user="User")
+        await client.generate(system="System", user="User", temperature=0.1)
+
+    assert call.call_count == 2
+    assert second == first
+    assert saved._value.get() - before == 150
+
+
+@pytest.mark.asyncio
+async def test_bypass_skips_reads_and_writes():
+    """Test that a bypassing request neither reads nor fills the cache."""
+    settings = load_settings(anthropic_api_key="test-api-key")
+    cache = ResponseCache(SQLiteResponseCache(":memory:"))
+    client = ClaudeClient(settings, response_cache=cache)
+
+    with patch.object(client, "_call_api", return_value=make_message()) as call:
+        set_response_cache_bypass(True)
+        await client.generate(system="System", user="User")
+        set_response_cache_bypass(False)
+        await client.generate(system="System", user="User")
+
+    assert call.call_count == 2
+
+
+def test_build_response_cache_from_settings(tmp_path):
+    """Test backend selection from settings."""
+    path = str(tmp_path / "responses.sqlite3")
+
+    def settings(**kwargs):
+        return load_settings(anthropic_api_key="test-api-key", **kwargs)
+
+    assert build_response_cache(settings(llm_response_cache_backend="none")) is None
+    cache = build_response_cache(
+        settings(llm_response_cache_backend="sqlite", llm_response_cache_path=path)
+    )
+    assert isinstance(cache.backend, SQLiteResponseCache)
+    with pytest.raises(ValueError):
+        build_response_cache(settings(llm_response_cache_backend="redis"))
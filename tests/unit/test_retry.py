@@ -0,0 +1,104 @@
+"""Unit tests for the shared LLM retry policy and per-request budget."""
+
+import asyncio
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from openai import APIConnectionError
+
+from test_data_agent.clients.vllm import VLLMClient
+from test_data_agent.config import load_settings
+from test_data_agent.resilience.circuit_breaker import CircuitBreaker
+from test_data_agent.resilience.retry import (
+    RetryPolicy,
+    current_retry_budget,
+    retry_after_seconds,
+    start_retry_budget,
+)
+
+REQUEST = httpx.Request("POST", "http://vllm:8000/v1/chat/completions")
+
+
+def test_backoff_is_jittered_within_bounds():
+    """Test that delays stay between the base and three times the previous delay."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=20.0, rng=random.Random(7))
+
+    delays = [policy.backoff(None) for _ in range(50)]
+    follow_ups = [policy.backoff(4.0) for _ in range(50)]
+
+    assert all(1.0 <= d <= 3.0 for d in delays)
+    assert len({round(d, 3) for d in delays}) > 40
+    assert all(1.0 <= d <= 12.0 for d in follow_ups)
+    assert policy.backoff(100.0) <= 20.0
+
+
+def test_retry_after_wins_over_backoff():
+    """Test that the provider's retry-after is used as the delay."""
+    error = MagicMock(response=MagicMock(headers={"retry-after": "7"}))
+    policy = RetryPolicy(max_delay=1.0)
+
+    assert retry_after_seconds(error) == 7.0
+    assert policy.next_delay("claude", 0, retry_after=retry_after_seconds(error)) == 7.0
+    ms_error = MagicMock(response=MagicMock(headers={"retry-after-ms": "250"}))
+    assert retry_after_seconds(ms_error) == pytest.approx(0.25)
+
+
+def test_attempts_per_call_are_capped():
+    """Test that the last allowed attempt is not retried."""
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+    assert policy.next_delay("vllm", 0) is not None
+    assert policy.next_delay("vllm", 1) is not None
+    assert policy.next_delay("vllm", 2) is None
+
+
+@pytest.mark.asyncio
+async def test_budget_is_shared_by_concurrent_calls():
+    """Test that calls spawned by one request spend a single budget."""
+    policy = RetryPolicy(max_attempts=10, base_delay=0.01, max_delay=0.01)
+
+    async def request() -> list[float | None]:
+        start_retry_budget(max_retries=3, max_wait_seconds=10.0)
+
+        async def call() -> float | None:
+            return policy.next_delay("claude", 0)
+
+        return await asyncio.gather(*(call() for _ in range(5)))
+
+    delays = await asyncio.create_task(request())
+
+    assert sum(d is not None for d in delays) == 3
+    assert current_retry_budget() is None  # Budgets don't leak out of the request
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_total_wait():
+    """Test that a retry whose delay would overrun the wait budget is refused."""
+    budget = start_retry_budget(max_retries=10, max_wait_seconds=5.0)
+    policy = RetryPolicy()
+
+    assert policy.next_delay("claude", 0, retry_after=4.0) == 4.0
+    assert policy.next_delay("claude", 0, retry_after=4.0) is None
+    assert budget.retries == 1
+    assert budget.waited_seconds == 4.0
+
+
+@pytest.mark.asyncio
+async def test_vllm_retries_connection_errors_within_budget():
+    """Test that the vLLM client stops retrying once the request's budget is spent."""
+    settings = load_settings(anthropic_api_key="test-api-key", llm_retry_max_attempts=5)
+    client = VLLMClient(settings, breaker=CircuitBreaker("vllm-test", failure_threshold=100))
+    client.client.chat.completions.create = AsyncMock(
+        side_effect=APIConnectionError(request=REQUEST)
+    )
+    start_retry_budget(max_retries=2, max_wait_seconds=60.0)
+
+    with patch("test_data_agent.clients.vllm.asyncio.sleep", new=AsyncMock()) as sleep:
+        with pytest.raises(APIConnectionError):
+            await client.generate(system="s", user="u")
+
+    assert client.client.chat.completions.create.await_count == 3
+    assert sleep.await_count == 2
+    assert client.client.max_retries == 0
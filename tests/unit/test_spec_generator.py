@@ -0,0 +1,149 @@
+"""Unit tests for spec-driven generation."""
+
+import json
+import random
+
+import pytest
+
+from test_data_agent.clients.claude import ClaudeResponse
+from test_data_agent.generators.spec import SpecGenerator, normalize_spec
+from test_data_agent.generators.traditional import TraditionalGenerator
+from test_data_agent.prompts.builder import PromptBuilder
+from test_data_agent.schemas.registry import get_registry
+
+LUXURY_CARTS = {"context": "realistic luxury jewelry carts", "hints": ["spec"]}
+
+SPEC = {
+    "fields": {
+        "currency": {"choice": ["USD"]},
+        "items": {
+            "count": [1, 3],
+            "item": {
+                "fields": {"quantity": {"range": [1, 2]}},
+                "groups": [
+                    {
+                        "fields": ["name", "category", "price"],
+                        "rows": [
+                            ["Diamond Tennis Bracelet", "jewelry", 4200.0],
+                            ["Pearl Drop Earrings", "jewelry", 650.0],
+                        ],
+                        "weights": [1, 3],
+                    }
+                ],
+            },
+        },
+        "not_in_schema": {"choice": ["x"]},
+    }
+}
+
+
+class SpecClient:
+    """LLM client stub returning a fixed spec."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, system, user, **kwargs):
+        self.calls += 1
+        return ClaudeResponse(
+            content="Here is the spec:\n" + json.dumps(SPEC),
+            tokens_used=900,
+            model="test",
+            stop_reason="end_turn",
+        )
+
+
+class DictRedisClient:
+    """RedisClient stand-in backed by a dict."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.values[key] = value
+
+
+def make_generator(client, redis_client=None) -> SpecGenerator:
+    """Build a spec generator with a seeded RNG."""
+    return SpecGenerator(
+        claude_client=client,
+        vllm_client=None,
+        prompt_builder=PromptBuilder(),
+        traditional_generator=TraditionalGenerator(),
+        redis_client=redis_client,
+        rng=random.Random(3),
+    )
+
+
+def test_normalize_spec_drops_unknown_and_malformed_entries():
+    """Test that only usable entries for schema fields survive."""
+    fields = {"status": {}, "total": {"type": "float"}, "note": {}}
+    spec = normalize_spec(
+        {
+            "fields": {
+                "status": {"choice": ["a", "b"], "weights": [1]},
+                "total": {"range": [500, 10], "distribution": "zipf"},
+                "note": {"unknown": True},
+                "extra": {"choice": ["x"]},
+            },
+            "groups": [{"fields": ["status", "total"], "rows": [["a", 1], ["b"]]}],
+        },
+        fields,
+    )
+
+    assert spec["fields"] == {
+        "status": {"choice": ["a", "b"], "weights": None},
+        "total": {"range": [10, 500], "distribution": "uniform", "decimals": 0},
+    }
+    assert spec["groups"] == [{"fields": ["status", "total"], "rows": [["a", 1]], "weights": None}]
+
+
+@pytest.mark.asyncio
+async def test_spec_requested_once_and_executed_locally(make_request):
+    """Test that later requests reuse the cached spec."""
+    client = SpecClient()
+    generator = make_generator(client)
+    context = {"schema_dict": get_registry().get_schema("cart")}
+
+    first = await generator.generate(make_request("cart", 50, **LUXURY_CARTS), context=context)
+    second = await generator.generate(make_request("cart", 200, **LUXURY_CARTS), context=context)
+
+    assert client.calls == 1
+    assert first.metadata["spec_source"] == "claude"
+    assert first.metadata["llm_tokens_used"] == 900
+    assert second.metadata["spec_source"] == "memory"
+    assert len(second.data) == 200
+
+    for record in second.data:
+        assert "not_in_schema" not in record
+        assert record["currency"] == "USD"
+        for item in record["items"]:
+            assert (item["name"], item["price"]) in {
+                ("Diamond Tennis Bracelet", 4200.0),
+                ("Pearl Drop Earrings", 650.0),
+            }
+            assert item["quantity"] in (1, 2)
+        subtotal = round(sum(i["quantity"] * i["price"] for i in record["items"]), 2)
+        assert record["subtotal"] == subtotal
+        assert record["total"] == round(record["subtotal"] + record["tax"], 2)
+
+
+@pytest.mark.asyncio
+async def test_spec_shared_through_redis(make_request):
+    """Test that a spec cached by one replica serves another."""
+    redis_client = DictRedisClient()
+    context = {"schema_dict": get_registry().get_schema("cart")}
+
+    await make_generator(SpecClient(), redis_client).generate(
+        make_request("cart", 50, **LUXURY_CARTS), context=context
+    )
+    client = SpecClient()
+    result = await make_generator(client, redis_client).generate(
+        make_request("cart", 50, **LUXURY_CARTS), context=context
+    )
+
+    assert client.calls == 0
+    assert result.metadata["spec_source"] == "redis"
@@ -0,0 +1,61 @@
+"""Unit tests for the token budget planner."""
+
+import pytest
+
+from test_data_agent.planning.token_budget import TokenBudgetExceededError, TokenBudgetPlanner
+from test_data_agent.schemas.registry import get_registry
+
+
+@pytest.fixture
+def planner():
+    """Create a planner with a small output window."""
+    return TokenBudgetPlanner(max_output_tokens=2000, safety_margin=1.25, smoothing=0.5)
+
+
+def test_static_estimate_grows_with_nesting(planner):
+    """Test that nested schemas are estimated larger than flat ones."""
+    registry = get_registry()
+
+    assert planner.static_estimate(registry.get_schema("order")) > planner.static_estimate(
+        registry.get_schema("coupon")
+    )
+
+
+def test_plan_splits_large_requests(planner):
+    """Test that requests beyond one call's capacity are split evenly."""
+    schema = {"fields": {f"f{i}": {"type": "string"} for i in range(8)}}
+
+    plan = planner.plan(schema, 200)
+
+    assert plan.calls > 1
+    assert sum(plan.chunk_counts(200)) == 200
+    assert plan.max_tokens <= 2000
+    assert plan.records_per_call * plan.tokens_per_record * 1.25 <= plan.max_tokens
+
+
+def test_small_requests_do_not_over_reserve(planner):
+    """Test that max_tokens scales down with the record count."""
+    schema = {"fields": {"name": {"type": "string"}}}
+
+    plan = planner.plan(schema, 3)
+
+    assert plan.calls == 1
+    assert plan.max_tokens < 200
+
+
+def test_observations_refine_estimate(planner):
+    """Test that observed usage moves the estimate toward reality."""
+    schema = {"fields": {"name": {"type": "string"}}}
+    static = planner.static_estimate(schema)
+
+    planner.observe(schema, output_tokens=1000, records=10)
+
+    assert planner.tokens_per_record(schema) == pytest.approx(static + 0.5 * (100 - static))
+
+
+def test_budget_is_enforced(planner):
+    """Test that plans over budget are rejected before any call."""
+    schema = {"fields": {"name": {"type": "string"}}}
+
+    with pytest.raises(TokenBudgetExceededError):
+        planner.plan(schema, 100, prompt_tokens=500, budget=1000)
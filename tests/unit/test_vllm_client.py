@@ -0,0 +1,49 @@
+"""Unit tests for the vLLM client."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from test_data_agent.clients.vllm import VLLMClient, VLLMResponse
+from test_data_agent.config import load_settings
+
+
+def make_completion(content: str) -> SimpleNamespace:
+    """Build an OpenAI chat completion response."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+    )
+
+
+@pytest.mark.asyncio
+async def test_in_flight_calls_are_capped_at_max_concurrency():
+    """Test that concurrent calls beyond the cap wait for a free slot."""
+    settings = load_settings(anthropic_api_key="test-api-key", vllm_max_concurrency=3)
+    client = VLLMClient(settings)
+    in_flight = 0
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        user = kwargs["messages"][1]["content"]
+        if user == "bad":
+            raise ValueError("boom")
+        return make_completion(f"echo {user}")
+
+    client.client.chat.completions.create = create
+    prompts = [("system", f"p{i}") for i in range(8)] + [("system", "bad")]
+
+    results = await asyncio.gather(
+        *(client.generate(system, user) for system, user in prompts), return_exceptions=True
+    )
+
+    assert [r.content for r in results[:8]] == [f"echo p{i}" for i in range(8)]
+    assert all(isinstance(r, VLLMResponse) for r in results[:8])
+    assert isinstance(results[8], ValueError)
+    assert peak == 3